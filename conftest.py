@@ -0,0 +1,13 @@
+"""pytest 공통 설정 - 프로젝트 루트와 in-tree C++ 파서 빌드를 경로에 추가
+
+core.KooDynaKeyword는 처음 임포트될 때 kfile_parser 사용 가능 여부를 고정하므로
+어떤 테스트 모듈이 먼저 core를 임포트하든 수집 전에 두 경로가 모두 있어야 합니다.
+"""
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent
+
+for path in (PROJECT_DIR / "core" / "kfile_parser", PROJECT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -966,6 +966,16 @@ class KFileReader:
             return self._parsed.stats
         return {}
 
+    @property
+    def model_stats(self):
+        """파싱 중 계산된 모델 통계 (ModelStats)
+
+        노드/엘리먼트 목록을 변환하지 않으므로 대형 모델에서도 즉시 반환됩니다.
+        """
+        if self._parsed:
+            return self._parsed.model_stats
+        return None
+
     @property
     def using_fast_parser(self) -> bool:
         """고속 파서 사용 여부"""
@@ -2,6 +2,14 @@ from .k_file_parser import KFileParser
 from .material_db import MaterialDatabase
 from .script_generator import ScriptGenerator
 from .config_manager import ConfigManager
-from .executor import ProcessExecutor
 from .display_parser import DisplayParser
 from .part_config_loader import PartConfigLoader
+from .runner import run_script, RunResult
+
+
+def __getattr__(name):
+    # ProcessExecutor is QProcess-based; import lazily so headless use never loads Qt
+    if name == 'ProcessExecutor':
+        from .executor import ProcessExecutor
+        return ProcessExecutor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
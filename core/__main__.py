@@ -0,0 +1,6 @@
+"""python -m core - headless pipeline CLI"""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,199 @@
+"""Command line interface for the headless pipeline
+
+Usage:
+    python -m core info model.k [--json]
+    python -m core script model.k --parts parts.csv --materials MaterialSource.txt [--run]
+    python -m core adjacent model.k --part 12 [--plane XY]
+    python -m core export model.k -o out.k
+    python -m core batch decks/*.k --parts parts.csv --materials MaterialSource.txt -j 8
+
+Exit code is 0 when every deck succeeded, 1 otherwise.
+"""
+import argparse
+import glob
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from . import pipeline
+from .runner import run_script
+
+
+def _expand_paths(patterns: List[str]) -> List[str]:
+    """Expand globs (Windows shells do not) and directories (*.k inside)"""
+    paths = []
+    for pattern in patterns:
+        p = Path(pattern)
+        if p.is_dir():
+            paths.extend(sorted(str(f) for f in p.glob("*.k")))
+        elif any(ch in pattern for ch in "*?["):
+            paths.extend(sorted(glob.glob(pattern)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def _cmd_info(args) -> int:
+    model = pipeline.load_model(args.kfile)
+    stats = model.get_stats()
+    if args.json:
+        print(json.dumps(stats, indent=2, default=str))
+    else:
+        elements = stats['elements']
+        print(f"{stats['filename']}  ({stats['parse_time_ms']:.1f} ms)")
+        print(f"  Nodes:    {stats['nodes']:,}")
+        print(f"  Elements: {elements['total']:,} "
+              f"(shell {elements['shell']:,}, solid {elements['solid']:,}, beam {elements['beam']:,})")
+        print(f"  Parts:    {stats['parts']:,}")
+    return 0
+
+
+def _cmd_script(args) -> int:
+    if not args.parts:
+        raise ValueError("--parts가 필요합니다")
+    model = pipeline.load_model(args.kfile)
+    script_path = pipeline.generate_script(model, args.parts, args.materials,
+                                           args.name, args.output_dir)
+    print(f"Script: {script_path}")
+    if not args.run:
+        return 0
+
+    result = run_script(str(script_path), args.koomesh, timeout=args.timeout,
+                        on_output=lambda line: print(line, end=""))
+    if result.error:
+        print(result.error, file=sys.stderr)
+    return result.exit_code
+
+
+def _cmd_adjacent(args) -> int:
+    model = pipeline.load_model(args.kfile)
+    thickness = (args.min, args.max) if args.min is not None and args.max is not None else None
+    result = pipeline.find_adjacent(model, args.part, args.plane, thickness,
+                                    args.coverage, args.layer_mode)
+    print(f"Part {result.source_part_id} ({result.plane}, "
+          f"{result.thickness_min:.2f} ~ {result.thickness_max:.2f}): "
+          f"{' '.join(str(pid) for pid in sorted(result.adjacent_parts)) or '-'}")
+    return 0
+
+
+def _cmd_export(args) -> int:
+    model = pipeline.load_model(args.kfile)
+    if not pipeline.export_keywords(model, args.output):
+        return 1
+    print(f"Exported: {args.output}")
+    return 0
+
+
+def _cmd_batch(args) -> int:
+    paths = _expand_paths(args.kfiles)
+    if not paths:
+        print("처리할 K-file이 없습니다", file=sys.stderr)
+        return 1
+
+    jobs = []
+    for path in paths:
+        export_path = None
+        if args.export_dir:
+            export_path = str(Path(args.export_dir) / f"{Path(path).stem}_export.k")
+        jobs.append(pipeline.DeckJob(
+            path=path,
+            part_csv=args.parts,
+            material_source=args.materials,
+            output_dir=args.output_dir,
+            adjacent_parts=list(args.adjacent or []),
+            export_path=export_path,
+            run=args.run,
+            koomesh_path=args.koomesh,
+            timeout=args.timeout,
+        ))
+    if args.export_dir:
+        Path(args.export_dir).mkdir(parents=True, exist_ok=True)
+
+    def report(result: pipeline.DeckResult):
+        status = "OK  " if result.ok else "FAIL"
+        line = f"[{status}] {result.filename}  {result.total_ms:8.1f} ms"
+        if result.error:
+            line += f"  {result.error}"
+        print(line, flush=True)
+
+    start = time.perf_counter()
+    results = pipeline.run_batch(jobs, args.jobs, on_result=report)
+    elapsed = time.perf_counter() - start
+
+    failed = sum(1 for r in results if not r.ok)
+    print(f"\n{len(results)} decks, {failed} failed, {elapsed:.2f} s "
+          f"({len(results) / elapsed if elapsed > 0 else 0:.1f} decks/s)")
+
+    if args.summary:
+        with open(args.summary, 'w', encoding='utf-8') as f:
+            json.dump([r.__dict__ for r in results], f, indent=2, default=str)
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m core",
+                                     description="Headless K-file pipeline (no GUI)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("info", help="모델 통계 출력")
+    p.add_argument("kfile")
+    p.add_argument("--json", action="store_true", help="JSON으로 출력")
+    p.set_defaults(func=_cmd_info)
+
+    def add_script_args(p):
+        p.add_argument("--parts", help="Part 설정 CSV (material,thickness,layer_set,part_id)")
+        p.add_argument("--materials", help="MaterialSource.txt")
+        p.add_argument("--output-dir", help="스크립트 출력 폴더 (기본: K-file 폴더)")
+        p.add_argument("--run", action="store_true", help="KooMeshModifier 실행")
+        p.add_argument("--koomesh", help="KooMeshModifier 실행 파일 경로")
+        p.add_argument("--timeout", type=float, help="실행 제한 시간 (초)")
+
+    p = sub.add_parser("script", help="display.txt 생성 (및 실행)")
+    p.add_argument("kfile")
+    add_script_args(p)
+    p.add_argument("--name", help="출력 모델 이름 (기본: K-file 이름)")
+    p.set_defaults(func=_cmd_script)
+
+    p = sub.add_parser("adjacent", help="인접 Part 검출")
+    p.add_argument("kfile")
+    p.add_argument("--part", type=int, required=True)
+    p.add_argument("--plane", choices=["XY", "YZ", "ZX"])
+    p.add_argument("--min", type=float, help="검색 거리 최소값 (기본: 자동)")
+    p.add_argument("--max", type=float, help="검색 거리 최대값 (기본: 자동)")
+    p.add_argument("--coverage", type=float, default=0.1)
+    p.add_argument("--layer-mode", action="store_true")
+    p.set_defaults(func=_cmd_adjacent)
+
+    p = sub.add_parser("export", help="키워드 K-file로 내보내기")
+    p.add_argument("kfile")
+    p.add_argument("-o", "--output", required=True)
+    p.set_defaults(func=_cmd_export)
+
+    p = sub.add_parser("batch", help="여러 deck 일괄 처리")
+    p.add_argument("kfiles", nargs="+", help="K-file, 폴더 또는 glob 패턴")
+    add_script_args(p)
+    p.add_argument("--adjacent", type=int, nargs="*", help="인접 Part 검출 대상 Part ID")
+    p.add_argument("--export-dir", help="키워드 내보내기 폴더")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="워커 프로세스 수 (0: CPU 수)")
+    p.add_argument("--summary", help="결과 JSON 저장 경로")
+    p.set_defaults(func=_cmd_batch)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "parts", None) and not args.materials:
+        print("--parts에는 --materials가 필요합니다", file=sys.stderr)
+        return 2
+    try:
+        return args.func(args)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
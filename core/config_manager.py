@@ -11,7 +11,11 @@ class ConfigManager:
         "last_output_dir": "",
         "koomesh_path": "",
         "theme": "dark",
-        "recent_files": []
+        "recent_files": [],
+        "memory_budget_mb": 8192,    # 재생성 가능한 캐시 메모리 예산 (0: 무제한)
+        "workspace_budget_mb": 4096,  # 비활성 모델 메모리 예산 (0: 무제한)
+        "mesh_cache_mb": 4096,       # 해제된 모델 MeshData 디스크 캐시 예산 (0: 무제한)
+        "skin_cache_mb": 4096        # 외곽면/스킨 디스크 캐시 예산 (0: 무제한)
     }
 
     def __init__(self):
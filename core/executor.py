@@ -1,9 +1,9 @@
 """Process executor for running KooMeshModifier"""
-import os
-import sys
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal, QProcess
 
+from .runner import default_koomesh_path, build_command
+
 class ProcessExecutor(QObject):
     """Executes KooMeshModifier and captures output"""
     output = Signal(str)
@@ -24,11 +24,7 @@ class ProcessExecutor(QObject):
         # Determine KooMeshModifier path
         if not koomesh_path:
             # Default: look in project directory
-            project_dir = Path(__file__).parent.parent
-            if sys.platform == 'win32':
-                koomesh_path = str(project_dir / "KooMeshModifier" / "run.bat")
-            else:
-                koomesh_path = str(project_dir / "KooMeshModifier" / "run.sh")
+            koomesh_path = default_koomesh_path()
 
         # Check if executable exists
         if not Path(koomesh_path).exists():
@@ -42,20 +38,13 @@ class ProcessExecutor(QObject):
         self.process.readyReadStandardError.connect(self._on_stderr)
         self.process.finished.connect(self._on_finished)
 
-        # Set working directory to script location
-        script_dir = str(Path(script_path).parent)
+        # Working directory is the script location
+        program, args, script_dir = build_command(script_path, koomesh_path)
         self.process.setWorkingDirectory(script_dir)
 
         # Run
         self._running = True
-        script_name = Path(script_path).name
-
-        if sys.platform == 'win32':
-            self.process.start(koomesh_path, [script_name])
-        else:
-            # Make sure script is executable
-            os.chmod(koomesh_path, 0o755)
-            self.process.start("/bin/bash", [koomesh_path, script_name])
+        self.process.start(program, args)
 
     def _on_stdout(self):
         data = self.process.readAllStandardOutput().data().decode('utf-8', errors='replace')
@@ -0,0 +1,296 @@
+"""Geometry cache - 모델 단위 파생 지오메트리 공유 캐시
+
+MeshData, 외곽면, Part별 bbox, 요소 법선, 노드->요소 인접 정보 등을
+한 번만 계산하여 모든 모듈(Model Viewer, Adjacent Parts Viewer 등)이
+공유합니다.
+
+- lazy 계산: 처음 요청될 때 생성
+- 자동 무효화: ParsedModelData.revision이 바뀌면 (키워드 편집 등) 전체 폐기
+- 스레드 안전: 같은 키는 한 번만 계산 (다른 스레드는 완료까지 대기)
+- 통계: hit/miss, 항목별 메모리/생성 시간
+- 메모리 예산: 항목별로 memory_registry에 등록, 예산 초과 시 LRU 해제 (재계산 가능)
+
+사용 예시:
+    geometry = ctx.geometry
+    mesh = geometry.mesh
+    faces = geometry.exterior_faces
+    bbox_min, bbox_max = geometry.part_bboxes[pid]
+
+    # 모듈 전용 파생 데이터도 같은 규칙으로 캐시
+    index = geometry.get('adjacent.spatial_index', lambda: SpatialIndex(mesh))
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from .memory_registry import memory_registry, estimate_nbytes, MemoryConsumer
+
+if TYPE_CHECKING:
+    from .model_data import ParsedModelData
+    from gui.modules.model_viewer.core.mesh_data import MeshData, PartFaces
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    value: Any
+    nbytes: int = 0
+    build_ms: float = 0.0
+
+
+class GeometryCache:
+    """모델 단위 파생 지오메트리 캐시
+
+    ParsedModelData마다 하나씩 생성되며 (model.geometry), 모델이 교체되면
+    캐시도 함께 버려집니다.
+    """
+
+    # 기본 제공 키
+    MESH = 'mesh'
+    EXTERIOR_FACES = 'exterior_faces'
+    PART_BBOXES = 'part_bboxes'
+    ELEMENT_NORMALS = 'element_normals'
+    NODE_ELEMENTS = 'node_elements'
+
+    def __init__(self, model: 'ParsedModelData'):
+        self._model = model
+        self._revision = model.revision
+        self._entries: Dict[str, CacheEntry] = {}
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._consumers: Dict[str, MemoryConsumer] = {}
+        self._lock = threading.RLock()
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    # ========== 기본 API ==========
+
+    def get(self, key: str, builder: Callable[[], Any]) -> Any:
+        """캐시된 값 반환, 없으면 builder()로 생성
+
+        같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 계산합니다.
+        """
+        self._check_revision()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._hits += 1
+                self._touch(key)
+                return entry.value
+            key_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                # 대기 중 다른 스레드가 생성했으면 재사용
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._hits += 1
+                    self._touch(key)
+                    return entry.value
+                self._misses += 1
+                revision = self._revision
+
+            start = time.perf_counter()
+            value = builder()
+            build_ms = (time.perf_counter() - start) * 1000
+
+            self._store(key, value, build_ms, revision)
+            return value
+
+    def put(self, key: str, value: Any):
+        """미리 계산된 값 저장 (예: 백그라운드 로더가 만든 MeshData)"""
+        self._check_revision()
+        with self._lock:
+            revision = self._revision
+        self._store(key, value, 0.0, revision)
+
+    def contains(self, key: str) -> bool:
+        """키가 캐시되어 있는지 확인 (통계에 반영하지 않음)"""
+        self._check_revision()
+        with self._lock:
+            return key in self._entries
+
+    def invalidate(self, key: str = None):
+        """캐시 무효화
+
+        Args:
+            key: 특정 키만 제거 (None이면 전체)
+        """
+        with self._lock:
+            # 외곽면은 MeshData에도 메모되어 있으므로 함께 해제
+            mesh_entry = self._entries.get(self.MESH)
+            if mesh_entry is not None and key in (None, self.EXTERIOR_FACES):
+                mesh_entry.value.clear_exterior_faces()
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            self._invalidations += 1
+            consumers = list(self._consumers.values()) if key is None \
+                else [c for k, c in self._consumers.items() if k == key]
+
+        for consumer in consumers:
+            consumer.update(0)
+
+    def release(self):
+        """캐시 비우고 메모리 레지스트리 등록 해제 (모델 교체 시)"""
+        with self._lock:
+            self._entries.clear()
+            self._consumers.clear()
+        memory_registry.unregister_owner(self)
+
+    def _store(self, key: str, value: Any, build_ms: float, revision: int):
+        nbytes = estimate_nbytes(value)
+        with self._lock:
+            # 계산 도중 모델이 편집되었으면 결과를 저장하지 않음
+            if revision != self._model.revision:
+                return
+            self._entries[key] = CacheEntry(value, nbytes, build_ms)
+            consumer = self._consumers.get(key)
+            if consumer is None:
+                consumer = memory_registry.register(
+                    f"geometry:{key} ({self._model.filename or '-'})",
+                    category="geometry",
+                    evict=lambda cache, k=key: cache.invalidate(k),
+                    owner=self,
+                )
+                self._consumers[key] = consumer
+
+        # 레지스트리 호출은 캐시 락 밖에서 (예산 초과 시 다른 캐시 해제)
+        consumer.update(nbytes)
+
+    def _touch(self, key: str):
+        consumer = self._consumers.get(key)
+        if consumer is not None:
+            consumer.touch()
+
+    def _check_revision(self):
+        """모델 편집 시 자동 무효화"""
+        revision = self._model.revision
+        if revision == self._revision:
+            return
+        with self._lock:
+            if revision != self._revision:
+                self._entries.clear()
+                self._revision = revision
+                self._invalidations += 1
+                consumers = list(self._consumers.values())
+            else:
+                consumers = []
+
+        for consumer in consumers:
+            consumer.update(0)
+
+    # ========== 통계 ==========
+
+    @property
+    def memory_bytes(self) -> int:
+        """캐시된 항목의 추정 메모리 합계"""
+        with self._lock:
+            return sum(e.nbytes for e in self._entries.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """hit/miss 및 항목별 메모리 통계"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'invalidations': self._invalidations,
+                'revision': self._revision,
+                'memory_bytes': sum(e.nbytes for e in self._entries.values()),
+                'entries': {
+                    key: {'bytes': e.nbytes, 'build_ms': e.build_ms}
+                    for key, e in self._entries.items()
+                },
+            }
+
+    # ========== 파생 지오메트리 ==========
+
+    @property
+    def mesh(self) -> 'MeshData':
+        """렌더링/분석용 MeshData"""
+        return self.get(self.MESH, self._build_mesh)
+
+    @property
+    def exterior_faces(self) -> Dict[int, 'PartFaces']:
+        """Part별 외곽면 {part_id: PartFaces} (반복하면 (elem_idx, face_indices))"""
+        return self.get(self.EXTERIOR_FACES, lambda: self.mesh.extract_exterior_faces())
+
+    @property
+    def part_bboxes(self) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """Part별 bounding box {part_id: (min_point, max_point)}"""
+        return self.get(self.PART_BBOXES, self._build_part_bboxes)
+
+    @property
+    def element_normals(self) -> np.ndarray:
+        """요소 법선 (M, 3) - 처음 3개 노드 기준 단위 벡터, 퇴화 요소는 0"""
+        return self.get(self.ELEMENT_NORMALS, self._build_element_normals)
+
+    @property
+    def node_elements(self) -> Tuple[np.ndarray, np.ndarray]:
+        """노드 -> 요소 인접 정보 (CSR)
+
+        Returns:
+            (offsets, element_indices): 노드 i에 연결된 요소는
+            element_indices[offsets[i]:offsets[i + 1]]
+        """
+        return self.get(self.NODE_ELEMENTS, self._build_node_elements)
+
+    def get_node_elements(self, node_idx: int) -> np.ndarray:
+        """노드 인덱스에 연결된 요소 인덱스"""
+        offsets, indices = self.node_elements
+        return indices[offsets[node_idx]:offsets[node_idx + 1]]
+
+    def _build_mesh(self) -> 'MeshData':
+        from gui.modules.model_viewer.core.mesh_data import MeshData
+        return MeshData.from_parsed_model(self._model)
+
+    def _build_part_bboxes(self) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        part_ids, mins, maxs = self.mesh.part_bounds()
+        return {int(pid): (lo, hi) for pid, lo, hi in zip(part_ids, mins, maxs)}
+
+    def _build_element_normals(self) -> np.ndarray:
+        mesh = self.mesh
+        elem_count = len(mesh.cell_types)
+        normals = np.zeros((elem_count, 3))
+        # Beam(노드 2개)은 법선 없음
+        polys = np.flatnonzero(mesh.nodes_per_cell >= 3)
+        if len(polys) == 0:
+            return normals
+
+        nodes = mesh.nodes.astype(np.float64)
+        starts = mesh.offsets[polys]
+        p0 = nodes[mesh.connectivity[starts]]
+        p1 = nodes[mesh.connectivity[starts + 1]]
+        p2 = nodes[mesh.connectivity[starts + 2]]
+        cross = np.cross(p1 - p0, p2 - p0)
+
+        norms = np.linalg.norm(cross, axis=1)
+        valid = norms >= 1e-10
+        normals[polys[valid]] = cross[valid] / norms[valid, None]
+        return normals
+
+    def _build_node_elements(self) -> Tuple[np.ndarray, np.ndarray]:
+        mesh = self.mesh
+        node_count = len(mesh.nodes)
+        elem_count = len(mesh.cell_types)
+
+        # (node, elem) 쌍 - 퇴화 요소의 중복 노드는 np.unique로 제거
+        node_idx = mesh.connectivity.astype(np.int64)
+        elem_idx = np.repeat(np.arange(elem_count, dtype=np.int64), mesh.nodes_per_cell)
+        pairs = np.unique(node_idx * max(elem_count, 1) + elem_idx)
+
+        pair_nodes = pairs // max(elem_count, 1)
+        element_indices = (pairs % max(elem_count, 1)).astype(np.int32)
+
+        offsets = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_nodes, minlength=node_count), out=offsets[1:])
+        return offsets, element_indices
@@ -1,8 +1,81 @@
 """K file parser for extracting Part IDs from LS-DYNA files"""
+import mmap
 import re
+from dataclasses import dataclass
 from typing import List, Set, Dict, Tuple
 from pathlib import Path
 
+
+@dataclass
+class PartHeader:
+    """*PART card found by scan_parts (name line + first data card)"""
+    pid: int
+    name: str = ""
+    secid: int = 0
+    mid: int = 0
+
+
+# *PART keyword at the start of a line (case-insensitive, *PART_xxx filtered later)
+_PART_KEYWORD = re.compile(rb'\n\*[Pp][Aa][Rr][Tt]')
+
+
+def _fixed_int(line: str, start: int, width: int = 10) -> int:
+    field = line[start:start + width].strip()
+    try:
+        return int(field) if field else 0
+    except ValueError:
+        return 0
+
+
+def scan_parts(filepath: str) -> List[PartHeader]:
+    """Scan only the *PART cards of a K file, without parsing nodes/elements.
+
+    The file is memory-mapped and searched for *PART keyword lines; only the
+    few lines after each hit are decoded, so even multi-GB decks scan in a
+    fraction of the full parse time. Card rules follow the C++ parser: the
+    keyword line must not contain *PART_, comment ($) and blank lines are
+    skipped, the name is the first 80 columns and pid/secid/mid are fixed
+    10-column fields.
+    """
+    parts: List[PartHeader] = []
+    with open(filepath, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return parts
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            starts = [m.start() + 1 for m in _PART_KEYWORD.finditer(mm)]
+            if mm[:5].upper() == b'*PART':
+                starts.insert(0, 0)
+
+            for start in starts:
+                end = mm.find(b'\n', start)
+                pos = len(mm) if end < 0 else end + 1
+                if b'*PART_' in mm[start:pos].upper():
+                    continue
+
+                card: List[str] = []
+                while len(card) < 2 and pos < len(mm):
+                    end = mm.find(b'\n', pos)
+                    line_end = len(mm) if end < 0 else end
+                    line = mm[pos:line_end].decode('utf-8', errors='ignore').rstrip('\r')
+                    pos = line_end + 1
+                    if not line.strip() or line.startswith('$'):
+                        continue
+                    if line.startswith('*'):
+                        break
+                    card.append(line)
+
+                if len(card) < 2:
+                    continue
+                name, data = card
+                parts.append(PartHeader(
+                    pid=_fixed_int(data, 0),
+                    name=name[:80].strip(),
+                    secid=_fixed_int(data, 10),
+                    mid=_fixed_int(data, 20),
+                ))
+    return parts
+
+
 class KFileParser:
     """Parser for LS-DYNA K files to extract Part IDs"""
 
@@ -30,7 +30,7 @@ except ImportError as e:
     _CPP_AVAILABLE = False
     _IMPORT_ERROR = str(e)
 
-from .wrapper import KFileParser, ParsedKFile, NodeData, PartData, ElementData
+from .wrapper import KFileParser, ParsedKFile, NodeData, PartData, ElementData, ModelStats
 
 __all__ = [
     'KFileParser',
@@ -38,6 +38,7 @@ __all__ = [
     'NodeData',
     'PartData',
     'ElementData',
+    'ModelStats',
     'ElementType',
     'is_cpp_available',
 ]
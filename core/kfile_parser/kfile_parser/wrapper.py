@@ -397,6 +397,145 @@ class MaterialData:
         return 0.0
 
 
+@dataclass
+class ModelStats:
+    """모델 통계 (파싱 중 누적 계산)
+
+    노드/엘리먼트 목록을 Python 객체로 변환하지 않고도
+    개수, 바운딩 박스, ID 범위를 바로 조회할 수 있습니다.
+    """
+    node_count: int = 0
+    part_count: int = 0
+    set_count: int = 0
+    section_count: int = 0
+    contact_count: int = 0
+    material_count: int = 0
+    # 키워드 블록 수 ('*' 제외 키워드명 -> 등장 횟수)
+    keyword_counts: Dict[str, int] = field(default_factory=dict)
+    # 타입별 엘리먼트 수
+    shell_count: int = 0
+    solid_count: int = 0
+    beam_count: int = 0
+    # 형상별 엘리먼트 수 (서로 다른 코너 노드 수 기준)
+    tri_count: int = 0
+    quad_count: int = 0
+    tet_count: int = 0
+    penta_count: int = 0
+    hex_count: int = 0
+    # 파트별 엘리먼트 수
+    part_element_counts: Dict[int, int] = field(default_factory=dict)
+    # 노드 바운딩 박스 (node_count > 0 일 때 유효)
+    bbox_min: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    bbox_max: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    # ID 범위 (비어 있으면 (0, 0))
+    node_id_range: Tuple[int, int] = (0, 0)
+    element_id_range: Tuple[int, int] = (0, 0)
+    part_id_range: Tuple[int, int] = (0, 0)
+
+    @property
+    def element_count(self) -> int:
+        """전체 엘리먼트 수"""
+        return self.shell_count + self.solid_count + self.beam_count
+
+    @property
+    def element_type_counts(self) -> Dict[str, int]:
+        """타입별 엘리먼트 수"""
+        return {'shell': self.shell_count, 'solid': self.solid_count, 'beam': self.beam_count}
+
+    @property
+    def element_shape_counts(self) -> Dict[str, int]:
+        """형상별 엘리먼트 수"""
+        return {
+            'tri': self.tri_count, 'quad': self.quad_count,
+            'tet': self.tet_count, 'penta': self.penta_count, 'hex': self.hex_count,
+            'beam': self.beam_count,
+        }
+
+    @classmethod
+    def from_cpp(cls, result) -> 'ModelStats':
+        """C++ ParseResult에서 변환 (엔티티 벡터는 길이만 조회)"""
+        s = result.stats
+        return cls(
+            node_count=s.node_count,
+            part_count=s.part_count,
+            set_count=len(result.sets),
+            section_count=len(result.sections),
+            contact_count=len(result.contacts),
+            material_count=len(result.materials),
+            keyword_counts=dict(s.keyword_counts),
+            shell_count=s.shell_count,
+            solid_count=s.solid_count,
+            beam_count=s.beam_count,
+            tri_count=s.tri_count,
+            quad_count=s.quad_count,
+            tet_count=s.tet_count,
+            penta_count=s.penta_count,
+            hex_count=s.hex_count,
+            part_element_counts=dict(s.part_element_counts),
+            bbox_min=tuple(s.bbox_min),
+            bbox_max=tuple(s.bbox_max),
+            node_id_range=(s.node_id_min, s.node_id_max),
+            element_id_range=(s.element_id_min, s.element_id_max),
+            part_id_range=(s.part_id_min, s.part_id_max),
+        )
+
+    def add_keyword(self, upper_line: str) -> None:
+        """키워드 블록 카운트 (Python 폴백용)"""
+        name = upper_line[1:].split(None, 1)[0] if len(upper_line) > 1 else ''
+        self.keyword_counts[name] = self.keyword_counts.get(name, 0) + 1
+
+    def add_node(self, node: NodeData) -> None:
+        """노드 누적 (Python 폴백용)"""
+        if self.node_count == 0:
+            self.bbox_min = (node.x, node.y, node.z)
+            self.bbox_max = (node.x, node.y, node.z)
+            self.node_id_range = (node.nid, node.nid)
+        else:
+            lo, hi = self.bbox_min, self.bbox_max
+            self.bbox_min = (min(lo[0], node.x), min(lo[1], node.y), min(lo[2], node.z))
+            self.bbox_max = (max(hi[0], node.x), max(hi[1], node.y), max(hi[2], node.z))
+            self.node_id_range = (min(self.node_id_range[0], node.nid),
+                                  max(self.node_id_range[1], node.nid))
+        self.node_count += 1
+
+    def add_part(self, part: PartData) -> None:
+        """파트 누적 (Python 폴백용)"""
+        if self.part_count == 0:
+            self.part_id_range = (part.pid, part.pid)
+        else:
+            self.part_id_range = (min(self.part_id_range[0], part.pid),
+                                  max(self.part_id_range[1], part.pid))
+        self.part_count += 1
+
+    def add_element(self, elem: ElementData) -> None:
+        """엘리먼트 누적 (Python 폴백용)"""
+        if self.element_count == 0:
+            self.element_id_range = (elem.eid, elem.eid)
+        else:
+            self.element_id_range = (min(self.element_id_range[0], elem.eid),
+                                     max(self.element_id_range[1], elem.eid))
+        self.part_element_counts[elem.pid] = self.part_element_counts.get(elem.pid, 0) + 1
+
+        if elem.element_type == 'shell':
+            self.shell_count += 1
+            distinct = len({nid for nid in elem.nodes[:4] if nid > 0})  # 0은 빈 칸 (C++ count_distinct와 동일)
+            if distinct == 3:
+                self.tri_count += 1
+            elif distinct == 4:
+                self.quad_count += 1
+        elif elem.element_type == 'solid':
+            self.solid_count += 1
+            distinct = len({nid for nid in elem.nodes[:8] if nid > 0})  # 0은 빈 칸 (C++ count_distinct와 동일)
+            if distinct == 4:
+                self.tet_count += 1
+            elif distinct == 6:
+                self.penta_count += 1
+            elif distinct == 8:
+                self.hex_count += 1
+        elif elem.element_type == 'beam':
+            self.beam_count += 1
+
+
 class ParsedKFile:
     """파싱된 K파일 데이터
 
@@ -412,6 +551,7 @@ class ParsedKFile:
         self._sections: Optional[List[SectionData]] = None
         self._contacts: Optional[List[ContactData]] = None
         self._materials: Optional[List[MaterialData]] = None
+        self._model_stats: Optional[ModelStats] = None
 
         # Python fallback용
         self._py_nodes: List[NodeData] = []
@@ -421,6 +561,7 @@ class ParsedKFile:
         self._py_sections: List[SectionData] = []
         self._py_contacts: List[ContactData] = []
         self._py_materials: List[MaterialData] = []
+        self._py_model_stats = ModelStats()
         self._py_node_index: Dict[int, int] = {}
         self._py_part_index: Dict[int, int] = {}
         self._py_element_index: Dict[int, int] = {}
@@ -460,6 +601,15 @@ class ParsedKFile:
             return self._elements
         return self._py_elements
 
+    @property
+    def model_stats(self) -> ModelStats:
+        """모델 통계 (파싱 중 계산된 값, 엔티티 목록 변환 없음)"""
+        if self._cpp_result is not None:
+            if self._model_stats is None:
+                self._model_stats = ModelStats.from_cpp(self._cpp_result)
+            return self._model_stats
+        return self._py_model_stats
+
     @property
     def sets(self) -> List[SetData]:
         """Set 목록"""
@@ -971,6 +1121,7 @@ class KFileParser:
             # Keyword check
             if line.startswith('*'):
                 upper = line.upper()
+                result._py_model_stats.add_keyword(upper)
 
                 # 현재 파싱 중인 set 저장
                 if current_set is not None and current_set.sid > 0 and current_set.count > 0:
@@ -1145,6 +1296,7 @@ class KFileParser:
                 node = self._parse_node_py(line)
                 if node:
                     result._py_nodes.append(node)
+                    result._py_model_stats.add_node(node)
 
             elif state == 'PART_NAME':
                 part_name = line[:80].strip()
@@ -1154,22 +1306,26 @@ class KFileParser:
                 part = self._parse_part_py(part_name, line)
                 if part:
                     result._py_parts.append(part)
+                    result._py_model_stats.add_part(part)
                 state = 'IDLE'
 
             elif state == 'SHELL':
                 elem = self._parse_element_py(line, 'shell')
                 if elem:
                     result._py_elements.append(elem)
+                    result._py_model_stats.add_element(elem)
 
             elif state == 'SOLID':
                 elem = self._parse_element_py(line, 'solid')
                 if elem:
                     result._py_elements.append(elem)
+                    result._py_model_stats.add_element(elem)
 
             elif state == 'BEAM':
                 elem = self._parse_element_py(line, 'beam')
                 if elem:
                     result._py_elements.append(elem)
+                    result._py_model_stats.add_element(elem)
 
             # SET _TITLE state: skip title line and move to header
             elif state == 'SET_TITLE':
@@ -1300,6 +1456,12 @@ class KFileParser:
         if current_material is not None and current_material.mid > 0:
             result._py_materials.append(current_material)
 
+        stats = result._py_model_stats
+        stats.set_count = len(result._py_sets)
+        stats.section_count = len(result._py_sections)
+        stats.contact_count = len(result._py_contacts)
+        stats.material_count = len(result._py_materials)
+
         # Build index
         if self._build_index:
             for i, n in enumerate(result._py_nodes):
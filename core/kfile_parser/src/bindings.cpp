@@ -803,6 +803,31 @@ PYBIND11_MODULE(_kfile_parser, m) {
     py::bind_vector<std::vector<kfile::ConstrainedJoint>>(m, "ConstrainedJointVector");
     py::bind_vector<std::vector<kfile::ConstrainedSpotweld>>(m, "ConstrainedSpotweldVector");
 
+    // ModelStats structure (accumulated during parsing)
+    py::class_<kfile::ModelStats>(m, "ModelStats")
+        .def(py::init<>())
+        .def_readonly("keyword_counts", &kfile::ModelStats::keyword_counts)
+        .def_readonly("shell_count", &kfile::ModelStats::shell_count)
+        .def_readonly("solid_count", &kfile::ModelStats::solid_count)
+        .def_readonly("beam_count", &kfile::ModelStats::beam_count)
+        .def_readonly("tri_count", &kfile::ModelStats::tri_count)
+        .def_readonly("quad_count", &kfile::ModelStats::quad_count)
+        .def_readonly("tet_count", &kfile::ModelStats::tet_count)
+        .def_readonly("penta_count", &kfile::ModelStats::penta_count)
+        .def_readonly("hex_count", &kfile::ModelStats::hex_count)
+        .def_readonly("part_element_counts", &kfile::ModelStats::part_element_counts)
+        .def_readonly("node_count", &kfile::ModelStats::node_count)
+        .def_readonly("part_count", &kfile::ModelStats::part_count)
+        .def_readonly("bbox_min", &kfile::ModelStats::bbox_min)
+        .def_readonly("bbox_max", &kfile::ModelStats::bbox_max)
+        .def_readonly("node_id_min", &kfile::ModelStats::node_id_min)
+        .def_readonly("node_id_max", &kfile::ModelStats::node_id_max)
+        .def_readonly("element_id_min", &kfile::ModelStats::element_id_min)
+        .def_readonly("element_id_max", &kfile::ModelStats::element_id_max)
+        .def_readonly("part_id_min", &kfile::ModelStats::part_id_min)
+        .def_readonly("part_id_max", &kfile::ModelStats::part_id_max)
+        .def_property_readonly("element_count", &kfile::ModelStats::element_count);
+
     // ParseResult structure
     py::class_<kfile::ParseResult>(m, "ParseResult")
         .def(py::init<>())
@@ -852,6 +877,7 @@ PYBIND11_MODULE(_kfile_parser, m) {
         .def_readwrite("contact_index", &kfile::ParseResult::contact_index)
         .def_readwrite("material_index", &kfile::ParseResult::material_index)
         .def_readwrite("curve_index", &kfile::ParseResult::curve_index)
+        .def_readwrite("stats", &kfile::ParseResult::stats)
         .def_readwrite("total_lines", &kfile::ParseResult::total_lines)
         .def_readwrite("parse_time_ms", &kfile::ParseResult::parse_time_ms)
         .def_readwrite("warnings", &kfile::ParseResult::warnings)
@@ -894,11 +920,14 @@ PYBIND11_MODULE(_kfile_parser, m) {
         .def("get_parse_initials", &kfile::KFileParser::get_parse_initials)
         .def("get_parse_constraineds", &kfile::KFileParser::get_parse_constraineds)
         .def("get_build_index", &kfile::KFileParser::get_build_index)
+        // GIL released while parsing so background loader threads don't block the UI
         .def("parse_file", &kfile::KFileParser::parse_file,
              py::arg("filepath"),
+             py::call_guard<py::gil_scoped_release>(),
              "Parse a K-file from disk")
         .def("parse_string", &kfile::KFileParser::parse_string,
              py::arg("content"),
+             py::call_guard<py::gil_scoped_release>(),
              "Parse K-file content from a string")
         .def_static("parse_node_line", &kfile::KFileParser::parse_node_line,
                     py::arg("line"),
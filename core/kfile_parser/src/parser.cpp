@@ -94,6 +94,7 @@ void KFileParser::process_line(const std::string& line, ParseState& state,
     // Check for keyword
     if (is_keyword(line)) {
         std::string upper_line = to_upper(line);
+        result.stats.add_keyword(upper_line);
 
         if (upper_line.find("*NODE") == 0 && upper_line.find("*NODE_") == std::string::npos) {
             state = parse_nodes_ ? ParseState::IN_NODE : ParseState::IDLE;
@@ -746,6 +747,7 @@ void KFileParser::process_line(const std::string& line, ParseState& state,
             try {
                 Node node = parse_node_line(line);
                 result.nodes.push_back(node);
+                result.stats.add_node(node);
             } catch (const std::exception& e) {
                 result.warnings.push_back("Node parse warning: " + std::string(e.what()));
             }
@@ -762,6 +764,7 @@ void KFileParser::process_line(const std::string& line, ParseState& state,
             try {
                 Part part = parse_part_lines(part_name, line);
                 result.parts.push_back(part);
+                result.stats.add_part(part);
             } catch (const std::exception& e) {
                 result.warnings.push_back("Part parse warning: " + std::string(e.what()));
             }
@@ -773,6 +776,7 @@ void KFileParser::process_line(const std::string& line, ParseState& state,
             try {
                 Element elem = parse_element_line(line, ElementType::SHELL);
                 result.elements.push_back(elem);
+                result.stats.add_element(elem);
             } catch (const std::exception& e) {
                 result.warnings.push_back("Element parse warning: " + std::string(e.what()));
             }
@@ -783,6 +787,7 @@ void KFileParser::process_line(const std::string& line, ParseState& state,
             try {
                 Element elem = parse_element_line(line, ElementType::SOLID);
                 result.elements.push_back(elem);
+                result.stats.add_element(elem);
             } catch (const std::exception& e) {
                 result.warnings.push_back("Element parse warning: " + std::string(e.what()));
             }
@@ -793,6 +798,7 @@ void KFileParser::process_line(const std::string& line, ParseState& state,
             try {
                 Element elem = parse_element_line(line, ElementType::BEAM);
                 result.elements.push_back(elem);
+                result.stats.add_element(elem);
             } catch (const std::exception& e) {
                 result.warnings.push_back("Element parse warning: " + std::string(e.what()));
             }
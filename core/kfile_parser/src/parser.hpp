@@ -19,6 +19,7 @@
 #include "database.hpp"
 #include "initial.hpp"
 #include "constrained.hpp"
+#include "stats.hpp"
 
 namespace kfile {
 
@@ -78,6 +79,7 @@ struct ParseResult {
     std::unordered_map<int32_t, size_t> curve_index;
 
     // Statistics
+    ModelStats stats;
     size_t total_lines = 0;
     size_t parse_time_ms = 0;
     std::vector<std::string> warnings;
@@ -128,6 +130,7 @@ struct ParseResult {
         curve_index.clear();
         warnings.clear();
         errors.clear();
+        stats.clear();
         total_lines = 0;
         parse_time_ms = 0;
     }
@@ -0,0 +1,142 @@
+#pragma once
+
+#include <array>
+#include <cstdint>
+#include <string>
+#include <unordered_map>
+#include <algorithm>
+#include "node.hpp"
+#include "part.hpp"
+#include "element.hpp"
+
+namespace kfile {
+
+/**
+ * Model statistics accumulated while parsing
+ *
+ * Counts, extents and ID ranges are updated as each entity is parsed, so
+ * callers can show model summaries without converting node/element vectors
+ * to Python objects.
+ */
+struct ModelStats {
+    // Keyword block occurrences (name without '*', e.g. "NODE" -> 3)
+    std::unordered_map<std::string, size_t> keyword_counts;
+
+    // Element counts per type
+    size_t shell_count = 0;
+    size_t solid_count = 0;
+    size_t beam_count = 0;
+
+    // Element counts per shape (distinct corner nodes)
+    size_t tri_count = 0;      // shell, 3 distinct nodes
+    size_t quad_count = 0;     // shell, 4 distinct nodes
+    size_t tet_count = 0;      // solid, 4 distinct nodes
+    size_t penta_count = 0;    // solid, 6 distinct nodes
+    size_t hex_count = 0;      // solid, 8 distinct nodes
+
+    // Element count per part ID
+    std::unordered_map<int32_t, size_t> part_element_counts;
+
+    size_t node_count = 0;
+    size_t part_count = 0;
+
+    // Node bounding box (valid when node_count > 0)
+    std::array<double, 3> bbox_min{{0.0, 0.0, 0.0}};
+    std::array<double, 3> bbox_max{{0.0, 0.0, 0.0}};
+
+    // ID ranges ([0, 0] when empty)
+    int32_t node_id_min = 0;
+    int32_t node_id_max = 0;
+    int32_t element_id_min = 0;
+    int32_t element_id_max = 0;
+    int32_t part_id_min = 0;
+    int32_t part_id_max = 0;
+
+    size_t element_count() const { return shell_count + solid_count + beam_count; }
+
+    void clear() {
+        *this = ModelStats();
+    }
+
+    void add_keyword(const std::string& upper_line) {
+        size_t end = upper_line.find_first_of(" \t\r", 1);
+        keyword_counts[upper_line.substr(1, end == std::string::npos ? end : end - 1)]++;
+    }
+
+    void add_node(const Node& node) {
+        if (node_count == 0) {
+            bbox_min = {{node.x, node.y, node.z}};
+            bbox_max = bbox_min;
+            node_id_min = node_id_max = node.nid;
+        } else {
+            bbox_min[0] = std::min(bbox_min[0], node.x);
+            bbox_min[1] = std::min(bbox_min[1], node.y);
+            bbox_min[2] = std::min(bbox_min[2], node.z);
+            bbox_max[0] = std::max(bbox_max[0], node.x);
+            bbox_max[1] = std::max(bbox_max[1], node.y);
+            bbox_max[2] = std::max(bbox_max[2], node.z);
+            node_id_min = std::min(node_id_min, node.nid);
+            node_id_max = std::max(node_id_max, node.nid);
+        }
+        ++node_count;
+    }
+
+    void add_part(const Part& part) {
+        if (part_count == 0) {
+            part_id_min = part_id_max = part.pid;
+        } else {
+            part_id_min = std::min(part_id_min, part.pid);
+            part_id_max = std::max(part_id_max, part.pid);
+        }
+        ++part_count;
+    }
+
+    void add_element(const Element& elem) {
+        if (element_count() == 0) {
+            element_id_min = element_id_max = elem.eid;
+        } else {
+            element_id_min = std::min(element_id_min, elem.eid);
+            element_id_max = std::max(element_id_max, elem.eid);
+        }
+        part_element_counts[elem.pid]++;
+
+        switch (elem.type) {
+            case ElementType::SHELL: {
+                ++shell_count;
+                int distinct = count_distinct(elem, 4);
+                if (distinct == 3) ++tri_count;
+                else if (distinct == 4) ++quad_count;
+                break;
+            }
+            case ElementType::SOLID: {
+                ++solid_count;
+                int distinct = count_distinct(elem, 8);
+                if (distinct == 4) ++tet_count;
+                else if (distinct == 6) ++penta_count;
+                else if (distinct == 8) ++hex_count;
+                break;
+            }
+            case ElementType::BEAM:
+                ++beam_count;
+                break;
+        }
+    }
+
+private:
+    // Number of distinct non-zero node IDs among the first n corner nodes
+    static int count_distinct(const Element& elem, int n) {
+        int distinct = 0;
+        for (int i = 0; i < n; ++i) {
+            int32_t nid = elem.nodes[i];
+            if (nid <= 0) continue;
+            bool seen = false;
+            for (int j = 0; j < i; ++j) {
+                if (elem.nodes[j] == nid) { seen = true; break; }
+            }
+            if (!seen) ++distinct;
+        }
+        return distinct;
+    }
+};
+
+} // namespace kfile
@@ -839,6 +839,111 @@ $#    lcid        sf    lciddr        xc        yc        zc       cid
     print("\n✓ LOAD 파싱 테스트 통과")
 
 
+def test_model_stats():
+    """ModelStats 파싱 중 통계 테스트"""
+    print("\n=== ModelStats 테스트 ===")
+
+    from kfile_parser import KFileParser
+
+    kfile_content = """*KEYWORD
+*NODE
+      10       0.000000       0.000000       0.000000       0       0
+      11       1.000000       0.000000       0.000000       0       0
+      12       1.000000       2.000000       0.000000       0       0
+      13       0.000000       2.000000      -3.000000       0       0
+*NODE
+      14       5.000000       0.000000       0.000000       0       0
+*PART
+Shell Part
+         7         1       100         0         0         0         0         0
+*PART
+Beam Part
+         3         2       100         0         0         0         0         0
+*ELEMENT_SHELL
+     200       7      10      11      12      13
+     201       7      10      11      12      12
+*ELEMENT_SOLID
+     150       7      10      11      12      10      13      13      13      13
+*ELEMENT_BEAM
+     300       3      10      14
+*END
+"""
+
+    parser = KFileParser()
+    result = parser.parse_string(kfile_content)
+    stats = result.model_stats
+
+    print(f"  키워드: {stats.keyword_counts}")
+    print(f"  파트별 엘리먼트: {stats.part_element_counts}")
+    print(f"  BBox: {stats.bbox_min} ~ {stats.bbox_max}")
+
+    assert stats.node_count == 5, f"노드 수가 맞지 않음: {stats.node_count}"
+    assert stats.part_count == 2, f"파트 수가 맞지 않음: {stats.part_count}"
+    assert stats.keyword_counts.get('NODE') == 2, f"NODE 키워드 수가 맞지 않음: {stats.keyword_counts}"
+    assert stats.keyword_counts.get('PART') == 2, f"PART 키워드 수가 맞지 않음: {stats.keyword_counts}"
+    assert stats.element_type_counts == {'shell': 2, 'solid': 1, 'beam': 1}, \
+        f"타입별 엘리먼트 수가 맞지 않음: {stats.element_type_counts}"
+    assert stats.quad_count == 1 and stats.tri_count == 1, \
+        f"Shell 형상 수가 맞지 않음: quad={stats.quad_count}, tri={stats.tri_count}"
+    assert stats.tet_count == 1, f"Tet 수가 맞지 않음: {stats.tet_count}"
+    assert stats.part_element_counts == {7: 3, 3: 1}, f"파트별 엘리먼트 수가 맞지 않음: {stats.part_element_counts}"
+    assert stats.bbox_min == (0.0, 0.0, -3.0), f"BBox min이 맞지 않음: {stats.bbox_min}"
+    assert stats.bbox_max == (5.0, 2.0, 0.0), f"BBox max가 맞지 않음: {stats.bbox_max}"
+    assert stats.node_id_range == (10, 14), f"노드 ID 범위가 맞지 않음: {stats.node_id_range}"
+    assert stats.element_id_range == (150, 300), f"엘리먼트 ID 범위가 맞지 않음: {stats.element_id_range}"
+    assert stats.part_id_range == (3, 7), f"파트 ID 범위가 맞지 않음: {stats.part_id_range}"
+
+    print("\n✓ ModelStats 테스트 통과")
+
+
+def test_model_stats_backends_agree():
+    """C++/Python 폴백 ModelStats 일치 (빈 칸 노드 0은 서로 다른 노드로 세지 않음)"""
+    print("\n=== ModelStats 백엔드 비교 테스트 ===")
+
+    from kfile_parser import KFileParser, is_cpp_available
+
+    kfile_content = """*KEYWORD
+*NODE
+       1       0.000000       0.000000       0.000000       0       0
+       2       1.000000       0.000000       0.000000       0       0
+       3       1.000000       1.000000       0.000000       0       0
+       4       0.000000       1.000000       0.000000       0       0
+       5       0.000000       0.000000       1.000000       0       0
+       6       1.000000       0.000000       1.000000       0       0
+*PART
+Mixed Part
+         1         1       100         0         0         0         0         0
+*ELEMENT_SHELL
+       1       1       1       2       3       0
+       2       1       1       2       3       4
+       3       1       1       2       3       3
+*ELEMENT_SOLID
+      10       1       1       2       3       5       0       0       0       0
+      11       1       1       2       3       3       5       6       4       4
+*END
+"""
+
+    parser = KFileParser()
+    python_stats = parser._parse_string_python(kfile_content).model_stats
+    assert (python_stats.tri_count, python_stats.quad_count) == (2, 1), \
+        f"Shell 형상 수가 맞지 않음: tri={python_stats.tri_count}, quad={python_stats.quad_count}"
+    assert (python_stats.tet_count, python_stats.penta_count) == (1, 1), \
+        f"Solid 형상 수가 맞지 않음: tet={python_stats.tet_count}, penta={python_stats.penta_count}"
+
+    if not is_cpp_available():
+        print("  C++ 파서 없음 - Python 결과만 확인")
+        return
+
+    cpp_stats = parser.parse_string(kfile_content).model_stats
+    for name in ('node_count', 'part_count', 'shell_count', 'solid_count', 'tri_count', 'quad_count',
+                 'tet_count', 'penta_count', 'hex_count', 'part_element_counts', 'node_id_range',
+                 'element_id_range', 'bbox_min', 'bbox_max'):
+        assert getattr(cpp_stats, name) == getattr(python_stats, name), \
+            f"{name}: C++ {getattr(cpp_stats, name)} != Python {getattr(python_stats, name)}"
+
+    print("\n✓ ModelStats 백엔드 비교 테스트 통과")
+
+
 if __name__ == "__main__":
     test_python_fallback()
     test_string_parsing()
@@ -855,5 +960,7 @@ if __name__ == "__main__":
     test_boundary_spc_parsing()
     test_boundary_motion_parsing()
     test_load_parsing()
+    test_model_stats()
+    test_model_stats_backends_agree()
     test_koodynak_compat()
     print("\n=== 모든 테스트 완료 ===")
@@ -0,0 +1,337 @@
+"""Memory registry - 캐시 메모리 사용량 집계 및 예산 관리
+
+모델 lazy 목록, 파생 지오메트리 캐시, RenderCache, VBO, Undo 히스토리 등
+메모리를 점유하는 캐시가 자신의 크기를 등록합니다.
+
+- 전역 예산(budget)을 넘으면 재생성 가능한(rebuildable) 캐시를 LRU 순으로 해제
+- 재생성 불가 항목(VBO, Undo 히스토리 등)은 집계만 함. 캐시는 예산에서 이 항목들을
+  뺀 나머지 안에서 관리 (단, 최소 min_cache_fraction 만큼은 보장)
+- get_report()/format_report()로 점유량이 큰 순서대로 조회
+
+사용 예시:
+    from core.memory_registry import memory_registry
+
+    # push 방식: 크기 변화 시 update()
+    # owner를 지정하면 콜백은 owner를 인자로 받음 (레지스트리가 owner를 붙잡지 않도록)
+    consumer = memory_registry.register(
+        "geometry:exterior_faces", category="geometry",
+        evict=lambda cache: cache.invalidate("exterior_faces"), owner=cache)
+    consumer.update(nbytes)
+    consumer.touch()   # 사용 시각 갱신 (LRU)
+
+    # pull 방식: 조회 시 size_fn(owner) 호출
+    memory_registry.register("render_cache", category="gpu",
+                             size_fn=lambda rc: rc.memory_bytes, owner=render_cache)
+"""
+import sys
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+def estimate_nbytes(obj: Any, _depth: int = 0) -> int:
+    """객체 메모리 사용량 추정 (bytes)
+
+    numpy 배열은 정확히, 큰 컨테이너는 앞쪽 항목을 샘플링하여 추정합니다.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if _depth > 4:
+        return sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        total = sys.getsizeof(obj)
+        items = list(obj.items())
+        sample = items[:64]
+        if sample:
+            sampled = sum(estimate_nbytes(k, _depth + 1) + estimate_nbytes(v, _depth + 1)
+                          for k, v in sample)
+            total += sampled * len(items) // len(sample)
+        return total
+    if isinstance(obj, (list, tuple)):
+        total = sys.getsizeof(obj)
+        sample = obj[:64]
+        if sample:
+            sampled = sum(estimate_nbytes(v, _depth + 1) for v in sample)
+            total += sampled * len(obj) // len(sample)
+        return total
+    if hasattr(obj, '__dict__'):
+        return sys.getsizeof(obj) + estimate_nbytes(vars(obj), _depth + 1)
+    return sys.getsizeof(obj)
+
+
+def format_bytes(nbytes: int) -> str:
+    """사람이 읽기 쉬운 크기 문자열"""
+    size = float(nbytes)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024.0 or unit == 'GB':
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{int(size)} B"
+        size /= 1024.0
+
+
+class MemoryConsumer:
+    """메모리 점유 항목 (레지스트리가 생성)"""
+
+    def __init__(self, registry: 'MemoryRegistry', name: str, category: str,
+                 size_fn: Optional[Callable[..., int]], evict: Optional[Callable[..., Any]],
+                 owner: Any):
+        self.name = name
+        self.category = category
+        self.last_used = time.monotonic()
+
+        self._registry = registry
+        self._size_fn = size_fn
+        self._evict = evict
+        self._nbytes = 0
+        self._owner_ref = weakref.ref(owner) if owner is not None else None
+
+    @property
+    def rebuildable(self) -> bool:
+        """예산 초과 시 해제 가능 여부"""
+        return self._evict is not None
+
+    @property
+    def alive(self) -> bool:
+        """소유 객체가 살아있는지 (owner 미지정 시 항상 True)"""
+        return self._owner_ref is None or self._owner_ref() is not None
+
+    def _call(self, fn: Callable):
+        """콜백 호출 - owner가 있으면 owner를 인자로 전달"""
+        if self._owner_ref is None:
+            return fn()
+        owner = self._owner_ref()
+        if owner is None:
+            return False
+        return fn(owner)
+
+    @property
+    def nbytes(self) -> int:
+        if self._size_fn is not None:
+            try:
+                return int(self._call(self._size_fn))
+            except Exception:
+                return 0
+        return self._nbytes
+
+    def update(self, nbytes: int):
+        """크기 갱신 (push 방식) - 증가 시 예산 확인"""
+        grew = nbytes > self._nbytes
+        self._nbytes = int(nbytes)
+        self.last_used = time.monotonic()
+        if grew:
+            self._registry.enforce_budget(exclude=self)
+
+    def touch(self):
+        """사용 시각 갱신 (LRU)"""
+        self.last_used = time.monotonic()
+
+    def evict(self) -> bool:
+        """캐시 해제 - evict 콜백이 False를 반환하면 해제 거부"""
+        if self._evict is None:
+            return False
+        if self._call(self._evict) is False:
+            return False
+        if self._size_fn is None:
+            self._nbytes = 0
+        return True
+
+    def unregister(self):
+        self._registry.unregister(self)
+
+
+class MemoryRegistry:
+    """전역 메모리 집계 및 예산 관리 (스레드 안전)"""
+
+    # 재생성 불가 항목만으로 예산을 넘어도 캐시에 남겨두는 최소 비율
+    # (0이면 모든 캐시를 해제 - 접근할 때마다 재계산되어 반복 해제/생성)
+    MIN_CACHE_FRACTION = 0.25
+
+    def __init__(self, budget_bytes: int = 0,
+                 min_cache_fraction: float = MIN_CACHE_FRACTION):
+        """
+        Args:
+            budget_bytes: 전역 예산 (0이면 무제한)
+            min_cache_fraction: 재생성 가능한 캐시에 항상 허용하는 예산 비율
+        """
+        self._consumers: List[MemoryConsumer] = []
+        self._budget = int(budget_bytes)
+        self._min_cache_fraction = min_cache_fraction
+        self._lock = threading.RLock()
+        self._eviction_count = 0
+        self._evicted_bytes = 0
+
+    # ========== 등록 ==========
+
+    def register(self, name: str, category: str = "other",
+                 size_fn: Optional[Callable[..., int]] = None,
+                 evict: Optional[Callable[..., Any]] = None,
+                 owner: Any = None) -> MemoryConsumer:
+        """메모리 점유 항목 등록
+
+        Args:
+            name: 표시 이름
+            category: 분류 (model, geometry, gpu, undo 등)
+            size_fn: 크기 조회 함수 (None이면 update()로 갱신)
+            evict: 해제 콜백 (None이면 재생성 불가 - 집계만, False 반환 시 해제 거부)
+            owner: 소유 객체 (약한 참조, 해제되면 자동 등록 해제).
+                지정하면 size_fn/evict는 owner를 인자로 받습니다.
+        """
+        consumer = MemoryConsumer(self, name, category, size_fn, evict, owner)
+        with self._lock:
+            self._consumers.append(consumer)
+        return consumer
+
+    def unregister(self, consumer: MemoryConsumer):
+        with self._lock:
+            if consumer in self._consumers:
+                self._consumers.remove(consumer)
+
+    def unregister_owner(self, owner: Any):
+        """owner가 등록한 모든 항목 해제"""
+        with self._lock:
+            self._consumers = [c for c in self._consumers
+                               if c._owner_ref is None or c._owner_ref() is not owner]
+
+    def _live_consumers(self) -> List[MemoryConsumer]:
+        with self._lock:
+            self._consumers = [c for c in self._consumers if c.alive]
+            return list(self._consumers)
+
+    # ========== 예산 ==========
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget
+
+    @budget_bytes.setter
+    def budget_bytes(self, value: int):
+        self._budget = max(0, int(value))
+        self.enforce_budget()
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(c.nbytes for c in self._live_consumers())
+
+    def cache_allowance(self, pinned_bytes: int) -> int:
+        """재생성 가능한 캐시에 허용되는 바이트 수
+
+        예산에서 재생성 불가 항목(pinned)을 뺀 나머지. 재생성 불가 항목만으로
+        예산을 넘으면 캐시를 해제해도 예산을 맞출 수 없으므로 최소 비율은 남겨둡니다.
+        """
+        if self._budget <= 0:
+            return -1
+        floor = int(self._budget * self._min_cache_fraction)
+        return max(self._budget - pinned_bytes, floor)
+
+    def enforce_budget(self, exclude: Optional[MemoryConsumer] = None) -> int:
+        """캐시 사용량이 허용량을 넘으면 재생성 가능한 캐시를 LRU 순으로 해제
+
+        재생성 불가 항목은 해제할 수 없으므로 재생성 가능한 항목의 합계만
+        cache_allowance()와 비교합니다.
+        evict 콜백은 레지스트리 락 밖에서 호출합니다 (캐시 락과의 교착 방지).
+
+        Args:
+            exclude: 해제 대상에서 제외할 항목 (방금 갱신한 항목 등)
+
+        Returns:
+            해제한 바이트 수
+        """
+        if self._budget <= 0:
+            return 0
+
+        consumers = self._live_consumers()
+        sizes = {id(c): c.nbytes for c in consumers}
+        pinned = sum(sizes[id(c)] for c in consumers if not c.rebuildable)
+        evictable = sum(sizes[id(c)] for c in consumers if c.rebuildable)
+        excess = evictable - self.cache_allowance(pinned)
+        if excess <= 0:
+            return 0
+
+        candidates = sorted(
+            (c for c in consumers if c.rebuildable and c is not exclude and sizes[id(c)] > 0),
+            key=lambda c: c.last_used
+        )
+
+        freed = 0
+        for consumer in candidates:
+            if freed >= excess:
+                break
+            nbytes = sizes[id(consumer)]
+            if consumer.evict():
+                freed += nbytes
+                with self._lock:
+                    self._eviction_count += 1
+                    self._evicted_bytes += nbytes
+                print(f"[Memory] Evicted {consumer.name} ({format_bytes(nbytes)})")
+        return freed
+
+    # ========== 진단 ==========
+
+    def get_report(self) -> List[Dict[str, Any]]:
+        """점유 항목 목록 (큰 순서)"""
+        now = time.monotonic()
+        report = [
+            {
+                'name': c.name,
+                'category': c.category,
+                'bytes': c.nbytes,
+                'rebuildable': c.rebuildable,
+                'idle_s': now - c.last_used,
+            }
+            for c in self._live_consumers()
+        ]
+        report.sort(key=lambda r: r['bytes'], reverse=True)
+        return report
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전체 통계 (카테고리별 합계 포함)"""
+        report = self.get_report()
+        by_category: Dict[str, int] = {}
+        for item in report:
+            by_category[item['category']] = by_category.get(item['category'], 0) + item['bytes']
+        total = sum(item['bytes'] for item in report)
+        pinned = sum(item['bytes'] for item in report if not item['rebuildable'])
+        return {
+            'total_bytes': total,
+            'pinned_bytes': pinned,
+            'cache_bytes': total - pinned,
+            'cache_allowance_bytes': max(self.cache_allowance(pinned), 0),
+            'budget_bytes': self._budget,
+            'usage_percent': (total / self._budget) * 100 if self._budget > 0 else 0,
+            'consumers': len(report),
+            'by_category': by_category,
+            'evictions': self._eviction_count,
+            'evicted_bytes': self._evicted_bytes,
+        }
+
+    def format_report(self, limit: int = 30) -> str:
+        """진단용 텍스트 리포트"""
+        stats = self.get_stats()
+        budget = format_bytes(stats['budget_bytes']) if stats['budget_bytes'] else "무제한"
+        lines = [
+            f"전체: {format_bytes(stats['total_bytes'])} / 예산: {budget}",
+            f"캐시: {format_bytes(stats['cache_bytes'])}"
+            + (f" / 허용: {format_bytes(stats['cache_allowance_bytes'])}"
+               if stats['budget_bytes'] else "")
+            + f"  (고정: {format_bytes(stats['pinned_bytes'])})",
+            f"해제 횟수: {stats['evictions']} ({format_bytes(stats['evicted_bytes'])})",
+            "",
+            "카테고리별:",
+        ]
+        for category, nbytes in sorted(stats['by_category'].items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {category:<10} {format_bytes(nbytes):>10}")
+
+        lines.extend(["", "항목별:"])
+        report = self.get_report()
+        for item in report[:limit]:
+            flag = "R" if item['rebuildable'] else " "
+            lines.append(f"  [{flag}] {format_bytes(item['bytes']):>10}  {item['category']:<10} {item['name']}")
+        if len(report) > limit:
+            lines.append(f"  ... 외 {len(report) - limit}개")
+        return "\n".join(lines)
+
+
+# 전역 레지스트리 (예산은 AppContext가 설정에서 적용)
+memory_registry = MemoryRegistry()
@@ -0,0 +1,467 @@
+"""Parsed model data - K-file 파싱 결과와 모델 단위 저장소/캐시
+
+UI와 무관한 모델 데이터 계층입니다 (Qt/OpenGL을 import하지 않음).
+GUI(AppContext)와 headless 파이프라인(core.pipeline)이 함께 사용합니다.
+"""
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Callable
+from pathlib import Path
+import time
+
+from .geometry_cache import GeometryCache
+from .memory_registry import memory_registry, estimate_nbytes
+from .model_store import ModelStore, NodeView, RowList
+
+# C++ 파서 가용성 확인
+try:
+    from .KooDynaKeyword import KFileReader, is_fast_parser_available
+    _KFILE_READER_AVAILABLE = is_fast_parser_available()
+except ImportError:
+    _KFILE_READER_AVAILABLE = False
+    KFileReader = None
+
+# 기본 Python 파서 (fallback)
+from .k_file_parser import KFileParser as BasicKFileParser
+
+
+@dataclass
+class ParsedModelData:
+    """파싱된 K-file 모델 데이터를 저장하는 클래스
+
+    모든 모듈에서 공유하는 중앙 데이터 저장소입니다.
+    C++ 파서로 파싱한 결과를 캐시하여 재파싱을 방지합니다.
+    """
+
+    # 파일 정보
+    filepath: str = ""
+    filename: str = ""
+    parse_time_ms: float = 0.0
+
+    # 기본 통계
+    node_count: int = 0
+    element_count: int = 0
+    part_count: int = 0
+
+    # KFileReader 인스턴스 (C++ 파서 결과)
+    _reader: Optional['KFileReader'] = None
+
+    # 노드/요소/Set/Part/Section/Contact/Material 저장소 (lazy loading)
+    _store: Optional[ModelStore] = field(default=None, repr=False, compare=False)
+
+    # 캐시된 데이터 (lazy loading)
+    _controls_cache: Optional[Dict] = None
+    _databases_cache: Optional[Dict] = None
+    _boundaries_cache: Optional[Dict] = None
+    _loads_cache: Optional[Dict] = None
+    _initials_cache: Optional[Dict] = None
+    _constraineds_cache: Optional[Dict] = None
+
+    # 편집 리비전 (증가하면 파생 지오메트리 캐시가 무효화됨)
+    revision: int = 0
+
+    # 파생 지오메트리 캐시 (모델 단위, __post_init__에서 생성)
+    _geometry: Optional[GeometryCache] = field(default=None, repr=False, compare=False)
+
+    # C++ 파서 구조체 크기 (node.hpp / element.hpp, 메모리 추정용)
+    _CPP_NODE_BYTES = 40
+    _CPP_ELEMENT_BYTES = 44
+
+    def __post_init__(self):
+        self._geometry = GeometryCache(self)
+
+    def _register_memory(self):
+        """메모리 집계 등록 (파싱 결과가 연결된 뒤 parse_k_file에서 호출)
+
+        빈 ParsedModelData() 자리표시자는 등록하지 않습니다.
+        엔티티 목록은 편집 대상 객체를 담고 있으므로 해제(evict)하지 않습니다.
+        """
+        name = self.filename or '-'
+        memory_registry.register(f"model:{name} parsed", category="model",
+                                 size_fn=lambda m: m._parsed_nbytes(), owner=self)
+        memory_registry.register(f"model:{name} entity lists", category="model",
+                                 size_fn=lambda m: m._lazy_cache_nbytes(), owner=self)
+
+    @property
+    def is_loaded(self) -> bool:
+        """모델이 로드되었는지 확인"""
+        return self._reader is not None
+
+    @property
+    def reader(self) -> Optional['KFileReader']:
+        """KFileReader 인스턴스 직접 접근"""
+        return self._reader
+
+    # ========== 열 기반 저장소 ==========
+    @property
+    def store(self) -> ModelStore:
+        """노드/요소/Set/Part 등의 열 기반 저장소 (lazy 생성)"""
+        if self._store is None:
+            self.build_store()
+        return self._store
+
+    def build_store(self, on_table: Optional[Callable[[str, int], None]] = None) -> ModelStore:
+        """파싱 결과로 저장소 생성 (on_table: 노드/요소 열 준비 알림, ModelStore.from_parsed 참고)"""
+        parsed = self._reader._parsed if self._reader else None
+        self._store = ModelStore.from_parsed(parsed, on_table=on_table)
+        return self._store
+
+    def restore_store(self, columns: Dict[str, Dict[str, Any]]):
+        """저장해 둔 노드/요소 열로 저장소 생성 (워크스페이스 디스크 캐시)"""
+        parsed = self._reader._parsed if self._reader else None
+        self._store = ModelStore.from_parsed(parsed, columns)
+
+    # ========== 노드 ==========
+    @property
+    def nodes(self) -> RowList:
+        """노드 목록 (저장소 행 프록시 NodeView)"""
+        return self.store.node_list
+
+    def get_node_by_id(self, nid: int):
+        """ID로 노드 검색"""
+        row = self.store.nodes.row_of(nid)
+        return NodeView(self.store.nodes, row) if row >= 0 else None
+
+    # ========== 파트 ==========
+    @property
+    def parts(self) -> List:
+        """파트 목록"""
+        return self.store.parts
+
+    def get_part_by_id(self, pid: int):
+        """ID로 파트 검색"""
+        return self.store.parts.get(pid)
+
+    def get_part_ids(self) -> List[int]:
+        """파트 ID 목록"""
+        return [p.pid for p in self.parts]
+
+    # ========== 요소 ==========
+    @property
+    def elements(self) -> Dict[str, RowList]:
+        """요소 목록 (타입별 딕셔너리, 저장소 행 프록시 ElementView)"""
+        return self.store.element_lists
+
+    @property
+    def shells(self) -> RowList:
+        return self.elements['shell']
+
+    @property
+    def solids(self) -> RowList:
+        return self.elements['solid']
+
+    @property
+    def beams(self) -> RowList:
+        return self.elements['beam']
+
+    # ========== 세트 ==========
+    @property
+    def sets(self) -> List:
+        """세트 목록 (멤버 ids는 int64 배열)"""
+        return self.store.sets
+
+    # ========== 섹션 ==========
+    @property
+    def sections(self) -> List:
+        """섹션 목록"""
+        return self.store.sections
+
+    # ========== 접촉 ==========
+    @property
+    def contacts(self) -> List:
+        """접촉 목록"""
+        return self.store.contacts
+
+    # ========== 재료 ==========
+    @property
+    def materials(self) -> List:
+        """재료 목록"""
+        return self.store.materials
+
+    # ========== 컨트롤 ==========
+    @property
+    def controls(self) -> Dict:
+        """컨트롤 키워드"""
+        if self._controls_cache is None and self._reader:
+            parsed = self._reader._parsed
+            if parsed:
+                self._controls_cache = {
+                    'termination': list(parsed.control_terminations),
+                    'timestep': list(parsed.control_timesteps),
+                    'energy': list(parsed.control_energies),
+                    'output': list(parsed.control_outputs),
+                    'shell': list(parsed.control_shells),
+                    'contact': list(parsed.control_contacts),
+                    'hourglass': list(parsed.control_hourglasses),
+                    'bulk_viscosity': list(parsed.control_bulk_viscosities),
+                }
+            else:
+                self._controls_cache = {}
+        return self._controls_cache or {}
+
+    # ========== 데이터베이스 ==========
+    @property
+    def databases(self) -> Dict:
+        """데이터베이스 출력 설정"""
+        if self._databases_cache is None and self._reader:
+            parsed = self._reader._parsed
+            if parsed:
+                self._databases_cache = {
+                    'binary': list(parsed.database_binaries),
+                    'ascii': list(parsed.database_asciis),
+                    'history_node': list(parsed.database_history_nodes),
+                    'history_element': list(parsed.database_history_elements),
+                    'cross_section': list(parsed.database_cross_sections),
+                }
+            else:
+                self._databases_cache = {}
+        return self._databases_cache or {}
+
+    # ========== 경계조건 ==========
+    @property
+    def boundaries(self) -> Dict:
+        """경계조건"""
+        if self._boundaries_cache is None and self._reader:
+            parsed = self._reader._parsed
+            if parsed:
+                self._boundaries_cache = {
+                    'spc': list(parsed.boundary_spcs),
+                    'motion': list(parsed.boundary_motions),
+                }
+            else:
+                self._boundaries_cache = {}
+        return self._boundaries_cache or {}
+
+    # ========== 하중 ==========
+    @property
+    def loads(self) -> Dict:
+        """하중 조건"""
+        if self._loads_cache is None and self._reader:
+            parsed = self._reader._parsed
+            if parsed:
+                self._loads_cache = {
+                    'node': list(parsed.load_nodes),
+                    'segment': list(parsed.load_segments),
+                    'body': list(parsed.load_bodies),
+                }
+            else:
+                self._loads_cache = {}
+        return self._loads_cache or {}
+
+    # ========== 초기조건 ==========
+    @property
+    def initials(self) -> Dict:
+        """초기조건"""
+        if self._initials_cache is None and self._reader:
+            parsed = self._reader._parsed
+            if parsed:
+                self._initials_cache = {
+                    'velocity': list(parsed.initial_velocities),
+                    'stress': list(parsed.initial_stresses),
+                }
+            else:
+                self._initials_cache = {}
+        return self._initials_cache or {}
+
+    # ========== 구속조건 ==========
+    @property
+    def constraineds(self) -> Dict:
+        """구속조건"""
+        if self._constraineds_cache is None and self._reader:
+            parsed = self._reader._parsed
+            if parsed:
+                self._constraineds_cache = {
+                    'rigid_body': list(parsed.constrained_nodal_rigid_bodies),
+                    'joint': list(parsed.constrained_joints),
+                    'spotweld': list(parsed.constrained_spotwelds),
+                }
+            else:
+                self._constraineds_cache = {}
+        return self._constraineds_cache or {}
+
+    # ========== 파생 지오메트리 ==========
+    @property
+    def geometry(self) -> GeometryCache:
+        """공유 파생 지오메트리 캐시 (MeshData, 외곽면, bbox, 법선 등)"""
+        return self._geometry
+
+    def release(self):
+        """모델 교체 시 파생 캐시 및 메모리 등록 해제"""
+        self._geometry.release()
+        memory_registry.unregister_owner(self)
+
+    @property
+    def memory_bytes(self) -> int:
+        """모델 전체 추정 메모리 (C++ 결과 + 엔티티 목록 + 파생 지오메트리)"""
+        return self._parsed_nbytes() + self._lazy_cache_nbytes() + self._geometry.memory_bytes
+
+    def _parsed_nbytes(self) -> int:
+        """C++ 파싱 결과 추정 크기 (노드/요소 구조체 기준)"""
+        stats = self.model_stats
+        if stats is None:
+            return 0
+        return (stats.node_count * self._CPP_NODE_BYTES
+                + stats.element_count * self._CPP_ELEMENT_BYTES)
+
+    def _lazy_cache_nbytes(self) -> int:
+        """lazy 캐시된 엔티티 목록 추정 크기"""
+        caches = (
+            self._controls_cache, self._databases_cache,
+            self._boundaries_cache, self._loads_cache, self._initials_cache,
+            self._constraineds_cache,
+        )
+        store_bytes = self._store.nbytes if self._store is not None else 0
+        return store_bytes + sum(estimate_nbytes(c) for c in caches if c is not None)
+
+    def mark_modified(self):
+        """모델 편집 알림 - 파생 지오메트리 캐시 무효화
+
+        저장소와 lazy 목록은 편집된 데이터를 담고 있으므로 유지합니다.
+        """
+        self.revision += 1
+
+    # ========== 통계 ==========
+    @property
+    def model_stats(self):
+        """파싱 중 계산된 모델 통계 (lazy 캐시를 건드리지 않음)"""
+        if self._reader:
+            return self._reader.model_stats
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """모델 통계 정보
+
+        파서가 계산한 ModelStats가 있으면 노드/요소 목록을 만들지 않고 반환합니다.
+        """
+        stats = self.model_stats
+        if stats is not None:
+            return {
+                'filepath': self.filepath,
+                'filename': self.filename,
+                'parse_time_ms': self.parse_time_ms,
+                'nodes': stats.node_count,
+                'parts': stats.part_count,
+                'elements': {
+                    'shell': stats.shell_count,
+                    'solid': stats.solid_count,
+                    'beam': stats.beam_count,
+                    'total': stats.element_count,
+                },
+                'sets': stats.set_count,
+                'sections': stats.section_count,
+                'contacts': stats.contact_count,
+                'materials': stats.material_count,
+                'keywords': dict(stats.keyword_counts),
+                'element_shapes': stats.element_shape_counts,
+                'part_elements': dict(stats.part_element_counts),
+                'bbox': (stats.bbox_min, stats.bbox_max),
+                'id_ranges': {
+                    'node': stats.node_id_range,
+                    'element': stats.element_id_range,
+                    'part': stats.part_id_range,
+                },
+            }
+
+        return {
+            'filepath': self.filepath,
+            'filename': self.filename,
+            'parse_time_ms': self.parse_time_ms,
+            'nodes': len(self.nodes),
+            'parts': len(self.parts),
+            'elements': {
+                'shell': len(self.shells),
+                'solid': len(self.solids),
+                'beam': len(self.beams),
+                'total': len(self.shells) + len(self.solids) + len(self.beams),
+            },
+            'sets': len(self.sets),
+            'sections': len(self.sections),
+            'contacts': len(self.contacts),
+            'materials': len(self.materials),
+        }
+
+    def clear_cache(self, keep_store: bool = False):
+        """캐시 초기화
+
+        Args:
+            keep_store: 열 기반 저장소 유지 (다시 만들려면 Python 반복이 필요)
+        """
+        if not keep_store:
+            self._store = None
+        self._controls_cache = None
+        self._databases_cache = None
+        self._boundaries_cache = None
+        self._loads_cache = None
+        self._initials_cache = None
+        self._constraineds_cache = None
+
+
+def parse_k_file(path: str, use_fast_parser: bool = True,
+                 basic_parser: Optional[BasicKFileParser] = None) -> Optional[ParsedModelData]:
+    """K파일을 파싱하여 ParsedModelData 생성
+
+    UI 상태를 건드리지 않으므로 워커 스레드에서도 호출할 수 있습니다.
+
+    Args:
+        path: K-file 경로
+        use_fast_parser: C++ 고속 파서 사용 여부 (기본: True)
+        basic_parser: fallback용 기본 파서 (없으면 새로 생성)
+
+    Returns:
+        ParsedModelData, 파일이 없으면 None
+    """
+    filepath = Path(path)
+    if not filepath.exists():
+        return None
+
+    if use_fast_parser and _KFILE_READER_AVAILABLE:
+        # C++ 고속 파서 사용
+        start = time.perf_counter()
+
+        reader = KFileReader(
+            str(path),
+            parse_nodes=True,
+            parse_parts=True,
+            parse_elements=True,
+            parse_sets=True,
+            parse_sections=True,
+            parse_contacts=True,
+            parse_materials=True,
+            parse_includes=True,
+            parse_curves=True,
+            parse_boundaries=True,
+            parse_loads=True,
+            parse_controls=True,
+            parse_databases=True,
+            parse_initials=True,
+            parse_constraineds=True,
+        )
+
+        elapsed = (time.perf_counter() - start) * 1000
+
+        # 모델 데이터 저장
+        model = ParsedModelData(
+            filepath=str(path),
+            filename=filepath.name,
+            parse_time_ms=elapsed,
+        )
+        # _reader를 별도로 설정 (dataclass 생성자에서 underscore 필드 처리 문제 회피)
+        model._reader = reader
+        model._register_memory()
+
+        # 통계 업데이트 (파싱 중 계산된 값 사용)
+        stats = reader.model_stats
+        model.node_count = stats.node_count
+        model.element_count = stats.element_count
+        model.part_count = stats.part_count
+        return model
+
+    # 기본 Python 파서 사용 (Part ID만)
+    if basic_parser is None:
+        basic_parser = BasicKFileParser()
+    part_ids = basic_parser.parse(str(path))
+
+    return ParsedModelData(
+        filepath=str(path),
+        filename=filepath.name,
+        part_count=len(part_ids),
+    )
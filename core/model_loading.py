@@ -0,0 +1,87 @@
+"""Staged model loading - K-file 단계별 로드 (Qt 비의존)
+
+gui.model_loader.ModelLoader(QThread)가 워커 스레드에서 호출하는 로드 절차입니다.
+각 단계의 데이터가 실제로 준비되는 시점에 emit(stage, *args)로 알립니다.
+
+단계 (순서대로):
+    'parts'     (List[PartHeader])  - 키워드 스캔으로 얻은 파트 목록 (전체 파싱 전)
+    'nodes'     (int)               - 노드 열 생성 완료, 노드 수
+    'elements'  (int)               - 요소 열 생성 완료, 요소 수
+    'geometry'  (MeshData)          - 렌더링용 지오메트리 생성 완료 (build_geometry=True)
+    'progress'  (str, int)          - 진행 메시지, 0-100 (단계 사이사이)
+
+취소는 단계 경계마다 is_cancelled()로 확인하며, 취소되면 LoadCancelled를 던집니다.
+"""
+from pathlib import Path
+from typing import Callable
+
+from .k_file_parser import scan_parts
+from .model_data import ParsedModelData, parse_k_file
+
+
+class LoadCancelled(Exception):
+    """로드 취소 시 단계 경계에서 발생"""
+    pass
+
+
+def load_model_staged(path: str,
+                      emit: Callable[..., None],
+                      is_cancelled: Callable[[], bool] = lambda: False,
+                      use_fast_parser: bool = True,
+                      build_geometry: bool = True) -> ParsedModelData:
+    """K-file을 단계별로 로드
+
+    Args:
+        path: K-file 경로
+        emit: 단계 알림 콜백 (stage, *args) - 모듈 docstring 참고
+        is_cancelled: 취소 여부 확인 콜백 (스레드 안전해야 함)
+        use_fast_parser: C++ 고속 파서 사용 여부
+        build_geometry: 렌더링용 MeshData까지 생성할지 여부
+
+    Returns:
+        ParsedModelData (저장소와 지오메트리 캐시가 채워진 상태)
+
+    Raises:
+        FileNotFoundError: 파일이 없을 때
+        LoadCancelled: 취소되었을 때
+    """
+    def check_cancelled():
+        if is_cancelled():
+            raise LoadCancelled()
+
+    if not Path(path).exists():
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+    # 1단계: *PART 키워드만 스캔 (파트 트리 먼저 표시)
+    emit('progress', "파트 스캔 중...", 5)
+    emit('parts', scan_parts(path))
+    check_cancelled()
+
+    # 2단계: 전체 파싱
+    emit('progress', "모델 파싱 중...", 15)
+    model = parse_k_file(path, use_fast_parser)
+    if model is None:
+        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+    check_cancelled()
+
+    if not model.is_loaded:
+        return model
+
+    # 3단계: 노드/요소 열 - 각 테이블이 만들어지는 즉시 알림
+    def on_table(name: str, count: int):
+        emit(name, count)
+        check_cancelled()
+        if name == 'nodes':
+            emit('progress', "요소 준비 중...", 75)
+
+    emit('progress', "노드 준비 중...", 60)
+    model.build_store(on_table=on_table)
+
+    # 4단계: 렌더링용 파생 지오메트리 (모델의 공유 캐시에 저장)
+    if build_geometry:
+        emit('progress', "지오메트리 생성 중...", 85)
+        mesh = model.geometry.mesh
+        check_cancelled()
+        emit('geometry', mesh)
+
+    return model
@@ -0,0 +1,870 @@
+"""Model store - 열 기반(columnar) 모델 저장소
+
+노드/요소는 필드별 numpy 배열(ColumnTable)로, Set 멤버는 Set별 정수 배열로,
+Part/Section/Material 등 소량 키워드는 레코드 테이블(RecordTable)로 보관합니다.
+Keyword Manager, Exporter, Model Viewer가 모두 이 저장소를 사용합니다.
+
+- 벡터화 수정: table.set(field, rows, values) - 이전 값을 반환 (Undo는 배열만 보관)
+- 추가/삭제: append(), 삭제는 tombstone 표시 후 compact()/maybe_compact()로 정리
+- 변경 추적: 행별 dirty 플래그, 추가/삭제 카운트, version 카운터
+- 기존 코드 호환: RowList(list처럼 동작)와 행 프록시(NodeView, ElementView)로
+  getattr/setattr, append/remove 기반 코드가 그대로 동작
+
+사용 예시:
+    store = model.store
+    rows = store.nodes.rows_of(node_ids)
+    old = store.nodes.set('xyz', rows, store.nodes.get('xyz', rows) + delta)
+
+    for node in model.nodes:          # NodeView (행 프록시)
+        print(node.nid, node.x)
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .memory_registry import estimate_nbytes
+
+
+# 요소 타입 코드 (C++ ElementType 순서와 동일)
+ELEMENT_TYPES = ('shell', 'solid', 'beam')
+ELEMENT_TYPE_CODES = {name: code for code, name in enumerate(ELEMENT_TYPES)}
+MAX_ELEMENT_NODES = 8
+
+NODE_FIELDS = {
+    'nid': (np.int64, 0),
+    'xyz': (np.float64, 3),
+    'tc': (np.int8, 0),
+    'rc': (np.int8, 0),
+}
+
+ELEMENT_FIELDS = {
+    'eid': (np.int64, 0),
+    'pid': (np.int32, 0),
+    'etype': (np.int8, 0),
+    'node_count': (np.int8, 0),
+    'nodes': (np.int32, MAX_ELEMENT_NODES),   # C++ 파서와 같은 32비트 노드 ID
+}
+
+
+class ColumnTable:
+    """열 기반 테이블 (행 = 엔티티)
+
+    - 필드별 numpy 배열 (용량은 2배씩 증가)
+    - 삭제는 tombstone(alive=False), compact()에서 실제 제거
+    - 행 핸들(handle): compact로 행 번호가 바뀌어도 유지되는 고유 번호
+      (Undo 명령과 행 프록시는 핸들로 행을 찾음)
+    """
+
+    MIN_CAPACITY = 1024
+
+    def __init__(self, id_field: str, fields: Dict[str, Tuple[Any, int]]):
+        """
+        Args:
+            id_field: ID 필드 이름 (nid, eid 등)
+            fields: {필드명: (dtype, 폭)} - 폭 0이면 1차원 열
+        """
+        self.id_field = id_field
+        self._fields = dict(fields)
+        self._data: Dict[str, np.ndarray] = {name: self._alloc(name, 0) for name in self._fields}
+        self._alive = np.zeros(0, dtype=bool)
+        self._dirty = np.zeros(0, dtype=bool)
+        self._handles = np.zeros(0, dtype=np.int64)
+        self._size = 0
+        self._tombstones = 0
+
+        self._next_handle = 0
+        self._handles_sorted = True
+        self._handle_order: Optional[np.ndarray] = None
+        self._id_index: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        # 변경 추적
+        self._added = 0
+        self._deleted = 0
+        self.version = 0        # 데이터 또는 행 구성이 바뀔 때 증가
+        self.generation = 0     # compact()로 행 번호가 바뀔 때 증가
+
+    def _alloc(self, name: str, capacity: int) -> np.ndarray:
+        dtype, width = self._fields[name]
+        shape = (capacity, width) if width else (capacity,)
+        return np.zeros(shape, dtype=dtype)
+
+    def load(self, columns: Dict[str, np.ndarray]):
+        """초기 데이터 설정 (파싱 결과 등, 기존 데이터는 버림)"""
+        count = len(columns[self.id_field])
+        for name in self._fields:
+            if name in columns:
+                dtype, _ = self._fields[name]
+                self._data[name] = np.ascontiguousarray(columns[name], dtype=dtype)
+            else:
+                self._data[name] = self._alloc(name, count)
+        self._alive = np.ones(count, dtype=bool)
+        self._dirty = np.zeros(count, dtype=bool)
+        self._handles = np.arange(count, dtype=np.int64)
+        self._size = count
+        self._tombstones = 0
+        self._next_handle = count
+        self._handles_sorted = True
+        self._invalidate_indices()
+        self.clear_changes()
+        self.version += 1
+        self.generation += 1
+
+    # ========== 조회 ==========
+
+    def __len__(self) -> int:
+        """살아있는 행 수"""
+        return self._size - self._tombstones
+
+    @property
+    def size(self) -> int:
+        """tombstone 포함 행 수"""
+        return self._size
+
+    @property
+    def tombstones(self) -> int:
+        return self._tombstones
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._fields)
+
+    def column(self, name: str) -> np.ndarray:
+        """필드 배열 (tombstone 포함, 읽기 전용으로 사용 - 수정은 set())"""
+        return self._data[name][:self._size]
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.column(self.id_field)
+
+    @property
+    def alive(self) -> np.ndarray:
+        return self._alive[:self._size]
+
+    def live_rows(self) -> np.ndarray:
+        """살아있는 행 번호 (행 순서 = 파일 순서)"""
+        if self._tombstones == 0:
+            return np.arange(self._size, dtype=np.intp)
+        return np.flatnonzero(self.alive)
+
+    def get(self, name: str, rows) -> np.ndarray:
+        """행들의 필드 값 (복사본)"""
+        return self._data[name][np.asarray(rows, dtype=np.intp)]
+
+    def rows_of(self, ids) -> np.ndarray:
+        """ID -> 행 번호 (없는 ID는 -1)
+
+        살아있는 행의 정렬된 ID 인덱스를 searchsorted로 조회합니다.
+        """
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        sorted_ids, rows = self._get_id_index()
+        if len(sorted_ids) == 0:
+            return np.full(len(ids), -1, dtype=np.intp)
+        pos = np.searchsorted(sorted_ids, ids)
+        pos[pos >= len(sorted_ids)] = 0
+        found = sorted_ids[pos] == ids
+        return np.where(found, rows[pos], -1)
+
+    def row_of(self, entity_id: int) -> int:
+        return int(self.rows_of([entity_id])[0])
+
+    def _get_id_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._id_index is None:
+            rows = self.live_rows()
+            ids = self.ids[rows]
+            order = np.argsort(ids, kind='stable')
+            self._id_index = (ids[order], rows[order])
+        return self._id_index
+
+    def row_values(self, row: int) -> Dict[str, Any]:
+        """한 행의 모든 필드 값 (복사본)"""
+        return {name: np.copy(self._data[name][row]) for name in self._fields}
+
+    # ========== 핸들 ==========
+
+    def handles_of(self, rows) -> np.ndarray:
+        return self._handles[np.asarray(rows, dtype=np.intp)]
+
+    def rows_for_handles(self, handles) -> np.ndarray:
+        """핸들 -> 행 번호 (compact로 제거된 행은 -1)"""
+        handles = np.asarray(handles, dtype=np.int64).ravel()
+        current = self._handles[:self._size]
+        if self._handles_sorted:
+            order = None
+            sorted_handles = current
+        else:
+            if self._handle_order is None:
+                self._handle_order = np.argsort(current, kind='stable')
+            order = self._handle_order
+            sorted_handles = current[order]
+
+        if len(sorted_handles) == 0:
+            return np.full(len(handles), -1, dtype=np.intp)
+        pos = np.searchsorted(sorted_handles, handles)
+        pos[pos >= len(sorted_handles)] = 0
+        found = sorted_handles[pos] == handles
+        rows = pos if order is None else order[pos]
+        return np.where(found, rows, -1)
+
+    # ========== 수정 ==========
+
+    def set(self, name: str, rows, values) -> np.ndarray:
+        """벡터화 수정
+
+        Returns:
+            이전 값 (Undo용)
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        column = self._data[name]
+        old = column[rows].copy()
+        column[rows] = values
+        self._dirty[rows] = True
+        if name == self.id_field:
+            self._id_index = None
+        self.version += 1
+        return old
+
+    def set_value(self, name: str, row: int, value, component: Optional[int] = None):
+        """단일 값 수정 (행 프록시 setattr용)"""
+        if component is None:
+            self._data[name][row] = value
+        else:
+            self._data[name][row, component] = value
+        self._dirty[row] = True
+        if name == self.id_field:
+            self._id_index = None
+        self.version += 1
+
+    def append(self, columns: Dict[str, Any], handles=None) -> np.ndarray:
+        """행 추가
+
+        Args:
+            columns: {필드명: 값 배열} - 없는 필드는 0
+            handles: 복원할 핸들 (삭제 Undo 시), None이면 새 핸들
+
+        Returns:
+            추가된 행 번호
+        """
+        count = len(np.atleast_1d(columns[self.id_field]))
+        self._reserve(count)
+        rows = np.arange(self._size, self._size + count, dtype=np.intp)
+
+        for name in self._fields:
+            if name in columns:
+                self._data[name][rows] = columns[name]
+            else:
+                self._data[name][rows] = 0
+        self._alive[rows] = True
+        self._dirty[rows] = True
+
+        if handles is None:
+            self._handles[rows] = np.arange(self._next_handle, self._next_handle + count)
+            self._next_handle += count
+        else:
+            handles = np.asarray(handles, dtype=np.int64)
+            self._handles[rows] = handles
+            last = self._handles[self._size - 1] if self._size else -1
+            if count and (handles.min() <= last or np.any(np.diff(handles) <= 0)):
+                self._handles_sorted = False
+
+        self._size += count
+        self._added += count
+        self._invalidate_indices()
+        self.version += 1
+        return rows
+
+    def delete(self, rows) -> np.ndarray:
+        """행 삭제 (tombstone 표시)
+
+        Returns:
+            실제로 삭제된 행 (정렬, 중복과 이미 삭제된 행 제외)
+        """
+        rows = np.unique(np.asarray(rows, dtype=np.intp))
+        rows = rows[self._alive[rows]]
+        self._alive[rows] = False
+        self._tombstones += len(rows)
+        self._deleted += len(rows)
+        self._id_index = None
+        self.version += 1
+        return rows
+
+    def undelete(self, rows) -> np.ndarray:
+        """tombstone 행 복원 (삭제 Undo)"""
+        rows = np.unique(np.asarray(rows, dtype=np.intp))
+        rows = rows[~self._alive[rows]]
+        self._alive[rows] = True
+        self._tombstones -= len(rows)
+        self._deleted -= len(rows)
+        self._id_index = None
+        self.version += 1
+        return rows
+
+    def compact(self) -> bool:
+        """tombstone 행 제거 (행 번호가 바뀜 - 핸들은 유지)"""
+        if self._tombstones == 0:
+            return False
+        keep = self.alive.copy()
+        new_size = int(keep.sum())
+        for name, column in self._data.items():
+            column[:new_size] = column[:self._size][keep]
+        self._dirty[:new_size] = self._dirty[:self._size][keep]
+        self._handles[:new_size] = self._handles[:self._size][keep]
+        self._alive[:new_size] = True
+        self._alive[new_size:] = False
+        self._size = new_size
+        self._tombstones = 0
+        self._invalidate_indices()
+        self.version += 1
+        self.generation += 1
+        return True
+
+    def maybe_compact(self, max_ratio: float = 0.25, min_rows: int = 1024) -> bool:
+        """tombstone 비율이 높으면 compact (주기적 정리)"""
+        if self._tombstones >= min_rows and self._tombstones > self._size * max_ratio:
+            return self.compact()
+        return False
+
+    def _reserve(self, count: int):
+        needed = self._size + count
+        capacity = len(self._alive)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, self.MIN_CAPACITY)
+        for name, column in self._data.items():
+            grown = self._alloc(name, new_capacity)
+            grown[:self._size] = column[:self._size]
+            self._data[name] = grown
+        for attr in ('_alive', '_dirty', '_handles'):
+            old = getattr(self, attr)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:self._size] = old[:self._size]
+            setattr(self, attr, grown)
+
+    def _invalidate_indices(self):
+        self._id_index = None
+        self._handle_order = None
+
+    # ========== 변경 추적 ==========
+
+    def dirty_rows(self) -> np.ndarray:
+        """마지막 clear_changes() 이후 수정/추가된 살아있는 행"""
+        return np.flatnonzero(self._dirty[:self._size] & self.alive)
+
+    def get_changes(self) -> Dict[str, int]:
+        return {
+            'modified': int(np.count_nonzero(self._dirty[:self._size] & self.alive)),
+            'added': self._added,
+            'deleted': self._deleted,
+        }
+
+    def clear_changes(self):
+        """저장(Export) 후 변경 추적 초기화"""
+        self._dirty[:] = False
+        self._added = 0
+        self._deleted = 0
+
+    @property
+    def nbytes(self) -> int:
+        return (sum(c.nbytes for c in self._data.values())
+                + self._alive.nbytes + self._dirty.nbytes + self._handles.nbytes)
+
+
+# ========== 행 프록시 ==========
+
+class RowView(ABC):
+    """ColumnTable 한 행의 프록시 (속성 읽기/쓰기가 열 배열에 반영됨)
+
+    하위 클래스(NodeView, ElementView)는 to_record()로 저장소와 분리된 레코드를 만듭니다.
+    """
+
+    __slots__ = ('_table', '_handle', '_row', '_generation', '_snapshot')
+
+    def __init__(self, table: ColumnTable, row: int):
+        self._table = table
+        self._row = int(row)
+        self._handle = int(table._handles[row])
+        self._generation = table.generation
+        self._snapshot: Optional[Dict[str, Any]] = None
+
+    @property
+    def row(self) -> int:
+        """현재 행 번호 (compact 후에는 핸들로 다시 찾음, 제거된 행은 -1)"""
+        table = self._table
+        if self._generation != table.generation or self._row < 0:
+            self._row = int(table.rows_for_handles([self._handle])[0])
+            self._generation = table.generation
+        return self._row
+
+    @property
+    def is_alive(self) -> bool:
+        row = self.row
+        return row >= 0 and bool(self._table._alive[row])
+
+    def _get(self, name: str, component: Optional[int] = None):
+        row = self.row
+        if row < 0:
+            return self._snapshot[name] if component is None else self._snapshot[name][component]
+        column = self._table._data[name]
+        return column[row] if component is None else column[row, component]
+
+    def _set(self, name: str, value, component: Optional[int] = None):
+        row = self.row
+        if row < 0:
+            raise LookupError("저장소에서 제거된 항목입니다")
+        self._table.set_value(name, row, value, component)
+
+    def __eq__(self, other):
+        return (isinstance(other, RowView) and other._table is self._table
+                and other._handle == self._handle)
+
+    def __hash__(self):
+        return hash((id(self._table), self._handle))
+
+    def __copy__(self):
+        return self.to_record()
+
+    def __deepcopy__(self, memo):
+        # 클립보드 복사 등: 저장소와 분리된 레코드로 복사
+        return self.to_record()
+
+    @abstractmethod
+    def to_record(self) -> Any:
+        """저장소와 분리된 레코드 (NodeRecord, ElementRecord)"""
+
+
+def _column_property(name: str, cast: Callable, component: Optional[int] = None, doc: str = ""):
+    def fget(self):
+        return cast(self._get(name, component))
+
+    def fset(self, value):
+        self._set(name, value, component)
+
+    return property(fget, fset, doc=doc)
+
+
+@dataclass
+class NodeRecord:
+    """저장소와 분리된 노드 (복사/붙여넣기용)"""
+    nid: int
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+    tc: int = 0
+    rc: int = 0
+
+
+@dataclass
+class ElementRecord:
+    """저장소와 분리된 요소 (복사/붙여넣기용)"""
+    eid: int
+    pid: int = 0
+    nodes: List[int] = field(default_factory=list)
+    element_type: str = 'shell'
+    node_count: int = 0
+
+
+class NodeView(RowView):
+    """노드 행 프록시 (NodeData와 같은 속성)"""
+
+    __slots__ = ()
+
+    nid = _column_property('nid', int)
+    x = _column_property('xyz', float, 0)
+    y = _column_property('xyz', float, 1)
+    z = _column_property('xyz', float, 2)
+    tc = _column_property('tc', int)
+    rc = _column_property('rc', int)
+
+    def to_record(self) -> NodeRecord:
+        return NodeRecord(self.nid, self.x, self.y, self.z, self.tc, self.rc)
+
+    def __repr__(self):
+        return f"NodeView(nid={self.nid}, x={self.x}, y={self.y}, z={self.z})"
+
+
+class ElementView(RowView):
+    """요소 행 프록시 (ElementData와 같은 속성)"""
+
+    __slots__ = ()
+
+    eid = _column_property('eid', int)
+    pid = _column_property('pid', int)
+    node_count = _column_property('node_count', int)
+
+    @property
+    def element_type(self) -> str:
+        return ELEMENT_TYPES[int(self._get('etype'))]
+
+    @element_type.setter
+    def element_type(self, value: str):
+        self._set('etype', ELEMENT_TYPE_CODES[value])
+
+    @property
+    def nodes(self) -> List[int]:
+        nodes = self._get('nodes')
+        return [int(n) for n in nodes[:self.node_count]]
+
+    @nodes.setter
+    def nodes(self, value):
+        padded = np.zeros(MAX_ELEMENT_NODES, dtype=np.int32)
+        values = list(value)[:MAX_ELEMENT_NODES]
+        padded[:len(values)] = values
+        self._set('nodes', padded)
+        self._set('node_count', len(values))
+
+    def to_record(self) -> ElementRecord:
+        return ElementRecord(self.eid, self.pid, self.nodes, self.element_type, self.node_count)
+
+    def __repr__(self):
+        return f"ElementView(eid={self.eid}, pid={self.pid}, type={self.element_type})"
+
+
+def _node_columns(items: List[Any]) -> Dict[str, np.ndarray]:
+    """노드 객체들 -> 열 배열"""
+    return {
+        'nid': np.array([getattr(n, 'nid', 0) for n in items], dtype=np.int64),
+        'xyz': np.array([(getattr(n, 'x', 0.0), getattr(n, 'y', 0.0), getattr(n, 'z', 0.0))
+                         for n in items], dtype=np.float64).reshape(-1, 3),
+        'tc': np.array([getattr(n, 'tc', 0) for n in items], dtype=np.int8),
+        'rc': np.array([getattr(n, 'rc', 0) for n in items], dtype=np.int8),
+    }
+
+
+def _element_columns(items: List[Any], default_type: int = 0) -> Dict[str, np.ndarray]:
+    """요소 객체들 -> 열 배열"""
+    count = len(items)
+    nodes = np.zeros((count, MAX_ELEMENT_NODES), dtype=np.int32)
+    node_counts = np.zeros(count, dtype=np.int8)
+    etypes = np.full(count, default_type, dtype=np.int8)
+    for i, item in enumerate(items):
+        item_nodes = list(getattr(item, 'nodes', None) or [])[:MAX_ELEMENT_NODES]
+        nodes[i, :len(item_nodes)] = item_nodes
+        node_counts[i] = getattr(item, 'node_count', 0) or len(item_nodes)
+        etype = getattr(item, 'element_type', None)
+        if etype in ELEMENT_TYPE_CODES:
+            etypes[i] = ELEMENT_TYPE_CODES[etype]
+    return {
+        'eid': np.array([getattr(e, 'eid', 0) for e in items], dtype=np.int64),
+        'pid': np.array([getattr(e, 'pid', 0) for e in items], dtype=np.int32),
+        'etype': etypes,
+        'node_count': node_counts,
+        'nodes': nodes,
+    }
+
+
+class RowList:
+    """ColumnTable의 살아있는 행을 list처럼 노출
+
+    기존 Keyword Manager 코드(AddCommand/DeleteCommand 등)가 list 연산으로
+    저장소를 수정할 수 있도록 append/insert/remove/index를 지원합니다.
+    항목은 행 프록시(RowView)이며, 일반 객체를 append하면 값을 복사해 행을 추가합니다.
+    """
+
+    def __init__(self, table: ColumnTable, view_cls: type,
+                 to_columns: Callable[[List[Any]], Dict[str, np.ndarray]],
+                 type_code: Optional[int] = None):
+        self._table = table
+        self._view_cls = view_cls
+        self._to_columns = to_columns
+        self._type_code = type_code   # 요소 타입 필터 (None이면 전체)
+        self._rows_cache: Optional[np.ndarray] = None
+        self._rows_version = -1
+
+    @property
+    def table(self) -> ColumnTable:
+        return self._table
+
+    @property
+    def rows(self) -> np.ndarray:
+        """목록에 포함된 행 번호"""
+        table = self._table
+        if self._rows_cache is None or self._rows_version != table.version:
+            rows = table.live_rows()
+            if self._type_code is not None:
+                rows = rows[table.column('etype')[rows] == self._type_code]
+            self._rows_cache = rows
+            self._rows_version = table.version
+        return self._rows_cache
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __bool__(self) -> bool:
+        return len(self.rows) > 0
+
+    def __getitem__(self, index):
+        rows = self.rows
+        if isinstance(index, slice):
+            return [self._view_cls(self._table, r) for r in rows[index]]
+        return self._view_cls(self._table, rows[index])
+
+    def __iter__(self):
+        table, view_cls = self._table, self._view_cls
+        for row in self.rows.tolist():
+            yield view_cls(table, row)
+
+    def _row_for(self, item) -> int:
+        """항목 -> 행 번호 (없으면 -1)"""
+        if isinstance(item, RowView) and item._table is self._table:
+            row = item.row
+        else:
+            entity_id = getattr(item, self._table.id_field, None)
+            if entity_id is None:
+                return -1
+            row = self._table.row_of(int(entity_id))
+        if row < 0 or not self._table._alive[row]:
+            return -1
+        if self._type_code is not None and self._table._data['etype'][row] != self._type_code:
+            return -1
+        return row
+
+    def __contains__(self, item) -> bool:
+        return self._row_for(item) >= 0
+
+    def index(self, item) -> int:
+        row = self._row_for(item)
+        if row < 0:
+            raise ValueError("항목이 목록에 없습니다")
+        return int(np.searchsorted(self.rows, row))
+
+    def append(self, item):
+        """항목 추가 - 삭제된 행 프록시면 복원, 일반 객체면 값 복사"""
+        table = self._table
+        if isinstance(item, RowView) and item._table is table:
+            row = item.row
+            if row >= 0:
+                table.undelete([row])
+                return
+            if item._snapshot is not None:
+                # compact로 제거된 행 - 같은 핸들로 다시 추가
+                columns = {name: np.asarray(value)[None, ...] for name, value in item._snapshot.items()}
+                table.append(columns, handles=[item._handle])
+                return
+
+        columns = self._to_columns([item])
+        if self._type_code is not None:
+            columns['etype'] = np.full(1, self._type_code, dtype=np.int8)
+        table.append(columns)
+
+    def insert(self, index: int, item):
+        # 행 순서는 저장소 순서를 따름 (위치는 무시)
+        self.append(item)
+
+    def extend(self, items: Iterable[Any]):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item):
+        row = self._row_for(item)
+        if row < 0:
+            raise ValueError("항목이 목록에 없습니다")
+        if isinstance(item, RowView):
+            # compact 이후 Undo로 복원할 수 있도록 값 보관
+            item._snapshot = self._table.row_values(row)
+        self._table.delete([row])
+
+
+class RecordTable(list):
+    """소량 키워드 레코드 테이블 (list + ID 인덱스)"""
+
+    def __init__(self, records: Iterable[Any] = (), id_field: str = 'id'):
+        super().__init__(records)
+        self.id_field = id_field
+        self._index: Optional[Dict[Any, Any]] = None
+
+    def get(self, record_id, default=None):
+        """ID로 레코드 조회"""
+        if self._index is None:
+            self._index = {getattr(r, self.id_field, None): r for r in self}
+        record = self._index.get(record_id)
+        if record is not None and getattr(record, self.id_field, None) != record_id:
+            # ID가 편집됨 - 인덱스 재생성
+            self._index = None
+            return self.get(record_id, default)
+        return record if record is not None else default
+
+    def _changed(self):
+        self._index = None
+
+    def append(self, record):
+        super().append(record)
+        self._changed()
+
+    def insert(self, index, record):
+        super().insert(index, record)
+        self._changed()
+
+    def remove(self, record):
+        super().remove(record)
+        self._changed()
+
+    def extend(self, records):
+        super().extend(records)
+        self._changed()
+
+    def __setitem__(self, index, record):
+        super().__setitem__(index, record)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, records):
+        result = super().__iadd__(records)
+        self._changed()
+        return result
+
+    def pop(self, index=-1):
+        record = super().pop(index)
+        self._changed()
+        return record
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
+class ModelStore:
+    """모델 전체 저장소
+
+    Attributes:
+        nodes: 노드 ColumnTable (nid, xyz[float64], tc, rc)
+        elements: 요소 ColumnTable (eid, pid, etype, node_count, nodes[8])
+        parts/sections/materials/contacts/sets: RecordTable
+            (Set 멤버 ids는 정렬되지 않은 int64 배열)
+    """
+
+    def __init__(self):
+        self.nodes = ColumnTable('nid', NODE_FIELDS)
+        self.elements = ColumnTable('eid', ELEMENT_FIELDS)
+        self.parts = RecordTable(id_field='pid')
+        self.sections = RecordTable(id_field='secid')
+        self.materials = RecordTable(id_field='mid')
+        self.contacts = RecordTable(id_field='cid')
+        self.sets = RecordTable(id_field='sid')
+
+        self.node_list = RowList(self.nodes, NodeView, _node_columns)
+        self.element_lists = {
+            name: RowList(self.elements, ElementView,
+                          lambda items, code=code: _element_columns(items, code), code)
+            for code, name in enumerate(ELEMENT_TYPES)
+        }
+
+    @classmethod
+    def from_parsed(cls, parsed,
+                    columns: Optional[Dict[str, Dict[str, np.ndarray]]] = None,
+                    on_table: Optional[Callable[[str, int], None]] = None) -> 'ModelStore':
+        """ParsedKFile(C++ 또는 Python fallback 결과)에서 생성
+
+        Args:
+            parsed: 파싱 결과
+            columns: 미리 저장해 둔 노드/요소 열 {'nodes': {...}, 'elements': {...}}
+                (디스크 캐시 등 - 있으면 파싱 결과의 노드/요소 대신 사용)
+            on_table: 노드/요소 열이 준비될 때마다 호출 (테이블 이름, 행 수)
+                - 백그라운드 로더의 단계 알림용. 예외를 던지면 생성이 중단됨
+        """
+        store = cls()
+        if parsed is None:
+            return store
+
+        # C++ 결과는 Python NodeData/ElementData 목록을 만들지 않고 바로 열로 변환
+        cpp = getattr(parsed, '_cpp_result', None)
+        if columns is not None:
+            store.nodes.load(columns['nodes'])
+        elif cpp is not None:
+            store.nodes.load(_cpp_node_columns(cpp.nodes))
+        else:
+            store.nodes.load(_node_columns(parsed.nodes))
+        if on_table is not None:
+            on_table('nodes', len(store.nodes))
+
+        if columns is not None:
+            store.elements.load(columns['elements'])
+        elif cpp is not None:
+            store.elements.load(_cpp_element_columns(cpp.elements))
+        else:
+            store.elements.load(_element_columns(parsed.elements))
+        if on_table is not None:
+            on_table('elements', len(store.elements))
+
+        store.parts.extend(parsed.parts)
+        store.sections.extend(parsed.sections)
+        store.materials.extend(parsed.materials)
+        store.contacts.extend(parsed.contacts)
+        for set_record in parsed.sets:
+            set_record.ids = np.asarray(set_record.ids, dtype=np.int64)
+            store.sets.append(set_record)
+        store.clear_changes()
+        return store
+
+    # ========== Set 멤버 ==========
+
+    def set_members(self, sid: int) -> np.ndarray:
+        record = self.sets.get(sid)
+        return record.ids if record is not None else np.zeros(0, dtype=np.int64)
+
+    def add_set_members(self, sid: int, ids) -> np.ndarray:
+        """Set에 멤버 추가 (중복 제외, 기존 순서 유지) - 이전 멤버 반환"""
+        record = self.sets.get(sid)
+        old = record.ids
+        ids = np.asarray(ids, dtype=np.int64).ravel()
+        new = ids[~np.isin(ids, old)]
+        record.ids = np.concatenate([old, np.unique(new)])
+        return old
+
+    def remove_set_members(self, sid: int, ids) -> np.ndarray:
+        """Set에서 멤버 제거 - 이전 멤버 반환"""
+        record = self.sets.get(sid)
+        old = record.ids
+        record.ids = old[~np.isin(old, np.asarray(ids, dtype=np.int64))]
+        return old
+
+    # ========== 유지보수 ==========
+
+    def maybe_compact(self) -> bool:
+        compacted = self.nodes.maybe_compact()
+        return self.elements.maybe_compact() or compacted
+
+    def get_changes(self) -> Dict[str, Dict[str, int]]:
+        return {'nodes': self.nodes.get_changes(), 'elements': self.elements.get_changes()}
+
+    def clear_changes(self):
+        self.nodes.clear_changes()
+        self.elements.clear_changes()
+
+    @property
+    def nbytes(self) -> int:
+        records = sum(estimate_nbytes(t) for t in
+                      (self.parts, self.sections, self.materials, self.contacts, self.sets))
+        return self.nodes.nbytes + self.elements.nbytes + records
+
+
+def _cpp_node_columns(cpp_nodes) -> Dict[str, np.ndarray]:
+    # 속성을 한 번씩만 읽어 파이썬 목록으로 모은 뒤 한 번에 배열 변환
+    # (numpy 원소 단위 대입보다 훨씬 빠름)
+    rows = [(n.nid, n.x, n.y, n.z, n.tc, n.rc) for n in cpp_nodes]
+    if not rows:
+        return {'nid': np.zeros(0, dtype=np.int64)}
+    ids, x, y, z, tc, rc = zip(*rows)
+    return {
+        'nid': np.array(ids, dtype=np.int64),
+        'xyz': np.column_stack([np.array(x), np.array(y), np.array(z)]),
+        'tc': np.array(tc, dtype=np.int8),
+        'rc': np.array(rc, dtype=np.int8),
+    }
+
+
+def _cpp_element_columns(cpp_elements) -> Dict[str, np.ndarray]:
+    rows = [(e.eid, e.pid, e.type.value, e.node_count, e.nodes) for e in cpp_elements]
+    if not rows:
+        return {'eid': np.zeros(0, dtype=np.int64)}
+    ids, pids, etypes, node_counts, nodes = zip(*rows)
+    return {
+        'eid': np.array(ids, dtype=np.int64),
+        'pid': np.array(pids, dtype=np.int32),
+        'etype': np.array(etypes, dtype=np.int8),
+        'node_count': np.array(node_counts, dtype=np.int8),
+        'nodes': np.array(nodes, dtype=np.int32).reshape(-1, MAX_ELEMENT_NODES),
+    }
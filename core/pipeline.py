@@ -0,0 +1,267 @@
+"""Headless pipeline API for batch processing (no Qt/OpenGL)
+
+Plain-Python entry points for the GUI workflow:
+parse -> part config -> ScriptGenerator -> KooMeshModifier run,
+adjacent part detection and keyword export.
+
+Importing this module never loads PySide6 or OpenGL, so it can run on
+render-farm nodes. See core/cli.py for the command line front end.
+
+Example:
+    from core.pipeline import DeckJob, run_batch
+
+    jobs = [DeckJob(path, part_csv="parts.csv", material_source="MaterialSource.txt")
+            for path in Path("decks").glob("*.k")]
+    for result in run_batch(jobs, workers=8):
+        print(result.filename, result.ok, f"{result.total_ms:.0f} ms")
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from models import PartConfig, LayerConfig
+from .material_db import MaterialDatabase
+from .part_config_loader import PartConfigLoader
+from .script_generator import ScriptGenerator
+from .model_data import ParsedModelData, parse_k_file
+from .runner import run_script
+
+
+# Material databases are reused across decks within a worker process
+_material_dbs: Dict[str, MaterialDatabase] = {}
+
+
+def load_model(path: str, use_fast_parser: bool = True) -> ParsedModelData:
+    """Parse a K-file
+
+    Raises:
+        FileNotFoundError: path does not exist
+    """
+    model = parse_k_file(str(path), use_fast_parser)
+    if model is None:
+        raise FileNotFoundError(path)
+    return model
+
+
+def load_material_db(path: str) -> MaterialDatabase:
+    """Load (and cache) a MaterialSource file
+
+    Raises:
+        ValueError: file could not be loaded
+    """
+    key = os.path.abspath(path)
+    db = _material_dbs.get(key)
+    if db is None:
+        db = MaterialDatabase()
+        if not db.load(key):
+            raise ValueError(f"Material Source를 불러올 수 없습니다: {path}")
+        _material_dbs[key] = db
+    return db
+
+
+def build_part_configs(model: ParsedModelData,
+                       layer_configs: Dict[int, List[LayerConfig]]) -> List[PartConfig]:
+    """Apply CSV layer configs to the parts of a model
+
+    Same rule as the laminate module's CSV import: parts that appear in the
+    CSV are enabled with its layers, CSV entries for unknown parts are skipped.
+    """
+    if model.parts:
+        names = {part.pid: part.name for part in model.parts}
+    else:
+        names = {pid: "" for pid in model.get_part_ids()}
+
+    parts = []
+    for pid in sorted(names):
+        layers = layer_configs.get(pid)
+        parts.append(PartConfig(part_id=pid, part_name=names[pid],
+                                enabled=bool(layers), layers=list(layers or [])))
+    return parts
+
+
+def generate_script(model: ParsedModelData, part_csv: str, material_source: str,
+                    output_name: Optional[str] = None,
+                    output_dir: Optional[str] = None) -> Path:
+    """Generate the KooMeshModifier display script for a model
+
+    Args:
+        model: Parsed K-file
+        part_csv: Part layer CSV (material_name,thickness,layer_set,part_id)
+        material_source: MaterialSource.txt path
+        output_name: Output model name (default: K-file stem)
+        output_dir: Script directory (default: next to the K-file)
+
+    Returns:
+        Path of the written <output_name>_display.txt
+
+    Raises:
+        ValueError: no part in the CSV matches the model
+    """
+    material_db = load_material_db(material_source)
+    parts = build_part_configs(model, PartConfigLoader().load(part_csv))
+    enabled = [p for p in parts if p.enabled]
+    if not enabled:
+        raise ValueError(f"CSV에 모델과 일치하는 Part가 없습니다: {part_csv}")
+
+    k_path = Path(model.filepath)
+    output_name = output_name or k_path.stem
+    output_path = Path(output_dir or k_path.parent) / f"{output_name}_display.txt"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    generator = ScriptGenerator(material_db)
+    script = generator.generate(enabled, output_name, k_path.name)
+    generator.save(script, str(output_path))
+    return output_path
+
+
+def find_adjacent(model: ParsedModelData, part_id: int, plane: Optional[str] = None,
+                  thickness_range: Optional[Sequence[float]] = None,
+                  coverage_threshold: float = 0.1, layer_mode: bool = False):
+    """Detect parts adjacent to part_id
+
+    Args:
+        plane: 'XY', 'YZ' or 'ZX' (default: dominant plane of the part)
+        thickness_range: (min, max) search distance (default: auto from bbox)
+
+    Returns:
+        DetectionResult
+    """
+    from gui.modules.adjacent_parts_viewer.core.detector import AdjacentPartsDetector
+
+    geometry = model.geometry
+    detector = AdjacentPartsDetector(geometry.mesh, geometry=geometry)
+    plane = plane or detector.suggest_best_plane(part_id) or 'XY'
+    if thickness_range is None:
+        thickness_range = detector.get_auto_thickness_range(part_id, plane)
+    return detector.find_adjacent(
+        part_id, plane, thickness_range[0], thickness_range[1],
+        coverage_threshold=coverage_threshold, layer_mode=layer_mode,
+    )
+
+
+def export_keywords(model: ParsedModelData, output_path: str, options=None) -> bool:
+    """Write the model's keywords to a K-file (Keyword Manager exporter)"""
+    from gui.modules.keyword_manager.core.exporter import KFileExporter
+    return KFileExporter(model, options).export(str(output_path))
+
+
+# ========== Batch ==========
+
+@dataclass
+class DeckJob:
+    """One deck to process in a batch"""
+    path: str
+    part_csv: Optional[str] = None          # generate a display script when set
+    material_source: Optional[str] = None
+    output_dir: Optional[str] = None
+    adjacent_parts: List[int] = field(default_factory=list)
+    export_path: Optional[str] = None
+    run: bool = False                       # run KooMeshModifier on the script
+    koomesh_path: Optional[str] = None
+    timeout: Optional[float] = None
+
+
+@dataclass
+class DeckResult:
+    """Outcome of a DeckJob"""
+    path: str
+    ok: bool = True
+    error: str = ""
+    parse_ms: float = 0.0
+    total_ms: float = 0.0
+    node_count: int = 0
+    element_count: int = 0
+    part_count: int = 0
+    script_path: str = ""
+    export_path: str = ""
+    adjacent: Dict[int, List[int]] = field(default_factory=dict)
+    exit_code: Optional[int] = None
+
+    @property
+    def filename(self) -> str:
+        return Path(self.path).name
+
+
+def process_deck(job: DeckJob) -> DeckResult:
+    """Run every step requested by job on one deck
+
+    Errors are captured in the result so one bad deck does not stop a batch.
+    """
+    start = time.perf_counter()
+    result = DeckResult(path=str(job.path))
+    model = None
+    try:
+        model = load_model(job.path)
+        result.parse_ms = model.parse_time_ms
+        result.node_count = model.node_count
+        result.element_count = model.element_count
+        result.part_count = model.part_count
+
+        for pid in job.adjacent_parts:
+            detection = find_adjacent(model, pid)
+            result.adjacent[pid] = sorted(detection.adjacent_parts)
+
+        if job.export_path:
+            if not export_keywords(model, job.export_path):
+                raise RuntimeError(f"Export 실패: {job.export_path}")
+            result.export_path = str(job.export_path)
+
+        if job.part_csv:
+            if not job.material_source:
+                raise ValueError("part_csv에는 material_source가 필요합니다")
+            script_path = generate_script(model, job.part_csv, job.material_source,
+                                          output_dir=job.output_dir)
+            result.script_path = str(script_path)
+
+            if job.run:
+                run = run_script(str(script_path), job.koomesh_path, timeout=job.timeout)
+                result.exit_code = run.exit_code
+                if not run.ok:
+                    raise RuntimeError(run.error.strip() or f"exit code {run.exit_code}")
+
+    except Exception as e:
+        result.ok = False
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        if model is not None:
+            model.release()
+        result.total_ms = (time.perf_counter() - start) * 1000
+    return result
+
+
+def run_batch(jobs: Iterable[DeckJob], workers: int = 1,
+              on_result: Optional[Callable[[DeckResult], None]] = None) -> List[DeckResult]:
+    """Process many decks, optionally in parallel worker processes
+
+    Args:
+        jobs: Decks to process
+        workers: Worker process count (1: in-process, 0: os.cpu_count())
+        on_result: Called with each result as it completes
+
+    Returns:
+        Results in job order
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(jobs) <= 1:
+        results = []
+        for job in jobs:
+            result = process_deck(job)
+            if on_result:
+                on_result(result)
+            results.append(result)
+        return results
+
+    results: List[Optional[DeckResult]] = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(process_deck, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result:
+                on_result(result)
+    return results
@@ -0,0 +1,135 @@
+"""Headless process runner for KooMeshModifier (no Qt dependency)
+
+ProcessExecutor (QProcess) is used by the GUI; batch pipelines and the CLI
+use run_script() which blocks on a plain subprocess.
+"""
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+
+def default_koomesh_path() -> str:
+    """Default KooMeshModifier launcher in the project directory"""
+    project_dir = Path(__file__).parent.parent
+    if sys.platform == 'win32':
+        return str(project_dir / "KooMeshModifier" / "run.bat")
+    return str(project_dir / "KooMeshModifier" / "run.sh")
+
+
+def build_command(script_path: str, koomesh_path: str) -> Tuple[str, List[str], str]:
+    """Build (program, args, working_dir) for running a display script
+
+    The script is passed by name and KooMeshModifier runs in the script's
+    directory, same as the GUI.
+    """
+    script_dir = str(Path(script_path).parent)
+    script_name = Path(script_path).name
+
+    if sys.platform == 'win32':
+        return koomesh_path, [script_name], script_dir
+
+    # Make sure script is executable
+    os.chmod(koomesh_path, 0o755)
+    return "/bin/bash", [koomesh_path, script_name], script_dir
+
+
+def _kill(proc: subprocess.Popen):
+    """Kill the launcher and everything it started
+
+    run.sh starts KooMeshModifier as a child, which would otherwise keep the
+    output pipes open after the shell is killed.
+    """
+    if proc.poll() is not None:
+        return
+    if sys.platform == 'win32':
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+@dataclass
+class RunResult:
+    """Result of a KooMeshModifier run"""
+    exit_code: int
+    output: str = ""
+    error: str = ""
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+def run_script(script_path: str, koomesh_path: str = None,
+               timeout: Optional[float] = None,
+               on_output: Optional[Callable[[str], None]] = None) -> RunResult:
+    """Run KooMeshModifier with the given script and wait for it to finish
+
+    Args:
+        script_path: display.txt script path
+        koomesh_path: launcher path (default: project KooMeshModifier)
+        timeout: seconds before the process is killed (None: no limit)
+        on_output: called with each stdout line as it arrives
+
+    Returns:
+        RunResult (exit_code 1 if the launcher is missing, -1 on timeout)
+    """
+    koomesh_path = koomesh_path or default_koomesh_path()
+    if not Path(koomesh_path).exists():
+        return RunResult(1, error=f"KooMeshModifier를 찾을 수 없습니다: {koomesh_path}")
+
+    program, args, cwd = build_command(script_path, koomesh_path)
+    start = time.perf_counter()
+
+    proc = subprocess.Popen(
+        [program, *args], cwd=cwd,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, encoding='utf-8', errors='replace',
+        start_new_session=sys.platform != 'win32',
+    )
+
+    if on_output is None:
+        try:
+            output, error = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill(proc)
+            output, error = proc.communicate()
+            return RunResult(-1, output, error + "\n시간 초과로 종료되었습니다.",
+                             time.perf_counter() - start)
+        return RunResult(proc.returncode, output, error, time.perf_counter() - start)
+
+    # Stream stdout line by line (stderr collected at the end).
+    # The timer also fires while the process is silent.
+    timed_out = threading.Event()
+
+    def on_timeout():
+        timed_out.set()
+        _kill(proc)
+
+    timer = threading.Timer(timeout, on_timeout) if timeout is not None else None
+    if timer:
+        timer.start()
+    lines = []
+    try:
+        for line in proc.stdout:
+            lines.append(line)
+            on_output(line)
+        error = proc.stderr.read()
+        exit_code = proc.wait()
+    finally:
+        if timer:
+            timer.cancel()
+    if timed_out.is_set():
+        return RunResult(-1, "".join(lines), error + "\n시간 초과로 종료되었습니다.",
+                         time.perf_counter() - start)
+    return RunResult(exit_code, "".join(lines), error, time.perf_counter() - start)
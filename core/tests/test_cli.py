@@ -0,0 +1,63 @@
+"""python -m core command line tests"""
+import json
+import sys
+from pathlib import Path
+
+# Project root (the in-tree C++ parser build is added by the root conftest.py)
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_DIR))
+
+from core import cli
+
+SAMPLE_K = PROJECT_DIR / "core" / "kfile_parser" / "tests" / "sample.k"
+MATERIAL_SOURCE = PROJECT_DIR / "examples" / "scripts" / "MaterialSource.txt"
+
+
+def test_expand_paths(tmp_path):
+    for name in ("b.k", "a.k", "notes.txt"):
+        (tmp_path / name).write_text("*KEYWORD\n*END\n")
+    explicit = str(tmp_path / "explicit.k")
+
+    assert cli._expand_paths([str(tmp_path)]) == [str(tmp_path / "a.k"), str(tmp_path / "b.k")]
+    assert cli._expand_paths([str(tmp_path / "*.k"), explicit]) == [
+        str(tmp_path / "a.k"), str(tmp_path / "b.k"), explicit]
+
+
+def test_info_json(capsys):
+    assert cli.main(["info", str(SAMPLE_K), "--json"]) == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["nodes"] == 8
+    assert stats["parts"] == 2
+    assert stats["elements"]["total"] == 5
+
+
+def test_info_missing_file(capsys, tmp_path):
+    assert cli.main(["info", str(tmp_path / "missing.k")]) == 1
+    assert "missing.k" in capsys.readouterr().err
+
+
+def test_parts_require_materials(capsys):
+    assert cli.main(["script", str(SAMPLE_K), "--parts", "parts.csv"]) == 2
+    assert "--materials" in capsys.readouterr().err
+
+
+def test_script(tmp_path, capsys):
+    csv_path = tmp_path / "parts.csv"
+    csv_path.write_text("FTG_R,0.1,1,1\n", encoding="utf-8")
+    code = cli.main(["script", str(SAMPLE_K), "--parts", str(csv_path),
+                     "--materials", str(MATERIAL_SOURCE), "--output-dir", str(tmp_path),
+                     "--name", "out"])
+    assert code == 0
+    assert (tmp_path / "out_display.txt").exists()
+    assert "out_display.txt" in capsys.readouterr().out
+
+
+def test_batch_summary(tmp_path, capsys):
+    summary = tmp_path / "summary.json"
+    code = cli.main(["batch", str(SAMPLE_K), str(tmp_path / "missing.k"),
+                     "--summary", str(summary)])
+    assert code == 1
+    out = capsys.readouterr().out
+    assert "[OK  ] sample.k" in out
+    assert "[FAIL] missing.k" in out
+    assert [entry["ok"] for entry in json.loads(summary.read_text())] == [True, False]
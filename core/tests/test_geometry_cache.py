@@ -0,0 +1,158 @@
+"""GeometryCache 테스트 (lazy 생성, revision 무효화, 동시 생성 잠금, 통계)"""
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+
+from core.geometry_cache import GeometryCache
+from core.memory_registry import memory_registry
+
+
+def make_cache():
+    model = SimpleNamespace(revision=0, filename="test.k")
+    return model, GeometryCache(model)
+
+
+def test_lazy_build_and_stats():
+    """처음 요청 시에만 생성, 이후는 hit"""
+    _, cache = make_cache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return np.arange(100, dtype=np.int64)
+
+    assert not cache.contains('values')
+    first = cache.get('values', build)
+    assert cache.get('values', build) is first
+    assert cache.get('values', build) is first
+    assert len(calls) == 1
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (2, 1)
+    assert stats['hit_rate'] == 2 / 3
+    assert stats['entries']['values']['bytes'] == first.nbytes
+    assert stats['memory_bytes'] == cache.memory_bytes == first.nbytes
+    cache.release()
+
+
+def test_revision_invalidates():
+    """모델 revision이 바뀌면 전체 폐기 후 재생성"""
+    model, cache = make_cache()
+    cache.put('a', np.zeros(4))
+    before = cache.get('b', lambda: [1])
+
+    model.revision += 1
+    assert not cache.contains('a')
+    after = cache.get('b', lambda: [2])
+    assert after == [2] and after is not before
+
+    stats = cache.get_stats()
+    assert stats['revision'] == 1
+    assert stats['invalidations'] == 1
+    cache.release()
+
+
+def test_build_during_edit_is_discarded():
+    """계산 도중 모델이 편집되면 결과를 캐시하지 않음"""
+    model, cache = make_cache()
+
+    def build():
+        model.revision += 1
+        return 'stale'
+
+    assert cache.get('value', build) == 'stale'
+    assert not cache.contains('value')
+    assert cache.get('value', lambda: 'fresh') == 'fresh'
+    assert cache.contains('value')
+    cache.release()
+
+
+def test_invalidate_single_key():
+    _, cache = make_cache()
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.invalidate('a')
+    assert not cache.contains('a') and cache.contains('b')
+    cache.invalidate()
+    assert not cache.contains('b')
+    cache.release()
+
+
+def test_concurrent_build_runs_once():
+    """같은 키를 동시에 요청하면 한 스레드만 계산하고 나머지는 결과를 공유"""
+    _, cache = make_cache()
+    calls = []
+    started = threading.Event()
+
+    def build():
+        calls.append(threading.get_ident())
+        started.set()
+        time.sleep(0.05)
+        return object()
+
+    results = [None] * 8
+
+    def worker(i):
+        results[i] = cache.get('shared', build)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(results))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    stats = cache.get_stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == len(results) - 1
+    cache.release()
+
+
+def test_waiting_thread_hit_updates_lru():
+    """생성 완료를 기다린 스레드의 hit도 LRU 사용 시각을 갱신"""
+    _, cache = make_cache()
+    building = threading.Event()
+    release = threading.Event()
+    touched = []
+    touch = cache._touch
+    cache._touch = lambda key: (touched.append(key), touch(key))
+
+    def build():
+        building.set()
+        release.wait(5)
+        return 'value'
+
+    builder = threading.Thread(target=cache.get, args=('key', build))
+    builder.start()
+    building.wait(5)
+
+    waiter = threading.Thread(target=cache.get, args=('key', lambda: 'other'))
+    waiter.start()
+    time.sleep(0.05)      # waiter가 생성 잠금에서 대기하도록
+    release.set()
+    builder.join()
+    waiter.join()
+
+    assert cache.get_stats()['hits'] == 1
+    assert touched == ['key']
+    cache.release()
+
+
+def test_registers_memory_consumers():
+    """항목별로 memory_registry에 등록되고 release() 시 해제"""
+    _, cache = make_cache()
+    cache.put('values', np.zeros(1000))
+    names = [r['name'] for r in memory_registry.get_report()]
+    assert "geometry:values (test.k)" in names
+
+    cache.release()
+    names = [r['name'] for r in memory_registry.get_report()]
+    assert "geometry:values (test.k)" not in names
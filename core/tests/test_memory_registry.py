@@ -0,0 +1,142 @@
+"""MemoryRegistry 테스트 (예산 계산, LRU 해제 순서)"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+
+from core.memory_registry import MemoryRegistry, estimate_nbytes
+
+
+class FakeCache:
+    """evict 호출을 기록하는 캐시"""
+
+    def __init__(self, registry, name, log, rebuildable=True):
+        self.name = name
+        self.log = log
+        self.consumer = registry.register(
+            name, category="geometry" if rebuildable else "gpu",
+            evict=(lambda cache: cache.evict()) if rebuildable else None, owner=self)
+
+    def evict(self):
+        self.log.append(self.name)
+
+
+def test_evicts_least_recently_used_first():
+    registry = MemoryRegistry(budget_bytes=1000)
+    log = []
+    caches = [FakeCache(registry, name, log) for name in ("a", "b", "c")]
+    for cache in caches:
+        cache.consumer.update(300)
+    assert log == []
+
+    caches[0].consumer.touch()              # a가 가장 최근 사용
+    caches[1].consumer.last_used -= 10     # b가 가장 오래됨
+    caches.append(FakeCache(registry, "d", log))
+    caches[-1].consumer.update(300)
+    assert log == ["b"]
+    assert registry.total_bytes == 900
+
+
+def test_evicts_until_under_budget():
+    registry = MemoryRegistry(budget_bytes=1000)
+    log = []
+    caches = [FakeCache(registry, name, log) for name in ("a", "b", "c")]
+    for i, cache in enumerate(caches):
+        cache.consumer.update(300)
+        cache.consumer.last_used = i
+
+    newest = FakeCache(registry, "d", log)
+    newest.consumer.update(700)
+    assert log == ["a", "b"]            # 700 + 300 = 1000
+    assert registry.total_bytes == 1000
+
+
+def test_pinned_bytes_reduce_cache_allowance():
+    """재생성 불가 항목을 뺀 나머지 예산 안에서 캐시 관리"""
+    registry = MemoryRegistry(budget_bytes=1000)
+    log = []
+    caches = [FakeCache(registry, "vbo", log, rebuildable=False),
+              FakeCache(registry, "a", log), FakeCache(registry, "b", log)]
+    caches[0].consumer.update(600)
+    caches[1].consumer.update(300)
+    assert log == []
+    caches[2].consumer.update(200)
+    assert log == ["a"]
+
+    stats = registry.get_stats()
+    assert stats['pinned_bytes'] == 600
+    assert stats['cache_bytes'] == 200
+    assert stats['cache_allowance_bytes'] == 400
+
+
+def test_pinned_over_budget_keeps_minimum_cache():
+    """재생성 불가 항목만으로 예산 초과 시에도 캐시를 모두 해제하지 않음"""
+    registry = MemoryRegistry(budget_bytes=1000, min_cache_fraction=0.25)
+    log = []
+    caches = [FakeCache(registry, name, log, rebuildable=name != "model")
+              for name in ("model", "a", "b", "c")]
+    caches[0].consumer.update(5000)
+    assert registry.cache_allowance(5000) == 250
+
+    caches[1].consumer.update(100)
+    caches[2].consumer.update(100)
+    assert log == []                    # 200 <= 250: 반복 해제/재생성 없음
+
+    caches[3].consumer.update(100)
+    assert log == ["a"]
+
+
+def test_pinned_growth_never_evicts_pinned():
+    """해제할 캐시가 없으면 더 이상 해제하지 않음"""
+    registry = MemoryRegistry(budget_bytes=1000, min_cache_fraction=0.0)
+    log = []
+    cache = FakeCache(registry, "a", log)
+    cache.consumer.update(100)
+    pinned = FakeCache(registry, "undo", log, rebuildable=False)
+    pinned.consumer.update(2000)
+
+    assert log == ["a"]
+    assert registry.enforce_budget() == 0
+    assert log == ["a"]
+
+
+def test_excluded_and_refusing_consumers():
+    registry = MemoryRegistry(budget_bytes=1000)
+    refused = registry.register("busy", evict=lambda: False)
+    refused.update(800)
+    refused.last_used = 0
+
+    log = []
+    newest = FakeCache(registry, "new", log)
+    newest.consumer.update(500)         # 방금 갱신한 항목은 해제 대상에서 제외
+    assert log == []
+    assert registry.get_stats()['evictions'] == 0
+
+
+def test_unlimited_budget():
+    registry = MemoryRegistry()
+    log = []
+    cache = FakeCache(registry, "a", log)
+    cache.consumer.update(10 ** 12)
+    assert log == []
+    assert registry.enforce_budget() == 0
+
+
+def test_dead_owner_is_dropped():
+    registry = MemoryRegistry()
+    cache = FakeCache(registry, "a", [])
+    cache.consumer.update(100)
+    assert registry.total_bytes == 100
+    del cache
+    assert registry.total_bytes == 0
+    assert registry.get_report() == []
+
+
+def test_estimate_nbytes():
+    array = np.zeros(1000, dtype=np.float64)
+    assert estimate_nbytes(array) == 8000
+    assert estimate_nbytes({'a': array, 'b': array}) >= 16000
+    assert estimate_nbytes([array] * 10) >= 80000
@@ -0,0 +1,142 @@
+"""Staged model loading tests (part scan, stage order, cancellation)"""
+import sys
+from pathlib import Path
+
+# Project root (the in-tree C++ parser build is added by the root conftest.py)
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_DIR))
+
+import pytest
+
+from core.k_file_parser import scan_parts
+from core.memory_registry import memory_registry
+from core.model_data import ParsedModelData, parse_k_file
+from core.model_loading import LoadCancelled, load_model_staged
+
+SAMPLE_K = PROJECT_DIR / "core" / "kfile_parser" / "tests" / "sample.k"
+
+
+class StageRecorder:
+    """emit 콜백 기록 (progress 제외), cancel_after 단계 이후 취소"""
+
+    def __init__(self, cancel_after=None):
+        self.stages = []
+        self.payloads = {}
+        self.cancel_after = cancel_after
+
+    def emit(self, stage, *args):
+        if stage == 'progress':
+            return
+        self.stages.append(stage)
+        self.payloads[stage] = args[0]
+
+    def is_cancelled(self):
+        return self.cancel_after in self.stages
+
+
+def test_scan_parts_matches_full_parse():
+    scanned = [(p.pid, p.name, p.secid, p.mid) for p in scan_parts(str(SAMPLE_K))]
+    model = parse_k_file(str(SAMPLE_K))
+    parsed = [(p.pid, p.name, p.secid, p.mid) for p in model.parts]
+    assert scanned == parsed
+    assert len(scanned) == 2
+
+
+def test_scan_parts_card_rules(tmp_path):
+    deck = tmp_path / "parts.k"
+    deck.write_text(
+        "*part\n"                                          # lowercase keyword, first line
+        "$ comment between keyword and name\n"
+        "Lower Case\n"
+        "\n"
+        "         7         3        12\n"
+        "*PART_CONTACT\n"                                  # not a plain *PART
+        "Skipped\n"
+        "        99         1         1\n"
+        "*PART\r\n"
+        "CRLF Part\r\n"
+        "        11         2         5\r\n"
+        "*PART\n"
+        "Truncated\n"                                      # data line missing
+        "*END\n"
+    )
+    parts = scan_parts(str(deck))
+    assert [(p.pid, p.name, p.secid, p.mid) for p in parts] == [
+        (7, "Lower Case", 3, 12),
+        (11, "CRLF Part", 2, 5),
+    ]
+
+
+def test_scan_parts_empty_file(tmp_path):
+    deck = tmp_path / "empty.k"
+    deck.write_bytes(b"")
+    assert scan_parts(str(deck)) == []
+
+
+def test_stage_order():
+    recorder = StageRecorder()
+    model = load_model_staged(str(SAMPLE_K), recorder.emit, recorder.is_cancelled)
+
+    assert recorder.stages == ['parts', 'nodes', 'elements', 'geometry']
+    assert [p.pid for p in recorder.payloads['parts']] == model.get_part_ids()
+    assert recorder.payloads['nodes'] == len(model.nodes) > 0
+    assert recorder.payloads['elements'] == sum(len(v) for v in model.elements.values())
+    assert recorder.payloads['geometry'] is model.geometry.mesh
+
+
+def test_nodes_stage_precedes_element_columns(monkeypatch):
+    """nodes 알림은 요소 열 생성 전에 발생 (전체 저장소 완료를 기다리지 않음)"""
+    import core.model_store as model_store
+
+    events = []
+    for name in ('_cpp_element_columns', '_element_columns'):
+        original = getattr(model_store, name)
+
+        def wrapped(*args, _original=original):
+            events.append('element_columns')
+            return _original(*args)
+        monkeypatch.setattr(model_store, name, wrapped)
+
+    def emit(stage, *args):
+        if stage != 'progress':
+            events.append(stage)
+
+    load_model_staged(str(SAMPLE_K), emit, build_geometry=False)
+    assert events == ['parts', 'nodes', 'element_columns', 'elements']
+
+
+def test_without_geometry():
+    recorder = StageRecorder()
+    model = load_model_staged(str(SAMPLE_K), recorder.emit, build_geometry=False)
+    assert recorder.stages == ['parts', 'nodes', 'elements']
+    assert model.geometry.get_stats()['entries'] == {}
+
+
+@pytest.mark.parametrize("cancel_after", ['parts', 'nodes', 'elements', 'geometry'])
+def test_cancel_stops_at_next_stage(cancel_after):
+    recorder = StageRecorder(cancel_after=cancel_after)
+    stages = ['parts', 'nodes', 'elements', 'geometry']
+
+    if cancel_after == 'geometry':
+        # 마지막 단계 이후에는 확인할 경계가 없음 (로더가 결과를 버림)
+        load_model_staged(str(SAMPLE_K), recorder.emit, recorder.is_cancelled)
+    else:
+        with pytest.raises(LoadCancelled):
+            load_model_staged(str(SAMPLE_K), recorder.emit, recorder.is_cancelled)
+    assert recorder.stages == stages[:stages.index(cancel_after) + 1]
+
+
+def test_missing_file():
+    with pytest.raises(FileNotFoundError):
+        load_model_staged(str(SAMPLE_K.with_name("missing.k")), lambda *a: None)
+
+
+def test_only_loaded_models_register_memory():
+    """빈 자리표시자는 메모리 집계에 등록되지 않음"""
+    placeholder = ParsedModelData(filename="placeholder.k")
+    model = parse_k_file(str(SAMPLE_K))
+    names = [r['name'] for r in memory_registry.get_report()]
+    assert not any(name.startswith("model:placeholder.k") for name in names)
+    assert "model:sample.k parsed" in names
+    assert "model:sample.k entity lists" in names
+    del placeholder, model
@@ -0,0 +1,206 @@
+"""ModelStore 테스트 (벡터화 수정, 추가, tombstone 삭제, compact, 변경 추적)"""
+import copy
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import numpy as np
+import pytest
+
+from core.model_store import (
+    ColumnTable, ElementRecord, ModelStore, NODE_FIELDS, NodeRecord, NodeView, RecordTable, RowView,
+)
+
+
+def make_nodes(count: int) -> ColumnTable:
+    table = ColumnTable('nid', NODE_FIELDS)
+    nids = np.arange(1, count + 1, dtype=np.int64) * 10
+    table.load({'nid': nids, 'xyz': np.column_stack([nids, nids * 2, nids * 3]).astype(float)})
+    return table
+
+
+def make_store() -> ModelStore:
+    nodes = [SimpleNamespace(nid=nid, x=float(nid), y=0.0, z=0.0) for nid in (1, 2, 3, 4, 5)]
+    elements = [SimpleNamespace(eid=100, pid=1, nodes=[1, 2, 3, 4], element_type='shell'),
+                SimpleNamespace(eid=200, pid=2, nodes=[1, 2, 3, 4, 5, 1, 2, 3], element_type='solid'),
+                SimpleNamespace(eid=300, pid=1, nodes=[4, 5], element_type='beam')]
+    parsed = SimpleNamespace(nodes=nodes, elements=elements, parts=[], sections=[],
+                             materials=[], contacts=[], sets=[])
+    return ModelStore.from_parsed(parsed)
+
+
+def test_vectorized_update_returns_old_values():
+    table = make_nodes(5)
+    rows = table.rows_of([20, 40])
+    assert rows.tolist() == [1, 3]
+
+    old = table.set('xyz', rows, table.get('xyz', rows) + 1.0)
+    assert old.tolist() == [[20, 40, 60], [40, 80, 120]]
+    assert table.get('xyz', rows).tolist() == [[21, 41, 61], [41, 81, 121]]
+    assert table.rows_of([999, 10]).tolist() == [-1, 0]
+
+
+def test_id_update_refreshes_index():
+    table = make_nodes(3)
+    table.set('nid', [0], [55])
+    assert table.row_of(55) == 0
+    assert table.row_of(10) == -1
+
+
+def test_append_grows_capacity():
+    table = make_nodes(3)
+    version = table.version
+    rows = table.append({'nid': np.arange(1000, 3000), 'xyz': np.zeros((2000, 3))})
+    assert rows[0] == 3 and len(rows) == 2000
+    assert len(table) == table.size == 2003
+    assert table.row_of(2999) == 2002
+    assert table.get('tc', rows[:1]).tolist() == [0]   # 없는 필드는 0
+    assert table.version > version
+
+
+def test_tombstone_delete_and_undelete():
+    table = make_nodes(5)
+    deleted = table.delete(table.rows_of([20, 30, 20]))
+    assert deleted.tolist() == [1, 2]
+    assert len(table) == 3 and table.size == 5 and table.tombstones == 2
+    assert table.row_of(20) == -1
+    assert table.live_rows().tolist() == [0, 3, 4]
+
+    assert table.delete([1]).tolist() == []       # 이미 삭제된 행
+    assert table.undelete([1]).tolist() == [1]
+    assert table.row_of(20) == 1
+    assert table.tombstones == 1
+
+
+def test_compact_keeps_handles_valid():
+    """compact 후 행 번호는 바뀌지만 핸들과 행 프록시는 같은 행을 가리킴"""
+    table = make_nodes(6)
+    handles = table.handles_of(table.rows_of([40, 60]))
+    view = NodeView(table, table.row_of(50))
+    removed = NodeView(table, table.row_of(20))
+
+    table.delete(table.rows_of([10, 20, 30]))
+    generation = table.generation
+    assert table.compact()
+    assert table.generation == generation + 1
+    assert table.size == 3 and table.tombstones == 0
+    assert not table.compact()
+
+    rows = table.rows_for_handles(handles)
+    assert rows.tolist() == [0, 2]
+    assert table.get('nid', rows).tolist() == [40, 60]
+    assert view.row == 1 and view.nid == 50
+    view.x = 7.5
+    assert table.get('xyz', [1])[0, 0] == 7.5
+    assert removed.row == -1 and not removed.is_alive
+
+
+def test_maybe_compact_threshold():
+    table = make_nodes(4000)
+    table.delete(np.arange(500))
+    assert not table.maybe_compact()              # 500 < min_rows
+    table.delete(np.arange(500, 1200))
+    assert table.maybe_compact()                  # 1200 > 4000 * 0.25
+    assert table.size == 2800
+    assert table.row_of(12010) == 0
+
+
+def test_change_tracking():
+    table = make_nodes(5)
+    assert table.get_changes() == {'modified': 0, 'added': 0, 'deleted': 0}
+
+    table.set('xyz', [0, 1], np.zeros((2, 3)))
+    table.append({'nid': [99]})
+    table.delete([1])
+    assert table.get_changes() == {'modified': 2, 'added': 1, 'deleted': 1}
+    assert table.dirty_rows().tolist() == [0, 5]
+
+    table.clear_changes()
+    assert table.get_changes() == {'modified': 0, 'added': 0, 'deleted': 0}
+    assert table.dirty_rows().tolist() == []
+
+
+def test_row_list_remove_and_restore_after_compact():
+    """삭제 후 compact되어도 같은 행 프록시를 append하면 값과 핸들이 복원됨"""
+    store = make_store()
+    nodes = store.node_list
+    node = nodes[1]
+    handle = node._handle
+
+    nodes.remove(node)
+    assert len(nodes) == 4 and node not in nodes
+    store.nodes.compact()
+    assert node.row == -1
+    assert node.nid == 2                          # 스냅샷에서 읽음
+
+    nodes.append(node)
+    assert node in nodes and node.row >= 0
+    assert node._handle == handle
+    assert store.nodes.get('nid', [node.row]).tolist() == [2]
+
+
+def test_element_lists_and_records():
+    store = make_store()
+    shells, solids, beams = (store.element_lists[name] for name in ('shell', 'solid', 'beam'))
+    assert [e.eid for e in shells] == [100]
+    assert solids[0].nodes == [1, 2, 3, 4, 5, 1, 2, 3]
+    assert beams[0].element_type == 'beam'
+
+    shells[0].pid = 9
+    assert store.elements.get('pid', [0]).tolist() == [9]
+    assert store.get_changes()['elements']['modified'] == 1
+
+    record = copy.deepcopy(shells[0])
+    assert record == ElementRecord(100, 9, [1, 2, 3, 4], 'shell', 4)
+    assert copy.copy(store.node_list[0]) == NodeRecord(1, 1.0, 0.0, 0.0, 0, 0)
+
+    shells.append(SimpleNamespace(eid=400, pid=3, nodes=[1, 2, 3]))
+    assert [e.eid for e in shells] == [100, 400]
+    assert shells[1].element_type == 'shell'
+
+
+def test_store_maybe_compact():
+    store = make_store()
+    store.nodes.append({'nid': np.arange(10, 3010)})
+    store.nodes.delete(np.arange(5, 1505))
+    assert store.maybe_compact()
+    assert len(store.nodes) == store.nodes.size == 1505
+
+
+def test_set_members():
+    store = make_store()
+    store.sets.append(SimpleNamespace(sid=1, ids=np.array([3, 1], dtype=np.int64)))
+    old = store.add_set_members(1, [5, 1, 5, 4])
+    assert old.tolist() == [3, 1]
+    assert store.set_members(1).tolist() == [3, 1, 4, 5]
+    store.remove_set_members(1, [3, 4])
+    assert store.set_members(1).tolist() == [1, 5]
+    assert store.set_members(99).tolist() == []
+
+
+
+def test_record_table_index_after_mutation():
+    parts = RecordTable([SimpleNamespace(pid=pid) for pid in (1, 2, 3)], id_field='pid')
+    assert parts.get(2).pid == 2  # 인덱스 생성
+
+    parts[1] = SimpleNamespace(pid=7)  # 길이가 같은 교체
+    assert parts.get(2) is None and parts.get(7) is parts[1]
+    parts.pop(0)
+    assert parts.get(1) is None
+    parts.append(SimpleNamespace(pid=1))
+    del parts[0]
+    assert parts.get(7) is None and parts.get(1).pid == 1
+    parts += [SimpleNamespace(pid=4)]
+    assert isinstance(parts, RecordTable) and parts.get(4).pid == 4
+    parts[:] = [SimpleNamespace(pid=5), SimpleNamespace(pid=6)]
+    assert parts.get(3) is None and parts.get(6).pid == 6
+    parts.clear()
+    assert parts.get(5, 'missing') == 'missing'
+
+
+def test_row_view_is_abstract():
+    with pytest.raises(TypeError):
+        RowView(make_nodes(1), 0)
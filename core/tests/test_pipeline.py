@@ -0,0 +1,103 @@
+"""Headless pipeline tests (parse -> part config -> script, batch)"""
+import sys
+from pathlib import Path
+
+# Project root (the in-tree C++ parser build is added by the root conftest.py)
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_DIR))
+
+import pytest
+
+from core import pipeline
+from models import LayerConfig
+
+SAMPLE_K = PROJECT_DIR / "core" / "kfile_parser" / "tests" / "sample.k"
+MATERIAL_SOURCE = PROJECT_DIR / "examples" / "scripts" / "MaterialSource.txt"
+
+
+def write_part_csv(path: Path, part_ids) -> Path:
+    path.write_text("".join(f"FTG_R,0.1,1,{pid}\nCU,0.05,2,{pid}\n" for pid in part_ids),
+                    encoding="utf-8")
+    return path
+
+
+def test_load_model_missing_file():
+    with pytest.raises(FileNotFoundError):
+        pipeline.load_model(str(SAMPLE_K.with_name("missing.k")))
+
+
+def test_load_material_db_is_cached():
+    first = pipeline.load_material_db(str(MATERIAL_SOURCE))
+    assert pipeline.load_material_db(str(MATERIAL_SOURCE)) is first
+    assert "FTG_R" in first.materials
+
+    with pytest.raises(ValueError):
+        pipeline.load_material_db(str(SAMPLE_K.with_name("missing.txt")))
+
+
+def test_build_part_configs():
+    """CSV에 있는 Part만 활성화, 모델에 없는 Part ID는 무시"""
+    model = pipeline.load_model(str(SAMPLE_K))
+    layers = {1: [LayerConfig("FTG_R", 0.1, 1)], 999: [LayerConfig("CU", 0.05, 1)]}
+    parts = pipeline.build_part_configs(model, layers)
+
+    assert [p.part_id for p in parts] == [1, 2]
+    assert parts[0].enabled and parts[0].part_name == "Test Part 1"
+    assert [layer.material_name for layer in parts[0].layers] == ["FTG_R"]
+    assert not parts[1].enabled and parts[1].layers == []
+
+
+def test_generate_script(tmp_path):
+    model = pipeline.load_model(str(SAMPLE_K))
+    csv_path = write_part_csv(tmp_path / "parts.csv", [1])
+
+    script = pipeline.generate_script(model, str(csv_path), str(MATERIAL_SOURCE),
+                                      output_dir=str(tmp_path))
+    assert script == tmp_path / "sample_display.txt"
+    assert "FTG_R" in script.read_text(encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        pipeline.generate_script(model, str(write_part_csv(tmp_path / "none.csv", [999])),
+                                 str(MATERIAL_SOURCE), output_dir=str(tmp_path))
+
+
+def test_process_deck(tmp_path):
+    job = pipeline.DeckJob(
+        path=str(SAMPLE_K),
+        part_csv=str(write_part_csv(tmp_path / "parts.csv", [1, 2])),
+        material_source=str(MATERIAL_SOURCE),
+        output_dir=str(tmp_path),
+    )
+    result = pipeline.process_deck(job)
+
+    assert result.ok, result.error
+    assert (result.node_count, result.element_count, result.part_count) == (8, 5, 2)
+    assert Path(result.script_path).exists()
+    assert result.total_ms >= result.parse_ms
+
+
+def test_process_deck_captures_errors(tmp_path):
+    """실패한 deck은 예외 대신 결과에 오류가 기록됨"""
+    missing = pipeline.process_deck(pipeline.DeckJob(path=str(tmp_path / "missing.k")))
+    assert not missing.ok
+    assert missing.error.startswith("FileNotFoundError")
+
+    no_materials = pipeline.process_deck(pipeline.DeckJob(
+        path=str(SAMPLE_K), part_csv=str(write_part_csv(tmp_path / "parts.csv", [1]))))
+    assert not no_materials.ok
+    assert no_materials.error.startswith("ValueError")
+
+
+def test_run_batch_keeps_job_order(tmp_path):
+    jobs = [pipeline.DeckJob(path=str(SAMPLE_K)),
+            pipeline.DeckJob(path=str(tmp_path / "missing.k")),
+            pipeline.DeckJob(path=str(SAMPLE_K))]
+    reported = []
+
+    results = pipeline.run_batch(jobs, workers=1, on_result=reported.append)
+    assert [r.ok for r in results] == [True, False, True]
+    assert reported == results
+
+    parallel = pipeline.run_batch(jobs, workers=2)
+    assert [r.path for r in parallel] == [job.path for job in jobs]
+    assert [r.ok for r in parallel] == [True, False, True]
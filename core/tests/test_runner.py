@@ -0,0 +1,69 @@
+"""Headless KooMeshModifier runner tests (fake launcher scripts)"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pytest
+
+from core import runner
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="bash launcher")
+
+
+def write_launcher(path: Path, body: str) -> Path:
+    path.write_text("#!/bin/bash\n" + body + "\n", encoding="utf-8")
+    return path
+
+
+def test_build_command(tmp_path):
+    launcher = write_launcher(tmp_path / "run.sh", "exit 0")
+    script = tmp_path / "scripts" / "model_display.txt"
+
+    program, args, cwd = runner.build_command(str(script), str(launcher))
+    assert program == "/bin/bash"
+    assert args == [str(launcher), "model_display.txt"]
+    assert cwd == str(script.parent)
+
+
+def test_missing_launcher(tmp_path):
+    result = runner.run_script(str(tmp_path / "model_display.txt"), str(tmp_path / "missing.sh"))
+    assert not result.ok
+    assert result.exit_code == 1
+    assert "missing.sh" in result.error
+
+
+def test_run_script_collects_output(tmp_path):
+    """스크립트 폴더에서 실행되고 스크립트 이름이 인자로 전달됨"""
+    launcher = write_launcher(tmp_path / "run.sh", 'echo "cwd=$(pwd) arg=$1"; echo oops >&2; exit 3')
+    script = tmp_path / "model_display.txt"
+    script.write_text("")
+
+    result = runner.run_script(str(script), str(launcher))
+    assert result.exit_code == 3
+    assert result.output.strip() == f"cwd={tmp_path} arg=model_display.txt"
+    assert result.error.strip() == "oops"
+
+
+def test_run_script_streams_lines(tmp_path):
+    launcher = write_launcher(tmp_path / "run.sh", "echo one; echo two")
+    lines = []
+
+    result = runner.run_script(str(tmp_path / "model_display.txt"), str(launcher),
+                               on_output=lines.append)
+    assert result.ok
+    assert lines == ["one\n", "two\n"]
+    assert result.output == "one\ntwo\n"
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_run_script_timeout(tmp_path, streaming):
+    launcher = write_launcher(tmp_path / "run.sh", "echo start; sleep 5; echo end")
+    on_output = (lambda line: None) if streaming else None
+
+    result = runner.run_script(str(tmp_path / "model_display.txt"), str(launcher),
+                               timeout=0.5, on_output=on_output)
+    assert result.exit_code == -1
+    assert "시간 초과" in result.error
+    assert result.elapsed_s < 5
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Exterior face extraction benchmark: tuple/dict counting vs NumPy keys
+
+Compares the previous MeshData.extract_exterior_faces algorithm (a sorted
+Python tuple per hex face counted in a dict) with the current vectorized
+implementation (face arrays from CSR connectivity, row-sorted and packed into
+uint64 keys, boundary faces from np.unique(return_counts=True)) on synthetic
+hex-block models.
+
+- node count < 65535: exact packed keys
+- larger models: 64-bit hash keys with a second hash to detect collisions
+
+The reference is only run up to --reference-limit elements (it needs minutes
+and several GB at 5M hexes); both results are checked for identical faces.
+
+Usage:
+    python examples/benchmark_exterior_faces.py [--elements 5000000] [--parts 20]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+from gui.modules.model_viewer.core.mesh_data import MeshData, boundary_faces
+
+HEX_FACES = [[0, 1, 2, 3], [4, 5, 6, 7], [0, 1, 5, 4], [2, 3, 7, 6], [0, 3, 7, 4], [1, 2, 6, 5]]
+
+
+def reference_exterior_faces(elements, part_elements):
+    """Previous implementation (sorted tuple per face + dict count)"""
+    elem_to_part = {}
+    for pid, elem_indices in part_elements.items():
+        for elem_idx in elem_indices:
+            elem_to_part[int(elem_idx)] = pid
+
+    face_count = {}
+    face_to_elem = {}
+    for elem_idx, node_indices in enumerate(elements):
+        for face_idx, face_def in enumerate(HEX_FACES):
+            face_nodes = tuple(sorted([node_indices[i] for i in face_def]))
+            face_count[face_nodes] = face_count.get(face_nodes, 0) + 1
+            face_to_elem[face_nodes] = (elem_idx, face_idx)
+
+    exterior_faces = {}
+    for face_nodes, count in face_count.items():
+        if count == 1:
+            elem_idx, face_idx = face_to_elem[face_nodes]
+            exterior_faces.setdefault(elem_to_part[elem_idx], []).append((elem_idx, HEX_FACES[face_idx]))
+    return exterior_faces
+
+
+def make_hex_block(target_elements: int, parts: int) -> MeshData:
+    """n x n x n hex block, parts stacked as slabs along k"""
+    n = max(1, round(target_elements ** (1 / 3)))
+    grid = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), np.arange(n + 1),
+                                indexing='ij'), axis=-1).reshape(-1, 3)
+    node_ids = np.arange(1, len(grid) + 1)
+
+    def nid(i, j, k):
+        return (i * (n + 1) + j) * (n + 1) + k + 1
+
+    i, j, k = np.meshgrid(np.arange(n), np.arange(n), np.arange(n), indexing='ij')
+    i, j, k = i.ravel(), j.ravel(), k.ravel()
+    connectivity = np.stack([
+        nid(i, j, k), nid(i + 1, j, k), nid(i + 1, j + 1, k), nid(i, j + 1, k),
+        nid(i, j, k + 1), nid(i + 1, j, k + 1), nid(i + 1, j + 1, k + 1), nid(i, j + 1, k + 1),
+    ], axis=1).astype(np.int32)
+    pids = (k * parts // n + 1).astype(np.int32)
+    del i, j, k
+    return MeshData.from_arrays(node_ids, grid * 1.0, connectivity, pids, 'solid')
+
+
+def normalized(faces):
+    """{(elem_idx, face local tuple)} for comparison"""
+    return {(int(e), tuple(f)) for part_faces in faces.values() for e, f in part_faces}
+
+
+def run(elements: int, parts: int, reference_limit: int):
+    start = time.perf_counter()
+    mesh = make_hex_block(elements, parts)
+    build_s = time.perf_counter() - start
+    cells = len(mesh.cell_types)
+    print("=" * 70)
+    print(f"  {cells:,} hex elements, {len(mesh.nodes):,} nodes "
+          f"({'exact keys' if len(mesh.nodes) < 65535 else 'hash keys'}), mesh build {build_s:.1f} s")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    face_elems, face_ids, face_nodes = mesh.cell_faces()
+    faces_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exterior = boundary_faces(face_nodes, len(mesh.nodes))
+    unique_s = time.perf_counter() - start
+    del face_elems, face_ids, face_nodes, exterior
+
+    start = time.perf_counter()
+    faces = mesh.extract_exterior_faces()
+    total_s = time.perf_counter() - start
+    count = sum(len(f) for f in faces.values())
+
+    print(f"  face arrays ({cells * 6:,} faces)  {faces_s * 1000:9.1f} ms")
+    print(f"  keys + np.unique              {unique_s * 1000:9.1f} ms")
+    print(f"  extract_exterior_faces total  {total_s * 1000:9.1f} ms  ({count:,} exterior faces)")
+
+    start = time.perf_counter()
+    again = mesh.extract_exterior_faces()
+    print(f"  second call (cached)          {(time.perf_counter() - start) * 1000:9.3f} ms")
+    assert again is faces
+
+    if cells <= reference_limit:
+        elements_list = [cell.tolist() for cell in mesh.elements]
+        start = time.perf_counter()
+        ref = reference_exterior_faces(elements_list, mesh.part_elements)
+        ref_s = time.perf_counter() - start
+        assert normalized(ref) == normalized(faces), "exterior faces differ"
+        print(f"  previous (tuples + dict)      {ref_s * 1000:9.1f} ms  ({ref_s / total_s:5.1f}x)")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--elements", type=int, default=5_000_000)
+    parser.add_argument("--parts", type=int, default=20)
+    parser.add_argument("--reference-limit", type=int, default=300_000)
+    args = parser.parse_args()
+
+    # 소형 (정확한 키) -> 대형 (해시 키)
+    for elements in sorted({min(args.elements, 30_000), min(args.elements, 250_000), args.elements}):
+        run(elements, args.parts, args.reference_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Headless pipeline benchmark: import time and batch throughput
+
+1. Import time of core.pipeline in a fresh interpreter, and a check that
+   neither PySide6 nor OpenGL was loaded.
+2. Batch throughput over synthetic shell decks (parse + display script
+   generation), in-process and with worker processes.
+
+Usage:
+    python examples/benchmark_headless.py [--decks 200] [--grid 60] [--jobs 0]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+# Use the in-tree C++ parser build if it is not installed
+sys.path.insert(1, str(PROJECT_DIR / "core" / "kfile_parser"))
+
+IMPORT_PROBE = """
+import sys, time
+sys.path.insert(0, 'core/kfile_parser')
+start = time.perf_counter()
+import core.pipeline
+elapsed = (time.perf_counter() - start) * 1000
+heavy = sorted(m for m in sys.modules if m.split('.')[0] in ('PySide6', 'OpenGL'))
+print(f"{elapsed:.1f}|{','.join(heavy)}")
+"""
+
+
+def measure_import(repeat: int = 5):
+    """Import time of core.pipeline in fresh interpreters (best of repeat)"""
+    times = []
+    heavy = ""
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", IMPORT_PROBE], cwd=PROJECT_DIR,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        ms, heavy = out.split("|")
+        times.append(float(ms))
+    return min(times), heavy
+
+
+def write_deck(path: Path, grid: int, parts: int):
+    """Shell grid deck with grid x grid elements split into parts strips"""
+    lines = ["*KEYWORD", "*NODE"]
+    nid = 1
+    for j in range(grid + 1):
+        for i in range(grid + 1):
+            lines.append(f"{nid:8d}{float(i):16.6f}{float(j):16.6f}{0.0:16.6f}       0       0")
+            nid += 1
+    for pid in range(1, parts + 1):
+        lines += ["*PART", f"Part {pid}", f"{pid:10d}{1:10d}{1:10d}"]
+    lines += ["*SECTION_SHELL", f"{1:10d}", f"{1.0:10.1f}{1.0:10.1f}{1.0:10.1f}{1.0:10.1f}"]
+    lines.append("*ELEMENT_SHELL")
+    eid = 1
+    rows_per_part = max(1, grid // parts)
+    for j in range(grid):
+        pid = min(parts, j // rows_per_part + 1)
+        for i in range(grid):
+            n1 = j * (grid + 1) + i + 1
+            lines.append(f"{eid:8d}{pid:8d}{n1:8d}{n1 + 1:8d}{n1 + grid + 2:8d}{n1 + grid + 1:8d}")
+            eid += 1
+    lines.append("*END")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def write_inputs(workdir: Path, parts: int):
+    """Part config CSV for every part (materials from the example MaterialSource)"""
+    csv_path = workdir / "parts.csv"
+    csv_path.write_text("".join(f"PL,0.5,1,{pid}\nOCA,0.3,2,{pid}\n" for pid in range(1, parts + 1)))
+    material_src = PROJECT_DIR / "examples" / "scripts" / "MaterialSource.txt"
+    return str(csv_path), str(material_src)
+
+
+def run_batch(paths, part_csv, materials, workers: int):
+    from core.pipeline import DeckJob, run_batch
+    jobs = [DeckJob(path=str(p), part_csv=part_csv, material_source=materials) for p in paths]
+    start = time.perf_counter()
+    results = run_batch(jobs, workers)
+    elapsed = time.perf_counter() - start
+    failed = [r for r in results if not r.ok]
+    if failed:
+        print(f"  {len(failed)} failed, first: {failed[0].filename}: {failed[0].error}")
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--decks", type=int, default=200)
+    parser.add_argument("--grid", type=int, default=60, help="elements per deck side")
+    parser.add_argument("--parts", type=int, default=10)
+    parser.add_argument("--jobs", type=int, default=0, help="worker processes (0: CPU count)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("  Import")
+    print("=" * 70)
+    import_ms, heavy = measure_import()
+    print(f"  core.pipeline import: {import_ms:.1f} ms")
+    print(f"  Qt/OpenGL modules loaded: {heavy or 'none'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        deck_dir = workdir / "decks"
+        deck_dir.mkdir()
+        write_deck(deck_dir / "deck_0000.k", args.grid, args.parts)
+        template = (deck_dir / "deck_0000.k").read_bytes()
+        for i in range(1, args.decks):
+            (deck_dir / f"deck_{i:04d}.k").write_bytes(template)
+        paths = sorted(deck_dir.glob("*.k"))
+        part_csv, materials = write_inputs(workdir, args.parts)
+        total_mb = len(template) * len(paths) / (1024 * 1024)
+
+        print()
+        print("=" * 70)
+        print(f"  Batch: {len(paths)} decks, {args.grid * args.grid:,} elements each, "
+              f"{total_mb:.1f} MB total")
+        print("=" * 70)
+
+        workers = args.jobs or os.cpu_count() or 1
+        for n in sorted({1, workers}):
+            elapsed, results = run_batch(paths, part_csv, materials, n)
+            parse_ms = sum(r.parse_ms for r in results) / len(results)
+            print(f"  workers={n:<3d} {elapsed:7.2f} s  {len(paths) / elapsed:8.1f} decks/s  "
+                  f"{total_mb / elapsed:7.1f} MB/s  (avg parse {parse_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
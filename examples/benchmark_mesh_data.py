@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+MeshData construction benchmark: per-element Python loop vs NumPy
+
+Compares the previous MeshData.from_parsed_model algorithm (node_id_to_idx
+dict + per-element remapping loop + per-part index lists) with the current
+vectorized implementation on synthetic hex-grid models:
+
+- object lists (NodeData/ElementData, as produced by the basic parser)
+- the columnar model store (what the GUI uses)
+- dense vs sparse node IDs (lookup table vs searchsorted)
+
+Results are checked for identical connectivity and part grouping.
+
+Usage:
+    python examples/benchmark_mesh_data.py [--elements 1000000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+sys.path.insert(1, str(PROJECT_DIR / "core" / "kfile_parser"))
+
+from kfile_parser.wrapper import ElementData, NodeData, PartData
+
+from core.model_store import ModelStore
+from gui.modules.model_viewer.core.mesh_data import MeshData
+
+
+def reference_from_objects(nodes_list, elements_list, nodes_per_elem=8):
+    """Previous implementation (dict lookup + Python loops)"""
+    node_id_to_idx = {}
+    nodes_array = np.empty((len(nodes_list), 3), dtype=np.float64)
+    for idx, node in enumerate(nodes_list):
+        node_id_to_idx[getattr(node, 'nid', idx + 1)] = idx
+        nodes_array[idx, 0] = getattr(node, 'x', 0.0)
+        nodes_array[idx, 1] = getattr(node, 'y', 0.0)
+        nodes_array[idx, 2] = getattr(node, 'z', 0.0)
+
+    elements_array = np.empty((len(elements_list), nodes_per_elem), dtype=np.int32)
+    part_elem_dict = {}
+    for elem_idx, elem in enumerate(elements_list):
+        node_list = getattr(elem, 'nodes', [0] * nodes_per_elem)
+        for i in range(nodes_per_elem):
+            nid = node_list[i] if i < len(node_list) else 0
+            elements_array[elem_idx, i] = node_id_to_idx.get(int(nid), 0)
+        pid = getattr(elem, 'pid', 0)
+        if pid not in part_elem_dict:
+            part_elem_dict[pid] = []
+        part_elem_dict[pid].append(elem_idx)
+
+    part_elements = {pid: np.array(idx, dtype=np.int32) for pid, idx in part_elem_dict.items()}
+    return nodes_array, elements_array, part_elements
+
+
+def make_arrays(target_elements: int, parts: int, id_stride: int):
+    """Hex grid (n x n x n elements) as node/element arrays"""
+    n = max(1, round(target_elements ** (1 / 3)))
+    grid = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), np.arange(n + 1),
+                                indexing='ij'), axis=-1).reshape(-1, 3)
+    xyz = grid * 2.5 + np.array([5000.0, -1200.0, 800.0])
+    node_ids = (np.arange(len(xyz)) * id_stride + 1).astype(np.int64)
+
+    def nid(i, j, k):
+        return (i * (n + 1) + j) * (n + 1) + k
+
+    i, j, k = np.meshgrid(np.arange(n), np.arange(n), np.arange(n), indexing='ij')
+    i, j, k = i.ravel(), j.ravel(), k.ravel()
+    corners = np.stack([
+        nid(i, j, k), nid(i + 1, j, k), nid(i + 1, j + 1, k), nid(i, j + 1, k),
+        nid(i, j, k + 1), nid(i + 1, j, k + 1), nid(i + 1, j + 1, k + 1), nid(i, j + 1, k + 1),
+    ], axis=1)
+    connectivity = node_ids[corners]
+    # Parts interleaved along i so grouping has real work to do
+    pids = (i % parts + 1).astype(np.int64)
+    return node_ids, xyz, connectivity, pids
+
+
+def make_object_model(node_ids, xyz, connectivity, pids, parts):
+    nodes = [NodeData(int(a), float(x), float(y), float(z))
+             for a, (x, y, z) in zip(node_ids.tolist(), xyz.tolist())]
+    elements = [ElementData(eid + 1, int(p), c, 'solid', 8)
+                for eid, (c, p) in enumerate(zip(connectivity.tolist(), pids.tolist()))]
+    part_list = [PartData(pid, f"Part {pid}", 1, 1) for pid in range(1, parts + 1)]
+    return SimpleNamespace(nodes=nodes, elements={'solid': elements, 'shell': []}, parts=part_list), \
+        nodes, elements
+
+
+def make_store_model(node_ids, xyz, connectivity, pids, parts):
+    from core.model_data import ParsedModelData
+    store = ModelStore()
+    store.nodes.load({'nid': node_ids, 'xyz': xyz})
+    conn = np.zeros((len(connectivity), 8), dtype=np.int32)
+    conn[:] = connectivity
+    store.elements.load({
+        'eid': np.arange(1, len(conn) + 1), 'pid': pids,
+        'etype': np.ones(len(conn)), 'node_count': np.full(len(conn), 8), 'nodes': conn,
+    })
+    store.parts.extend(PartData(pid, f"Part {pid}", 1, 1) for pid in range(1, parts + 1))
+    return ParsedModelData(filename="benchmark.k", _store=store)
+
+
+def best_of(fn, repeat):
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+def check_same(ref, mesh):
+    _, ref_elements, ref_parts = ref
+    assert np.array_equal(ref_elements, mesh.elements), "connectivity differs"
+    assert ref_parts.keys() == mesh.part_elements.keys(), "part ids differ"
+    for pid, idx in ref_parts.items():
+        assert np.array_equal(idx, mesh.part_elements[pid]), f"part {pid} differs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    parser.add_argument("--parts", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for label, stride in (("dense IDs (lookup table)", 1), ("sparse IDs (searchsorted)", 97)):
+        node_ids, xyz, connectivity, pids = make_arrays(args.elements, args.parts, stride)
+        print("=" * 70)
+        print(f"  {len(connectivity):,} hex elements, {len(node_ids):,} nodes, {label}")
+        print("=" * 70)
+
+        model, nodes, elements = make_object_model(node_ids, xyz, connectivity, pids, args.parts)
+        ref_ms, ref = best_of(lambda: reference_from_objects(nodes, elements), 1)
+        obj_ms, mesh = best_of(lambda: MeshData.from_parsed_model(model), args.repeat)
+        check_same(ref, mesh)
+        del model, nodes, elements
+
+        store_model = make_store_model(node_ids, xyz, connectivity, pids, args.parts)
+        store_ms, mesh = best_of(lambda: MeshData.from_parsed_model(store_model), args.repeat)
+        check_same(ref, mesh)
+        store_model.release()
+
+        arr_ms, mesh = best_of(lambda: MeshData.from_arrays(node_ids, xyz, connectivity, pids, 'solid'),
+                               args.repeat)
+        check_same(ref, mesh)
+
+        print(f"  previous (dict + loops)        {ref_ms:9.1f} ms")
+        print(f"  vectorized, object lists       {obj_ms:9.1f} ms  ({ref_ms / obj_ms:5.1f}x)")
+        print(f"  vectorized, model store        {store_ms:9.1f} ms  ({ref_ms / store_ms:5.1f}x)")
+        print(f"  vectorized, from_arrays only   {arr_ms:9.1f} ms  ({ref_ms / arr_ms:5.1f}x)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+VBO buffer construction benchmark: per-vertex list.extend vs NumPy gathering
+
+Builds the vertex arrays used by the VBO renderer for every draw mode without
+an OpenGL context (the GL upload itself is not measured):
+
+- solid     fan-triangulated exterior faces, part color
+- edges     exterior face outlines, black
+- wireframe exterior face outlines, part color
+- picking   triangles with a per-face 24-bit color ID
+- nodes     unique nodes of the visible parts
+- batched   solid + edges of all parts concatenated
+- indexed   the indexed skin the renderer uploads instead of the above:
+            shared per-part vertices (position, face normal on the provoking
+            vertex, part color, picking color) + triangle and deduplicated
+            edge index lists
+
+The previous implementation (a Python list extended per vertex, converted to
+float32 at the end) is run up to --reference-limit faces and both results are
+checked for identical buffers. The memory line compares the indexed skin with
+the non-indexed buffers the renderer used to keep for the same faces.
+
+The LOD line times the interaction levels (vertex clustering of the indexed
+skin) built at load time and lists their triangle counts.
+
+The cache lines rebuild the skin through the part-granular RenderCache: cold
+(every part built), unchanged model (every part reused) and one moved part
+(only that part rebuilt).
+
+The progressive line runs the worker-thread skin loader used for large models:
+time until the first part batch can be uploaded and drawn, and until the full
+skin is ready (the blocking path waits for the latter before the first frame).
+
+The disk cache line compares opening a model cold (exterior face extraction +
+skin build) with reopening it from the on-disk SkinDiskCache: the mesh content
+hash that keys the entry, and the memory-mapped load.
+
+The raycast line builds the exterior face BVH and casts rays from a fitted
+camera through random face centers (CPU picking instead of a color-ID render
+and glReadPixels).
+
+The visibility lines time a part toggle, isolate and show-all: concatenating
+the visible index ranges for re-upload vs updating the multi-draw list
+(PartRuns) over the resident per-part buffers.
+
+Usage:
+    python examples/benchmark_vbo_buffers.py [--faces 1000000] [--parts 50]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+from gui.mesh_cache import SkinDiskCache
+from gui.modules.model_viewer.core import vertex_buffers as vb
+from gui.modules.model_viewer.core.bvh import FaceBVH
+from gui.modules.model_viewer.core.camera import Camera
+from gui.modules.model_viewer.core.lod import LODSettings, build_lod_levels
+from gui.modules.model_viewer.core.progressive import LoadedSkin, ProgressiveSkinLoader, upload_order
+from gui.modules.model_viewer.core.render_cache import RenderCache, cached_skin
+from gui.modules.model_viewer.core.mesh_data import MeshData
+
+BLACK = (0.0, 0.0, 0.0)
+
+
+def make_skin(target_faces: int, parts: int) -> MeshData:
+    """n x n quad shell on a wavy surface, every 7th quad split into two tris"""
+    n = max(1, round(target_faces ** 0.5))
+    ij = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij'), axis=-1).reshape(-1, 2)
+    xyz = np.zeros((len(ij), 3))
+    xyz[:, :2] = ij * 5.0
+    xyz[:, 2] = np.sin(ij[:, 0] * 0.05) * 20.0
+    node_ids = np.arange(1, len(xyz) + 1)
+
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    i, j = i.ravel(), j.ravel()
+    n1 = i * (n + 1) + j + 1
+    quads = np.stack([n1, n1 + n + 1, n1 + n + 2, n1 + 1], axis=1)
+    split = np.arange(len(quads)) % 7 == 0
+    tris = np.concatenate([quads[split][:, [0, 1, 2, 2]], quads[split][:, [0, 2, 3, 3]]])
+    connectivity = np.zeros((len(quads) - split.sum() + len(tris), 8), dtype=np.int32)
+    connectivity[:, :4] = np.concatenate([quads[~split], tris])
+    pids = np.concatenate([i[~split], i[split], i[split]]) * parts // n + 1
+    return MeshData.from_arrays(node_ids, xyz, connectivity, pids, 'shell')
+
+
+def reference_faces(mesh, part_faces, color, mode):
+    """Previous implementation (list.extend per vertex)"""
+    vertices = []
+    for elem_idx, face_indices in part_faces:
+        node_indices = mesh.elements[elem_idx]
+        if mode == 'solid':
+            for k in range(1, len(face_indices) - 1):
+                for i in (face_indices[0], face_indices[k], face_indices[k + 1]):
+                    p = mesh.nodes[node_indices[i]]
+                    vertices.extend([p[0], p[1], p[2]])
+                    vertices.extend(color)
+        else:
+            n = len(face_indices)
+            for k in range(n):
+                p1 = mesh.nodes[node_indices[face_indices[k]]]
+                p2 = mesh.nodes[node_indices[face_indices[(k + 1) % n]]]
+                vertices.extend([p1[0], p1[1], p1[2]])
+                vertices.extend(color)
+                vertices.extend([p2[0], p2[1], p2[2]])
+                vertices.extend(color)
+    return np.array(vertices, dtype=np.float32)
+
+
+def reference_picking(mesh, part_faces, color_id):
+    vertices = []
+    for elem_idx, face_indices in part_faces:
+        color = (((color_id >> 16) & 0xFF) / 255.0, ((color_id >> 8) & 0xFF) / 255.0,
+                 (color_id & 0xFF) / 255.0)
+        color_id += 1
+        node_indices = mesh.elements[elem_idx]
+        for k in range(1, len(face_indices) - 1):
+            for i in (face_indices[0], face_indices[k], face_indices[k + 1]):
+                p = mesh.nodes[node_indices[i]]
+                vertices.extend([p[0], p[1], p[2]])
+                vertices.extend(color)
+    return np.array(vertices, dtype=np.float32)
+
+
+def reference_nodes(mesh, part_ids):
+    node_indices = set()
+    for pid in part_ids:
+        for elem_idx in mesh.part_elements[pid]:
+            node_indices.update(mesh.elements[elem_idx])
+    vertices = []
+    for idx in sorted(node_indices):
+        p = mesh.nodes[idx]
+        vertices.extend([p[0], p[1], p[2]])
+        vertices.extend([1.0, 1.0, 0.0])
+    return np.array(vertices, dtype=np.float32)
+
+
+def build_modes(mesh, faces, colors):
+    """Vectorized buffers per mode, as built by VBORenderer"""
+    nodes = mesh.nodes
+
+    def picking():
+        result, color_id = {}, 1
+        for pid, part_faces in faces.items():
+            result[pid] = vb.picking_vertices(nodes, part_faces.nodes, color_id)
+            color_id += len(part_faces)
+        return result
+
+    def batched():
+        return (np.concatenate([vb.solid_vertices(nodes, f.nodes, colors[pid]) for pid, f in faces.items()]),
+                np.concatenate([vb.edge_vertices(nodes, f.nodes, BLACK) for f in faces.values()]))
+
+    def node_points():
+        used = np.zeros(len(nodes), dtype=bool)
+        used[mesh.cell_nodes(mesh.get_visible_elements(set(faces)))] = True
+        return vb.point_vertices(nodes, np.flatnonzero(used), (1.0, 1.0, 0.0))
+
+    return {
+        'solid': lambda: {pid: vb.solid_vertices(nodes, f.nodes, colors[pid]) for pid, f in faces.items()},
+        'edges': lambda: {pid: vb.edge_vertices(nodes, f.nodes, BLACK) for pid, f in faces.items()},
+        'wireframe': lambda: {pid: vb.edge_vertices(nodes, f.nodes, colors[pid]) for pid, f in faces.items()},
+        'picking': picking,
+        'nodes': node_points,
+        'batched': batched,
+        'indexed': lambda: vb.build_indexed_skin(nodes, faces, colors),
+    }
+
+
+def build_reference(mesh, faces, colors):
+    def picking():
+        result, color_id = {}, 1
+        for pid, part_faces in faces.items():
+            result[pid] = reference_picking(mesh, part_faces, color_id)
+            color_id += len(part_faces)
+        return result
+
+    def batched():
+        return (np.concatenate([reference_faces(mesh, f, colors[pid], 'solid') for pid, f in faces.items()]),
+                np.concatenate([reference_faces(mesh, f, BLACK, 'edges') for f in faces.values()]))
+
+    return {
+        'solid': lambda: {pid: reference_faces(mesh, f, colors[pid], 'solid') for pid, f in faces.items()},
+        'edges': lambda: {pid: reference_faces(mesh, f, BLACK, 'edges') for pid, f in faces.items()},
+        'wireframe': lambda: {pid: reference_faces(mesh, f, colors[pid], 'edges') for pid, f in faces.items()},
+        'picking': picking,
+        'nodes': lambda: reference_nodes(mesh, faces),
+        'batched': batched,
+    }
+
+
+def flatten(result):
+    if isinstance(result, vb.IndexedSkin):
+        return [result.vertices, result.triangles, result.edges]
+    if isinstance(result, dict):
+        return [np.ravel(a) for a in result.values()]
+    if isinstance(result, tuple):
+        return [np.ravel(a) for a in result]
+    return [np.ravel(result)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def run(target_faces, parts, reference_limit):
+    mesh = make_skin(target_faces, parts)
+    faces = mesh.extract_exterior_faces()
+    face_count = sum(len(f) for f in faces.values())
+    colors = {pid: (0.0, 0.45, 0.74) if pid % 2 else (0.85, 0.33, 0.10) for pid in faces}
+    with_reference = face_count <= reference_limit
+
+    print("=" * 70)
+    print(f"  {face_count:,} exterior faces, {len(mesh.nodes):,} nodes, {len(faces)} parts")
+    print("=" * 70)
+
+    modes = build_modes(mesh, faces, colors)
+    reference = build_reference(mesh, faces, colors) if with_reference else {}
+    for mode, fn in modes.items():
+        ms, result = timed(fn)
+        nbytes = sum(a.nbytes for a in flatten(result))
+        line = f"  {mode:10s} {ms:9.1f} ms  {nbytes / 1e6:8.1f} MB"
+        if mode in reference:
+            ref_ms, ref = timed(reference[mode])
+            assert all(np.array_equal(a, b) for a, b in zip(flatten(result), flatten(ref))), \
+                f"{mode} buffers differ"
+            line += f"   previous {ref_ms:9.1f} ms  ({ref_ms / ms:5.1f}x)"
+        print(line)
+
+    skin = result
+    print(f"  memory: indexed {skin.nbytes / 1e6:.1f} MB vs non-indexed {skin.unindexed_nbytes / 1e6:.1f} MB "
+          f"({skin.unindexed_nbytes / skin.nbytes:.1f}x), {len(skin.vertices):,} vertices for "
+          f"{len(mesh.nodes):,} nodes, {len(skin.edges):,} edges of {skin.face_edge_count:,}")
+    lod_ms, levels = timed(lambda: build_lod_levels(skin, LODSettings(min_triangles=0)))
+    print(f"  lod        {lod_ms:9.1f} ms  triangles {len(skin.triangles):,} -> "
+          + " -> ".join(f"{len(level.triangles):,}" for level in levels))
+    benchmark_cache(mesh, faces, colors)
+    benchmark_progressive(mesh, faces, colors)
+    benchmark_disk_cache(mesh, colors)
+    benchmark_picking(mesh, faces)
+    benchmark_visibility(skin)
+    print()
+
+
+def benchmark_cache(mesh, faces, colors):
+    cache = RenderCache(max_memory_mb=4096)
+    moved = mesh.nodes.copy()
+    last = next(reversed(faces.values()))
+    moved[last.nodes[last.nodes >= 0]] += 1.0
+    cases = {'cold': mesh.nodes, 'unchanged': mesh.nodes, 'one part': moved}
+    for label, nodes in cases.items():
+        ms, (_, _, built) = timed(lambda: cached_skin(cache, nodes, faces, colors))
+        print(f"  cache {label:10s} {ms:9.1f} ms  ({built} of {len(faces)} parts built)")
+
+
+def benchmark_progressive(mesh, faces, colors):
+    order = upload_order(*mesh.part_bounds())
+    loader = ProgressiveSkinLoader(RenderCache(max_memory_mb=4096), mesh.nodes, faces, colors, order)
+    start = time.perf_counter()
+    loader.start()
+    first_ms = None
+    while True:
+        results = loader.poll()
+        now = (time.perf_counter() - start) * 1000
+        if results and first_ms is None:
+            first_ms = now
+        if any(isinstance(r, LoadedSkin) for r in results) or not loader.is_alive() and not results:
+            break
+        time.sleep(0.001)
+    print(f"  progressive first batch {first_ms:7.1f} ms  full skin {now:8.1f} ms  "
+          f"({len(loader.batches)} batches)")
+
+
+def benchmark_disk_cache(mesh, colors):
+    def cold():
+        mesh.clear_exterior_faces()
+        faces = mesh.extract_exterior_faces()
+        return faces, cached_skin(RenderCache(max_memory_mb=4096), mesh.nodes, faces, colors)
+
+    cold_ms, (faces, (skin, signatures, _)) = timed(cold)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SkinDiskCache(Path(tmp))
+        hash_ms, key = timed(lambda: cache.key_for(mesh))
+        save_ms, _ = timed(lambda: cache.save(key, faces, skin, signatures))
+        load_ms, cached = timed(lambda: cache.load(key))
+        # memory-mapped: the data is read at upload time, here once in full
+        read_ms, _ = timed(lambda: [np.asarray(getattr(cached.skin, name)).sum()
+                                    for name in ('vertices', 'triangles', 'edges')])
+        del cached
+    print(f"  disk cache cold {cold_ms:8.1f} ms  reopen {hash_ms + load_ms:7.1f} ms "
+          f"(hash {hash_ms:.1f}, map {load_ms:.1f}, read {read_ms:.1f})  save {save_ms:7.1f} ms")
+
+
+def benchmark_picking(mesh, faces, rays=200):
+    build_ms, bvh = timed(lambda: FaceBVH(mesh.nodes, faces))
+    camera = Camera()
+    camera.fit_to_bounds(mesh.nodes.min(axis=0), mesh.nodes.max(axis=0))
+    view = camera.get_view_matrix()
+    eye = -(view[:3, :3].T @ view[:3, 3])
+    face_nodes = np.concatenate([f.nodes for f in faces.values()])
+    rng = np.random.default_rng(0)
+    times = []
+    for k in rng.integers(len(face_nodes), size=rays):
+        direction = mesh.nodes[face_nodes[k, :3]].mean(axis=0) - eye
+        ms, hit = timed(lambda: bvh.raycast(eye, direction / np.linalg.norm(direction)))
+        assert hit is not None
+        times.append(ms)
+    print(f"  raycast    bvh {build_ms:7.1f} ms  {bvh.nbytes / 1e6:6.1f} MB   ray median "
+          f"{np.median(times):5.2f} ms, p95 {np.percentile(times, 95):5.2f} ms")
+
+
+def benchmark_visibility(skin):
+    part_ids = skin.part_ids.tolist()
+    runs = vb.PartRuns(part_ids)
+    cases = {
+        'hide one': set(part_ids[:len(part_ids) // 2] + part_ids[len(part_ids) // 2 + 1:]),
+        'isolate': {part_ids[len(part_ids) // 2]},
+        'show all': set(part_ids),
+    }
+
+    def concatenate(visible):
+        ranks = [i for i, pid in enumerate(part_ids) if pid in visible]
+        return (np.concatenate([skin.triangles[skin.triangle_offsets[r]:skin.triangle_offsets[r + 1]]
+                                for r in ranks]),
+                np.concatenate([skin.edges[skin.edge_offsets[r]:skin.edge_offsets[r + 1]] for r in ranks]))
+
+    def draw_list(visible):
+        runs.set_visible(visible)
+        return runs.ranges(skin.triangle_offsets), runs.ranges(skin.edge_offsets)
+
+    for label, visible in cases.items():
+        rebuild_ms, _ = timed(lambda: concatenate(visible))
+        update_ms, ((_, counts), _) = timed(lambda: draw_list(visible))
+        print(f"  visibility {label:9s} re-upload indices {rebuild_ms:8.2f} ms   "
+              f"draw list {update_ms * 1000:7.1f} us ({len(counts)} draws)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--faces", type=int, default=1_000_000)
+    parser.add_argument("--parts", type=int, default=50)
+    parser.add_argument("--reference-limit", type=int, default=100_000,
+                        help="run the previous per-vertex loops up to this many faces")
+    args = parser.parse_args()
+
+    for faces in sorted({min(20_000, args.faces), args.faces}):
+        run(faces, args.parts, args.reference_limit)
+
+
+if __name__ == "__main__":
+    main()
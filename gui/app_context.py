@@ -1,306 +1,18 @@
 """App context - shared state between modules"""
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
-from pathlib import Path
+from typing import Optional, List, TYPE_CHECKING
 
 from core import ConfigManager, MaterialDatabase
+from core.geometry_cache import GeometryCache
+from core.memory_registry import memory_registry
+from core.model_data import (
+    ParsedModelData, parse_k_file, BasicKFileParser, _KFILE_READER_AVAILABLE,
+)
+from gui.mesh_cache import SkinDiskCache
+from gui.workspace import ModelWorkspace
 
-# C++ 파서 가용성 확인
-try:
-    from core.KooDynaKeyword import KFileReader, is_fast_parser_available
-    _KFILE_READER_AVAILABLE = is_fast_parser_available()
-except ImportError:
-    _KFILE_READER_AVAILABLE = False
-    KFileReader = None
-
-# 기본 Python 파서 (fallback)
-from core import KFileParser as BasicKFileParser
-
-
-@dataclass
-class ParsedModelData:
-    """파싱된 K-file 모델 데이터를 저장하는 클래스
-
-    모든 모듈에서 공유하는 중앙 데이터 저장소입니다.
-    C++ 파서로 파싱한 결과를 캐시하여 재파싱을 방지합니다.
-    """
-
-    # 파일 정보
-    filepath: str = ""
-    filename: str = ""
-    parse_time_ms: float = 0.0
-
-    # 기본 통계
-    node_count: int = 0
-    element_count: int = 0
-    part_count: int = 0
-
-    # KFileReader 인스턴스 (C++ 파서 결과)
-    _reader: Optional['KFileReader'] = None
-
-    # 캐시된 데이터 (lazy loading)
-    _nodes_cache: Optional[List] = None
-    _parts_cache: Optional[List] = None
-    _elements_cache: Optional[Dict] = None
-    _sets_cache: Optional[List] = None
-    _sections_cache: Optional[List] = None
-    _contacts_cache: Optional[List] = None
-    _materials_cache: Optional[List] = None
-    _controls_cache: Optional[Dict] = None
-    _databases_cache: Optional[Dict] = None
-    _boundaries_cache: Optional[Dict] = None
-    _loads_cache: Optional[Dict] = None
-    _initials_cache: Optional[Dict] = None
-    _constraineds_cache: Optional[Dict] = None
-
-    @property
-    def is_loaded(self) -> bool:
-        """모델이 로드되었는지 확인"""
-        return self._reader is not None
-
-    @property
-    def reader(self) -> Optional['KFileReader']:
-        """KFileReader 인스턴스 직접 접근"""
-        return self._reader
-
-    # ========== 노드 ==========
-    @property
-    def nodes(self) -> List:
-        """노드 목록 (lazy loading)"""
-        if self._nodes_cache is None and self._reader:
-            # ParsedKFile에서 직접 접근
-            parsed = self._reader._parsed
-            self._nodes_cache = list(parsed.nodes) if parsed else []
-        return self._nodes_cache or []
-
-    def get_node_by_id(self, nid: int):
-        """ID로 노드 검색"""
-        if self._reader and self._reader._parsed:
-            return self._reader._parsed.get_node(nid)
-        return None
-
-    # ========== 파트 ==========
-    @property
-    def parts(self) -> List:
-        """파트 목록 (lazy loading)"""
-        if self._parts_cache is None and self._reader:
-            parsed = self._reader._parsed
-            self._parts_cache = list(parsed.parts) if parsed else []
-        return self._parts_cache or []
-
-    def get_part_by_id(self, pid: int):
-        """ID로 파트 검색"""
-        if self._reader and self._reader._parsed:
-            return self._reader._parsed.get_part(pid)
-        return None
-
-    def get_part_ids(self) -> List[int]:
-        """파트 ID 목록"""
-        return [p.pid for p in self.parts]
-
-    # ========== 요소 ==========
-    @property
-    def elements(self) -> Dict:
-        """요소 목록 (타입별 딕셔너리)"""
-        if self._elements_cache is None and self._reader:
-            parsed = self._reader._parsed
-            if parsed:
-                # elements는 리스트, element_type으로 필터링
-                all_elements = list(parsed.elements)
-                self._elements_cache = {
-                    'shell': [e for e in all_elements if e.element_type == 'shell'],
-                    'solid': [e for e in all_elements if e.element_type == 'solid'],
-                    'beam': [e for e in all_elements if e.element_type == 'beam'],
-                }
-            else:
-                self._elements_cache = {'shell': [], 'solid': [], 'beam': []}
-        return self._elements_cache or {'shell': [], 'solid': [], 'beam': []}
-
-    @property
-    def shells(self) -> List:
-        return self.elements.get('shell', [])
-
-    @property
-    def solids(self) -> List:
-        return self.elements.get('solid', [])
-
-    @property
-    def beams(self) -> List:
-        return self.elements.get('beam', [])
-
-    # ========== 세트 ==========
-    @property
-    def sets(self) -> List:
-        """세트 목록"""
-        if self._sets_cache is None and self._reader:
-            parsed = self._reader._parsed
-            self._sets_cache = list(parsed.sets) if parsed else []
-        return self._sets_cache or []
-
-    # ========== 섹션 ==========
-    @property
-    def sections(self) -> List:
-        """섹션 목록"""
-        if self._sections_cache is None and self._reader:
-            parsed = self._reader._parsed
-            self._sections_cache = list(parsed.sections) if parsed else []
-        return self._sections_cache or []
-
-    # ========== 접촉 ==========
-    @property
-    def contacts(self) -> List:
-        """접촉 목록"""
-        if self._contacts_cache is None and self._reader:
-            parsed = self._reader._parsed
-            self._contacts_cache = list(parsed.contacts) if parsed else []
-        return self._contacts_cache or []
-
-    # ========== 재료 ==========
-    @property
-    def materials(self) -> List:
-        """재료 목록"""
-        if self._materials_cache is None and self._reader:
-            parsed = self._reader._parsed
-            self._materials_cache = list(parsed.materials) if parsed else []
-        return self._materials_cache or []
-
-    # ========== 컨트롤 ==========
-    @property
-    def controls(self) -> Dict:
-        """컨트롤 키워드"""
-        if self._controls_cache is None and self._reader:
-            parsed = self._reader._parsed
-            if parsed:
-                self._controls_cache = {
-                    'termination': list(parsed.control_terminations),
-                    'timestep': list(parsed.control_timesteps),
-                    'energy': list(parsed.control_energies),
-                    'output': list(parsed.control_outputs),
-                    'shell': list(parsed.control_shells),
-                    'contact': list(parsed.control_contacts),
-                    'hourglass': list(parsed.control_hourglasses),
-                    'bulk_viscosity': list(parsed.control_bulk_viscosities),
-                }
-            else:
-                self._controls_cache = {}
-        return self._controls_cache or {}
-
-    # ========== 데이터베이스 ==========
-    @property
-    def databases(self) -> Dict:
-        """데이터베이스 출력 설정"""
-        if self._databases_cache is None and self._reader:
-            parsed = self._reader._parsed
-            if parsed:
-                self._databases_cache = {
-                    'binary': list(parsed.database_binaries),
-                    'ascii': list(parsed.database_asciis),
-                    'history_node': list(parsed.database_history_nodes),
-                    'history_element': list(parsed.database_history_elements),
-                    'cross_section': list(parsed.database_cross_sections),
-                }
-            else:
-                self._databases_cache = {}
-        return self._databases_cache or {}
-
-    # ========== 경계조건 ==========
-    @property
-    def boundaries(self) -> Dict:
-        """경계조건"""
-        if self._boundaries_cache is None and self._reader:
-            parsed = self._reader._parsed
-            if parsed:
-                self._boundaries_cache = {
-                    'spc': list(parsed.boundary_spcs),
-                    'motion': list(parsed.boundary_motions),
-                }
-            else:
-                self._boundaries_cache = {}
-        return self._boundaries_cache or {}
-
-    # ========== 하중 ==========
-    @property
-    def loads(self) -> Dict:
-        """하중 조건"""
-        if self._loads_cache is None and self._reader:
-            parsed = self._reader._parsed
-            if parsed:
-                self._loads_cache = {
-                    'node': list(parsed.load_nodes),
-                    'segment': list(parsed.load_segments),
-                    'body': list(parsed.load_bodies),
-                }
-            else:
-                self._loads_cache = {}
-        return self._loads_cache or {}
-
-    # ========== 초기조건 ==========
-    @property
-    def initials(self) -> Dict:
-        """초기조건"""
-        if self._initials_cache is None and self._reader:
-            parsed = self._reader._parsed
-            if parsed:
-                self._initials_cache = {
-                    'velocity': list(parsed.initial_velocities),
-                    'stress': list(parsed.initial_stresses),
-                }
-            else:
-                self._initials_cache = {}
-        return self._initials_cache or {}
-
-    # ========== 구속조건 ==========
-    @property
-    def constraineds(self) -> Dict:
-        """구속조건"""
-        if self._constraineds_cache is None and self._reader:
-            parsed = self._reader._parsed
-            if parsed:
-                self._constraineds_cache = {
-                    'rigid_body': list(parsed.constrained_nodal_rigid_bodies),
-                    'joint': list(parsed.constrained_joints),
-                    'spotweld': list(parsed.constrained_spotwelds),
-                }
-            else:
-                self._constraineds_cache = {}
-        return self._constraineds_cache or {}
-
-    # ========== 통계 ==========
-    def get_stats(self) -> Dict[str, Any]:
-        """모델 통계 정보"""
-        return {
-            'filepath': self.filepath,
-            'filename': self.filename,
-            'parse_time_ms': self.parse_time_ms,
-            'nodes': len(self.nodes),
-            'parts': len(self.parts),
-            'elements': {
-                'shell': len(self.shells),
-                'solid': len(self.solids),
-                'beam': len(self.beams),
-                'total': len(self.shells) + len(self.solids) + len(self.beams),
-            },
-            'sets': len(self.sets),
-            'sections': len(self.sections),
-            'contacts': len(self.contacts),
-            'materials': len(self.materials),
-        }
-
-    def clear_cache(self):
-        """캐시 초기화"""
-        self._nodes_cache = None
-        self._parts_cache = None
-        self._elements_cache = None
-        self._sets_cache = None
-        self._sections_cache = None
-        self._contacts_cache = None
-        self._materials_cache = None
-        self._controls_cache = None
-        self._databases_cache = None
-        self._boundaries_cache = None
-        self._loads_cache = None
-        self._initials_cache = None
-        self._constraineds_cache = None
+if TYPE_CHECKING:
+    from gui.model_loader import ModelLoader
 
 
 @dataclass
@@ -332,6 +44,46 @@ class AppContext:
     # 기본 파서 (fallback, 호환성)
     _basic_parser: BasicKFileParser = field(default_factory=BasicKFileParser)
 
+    # 진행 중인 백그라운드 로더
+    _loader: Optional['ModelLoader'] = None
+
+    # 열린 모델들 (활성 모델 = model)
+    workspace: Optional[ModelWorkspace] = None
+
+    # 외곽면/스킨 디스크 캐시 (Model Viewer)
+    skin_cache: SkinDiskCache = field(default_factory=SkinDiskCache)
+
+    def __post_init__(self):
+        if self.workspace is None:
+            self.workspace = ModelWorkspace(
+                loader=lambda path: parse_k_file(path, True, self._basic_parser)
+            )
+        self.apply_memory_budget()
+
+    def apply_memory_budget(self):
+        """설정의 메모리 예산 적용 (0이면 무제한)
+
+        - memory_budget_mb: 재생성 가능한 캐시 전역 예산
+        - workspace_budget_mb: 비활성 모델 예산 (초과 시 디스크 캐시로 해제)
+        - mesh_cache_mb: MeshData 디스크 캐시 예산
+        - skin_cache_mb: 외곽면/스킨 디스크 캐시 예산
+        """
+        defaults = ConfigManager.DEFAULT_CONFIG
+        budget_mb = self.config.get("memory_budget_mb", defaults["memory_budget_mb"])
+        memory_registry.budget_bytes = int(budget_mb) * 1024 * 1024
+
+        workspace_mb = self.config.get("workspace_budget_mb", defaults["workspace_budget_mb"])
+        self.workspace.budget_bytes = int(workspace_mb) * 1024 * 1024
+        cache_mb = self.config.get("mesh_cache_mb", defaults["mesh_cache_mb"])
+        self.workspace.mesh_cache.max_bytes = int(cache_mb) * 1024 * 1024
+        skin_mb = self.config.get("skin_cache_mb", defaults["skin_cache_mb"])
+        self.skin_cache.max_bytes = int(skin_mb) * 1024 * 1024
+        self.workspace.enforce_budget()
+
+    def get_memory_report(self) -> str:
+        """캐시 메모리 사용량 리포트 (진단용)"""
+        return memory_registry.format_report()
+
     # 공유 상태
     current_k_file: str = ""
     current_material_file: str = ""
@@ -353,68 +105,111 @@ class AppContext:
             성공 여부
         """
         try:
-            filepath = Path(path)
-            if not filepath.exists():
+            model = parse_k_file(path, use_fast_parser, self._basic_parser)
+            if model is None:
                 return False
-
-            if use_fast_parser and _KFILE_READER_AVAILABLE:
-                # C++ 고속 파서 사용
-                import time
-                start = time.perf_counter()
-
-                reader = KFileReader(
-                    str(path),
-                    parse_nodes=True,
-                    parse_parts=True,
-                    parse_elements=True,
-                    parse_sets=True,
-                    parse_sections=True,
-                    parse_contacts=True,
-                    parse_materials=True,
-                    parse_includes=True,
-                    parse_curves=True,
-                    parse_boundaries=True,
-                    parse_loads=True,
-                    parse_controls=True,
-                    parse_databases=True,
-                    parse_initials=True,
-                    parse_constraineds=True,
-                )
-
-                elapsed = (time.perf_counter() - start) * 1000
-
-                # 모델 데이터 저장
-                self.model = ParsedModelData(
-                    filepath=str(path),
-                    filename=filepath.name,
-                    parse_time_ms=elapsed,
-                )
-                # _reader를 별도로 설정 (dataclass 생성자에서 underscore 필드 처리 문제 회피)
-                self.model._reader = reader
-
-                # 통계 업데이트
-                stats = reader.stats
-                self.model.node_count = stats.get('nodes', 0)
-                self.model.element_count = stats.get('elements', {}).get('total', 0)
-                self.model.part_count = stats.get('parts', 0)
-
-            else:
-                # 기본 Python 파서 사용 (Part ID만)
-                part_ids = self._basic_parser.parse(str(path))
-
-                self.model = ParsedModelData(
-                    filepath=str(path),
-                    filename=filepath.name,
-                    part_count=len(part_ids),
-                )
-
-            self.current_k_file = str(path)
+            self.set_model(model)
             return True
 
         except Exception as e:
             print(f"K-file 로드 오류: {e}")
             return False
 
+    def load_k_file_async(self, path: str, use_fast_parser: bool = True,
+                          build_geometry: bool = True) -> 'ModelLoader':
+        """K파일 백그라운드 로드
+
+        워커 스레드에서 파싱하고 단계별 시그널(partsReady, nodesReady,
+        elementsReady, geometryReady)을 발생시킵니다. 완료 시 모델은 UI
+        스레드에서 set_model()로 교체되며, 진행 중인 이전 로드는 취소됩니다.
+
+        Args:
+            path: K-file 경로
+            use_fast_parser: C++ 고속 파서 사용 여부 (기본: True)
+            build_geometry: 렌더링용 MeshData까지 생성할지 여부
+
+        Returns:
+            시작된 ModelLoader (시그널 연결용)
+        """
+        from gui.model_loader import ModelLoader
+
+        self.cancel_loading()
+
+        loader = ModelLoader(path, use_fast_parser=use_fast_parser,
+                             build_geometry=build_geometry,
+                             handoff=self.set_model)
+        loader.loaded.connect(lambda _model, l=loader: self._release_loader(l))
+        loader.failed.connect(lambda _msg, l=loader: self._release_loader(l))
+        loader.cancelled.connect(lambda l=loader: self._release_loader(l))
+        self._loader = loader
+        loader.start()
+        return loader
+
+    @property
+    def is_loading(self) -> bool:
+        """백그라운드 로드 진행 중 여부"""
+        return self._loader is not None
+
+    def cancel_loading(self):
+        """진행 중인 백그라운드 로드 취소 (결과는 버려짐)"""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+
+    def _release_loader(self, loader):
+        if loader is self._loader:
+            self._loader = None
+
+    def set_model(self, model: ParsedModelData):
+        """파싱된 모델을 현재 모델로 설정 (UI 스레드에서 호출)
+
+        로드된 모델은 워크스페이스에 추가되고, 이전 활성 모델은 해제되지 않고
+        비활성(COMPACT)으로 유지됩니다.
+        """
+        old = self.model
+        if model.is_loaded:
+            self.workspace.add(model)
+        if old is not model and not self.workspace.holds(old):
+            old.release()
+        self.model = model
+        self.current_k_file = model.filepath
+
+    def switch_model(self, model_id: str) -> bool:
+        """워크스페이스의 다른 모델로 전환
+
+        Args:
+            model_id: 모델 ID (workspace.ids 참고)
+
+        Returns:
+            성공 여부
+        """
+        if model_id not in self.workspace:
+            return False
+        try:
+            model = self.workspace.activate(model_id)
+        except Exception as e:
+            print(f"모델 전환 오류: {e}")
+            return False
+        self.model = model
+        self.current_k_file = model.filepath
+        return True
+
+    def close_model(self, model_id: Optional[str] = None):
+        """워크스페이스에서 모델 닫기 (기본: 활성 모델)
+
+        활성 모델을 닫으면 최근 사용한 다른 모델로 전환합니다.
+        """
+        model_id = model_id or self.workspace.active_id
+        if model_id is None:
+            return
+        was_active = model_id == self.workspace.active_id
+        self.workspace.close(model_id)
+        if was_active:
+            remaining = self.workspace.ids
+            if not (remaining and self.switch_model(remaining[0])):
+                self.model = ParsedModelData()
+                self.current_k_file = ""
+
     def load_materials(self, path: str) -> bool:
         """Material DB 로드"""
         if self.material_db.load(path):
@@ -432,8 +227,17 @@ class AppContext:
         """Material 이름 목록"""
         return self.material_db.get_names() if self.material_db else []
 
+    @property
+    def geometry(self) -> GeometryCache:
+        """현재 모델의 파생 지오메트리 캐시 (model.geometry 프록시)"""
+        return self.model.geometry
+
     def clear_model(self):
         """현재 모델 데이터 초기화"""
+        self.cancel_loading()
+        if self.workspace.active_id is not None:
+            self.workspace.close(self.workspace.active_id)
+        self.model.release()
         self.model = ParsedModelData()
         self.current_k_file = ""
 
@@ -0,0 +1,54 @@
+"""Memory diagnostics dialog"""
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
+                                QPlainTextEdit)
+from PySide6.QtGui import QFont
+
+from gui.styles import DARK_STYLE
+from core.memory_registry import memory_registry
+
+
+class MemoryDialog(QDialog):
+    """캐시 메모리 사용량 진단 (점유량 큰 순서)"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("메모리 사용량")
+        self.setMinimumSize(640, 480)
+        self.setStyleSheet(DARK_STYLE)
+        self._setup_ui()
+        self._refresh()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        self.report_text = QPlainTextEdit()
+        self.report_text.setReadOnly(True)
+        self.report_text.setFont(QFont("Consolas", 9))
+        layout.addWidget(self.report_text, 1)
+
+        btn_layout = QHBoxLayout()
+
+        refresh_btn = QPushButton("새로고침")
+        refresh_btn.clicked.connect(self._refresh)
+        btn_layout.addWidget(refresh_btn)
+
+        trim_btn = QPushButton("예산 적용 (캐시 정리)")
+        trim_btn.clicked.connect(self._enforce_budget)
+        btn_layout.addWidget(trim_btn)
+
+        btn_layout.addStretch()
+
+        close_btn = QPushButton("닫기")
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+
+        layout.addLayout(btn_layout)
+
+    def _refresh(self):
+        self.report_text.setPlainText(
+            memory_registry.format_report() + "\n\n[R] = 예산 초과 시 해제 가능 (재계산 가능)"
+        )
+
+    def _enforce_budget(self):
+        memory_registry.enforce_budget()
+        self._refresh()
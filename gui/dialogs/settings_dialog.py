@@ -3,7 +3,7 @@ import sys
 from pathlib import Path
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
                                 QLabel, QLineEdit, QPushButton, QFileDialog,
-                                QComboBox)
+                                QComboBox, QSpinBox)
 from PySide6.QtCore import Signal
 import qtawesome as qta
 from gui.styles import DARK_STYLE
@@ -77,6 +77,17 @@ class SettingsDialog(QDialog):
         theme_layout.addWidget(self.theme_combo, 1)
         layout.addWidget(theme_group)
 
+        # Memory budget
+        memory_group = QGroupBox("메모리")
+        memory_layout = QHBoxLayout(memory_group)
+        memory_layout.addWidget(QLabel("캐시 메모리 예산 (MB, 0=무제한):"))
+        self.memory_budget_spin = QSpinBox()
+        self.memory_budget_spin.setRange(0, 1024 * 1024)
+        self.memory_budget_spin.setSingleStep(512)
+        self.memory_budget_spin.setValue(int(self.config.get("memory_budget_mb", 8192)))
+        memory_layout.addWidget(self.memory_budget_spin, 1)
+        layout.addWidget(memory_group)
+
         layout.addStretch()
 
         # Buttons
@@ -111,6 +122,7 @@ class SettingsDialog(QDialog):
         self.config["koomesh_path"] = self.koomesh_edit.text()
         self.config["last_output_dir"] = self.output_dir_edit.text()
         self.config["theme"] = self.theme_combo.currentText().lower()
+        self.config["memory_budget_mb"] = self.memory_budget_spin.value()
         self.settingsChanged.emit(self.config)
         self.accept()
 
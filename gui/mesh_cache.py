@@ -0,0 +1,414 @@
+"""Mesh disk cache - MeshData 바이너리 캐시
+
+MeshData를 numpy .npz (비압축, pickle 없음)로 저장/로드합니다.
+워크스페이스에서 해제(evict)된 모델을 다시 열 때 MeshData 생성을 건너뛰어
+뷰어를 바로 표시할 수 있습니다.
+
+캐시 키는 K-file 경로, 크기, 수정 시각으로 만들어 파일이 바뀌면 자동으로
+새 키가 됩니다. 해제된 모델의 노드/요소 저장소 열(ModelStore)도 같은 키로
+저장해, 다시 열 때 C++ 결과에서 열을 만드는 Python 반복을 건너뜁니다.
+
+두 캐시 모두 max_bytes 예산을 넘으면 저장할 때 가장 오래 쓰지 않은 항목
+(파일 수정 시각 기준, 로드하면 갱신)부터 삭제합니다.
+
+SkinDiskCache는 메쉬에서 파생된 외곽면 (PartFaces)과 렌더링 스킨 (IndexedSkin:
+정점/법선, 삼각형, 엣지, Part 범위)을 저장해, 같은 모델을 다시 열 때 외곽면 추출과
+스킨 생성을 건너뜁니다. 키는 메쉬 내용 해시 + 추출 버전이므로 *INCLUDE 파일이
+바뀌거나 추출 방식이 바뀌면 자동으로 새 키가 됩니다.
+"""
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from core.model_store import ModelStore
+    from gui.modules.model_viewer.core.mesh_data import MeshData, PartFaces
+
+# 기본 디스크 예산 (bytes, 0이면 무제한)
+DEFAULT_MESH_CACHE_BYTES = 4 * 1024 ** 3
+DEFAULT_SKIN_CACHE_BYTES = 4 * 1024 ** 3
+
+# 외곽면 추출/스킨 생성 결과가 바뀌면 올림 (이전 캐시는 다른 키가 되어 무시됨)
+SKIN_CACHE_VERSION = 1
+
+# IndexedSkin 배열 필드 (디스크 파일 이름 = skin_<필드>.npy)
+_SKIN_ARRAYS = ('vertices', 'triangles', 'edges', 'part_ids', 'vertex_offsets', 'face_offsets',
+                'triangle_offsets', 'edge_offsets', 'pick_elements')
+
+
+def default_cache_dir() -> Path:
+    """기본 캐시 디렉토리 (config/cache/mesh)"""
+    return Path(__file__).parent.parent / "config" / "cache" / "mesh"
+
+
+def default_skin_cache_dir() -> Path:
+    """기본 스킨 캐시 디렉토리 (config/cache/skin)"""
+    return Path(__file__).parent.parent / "config" / "cache" / "skin"
+
+
+def _entry_bytes(path: Path) -> int:
+    if path.is_dir():
+        return sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+    return path.stat().st_size
+
+
+def prune_cache_dir(cache_dir: Path, max_bytes: int, keep: Iterable[Path] = ()) -> int:
+    """캐시 디렉토리가 max_bytes를 넘으면 오래 쓰지 않은 항목부터 삭제
+
+    항목은 디렉토리 바로 아래의 파일 또는 하위 디렉토리이고, 사용 순서는
+    수정 시각(mtime)으로 판단합니다. 작성 중인 임시 항목(.tmp*, .old)은 건너뜁니다.
+
+    Args:
+        cache_dir: 캐시 디렉토리
+        max_bytes: 예산 (0 이하면 무제한)
+        keep: 삭제하지 않을 항목 (방금 저장한 항목 등)
+
+    Returns:
+        삭제한 바이트 수
+    """
+    if max_bytes <= 0 or not cache_dir.is_dir():
+        return 0
+    keep = {Path(p) for p in keep}
+
+    entries = []
+    for path in cache_dir.iterdir():
+        if '.tmp' in path.name or path.name.endswith('.old'):
+            continue
+        try:
+            entries.append((path.stat().st_mtime, _entry_bytes(path), path))
+        except OSError:
+            continue   # 다른 프로세스가 삭제 중
+
+    total = sum(nbytes for _, nbytes, _ in entries)
+    freed = 0
+    for _, nbytes, path in sorted(entries, key=lambda e: e[0]):
+        if total - freed <= max_bytes:
+            break
+        if path in keep:
+            continue
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+        freed += nbytes
+    return freed
+
+
+def _touch(path: Path):
+    """LRU 정리용 사용 시각 갱신"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+class MeshDiskCache:
+    """MeshData .npz 캐시 (+ ModelStore 노드/요소 열)"""
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 max_bytes: int = DEFAULT_MESH_CACHE_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본: config/cache/mesh)
+            max_bytes: 디스크 예산 (0이면 무제한)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_bytes = int(max_bytes)
+
+    @staticmethod
+    def key_for(filepath: str) -> str:
+        """K-file 경로 + 크기 + 수정 시각 기반 캐시 키"""
+        path = os.path.abspath(filepath)
+        try:
+            st = os.stat(path)
+            ident = f"{path}|{st.st_size}|{st.st_mtime_ns}"
+        except OSError:
+            ident = path
+        return hashlib.sha1(ident.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npz"
+
+    def contains(self, key: str) -> bool:
+        return self.path_for(key).exists()
+
+    def save(self, key: str, mesh: 'MeshData') -> Path:
+        """MeshData 저장"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        part_ids = np.array(sorted(mesh.part_elements.keys()), dtype=np.int64)
+        part_arrays = [np.asarray(mesh.part_elements[int(pid)], dtype=np.int32) for pid in part_ids]
+        part_offsets = np.zeros(len(part_ids) + 1, dtype=np.int64)
+        if part_arrays:
+            np.cumsum([len(a) for a in part_arrays], out=part_offsets[1:])
+            part_indices = np.concatenate(part_arrays)
+        else:
+            part_indices = np.zeros(0, dtype=np.int32)
+
+        meta = {
+            'part_names': {str(pid): name for pid, name in mesh.part_names.items()},
+        }
+
+        path = self.path_for(key)
+        tmp_path = path.with_name(path.stem + ".tmp.npz")
+        np.savez(
+            tmp_path,
+            nodes=mesh.nodes,
+            offsets=mesh.offsets,
+            connectivity=mesh.connectivity,
+            cell_types=mesh.cell_types,
+            part_ids=part_ids,
+            part_offsets=part_offsets,
+            part_indices=part_indices,
+            bounds_min=np.asarray(mesh.bounds[0]),
+            bounds_max=np.asarray(mesh.bounds[1]),
+            origin=np.asarray(mesh.origin, dtype=np.float64),
+            meta=np.array(json.dumps(meta)),
+        )
+        os.replace(tmp_path, path)
+        prune_cache_dir(self.cache_dir, self.max_bytes, keep=[path, self.store_path_for(key)])
+        return path
+
+    def load(self, key: str) -> Optional['MeshData']:
+        """MeshData 로드 (없거나 손상되었으면 None)"""
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+
+        from gui.modules.model_viewer.core.mesh_data import MeshData
+
+        _touch(path)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                part_ids = data['part_ids']
+                offsets = data['part_offsets']
+                indices = data['part_indices']
+                part_elements = {
+                    int(pid): indices[offsets[i]:offsets[i + 1]]
+                    for i, pid in enumerate(part_ids)
+                }
+                return MeshData(
+                    nodes=data['nodes'],
+                    offsets=data['offsets'],
+                    connectivity=data['connectivity'],
+                    cell_types=data['cell_types'],
+                    part_elements=part_elements,
+                    part_names={int(pid): name for pid, name in meta['part_names'].items()},
+                    bounds=(data['bounds_min'], data['bounds_max']),
+                    # 원점이 없는 이전 캐시는 전역 좌표 그대로 저장됨
+                    origin=data['origin'] if 'origin' in data.files else np.zeros(3),
+                )
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[MeshCache] 캐시 로드 실패 ({path.name}): {e}")
+            return None
+
+    # ========== ModelStore 열 ==========
+
+    def store_path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.store.npz"
+
+    def save_store(self, key: str, store: 'ModelStore') -> Path:
+        """노드/요소 열 저장 (살아있는 행만)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        arrays = {}
+        for prefix, table in (('nodes', store.nodes), ('elements', store.elements)):
+            rows = table.live_rows()
+            for name in table.fields:
+                arrays[f"{prefix}.{name}"] = table.get(name, rows)
+
+        path = self.store_path_for(key)
+        tmp_path = path.with_name(f"{key}.store.tmp.npz")
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        prune_cache_dir(self.cache_dir, self.max_bytes, keep=[path, self.path_for(key)])
+        return path
+
+    def load_store(self, key: str) -> Optional[Dict[str, Dict[str, np.ndarray]]]:
+        """노드/요소 열 로드 - {'nodes': {필드: 배열}, 'elements': {...}} (없으면 None)"""
+        path = self.store_path_for(key)
+        if not path.exists():
+            return None
+        _touch(path)
+        try:
+            columns: Dict[str, Dict[str, np.ndarray]] = {'nodes': {}, 'elements': {}}
+            with np.load(path, allow_pickle=False) as data:
+                for name in data.files:
+                    prefix, field_name = name.split('.', 1)
+                    columns[prefix][field_name] = data[name]
+            return columns
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[MeshCache] 저장소 캐시 로드 실패 ({path.name}): {e}")
+            return None
+
+    def remove(self, key: str):
+        for path in (self.path_for(key), self.store_path_for(key)):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def mesh_content_hash(mesh: 'MeshData') -> str:
+    """메쉬 내용 해시 (노드 좌표, 요소 연결, Part 구성 - 외곽면/스킨이 의존하는 전부)"""
+    h = hashlib.blake2b(digest_size=16)
+    for array in (mesh.nodes, np.asarray(mesh.origin, dtype=np.float64), mesh.offsets,
+                  mesh.connectivity, mesh.cell_types):
+        array = np.ascontiguousarray(array)
+        h.update(f"{array.dtype.str}{array.shape}".encode('ascii'))
+        h.update(memoryview(array).cast('B'))
+    for pid in sorted(mesh.part_elements):
+        elements = np.ascontiguousarray(mesh.part_elements[pid], dtype=np.int64)
+        h.update(f"|{pid}:{len(elements)}".encode('ascii'))
+        h.update(memoryview(elements).cast('B'))
+    return h.hexdigest()
+
+
+@dataclass
+class CachedSkin:
+    """SkinDiskCache 항목 (배열은 읽기 전용 memory-map)"""
+    exterior_faces: Dict[int, 'PartFaces']
+    skin: Any = None  # IndexedSkin (외곽면만 저장된 항목은 None)
+    signatures: Optional[Dict[int, str]] = None  # {part_id: Part 조각 내용 해시}
+
+
+class SkinDiskCache:
+    """외곽면 + 렌더링 스킨 디스크 캐시
+
+    항목마다 디렉토리 하나에 배열별 비압축 .npy를 저장하고 np.load(mmap_mode='r')로
+    엽니다. 로드는 파일을 매핑만 하므로 모델 크기와 관계없이 거의 즉시 끝나고,
+    실제 읽기는 GPU 업로드 등에서 필요한 만큼만 일어납니다.
+    (zlib 압축 .npz는 memory-map이 안 되므로 쓰지 않음 - 배열은 이미 float32/int32/int8)
+
+    사용 예시:
+        cache = SkinDiskCache()
+        key = cache.key_for(mesh)
+        cached = cache.load(key)
+        if cached is None:
+            faces = mesh.extract_exterior_faces()
+            cache.save(key, faces, skin, signatures)
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 max_bytes: int = DEFAULT_SKIN_CACHE_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본: config/cache/skin)
+            max_bytes: 디스크 예산 (0이면 무제한) - 편집할 때마다 새 키가 생기므로 필요
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_skin_cache_dir()
+        self.max_bytes = int(max_bytes)
+
+    @staticmethod
+    def key_for(mesh: 'MeshData') -> str:
+        """메쉬 내용 해시 + 추출 버전 기반 캐시 키"""
+        return f"{mesh_content_hash(mesh)}-v{SKIN_CACHE_VERSION}"
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def contains(self, key: str, with_skin: bool = False) -> bool:
+        meta = self._read_meta(self.path_for(key))
+        return meta is not None and (meta['has_skin'] or not with_skin)
+
+    def save(self, key: str, exterior_faces: Dict[int, 'PartFaces'], skin: Any = None,
+             signatures: Optional[Dict[int, str]] = None) -> Path:
+        """외곽면 (+ 스킨) 저장 - 임시 디렉토리에 쓴 뒤 교체하므로 중간 상태는 보이지 않음"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        part_ids = np.array(list(exterior_faces.keys()), dtype=np.int64)
+        faces = list(exterior_faces.values())
+        face_offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+        np.cumsum([len(f) for f in faces], out=face_offsets[1:])
+        arrays = {
+            'face_part_ids': part_ids,
+            'face_part_offsets': face_offsets,
+            'face_elements': _concat([f.elements for f in faces], np.int32, (0,)),
+            'face_local': _concat([f.local for f in faces], np.int8, (0, 4)),
+            'face_nodes': _concat([f.nodes for f in faces], np.int32, (0, 4)),
+        }
+        if skin is not None:
+            arrays.update({f'skin_{name}': getattr(skin, name) for name in _SKIN_ARRAYS})
+
+        meta = {
+            'version': SKIN_CACHE_VERSION,
+            'has_skin': skin is not None,
+            'face_edge_count': int(skin.face_edge_count) if skin is not None else 0,
+            'signatures': {str(pid): sig for pid, sig in (signatures or {}).items()},
+        }
+
+        path = self.path_for(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tmp_path.mkdir()
+        for name, array in arrays.items():
+            np.save(tmp_path / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+        # meta.json은 마지막에 기록 (meta가 있는 항목만 완전한 항목)
+        (tmp_path / "meta.json").write_text(json.dumps(meta), encoding='utf-8')
+
+        old_path = path.with_name(path.name + ".old")
+        if path.exists():
+            os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+        prune_cache_dir(self.cache_dir, self.max_bytes, keep=[path])
+        return path
+
+    def load(self, key: str) -> Optional[CachedSkin]:
+        """캐시 항목 로드 (없거나 손상되었으면 None)"""
+        path = self.path_for(key)
+        meta = self._read_meta(path)
+        if meta is None:
+            return None
+
+        from gui.modules.model_viewer.core.mesh_data import PartFaces
+        from gui.modules.model_viewer.core.vertex_buffers import IndexedSkin
+
+        _touch(path)
+
+        def array(name):
+            return np.load(path / f"{name}.npy", mmap_mode='r', allow_pickle=False)
+
+        try:
+            part_ids = array('face_part_ids')
+            offsets = array('face_part_offsets')
+            elements, local, nodes = array('face_elements'), array('face_local'), array('face_nodes')
+            exterior_faces = {
+                int(pid): PartFaces(elements=elements[offsets[i]:offsets[i + 1]],
+                                    local=local[offsets[i]:offsets[i + 1]],
+                                    nodes=nodes[offsets[i]:offsets[i + 1]])
+                for i, pid in enumerate(part_ids)
+            }
+            cached = CachedSkin(exterior_faces)
+            if meta['has_skin']:
+                cached.skin = IndexedSkin(**{name: array(f'skin_{name}') for name in _SKIN_ARRAYS},
+                                          face_edge_count=meta['face_edge_count'])
+                cached.signatures = {int(pid): sig for pid, sig in meta['signatures'].items()}
+            return cached
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[SkinCache] 캐시 로드 실패 ({path.name}): {e}")
+            return None
+
+    def remove(self, key: str):
+        shutil.rmtree(self.path_for(key), ignore_errors=True)
+
+    @staticmethod
+    def _read_meta(path: Path) -> Optional[dict]:
+        try:
+            meta = json.loads((path / "meta.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get('version') == SKIN_CACHE_VERSION else None
+
+
+def _concat(arrays, dtype, empty_shape) -> np.ndarray:
+    return np.concatenate(arrays).astype(dtype, copy=False) if arrays else np.zeros(empty_shape, dtype=dtype)
@@ -0,0 +1,140 @@
+"""Background model loader - K-file 백그라운드 로드
+
+대형 K-file 파싱을 워커 스레드에서 수행하고 단계별로 결과를 알립니다.
+
+단계 (로드 절차는 core.model_loading.load_model_staged):
+    1. partsReady     - 파트 목록 (*PART 키워드 스캔, 전체 파싱 전에 파트 트리 표시)
+    2. nodesReady     - 노드 열 생성 직후
+    3. elementsReady  - 요소 열 생성 직후
+    4. geometryReady  - 렌더링용 MeshData 생성 (model.geometry 캐시에 저장)
+    5. loaded         - 최종 ParsedModelData (UI 스레드에서 AppContext에 반영)
+
+사용 예시:
+    loader = ctx.load_k_file_async(path)
+    loader.partsReady.connect(part_tree.set_parts)
+    loader.geometryReady.connect(viewer.set_mesh)
+    loader.loaded.connect(lambda model: ...)
+    loader.cancel()  # 다음 단계 경계에서 중단
+"""
+import threading
+import time
+
+from PySide6.QtCore import QThread, QCoreApplication, Signal, Slot
+
+from core.model_data import ParsedModelData
+from core.model_loading import LoadCancelled, load_model_staged
+
+
+class ModelLoader(QThread):
+    """K-file 백그라운드 로더
+
+    워커 스레드는 AppContext를 직접 수정하지 않습니다. 단계 시그널은 워커
+    스레드에서 발생하므로 QObject 메서드에 연결해야 합니다 (queued connection).
+    최종 시그널(loaded, failed, cancelled)은 항상 UI 스레드에서 발생하며,
+    loaded 직전에 handoff 콜백으로 모델이 AppContext에 반영됩니다.
+
+    취소는 단계 경계에서 확인합니다. C++ 파싱 자체는 중단되지 않지만
+    GIL을 해제하므로 UI는 응답 상태를 유지합니다.
+    """
+
+    # 단계별 시그널
+    partsReady = Signal(list)        # 파트 목록
+    nodesReady = Signal(int)         # 노드 수
+    elementsReady = Signal(int)      # 요소 수
+    geometryReady = Signal(object)   # MeshData
+
+    # 진행/결과 시그널
+    progress = Signal(str, int)      # (단계 메시지, 0-100)
+    loaded = Signal(object)          # ParsedModelData (UI 스레드)
+    failed = Signal(str)             # 오류 메시지 (UI 스레드)
+    cancelled = Signal()             # (UI 스레드)
+
+    # 워커 -> UI 스레드 전달용 (결과 종류, 데이터)
+    _workerDone = Signal(str, object)
+
+    def __init__(self, path: str, use_fast_parser: bool = True,
+                 build_geometry: bool = True, handoff=None, parent=None):
+        """
+        Args:
+            path: K-file 경로
+            use_fast_parser: C++ 고속 파서 사용 여부
+            build_geometry: 렌더링용 MeshData까지 생성할지 여부
+            handoff: 완료 시 UI 스레드에서 loaded 전에 호출할 콜백 (model)
+            parent: 부모 QObject (없으면 QCoreApplication - 종료 전 해제 방지)
+        """
+        super().__init__(parent or QCoreApplication.instance())
+        self.path = str(path)
+        self.use_fast_parser = use_fast_parser
+        self.build_geometry = build_geometry
+        self._handoff = handoff
+
+        self.model: ParsedModelData = None
+        self.mesh = None
+        self.load_time_ms: float = 0.0
+
+        self._cancel_event = threading.Event()
+
+        # 이 객체는 UI 스레드 소속이므로 워커에서 emit하면 queued로 전달됨
+        self._workerDone.connect(self._on_worker_done)
+        self.finished.connect(self.deleteLater)
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """로드 취소 요청 (스레드 안전)"""
+        self._cancel_event.set()
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            model = load_model_staged(
+                self.path,
+                emit=self._emit_stage,
+                is_cancelled=self._cancel_event.is_set,
+                use_fast_parser=self.use_fast_parser,
+                build_geometry=self.build_geometry,
+            )
+            self.model = model
+            self.load_time_ms = (time.perf_counter() - start) * 1000
+            self.progress.emit("로드 완료", 100)
+            self._workerDone.emit('loaded', model)
+
+        except LoadCancelled:
+            self._workerDone.emit('cancelled', None)
+        except Exception as e:
+            if self.is_cancelled:
+                self._workerDone.emit('cancelled', None)
+            else:
+                self._workerDone.emit('failed', str(e))
+
+    def _emit_stage(self, stage: str, *args):
+        """load_model_staged 단계 알림 -> 시그널 (워커 스레드)"""
+        if stage == 'parts':
+            self.partsReady.emit(*args)
+        elif stage == 'nodes':
+            self.nodesReady.emit(*args)
+        elif stage == 'elements':
+            self.elementsReady.emit(*args)
+        elif stage == 'geometry':
+            self.mesh = args[0]
+            self.geometryReady.emit(*args)
+        elif stage == 'progress':
+            self.progress.emit(*args)
+
+    @Slot(str, object)
+    def _on_worker_done(self, kind: str, payload):
+        """UI 스레드에서 최종 결과 전달"""
+        if kind == 'loaded' and self.is_cancelled:
+            # 완료 직후 취소된 경우 결과를 버림
+            kind = 'cancelled'
+
+        if kind == 'loaded':
+            if self._handoff is not None:
+                self._handoff(payload)
+            self.loaded.emit(payload)
+        elif kind == 'failed':
+            self.failed.emit(payload)
+        else:
+            self.cancelled.emit()
@@ -96,6 +96,7 @@ def load_modules():
     from . import file_loader  # 첫 번째 모듈
     from . import advanced_laminate
     from . import advanced_contact
-    from . import keyword_manager
-    from . import model_viewer
-    from . import adjacent_parts_viewer
+    # 아래 패키지는 __init__에서 위젯을 지연 import하므로 module을 직접 로드
+    from .keyword_manager import module as _keyword_manager
+    from .model_viewer import module as _model_viewer
+    from .adjacent_parts_viewer import module as _adjacent_parts_viewer
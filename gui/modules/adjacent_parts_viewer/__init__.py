@@ -3,6 +3,12 @@
 Ray-tracing based detection of adjacent parts.
 """
 
-from .module import AdjacentPartsViewerModule
-
 __all__ = ['AdjacentPartsViewerModule']
+
+
+def __getattr__(name):
+    # 위젯 모듈은 지연 import (core 서브패키지는 Qt 없이 사용 가능)
+    if name == 'AdjacentPartsViewerModule':
+        from .module import AdjacentPartsViewerModule
+        return AdjacentPartsViewerModule
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -50,22 +50,31 @@ class AdjacentPartsDetector:
     5. Filtering: Apply coverage threshold
     """
 
-    def __init__(self, mesh_data):
+    def __init__(self, mesh_data, geometry=None):
         """Initialize detector
 
         Args:
             mesh_data: MeshData object
+            geometry: Shared GeometryCache for mesh_data (optional). When given,
+                exterior faces, part bboxes, normals and the spatial index are
+                shared with other modules instead of recomputed.
         """
         self._mesh = mesh_data
+        self._geometry = geometry
 
         # Initialize subsystems
-        self._spatial_index = SpatialIndex(mesh_data)
-        self._surface_analyzer = SurfaceAnalyzer(mesh_data)
+        if geometry is not None:
+            self._spatial_index = geometry.get(
+                'adjacent.spatial_index', lambda: SpatialIndex(mesh_data, geometry)
+            )
+        else:
+            self._spatial_index = SpatialIndex(mesh_data)
+        self._surface_analyzer = SurfaceAnalyzer(mesh_data, geometry)
         self._projection_engine = ProjectionEngine(mesh_data)
         self._ray_tracer = RayTracer(mesh_data, self._spatial_index)
-        self._element_ray_tracer = ElementRayTracer(mesh_data)
-        self._simple_detector = SimpleAdjacentDetector(mesh_data)
-        self._fast_detector = FastAdjacentDetector(mesh_data, self._spatial_index)
+        self._element_ray_tracer = ElementRayTracer(mesh_data, geometry)
+        self._simple_detector = SimpleAdjacentDetector(mesh_data, geometry)
+        self._fast_detector = FastAdjacentDetector(mesh_data, self._spatial_index, geometry)
 
     def get_auto_thickness_range(
         self,
@@ -19,20 +19,25 @@ class FaceHit:
 class ElementRayTracer:
     """Ray tracing using actual element faces"""
 
-    def __init__(self, mesh_data):
+    def __init__(self, mesh_data, geometry=None):
         """Initialize element ray tracer
 
         Args:
             mesh_data: MeshData object
+            geometry: Shared GeometryCache (optional, reuses exterior faces)
         """
         self._mesh = mesh_data
+        self._geometry = geometry
         self._exterior_faces = None  # Lazy load
 
     def _ensure_exterior_faces(self):
         """Extract exterior faces if not already done"""
         if self._exterior_faces is None:
-            print("[ElementRayTracer] Extracting exterior faces...")
-            self._exterior_faces = self._mesh.extract_exterior_faces()
+            if self._geometry is not None:
+                self._exterior_faces = self._geometry.exterior_faces
+            else:
+                print("[ElementRayTracer] Extracting exterior faces...")
+                self._exterior_faces = self._mesh.extract_exterior_faces()
             total_faces = sum(len(faces) for faces in self._exterior_faces.values())
             print(f"[ElementRayTracer] Extracted {total_faces} exterior faces from {len(self._exterior_faces)} parts")
 
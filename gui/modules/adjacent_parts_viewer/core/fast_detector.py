@@ -13,16 +13,20 @@ from typing import Set, Dict
 class FastAdjacentDetector:
     """Fast bbox + sampling based detector"""
 
-    def __init__(self, mesh_data, spatial_index):
+    def __init__(self, mesh_data, spatial_index, geometry=None):
         self._mesh = mesh_data
         self._spatial_index = spatial_index
+        self._geometry = geometry  # Shared GeometryCache (optional)
         self._exterior_faces = None
 
     def _ensure_exterior_faces(self):
         """Lazy load exterior faces"""
         if self._exterior_faces is None:
-            print("[FastDetector] Extracting exterior faces...")
-            self._exterior_faces = self._mesh.extract_exterior_faces()
+            if self._geometry is not None:
+                self._exterior_faces = self._geometry.exterior_faces
+            else:
+                print("[FastDetector] Extracting exterior faces...")
+                self._exterior_faces = self._mesh.extract_exterior_faces()
             total = sum(len(f) for f in self._exterior_faces.values())
             print(f"[FastDetector] Total exterior faces: {total}")
 
@@ -21,15 +21,19 @@ class SimpleHit:
 class SimpleAdjacentDetector:
     """Simple, robust detector using node-based ray casting"""
 
-    def __init__(self, mesh_data):
+    def __init__(self, mesh_data, geometry=None):
         self._mesh = mesh_data
+        self._geometry = geometry  # Shared GeometryCache (optional)
         self._exterior_faces = None
 
     def _ensure_exterior_faces(self):
         """Extract exterior faces if needed"""
         if self._exterior_faces is None:
-            print("[SimpleDetector] Extracting exterior faces...")
-            self._exterior_faces = self._mesh.extract_exterior_faces()
+            if self._geometry is not None:
+                self._exterior_faces = self._geometry.exterior_faces
+            else:
+                print("[SimpleDetector] Extracting exterior faces...")
+                self._exterior_faces = self._mesh.extract_exterior_faces()
             total = sum(len(f) for f in self._exterior_faces.values())
             print(f"[SimpleDetector] Extracted {total} exterior faces")
 
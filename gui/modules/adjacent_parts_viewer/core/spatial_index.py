@@ -138,13 +138,15 @@ class SpatialIndex:
     Provides O(log n) bounding box queries.
     """
 
-    def __init__(self, mesh_data):
+    def __init__(self, mesh_data, geometry=None):
         """Initialize spatial index
 
         Args:
             mesh_data: MeshData object with nodes and elements
+            geometry: Shared GeometryCache (optional, reuses part bboxes)
         """
         self._mesh = mesh_data
+        self._geometry = geometry
         self._part_bboxes = {}  # part_id -> BoundingBox
         self._root: Optional[OctreeNode] = None
 
@@ -153,9 +155,13 @@ class SpatialIndex:
     def _build_index(self):
         """Build octree from mesh data"""
         # Compute bounding box for each part
-        for part_id in self._mesh.part_ids:
-            bbox = self._compute_part_bbox(part_id)
-            self._part_bboxes[part_id] = bbox
+        if self._geometry is not None:
+            for part_id, (min_point, max_point) in self._geometry.part_bboxes.items():
+                self._part_bboxes[part_id] = BoundingBox(min_point, max_point)
+        else:
+            for part_id in self._mesh.part_ids:
+                bbox = self._compute_part_bbox(part_id)
+                self._part_bboxes[part_id] = bbox
 
         # Compute global bounding box
         if not self._part_bboxes:
@@ -17,13 +17,15 @@ class SurfaceNormal:
 class SurfaceAnalyzer:
     """Analyzes surface normals to determine if parts face each other"""
 
-    def __init__(self, mesh_data):
+    def __init__(self, mesh_data, geometry=None):
         """Initialize surface analyzer
 
         Args:
             mesh_data: MeshData object
+            geometry: Shared GeometryCache (optional, reuses element normals)
         """
         self._mesh = mesh_data
+        self._geometry = geometry
         self._normal_cache: Dict[tuple, SurfaceNormal] = {}
 
     def compute_part_normal(
@@ -53,17 +55,21 @@ class SurfaceAnalyzer:
 
         elem_indices = self._mesh.part_elements[part_id]
 
-        for elem_idx in elem_indices:
-            # Compute element normal
-            normal = self._compute_element_normal(elem_idx)
-            if normal is not None:
-                element_normals.append(normal)
-
-        if not element_normals:
+        if self._geometry is not None:
+            # Precomputed unit normals (degenerate elements are zero rows)
+            element_normals = self._geometry.element_normals[elem_indices]
+            element_normals = element_normals[np.any(element_normals != 0.0, axis=1)]
+        else:
+            for elem_idx in elem_indices:
+                # Compute element normal
+                normal = self._compute_element_normal(elem_idx)
+                if normal is not None:
+                    element_normals.append(normal)
+            element_normals = np.array(element_normals)
+
+        if len(element_normals) == 0:
             return None
 
-        element_normals = np.array(element_normals)
-
         # Compute average normal
         avg_normal = np.mean(element_normals, axis=0)
 
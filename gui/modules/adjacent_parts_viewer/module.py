@@ -120,8 +120,9 @@ class AdjacentPartsViewerModule(BaseModule):
         """모듈 활성화 시 호출"""
         self.log("패키지 이동 DOE 모듈 활성화", "info")
 
-        # 이미 로드된 경우 스킵
-        if self._detector is not None:
+        # 이미 로드된 경우 스킵 (모델 교체/편집으로 캐시 메쉬가 바뀌면 재로드)
+        if self._detector is not None and self.ctx.geometry.contains('mesh') \
+                and self.ctx.geometry.mesh is self._mesh_data:
             self.log("이미 로드됨 - 스킵", "info")
             return
 
@@ -136,9 +137,9 @@ class AdjacentPartsViewerModule(BaseModule):
         """Load mesh data from AppContext"""
         try:
             self.log("MeshData 생성 중...", "info")
-            # MeshData 생성
-            from gui.modules.model_viewer.core.mesh_data import MeshData
-            self._mesh_data = MeshData.from_parsed_model(self.ctx.model)
+            # 공유 캐시의 MeshData 사용
+            geometry = self.ctx.geometry
+            self._mesh_data = geometry.mesh
 
             if self._mesh_data is None:
                 raise ValueError("Failed to create mesh data")
@@ -147,7 +148,7 @@ class AdjacentPartsViewerModule(BaseModule):
 
             # Initialize detector
             self.log("Detector 초기화 중...", "info")
-            self._detector = AdjacentPartsDetector(self._mesh_data)
+            self._detector = AdjacentPartsDetector(self._mesh_data, geometry)
             self.log("Detector 초기화 완료", "success")
 
             # Populate Part list
@@ -5,7 +5,7 @@
 import os
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QFileDialog, QGroupBox, QTextEdit, QSplitter
+    QFileDialog, QGroupBox, QTextEdit, QSplitter, QComboBox
 )
 from PySide6.QtCore import Qt, Signal
 
@@ -81,7 +81,28 @@ class FileLoaderModule(BaseModule):
         browse_btn.clicked.connect(self._browse_file)
         path_layout.addWidget(browse_btn)
 
+        # 로드 취소 버튼 (로드 중에만 표시)
+        self._cancel_btn = QPushButton("취소")
+        self._cancel_btn.setFixedWidth(80)
+        self._cancel_btn.setVisible(False)
+        self._cancel_btn.clicked.connect(self._cancel_loading)
+        path_layout.addWidget(self._cancel_btn)
+
         file_layout.addLayout(path_layout)
+
+        # 열린 모델 (워크스페이스) - 재파싱 없이 전환
+        models_layout = QHBoxLayout()
+        models_layout.addWidget(QLabel("열린 모델:"))
+        self._model_combo = QComboBox()
+        self._model_combo.activated.connect(self._on_model_selected)
+        models_layout.addWidget(self._model_combo, 1)
+
+        close_model_btn = QPushButton("닫기")
+        close_model_btn.setFixedWidth(80)
+        close_model_btn.clicked.connect(self._close_current_model)
+        models_layout.addWidget(close_model_btn)
+
+        file_layout.addLayout(models_layout)
         layout.addWidget(file_group)
 
         # 메인 컨텐츠 - 스플리터
@@ -195,37 +216,143 @@ class FileLoaderModule(BaseModule):
             self._load_file(path)
 
     def _load_file(self, filepath: str):
-        """K-file 로드"""
-        try:
-            self._status.setText(f"로드 중: {os.path.basename(filepath)}...")
-
-            # AppContext에 로드
-            self.ctx.load_k_file(filepath)
-
-            # 파일 경로 표시
-            self._file_label.setText(filepath)
+        """K-file 백그라운드 로드 시작"""
+        self._next_btn.setEnabled(False)
+        self._cancel_btn.setVisible(True)
+        self._file_label.setText(filepath)
+        self._file_label.setStyleSheet("padding: 8px; background: #fff8e1; border-radius: 4px;")
+        self._status.setText(f"로드 중: {os.path.basename(filepath)}...")
+
+        # 워커 스레드에서 파싱 - 단계별 시그널로 UI 갱신
+        loader = self.ctx.load_k_file_async(filepath)
+        loader.progress.connect(self._on_load_progress)
+        loader.partsReady.connect(self._on_parts_ready)
+        loader.geometryReady.connect(self._on_geometry_ready)
+        loader.loaded.connect(self._on_loaded)
+        loader.failed.connect(self._on_load_failed)
+
+    def _cancel_loading(self):
+        """로드 취소 (워커 결과는 버려지고 기존 모델 유지)"""
+        self.ctx.cancel_loading()
+        self._cancel_btn.setVisible(False)
+        self._status.setText("로드 취소됨")
+        if self.ctx.model.is_loaded:
+            self._file_label.setText(self.ctx.model.filepath)
             self._file_label.setStyleSheet("padding: 8px; background: #e8f5e9; border-radius: 4px;")
-
-            # 모델 정보 표시
-            self._update_model_info()
-
-            # 3D 미리보기
-            self._update_3d_preview()
-
-            # 다음 버튼 활성화
             self._next_btn.setEnabled(True)
+        else:
+            self._file_label.setText("파일이 선택되지 않았습니다")
+            self._file_label.setStyleSheet("padding: 8px; background: #f0f0f0; border-radius: 4px;")
+
+    def _is_current_loader(self) -> bool:
+        """취소(또는 새 로드로 대체)된 워커의 단계 시그널 무시"""
+        loader = self.sender()
+        return loader is not None and not loader.is_cancelled
+
+    def _on_load_progress(self, message: str, percent: int):
+        if not self._is_current_loader():
+            return
+        self._status.setText(f"{message} ({percent}%)")
+
+    def _on_parts_ready(self, parts: list):
+        """파트 목록 먼저 표시 (노드/요소는 로드 중)"""
+        if not self._is_current_loader():
+            return
+        info_lines = [
+            "=" * 50,
+            "  Part 목록 (요소 로드 중...)",
+            "=" * 50,
+            "",
+        ]
+        for part in parts[:10]:
+            info_lines.append(f"  Part {part.pid:3d}: {part.name}")
+        if len(parts) > 10:
+            info_lines.append(f"  ... 외 {len(parts) - 10}개 Part")
+        self._info_text.setPlainText("\n".join(info_lines))
 
-            self._status.setText(f"로드 완료: {os.path.basename(filepath)}")
-            self.log(f"K-file loaded: {filepath}", "success")
-
-            # 시그널 발생
+    def _on_geometry_ready(self, mesh):
+        """워커에서 생성한 MeshData로 3D 미리보기"""
+        if not self._is_current_loader():
+            return
+        self._set_preview_mesh(mesh)
+
+    def _on_loaded(self, model):
+        """로드 완료 - 모델은 이미 AppContext에 반영됨"""
+        self._cancel_btn.setVisible(False)
+        self._file_label.setStyleSheet("padding: 8px; background: #e8f5e9; border-radius: 4px;")
+
+        # 모델 정보 표시
+        self._update_model_info()
+        self._refresh_model_list()
+
+        # 다음 버튼 활성화
+        self._next_btn.setEnabled(True)
+
+        self._status.setText(f"로드 완료: {model.filename} ({self.sender().load_time_ms:.0f} ms)")
+        self.log(f"K-file loaded: {model.filepath}", "success")
+
+        # 시그널 발생
+        self.fileLoaded.emit()
+
+    def _on_load_failed(self, message: str):
+        self._cancel_btn.setVisible(False)
+        self._status.setText(f"로드 실패: {message}")
+        self.log(f"Failed to load K-file: {message}", "error")
+        self._file_label.setText("파일 로드 실패!")
+        self._file_label.setStyleSheet("padding: 8px; background: #ffebee; border-radius: 4px;")
+
+    def _refresh_model_list(self):
+        """워크스페이스 모델 목록 갱신"""
+        workspace = self.ctx.workspace
+        self._model_combo.blockSignals(True)
+        self._model_combo.clear()
+        for model_id in workspace.ids:
+            entry = workspace.get_entry(model_id)
+            self._model_combo.addItem(f"{os.path.basename(entry.filepath)} [{entry.state}]", model_id)
+            if model_id == workspace.active_id:
+                self._model_combo.setCurrentIndex(self._model_combo.count() - 1)
+        self._model_combo.blockSignals(False)
+
+    def _on_model_selected(self, index: int):
+        """열린 모델 전환"""
+        model_id = self._model_combo.itemData(index)
+        if model_id is None or model_id == self.ctx.workspace.active_id:
+            return
+        if self.ctx.is_loading:
+            self.ctx.cancel_loading()
+            self._cancel_btn.setVisible(False)
+
+        if self.ctx.switch_model(model_id):
+            self._show_current_model()
+            self.log(f"모델 전환: {self.ctx.model.filename}", "info")
             self.fileLoaded.emit()
-
-        except Exception as e:
-            self._status.setText(f"로드 실패: {str(e)}")
-            self.log(f"Failed to load K-file: {str(e)}", "error")
-            self._file_label.setText("파일 로드 실패!")
-            self._file_label.setStyleSheet("padding: 8px; background: #ffebee; border-radius: 4px;")
+        else:
+            self.log(f"모델 전환 실패: {model_id}", "error")
+        self._refresh_model_list()
+
+    def _close_current_model(self):
+        """활성 모델 닫기"""
+        if not self.ctx.model.is_loaded:
+            return
+        self.ctx.close_model()
+        if self.ctx.model.is_loaded:
+            self._show_current_model()
+        else:
+            self._file_label.setText("파일이 선택되지 않았습니다")
+            self._file_label.setStyleSheet("padding: 8px; background: #f0f0f0; border-radius: 4px;")
+            self._info_text.setPlainText("K-file을 로드하면 모델 정보가 여기에 표시됩니다.")
+            self._viewer.set_mesh(None)
+            self._next_btn.setEnabled(False)
+        self._refresh_model_list()
+
+    def _show_current_model(self):
+        """활성 모델 정보 및 미리보기 표시"""
+        self._file_label.setText(self.ctx.model.filepath)
+        self._file_label.setStyleSheet("padding: 8px; background: #e8f5e9; border-radius: 4px;")
+        self._update_model_info()
+        self._update_3d_preview()
+        self._next_btn.setEnabled(True)
+        self._status.setText(f"모델: {self.ctx.model.filename}")
 
     def _update_model_info(self):
         """모델 정보 업데이트"""
@@ -287,9 +414,15 @@ class FileLoaderModule(BaseModule):
     def _update_3d_preview(self):
         """3D 미리보기 업데이트"""
         try:
-            # MeshData 생성
-            mesh = MeshData.from_parsed_model(self.ctx.model)
+            # 공유 캐시의 MeshData 사용
+            self._set_preview_mesh(self.ctx.geometry.mesh)
+
+        except Exception as e:
+            self.log(f"Failed to create 3D preview: {str(e)}", "error")
 
+    def _set_preview_mesh(self, mesh: MeshData):
+        """뷰어에 메쉬 설정"""
+        try:
             # 뷰어에 설정
             self._viewer.set_mesh(mesh)
 
@@ -309,8 +442,9 @@ class FileLoaderModule(BaseModule):
 
     def on_activate(self):
         """모듈 활성화 시"""
-        # 이미 로드된 K-file이 있으면 표시
-        if self.ctx.model.is_loaded:
+        # 이미 로드된 K-file이 있으면 표시 (로드 중이면 완료 시그널에서 갱신)
+        self._refresh_model_list()
+        if self.ctx.model.is_loaded and not self.ctx.is_loading:
             self._file_label.setText(self.ctx.model.filepath)
             self._file_label.setStyleSheet("padding: 8px; background: #e8f5e9; border-radius: 4px;")
             self._update_model_info()
@@ -1,4 +1,11 @@
 """Keyword Manager module for browsing and editing K-file keywords"""
-from .module import KeywordManagerModule
 
 __all__ = ['KeywordManagerModule']
+
+
+def __getattr__(name):
+    # 위젯 모듈은 지연 import (core.exporter는 Qt 없이 사용 가능)
+    if name == 'KeywordManagerModule':
+        from .module import KeywordManagerModule
+        return KeywordManagerModule
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,11 @@
 """Keyword Manager core functionality"""
-from .keyword_model import KeywordModel
 
 __all__ = ['KeywordModel']
+
+
+def __getattr__(name):
+    # KeywordModel은 UndoManager(QObject)를 사용 - exporter만 쓰는 경우 Qt를 로드하지 않음
+    if name == 'KeywordModel':
+        from .keyword_model import KeywordModel
+        return KeywordModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
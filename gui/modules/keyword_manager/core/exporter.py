@@ -5,8 +5,21 @@ Card 정의를 활용한 정확한 K-file 포맷 출력을 담당합니다.
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
+import numpy as np
+
 if TYPE_CHECKING:
-    from gui.app_context import ParsedModelData
+    from core.model_data import ParsedModelData
+
+
+# Set 타입 -> 키워드 (SetType 순서 = C++ 값)
+SET_KEYWORDS = {
+    'NODE_LIST': 'SET_NODE_LIST',
+    'PART_LIST': 'SET_PART_LIST',
+    'SEGMENT': 'SET_SEGMENT',
+    'SHELL': 'SET_SHELL_LIST',
+    'SOLID': 'SET_SOLID',
+}
+SET_TYPE_NAMES = tuple(SET_KEYWORDS)
 
 
 @dataclass
@@ -151,97 +164,57 @@ class KFileExporter:
             lines.append(f"$# {section_name}")
 
     def _export_nodes(self, lines: List[str]):
-        """노드 출력"""
-        if not self._model.nodes:
+        """노드 출력 (저장소 열에서 직접)"""
+        table = self._model.store.nodes
+        rows = table.live_rows()
+        if len(rows) == 0:
             return
 
         self._add_section_comment(lines, "NODES")
         lines.append("*NODE")
 
-        w = self._options.default_field_width  # 8 or 10
         cw = self._options.node_coord_width    # 16
+        fmt_int, fmt_float = self._format_int, self._format_float
 
-        for node in self._model.nodes:
-            nid = getattr(node, 'nid', 0)
-            x = getattr(node, 'x', 0.0)
-            y = getattr(node, 'y', 0.0)
-            z = getattr(node, 'z', 0.0)
-            tc = getattr(node, 'tc', 0)
-            rc = getattr(node, 'rc', 0)
+        nids = table.get('nid', rows).tolist()
+        coords = table.get('xyz', rows).tolist()
+        tcs = table.get('tc', rows).tolist()
+        rcs = table.get('rc', rows).tolist()
 
+        for nid, (x, y, z), tc, rc in zip(nids, coords, tcs, rcs):
             # NID, X, Y, Z, TC, RC
-            line = self._format_int(nid, 8)
-            line += self._format_float(x, cw, 8)
-            line += self._format_float(y, cw, 8)
-            line += self._format_float(z, cw, 8)
-            line += self._format_int(tc, 8)
-            line += self._format_int(rc, 8)
-
-            lines.append(line)
+            lines.append(fmt_int(nid, 8) + fmt_float(x, cw, 8) + fmt_float(y, cw, 8)
+                         + fmt_float(z, cw, 8) + fmt_int(tc, 8) + fmt_int(rc, 8))
 
     def _export_elements(self, lines: List[str]):
-        """요소 출력"""
-        # Shell elements
-        if self._model.shells:
-            self._add_section_comment(lines, "SHELL ELEMENTS")
-            lines.append("*ELEMENT_SHELL")
-
-            for elem in self._model.shells:
-                eid = getattr(elem, 'eid', 0)
-                pid = getattr(elem, 'pid', 0)
-                nodes = getattr(elem, 'nodes', [])
-
-                # Pad nodes to 4
-                nodes_padded = list(nodes) + [0] * (4 - len(nodes))
-
-                line = self._format_int(eid, 8)
-                line += self._format_int(pid, 8)
-                for n in nodes_padded[:4]:
-                    line += self._format_int(n, 8)
-
-                lines.append(line)
-
-        # Solid elements
-        if self._model.solids:
-            self._add_section_comment(lines, "SOLID ELEMENTS")
-            lines.append("*ELEMENT_SOLID")
-
-            for elem in self._model.solids:
-                eid = getattr(elem, 'eid', 0)
-                pid = getattr(elem, 'pid', 0)
-                nodes = getattr(elem, 'nodes', [])
-
-                # Pad nodes to 8
-                nodes_padded = list(nodes) + [0] * (8 - len(nodes))
-
-                line = self._format_int(eid, 8)
-                line += self._format_int(pid, 8)
-                for n in nodes_padded[:8]:
-                    line += self._format_int(n, 8)
-
-                lines.append(line)
-
-        # Beam elements
-        if self._model.beams:
-            self._add_section_comment(lines, "BEAM ELEMENTS")
-            lines.append("*ELEMENT_BEAM")
-
-            for elem in self._model.beams:
-                eid = getattr(elem, 'eid', 0)
-                pid = getattr(elem, 'pid', 0)
-                nodes = getattr(elem, 'nodes', [])
+        """요소 출력 (저장소 열에서 직접)"""
+        # (카테고리, 키워드, 출력 노드 수)
+        blocks = (
+            ('shell', "SHELL ELEMENTS", "*ELEMENT_SHELL", 4),
+            ('solid', "SOLID ELEMENTS", "*ELEMENT_SOLID", 8),
+            ('beam', "BEAM ELEMENTS", "*ELEMENT_BEAM", 3),
+        )
+        table = self._model.store.elements
+        fmt_int = self._format_int
+
+        for category, comment, keyword, node_width in blocks:
+            rows = self._model.elements[category].rows
+            if len(rows) == 0:
+                continue
 
-                n1 = nodes[0] if len(nodes) > 0 else 0
-                n2 = nodes[1] if len(nodes) > 1 else 0
-                n3 = nodes[2] if len(nodes) > 2 else 0
+            self._add_section_comment(lines, comment)
+            lines.append(keyword)
 
-                line = self._format_int(eid, 8)
-                line += self._format_int(pid, 8)
-                line += self._format_int(n1, 8)
-                line += self._format_int(n2, 8)
-                line += self._format_int(n3, 8)
+            # node_count 이후 슬롯은 0 (shell/solid는 0으로 패딩)
+            nodes = table.get('nodes', rows)
+            counts = table.get('node_count', rows)
+            nodes[np.arange(nodes.shape[1]) >= counts[:, None]] = 0
 
-                lines.append(line)
+            eids = table.get('eid', rows).tolist()
+            pids = table.get('pid', rows).tolist()
+            for eid, pid, elem_nodes in zip(eids, pids, nodes[:, :node_width].tolist()):
+                lines.append(fmt_int(eid, 8) + fmt_int(pid, 8)
+                             + ''.join(fmt_int(n, 8) for n in elem_nodes))
 
     def _export_parts(self, lines: List[str]):
         """파트 출력"""
@@ -427,7 +400,7 @@ class KFileExporter:
         self._add_section_comment(lines, "SETS")
 
         for set_item in self._model.sets:
-            keyword_type = getattr(set_item, 'keyword_type', 'SET_NODE_LIST')
+            keyword_type = self._set_keyword(set_item)
             lines.append(f"*{keyword_type}")
 
             # Title if present
@@ -452,14 +425,36 @@ class KFileExporter:
 
             lines.append(line1)
 
+            if keyword_type == 'SET_SEGMENT':
+                # Segment: 한 줄에 N1~N4
+                for segment in getattr(set_item, 'segments', None) or []:
+                    lines.append(''.join(self._format_int(n, 10) for n in list(segment)[:4]))
+                continue
+
             # Members (8 per line)
-            members = getattr(set_item, 'members', [])
-            if members:
+            members = getattr(set_item, 'ids', [])
+            if len(members):
                 for i in range(0, len(members), 8):
                     chunk = members[i:i+8]
                     line = ''.join(self._format_int(m, 10) for m in chunk)
                     lines.append(line)
 
+    @staticmethod
+    def _set_keyword(set_item: Any) -> str:
+        """Set 타입에 맞는 키워드 (keyword_type이 있으면 우선)"""
+        keyword_type = getattr(set_item, 'keyword_type', None)
+        if keyword_type:
+            return keyword_type
+        set_type = getattr(set_item, 'set_type', None)
+        name = getattr(set_type, 'name', set_type)
+        if isinstance(name, int) and 0 <= name < len(SET_TYPE_NAMES):
+            name = SET_TYPE_NAMES[name]
+        if isinstance(name, str):
+            name = name.upper()
+            if name.startswith('SET_'):
+                name = name[len('SET_'):]
+        return SET_KEYWORDS.get(name, 'SET_NODE_LIST')
+
     def _export_controls(self, lines: List[str]):
         """컨트롤 키워드 출력"""
         if not self._model.controls:
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 if TYPE_CHECKING:
-    from gui.app_context import ParsedModelData
+    from core.model_data import ParsedModelData
 
 
 class SeverityLevel(Enum):
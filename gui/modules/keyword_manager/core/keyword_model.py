@@ -2,11 +2,14 @@
 from typing import Dict, List, Any, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .exporter import KFileExporter, ExportOptions
-from .undo_manager import UndoManager, ModifyCommand, ModifyNodesCommand, AddCommand, DeleteCommand
+from .undo_manager import (UndoManager, ModifyCommand, ModifyNodesCommand, AddCommand, DeleteCommand,
+                           ColumnUpdateCommand)
 
 if TYPE_CHECKING:
-    from gui.app_context import ParsedModelData
+    from core.model_data import ParsedModelData
 
 
 @dataclass
@@ -20,6 +23,9 @@ class CategoryInfo:
     subcategories: List['CategoryInfo'] = field(default_factory=list)
 
 
+# 열 기반 저장소가 변경을 추적하는 카테고리
+STORE_CATEGORIES = ('nodes', 'shell', 'solid', 'beam')
+
 # 카테고리 정의
 KEYWORD_CATEGORIES = [
     CategoryInfo('nodes', 'Nodes', '노드', 'fa5s.dot-circle'),
@@ -130,6 +136,12 @@ class KeywordModel:
     def mark_modified(self, category: str, item: Any):
         """항목 수정 표시"""
         self._is_dirty = True
+        if self._model is not None:
+            # 공유 파생 지오메트리 캐시 무효화
+            self._model.mark_modified()
+        if category in STORE_CATEGORIES:
+            # 노드/요소는 저장소의 행 단위 dirty 플래그로 추적
+            return
         if category not in self._modified_items:
             self._modified_items[category] = set()
 
@@ -155,13 +167,19 @@ class KeywordModel:
         return id(item)  # 기본값으로 객체 ID 사용
 
     def get_modified_count(self) -> int:
-        """수정된 항목 총 수"""
-        return sum(len(items) for items in self._modified_items.values())
+        """수정된 항목 총 수 (노드/요소는 저장소 변경 추적 기준)"""
+        count = sum(len(items) for items in self._modified_items.values())
+        if self._model is not None and self._model._store is not None:
+            for changes in self._model.store.get_changes().values():
+                count += changes['modified'] + changes['deleted']
+        return count
 
     def clear_modified(self):
         """수정 표시 초기화"""
         self._modified_items.clear()
         self._is_dirty = False
+        if self._model is not None and self._model._store is not None:
+            self._model.store.clear_changes()
 
     @staticmethod
     def get_categories() -> List[CategoryInfo]:
@@ -383,6 +401,52 @@ class KeywordModel:
                 return True
         return False
 
+    def move_nodes(self, node_ids, delta) -> bool:
+        """노드 일괄 이동 (벡터화, Undo 지원)
+
+        Args:
+            node_ids: 이동할 노드 ID 배열
+            delta: 이동량 (3,) 또는 노드별 (N, 3)
+
+        Returns:
+            성공 여부 (존재하지 않는 ID가 있으면 False)
+        """
+        if not self._model:
+            return False
+        table = self._model.store.nodes
+        rows = table.rows_of(node_ids)
+        if len(rows) == 0 or (rows < 0).any():
+            return False
+
+        old = table.get('xyz', rows)
+        new = old + np.asarray(delta, dtype=np.float64)
+        cmd = ColumnUpdateCommand(table, 'xyz', table.handles_of(rows), old, new, 'nodes',
+                                  f"Move {len(rows)} nodes")
+        if self._undo_manager.execute(cmd):
+            self._notify_model_changed()
+            self._is_dirty = True
+            return True
+        return False
+
+    def reassign_elements(self, element_ids, pid: int) -> bool:
+        """요소 Part 일괄 변경 (벡터화, Undo 지원)"""
+        if not self._model:
+            return False
+        table = self._model.store.elements
+        rows = table.rows_of(element_ids)
+        if len(rows) == 0 or (rows < 0).any():
+            return False
+
+        old = table.get('pid', rows)
+        new = np.full(len(rows), pid, dtype=old.dtype)
+        cmd = ColumnUpdateCommand(table, 'pid', table.handles_of(rows), old, new, 'elements',
+                                  f"Move {len(rows)} elements to Part {pid}")
+        if self._undo_manager.execute(cmd):
+            self._notify_model_changed()
+            self._is_dirty = True
+            return True
+        return False
+
     def add_item(self, category: str, item: Any) -> bool:
         """항목 추가 (Undo 지원)
 
@@ -421,7 +485,10 @@ class KeywordModel:
             items_list, item, -1, category,
             on_remove=lambda c, i: self.mark_modified(c, i)
         )
-        return self._undo_manager.execute(cmd)
+        if not self._undo_manager.execute(cmd):
+            return False
+        self._maybe_compact()
+        return True
 
     def _get_items_list(self, category: str) -> Optional[List]:
         """카테고리의 리스트 참조 반환 (직접 수정용)"""
@@ -450,11 +517,32 @@ class KeywordModel:
 
     def undo(self) -> bool:
         """실행 취소"""
-        return self._undo_manager.undo()
+        if self._undo_manager.undo():
+            self._maybe_compact()
+            self._notify_model_changed()
+            return True
+        return False
 
     def redo(self) -> bool:
         """다시 실행"""
-        return self._undo_manager.redo()
+        if self._undo_manager.redo():
+            self._maybe_compact()
+            self._notify_model_changed()
+            return True
+        return False
+
+    def _maybe_compact(self):
+        """삭제/Undo로 tombstone이 쌓였으면 저장소 정리
+
+        Undo 명령과 행 프록시는 행 핸들로 행을 찾으므로 compact 후에도 유효합니다.
+        """
+        if self._model is not None and self._model._store is not None:
+            self._model.store.maybe_compact()
+
+    def _notify_model_changed(self):
+        """모델 편집 알림 (파생 지오메트리 캐시 무효화)"""
+        if self._model is not None:
+            self._model.mark_modified()
 
     def can_undo(self) -> bool:
         """실행 취소 가능 여부"""
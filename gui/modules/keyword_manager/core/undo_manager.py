@@ -2,12 +2,17 @@
 
 키워드 편집 작업의 실행 취소 및 다시 실행을 관리합니다.
 """
+import logging
 from typing import Any, Optional, List, Dict, Callable
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from PySide6.QtCore import QObject, Signal
 
+from core.memory_registry import memory_registry, estimate_nbytes
+
+logger = logging.getLogger(__name__)
+
 
 class Command(ABC):
     """추상 명령 클래스"""
@@ -137,6 +142,49 @@ class ModifyNodesCommand(Command):
         return self._category
 
 
+class ColumnUpdateCommand(Command):
+    """열 기반 저장소 벡터화 수정 명령
+
+    여러 행의 한 필드를 한 번에 변경합니다. 항목 객체 대신 행 핸들과
+    이전/새 값 배열만 보관하므로 대량 편집도 히스토리 메모리가 작습니다.
+    """
+
+    def __init__(self, table: Any, column: str, handles, old_values, new_values,
+                 category: str = "", desc: str = ""):
+        self._table = table
+        self._column = column
+        self._handles = handles
+        self._old_values = old_values
+        self._new_values = new_values
+        self._category = category
+        self._desc = desc
+
+    def _apply(self, values) -> bool:
+        rows = self._table.rows_for_handles(self._handles)
+        if (rows < 0).any():
+            logger.warning("ColumnUpdateCommand: %d rows no longer exist", int((rows < 0).sum()))
+            return False
+        self._table.set(self._column, rows, values)
+        return True
+
+    def execute(self) -> bool:
+        return self._apply(self._new_values)
+
+    def undo(self) -> bool:
+        return self._apply(self._old_values)
+
+    def description(self) -> str:
+        return self._desc or f"Modify {len(self._handles)} {self._category} {self._column}"
+
+    @property
+    def category(self) -> str:
+        return self._category
+
+    @property
+    def count(self) -> int:
+        return len(self._handles)
+
+
 class AddCommand(Command):
     """항목 추가 명령"""
 
@@ -298,6 +346,15 @@ class UndoManager(QObject):
         self._redo_stack: List[Command] = []
         self._batch_command: Optional[BatchCommand] = None
 
+        # 메모리 집계 (히스토리는 재생성 불가 - 해제 대상 아님)
+        memory_registry.register("undo history", category="undo",
+                                 size_fn=lambda um: um.memory_bytes, owner=self)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Undo/Redo 스택 추정 메모리 (삭제된 항목 등 명령이 붙잡은 객체 포함)"""
+        return estimate_nbytes(self._undo_stack) + estimate_nbytes(self._redo_stack)
+
     def execute(self, command: Command) -> bool:
         """명령 실행 및 히스토리에 추가"""
         # 배치 모드인 경우
@@ -0,0 +1,70 @@
+"""KFileExporter 테스트 (Set 타입별 키워드 round-trip)"""
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가 (C++ 파서 빌드 경로는 루트 conftest.py)
+PROJECT_DIR = Path(__file__).resolve().parents[4]
+sys.path.insert(0, str(PROJECT_DIR))
+
+import pytest
+
+from core.model_data import parse_k_file, _KFILE_READER_AVAILABLE
+from gui.modules.keyword_manager.core.exporter import KFileExporter
+
+pytestmark = pytest.mark.skipif(not _KFILE_READER_AVAILABLE, reason="C++ parser not built")
+
+HEADER = "         7       0.0       0.0       0.0       0.0MECH\n"
+
+SET_DECKS = {
+    'NODE_LIST': ("*SET_NODE_LIST\n" + HEADER +
+                  "         1         2         3         4         5         6         7         8\n"
+                  "         9\n"),
+    'PART_LIST': "*SET_PART_LIST\n" + HEADER + "         1         2\n",
+    'SEGMENT': ("*SET_SEGMENT\n" + HEADER +
+                "         1         2         3         4\n"
+                "         5         6         7         8\n"),
+    'SHELL': "*SET_SHELL_LIST\n" + HEADER + "       101       102       103\n",
+    'SOLID': "*SET_SOLID\n" + HEADER + "       201\n",
+}
+
+EXPECTED_KEYWORDS = {
+    'NODE_LIST': '*SET_NODE_LIST',
+    'PART_LIST': '*SET_PART_LIST',
+    'SEGMENT': '*SET_SEGMENT',
+    'SHELL': '*SET_SHELL_LIST',
+    'SOLID': '*SET_SOLID',
+}
+
+
+def load(path: Path):
+    model = parse_k_file(str(path))
+    assert model is not None
+    return model
+
+
+@pytest.mark.parametrize("set_type", list(SET_DECKS))
+def test_set_round_trip(tmp_path, set_type):
+    """Set 타입에 맞는 키워드로 출력되고 다시 읽으면 같은 Set"""
+    source = tmp_path / "source.k"
+    source.write_text("*KEYWORD\n" + SET_DECKS[set_type] + "*END\n")
+    original = load(source).sets[0]
+    assert original.set_type.name == set_type
+
+    exported = tmp_path / "exported.k"
+    assert KFileExporter(load(source)).export(str(exported))
+    text = exported.read_text()
+    assert EXPECTED_KEYWORDS[set_type] in text.splitlines()
+
+    result = load(exported).sets[0]
+    assert result.set_type == original.set_type
+    assert result.sid == original.sid == 7
+    assert list(result.ids) == list(original.ids)
+    assert result.segments == original.segments
+
+
+def test_sample_deck_keeps_every_set():
+    sample = PROJECT_DIR / "core" / "kfile_parser" / "tests" / "sample.k"
+    lines = KFileExporter(load(sample)).generate_content()
+    keywords = [line for line in lines if line.startswith("*SET_")]
+    assert keywords == ['*SET_NODE_LIST', '*SET_PART_LIST', '*SET_SEGMENT',
+                        '*SET_SHELL_LIST', '*SET_SOLID']
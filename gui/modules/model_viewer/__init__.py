@@ -1,4 +1,11 @@
 """Model Viewer module for 3D visualization of K-file models"""
-from .module import ModelViewerModule
 
 __all__ = ['ModelViewerModule']
+
+
+def __getattr__(name):
+    # 위젯 모듈은 지연 import (core 서브패키지는 Qt/OpenGL 없이 사용 가능)
+    if name == 'ModelViewerModule':
+        from .module import ModelViewerModule
+        return ModelViewerModule
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
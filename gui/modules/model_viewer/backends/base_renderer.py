@@ -3,11 +3,13 @@
 모든 렌더링 백엔드의 공통 인터페이스
 """
 from abc import ABC, abstractmethod
-from typing import Set, Dict, Optional
+from typing import Iterable, Set, Dict, Optional
 import numpy as np
 
-from ..core.mesh_data import MeshData
+from ..core.mesh_data import MeshData, CELL_FACES
 from ..core.camera import Camera
+from ..core.selection import PARTS, REPLACE, RegionSelector, SelectionManager
+from ..core.vertex_buffers import PartAttributes
 
 
 class BaseRenderer(ABC):
@@ -20,6 +22,7 @@ class BaseRenderer(ABC):
         self._mesh: Optional[MeshData] = None
         self._visible_parts: Set[int] = set()
         self._part_colors: Dict[int, tuple] = {}
+        self._attributes: Optional[PartAttributes] = None  # 표시 색상 (하이라이트/투명도/선택 반영)
         self._camera: Optional[Camera] = None
 
         # Rendering options (CAE 기본값)
@@ -32,6 +35,15 @@ class BaseRenderer(ABC):
         # Cached exterior faces for solid rendering
         self._exterior_faces: Optional[Dict] = None
 
+        # 외곽면/스킨 디스크 캐시 (gui.mesh_cache.SkinDiskCache, None이면 사용 안 함)
+        self._skin_disk_cache = None
+        self._skin_cache_key = ""
+        self._cached_skin = None  # 현재 메쉬의 캐시 항목 (CachedSkin, 없으면 None)
+
+        # 영역 선택 (Box/Lasso) - 선택 후보는 메쉬마다 처음 선택할 때 생성
+        self._selection = SelectionManager()
+        self._region_selector: Optional[RegionSelector] = None
+
     @abstractmethod
     def initialize(self):
         """렌더링 초기화 (initializeGL에서 호출)"""
@@ -50,9 +62,14 @@ class BaseRenderer(ABC):
     def set_mesh(self, mesh: MeshData):
         """메쉬 데이터 설정"""
         self._mesh = mesh
+        self._region_selector = None
+        self._selection.clear()
         if mesh:
             self._visible_parts = set(mesh.part_elements.keys())
             self._generate_part_colors()
+            self._attributes = PartAttributes(list(mesh.part_elements.keys()), self._part_colors)
+            # 디스크 캐시에 있으면 외곽면 추출 생략
+            self._load_skin_cache(mesh)
             # 외곽면 추출 (Solid 렌더링 최적화)
             print(f"[Renderer] Extracting exterior faces...")
             self._exterior_faces = mesh.extract_exterior_faces()
@@ -60,11 +77,42 @@ class BaseRenderer(ABC):
             if self._exterior_faces:
                 total_faces = sum(len(faces) for faces in self._exterior_faces.values())
                 total_elements = len(mesh.elements)
-                print(f"[Renderer] Exterior faces: {total_faces} (elements: {total_elements})")
-                if mesh.element_type == 'solid':
-                    reduction = 100 * (1 - total_faces / (total_elements * 6))
+                print(f"[Renderer] Exterior faces: {total_faces} (elements: {total_elements}, "
+                      f"{mesh.type_counts()})")
+                all_faces = sum(len(CELL_FACES.get(t, ())) * n
+                                for t, n in enumerate(np.bincount(mesh.cell_types)))
+                if mesh.element_type != 'shell' and all_faces:
+                    reduction = 100 * (1 - total_faces / all_faces)
                     print(f"[Renderer] Rendering reduction: {reduction:.1f}%")
 
+    def set_skin_disk_cache(self, cache):
+        """외곽면/스킨 디스크 캐시 설정 (다음 set_mesh부터, None이면 끔)"""
+        self._skin_disk_cache = cache
+
+    def _load_skin_cache(self, mesh: MeshData):
+        """메쉬 내용 해시로 캐시 항목 조회 → 있으면 외곽면을 메쉬에 설정"""
+        self._skin_cache_key = ""
+        self._cached_skin = None
+        if self._skin_disk_cache is None:
+            return
+        self._skin_cache_key = self._skin_disk_cache.key_for(mesh)
+        self._cached_skin = self._skin_disk_cache.load(self._skin_cache_key)
+        if self._cached_skin is not None:
+            print(f"[Renderer] Skin cache hit ({self._skin_cache_key[:12]})")
+            mesh.set_exterior_faces(self._cached_skin.exterior_faces)
+
+    def _save_skin_cache(self, skin=None, signatures: Optional[Dict[int, str]] = None):
+        """외곽면 (+ 스킨)을 디스크 캐시에 저장 (같은 내용이 이미 있으면 생략)"""
+        cache, key = self._skin_disk_cache, self._skin_cache_key
+        if cache is None or not key or not self._exterior_faces:
+            return
+        if cache.contains(key, with_skin=skin is not None):
+            return
+        try:
+            cache.save(key, self._exterior_faces, skin, signatures)
+        except OSError as e:
+            print(f"[Renderer] 스킨 캐시 저장 실패: {e}")
+
     def set_camera(self, camera: Camera):
         """카메라 설정"""
         self._camera = camera
@@ -124,6 +172,118 @@ class BaseRenderer(ABC):
             color = cae_colors[i % len(cae_colors)]
             self._part_colors[pid] = color
 
+    # ========== Part 표시 속성 ==========
+
+    def set_part_colors(self, colors: Dict[int, tuple]):
+        """Part 색상 변경 {part_id: (r, g, b)} - 지오메트리는 다시 만들지 않음"""
+        self._part_colors.update(colors)
+        if self._attributes is not None:
+            self._attributes.set_colors(colors)
+            self._apply_part_attributes()
+
+    def set_part_opacity(self, part_ids: Iterable[int], opacity: float):
+        """Part 불투명도 (1.0 불투명, 작을수록 투명)"""
+        if self._attributes is not None:
+            self._attributes.set_alpha(part_ids, opacity)
+            self._apply_part_attributes()
+
+    def set_highlighted_parts(self, part_ids: Iterable[int]):
+        """하이라이트할 Part (이전 하이라이트는 해제)"""
+        if self._attributes is not None:
+            self._attributes.set_highlighted(part_ids)
+            self._apply_part_attributes()
+
+    def _display_color(self, part_id: int) -> tuple:
+        """그릴 Part 색상 (하이라이트/선택 반영)"""
+        if self._attributes is None:
+            return self._part_colors.get(part_id, (0.7, 0.7, 0.7))
+        return self._attributes.color(part_id)
+
+    def _apply_part_attributes(self):
+        changed = self._attributes.commit()
+        if changed:
+            self._on_part_attributes_changed(changed)
+
+    def _on_part_attributes_changed(self, part_ids: Set[int]):
+        """표시 색상이 바뀐 Part (색상 버퍼 갱신 등, 백엔드별)"""
+        pass
+
+    def _sync_selected_parts(self):
+        """Part 선택은 Part 표시 색상으로 하이라이트"""
+        if self._attributes is None:
+            return
+        selection = self._selection
+        self._attributes.set_selected(selection.indices.tolist() if selection.target == PARTS else [])
+        self._apply_part_attributes()
+
+    @property
+    def selection(self) -> SelectionManager:
+        """영역 선택 결과 (요소/노드/Part 인덱스 배열)"""
+        return self._selection
+
+    def select_region(self, polygon: np.ndarray, width: int, height: int, mode: str = REPLACE,
+                      front_only: bool = True) -> np.ndarray:
+        """Box/Lasso 영역 선택 (GL 불필요, CPU 투영)
+
+        Args:
+            polygon: (K, 2) 윈도우 좌표 다각형 (top-down, box는 rectangle_polygon)
+            width, height: polygon 좌표계의 뷰포트 크기
+            mode: REPLACE, ADD, SUBTRACT
+            front_only: 가려진 요소/노드 제외
+
+        Returns:
+            영역 안에서 찾은 인덱스 (selection.target 기준, 반영 전)
+        """
+        if self._mesh is None or self._camera is None:
+            return np.zeros(0, dtype=np.int64)
+        if self._region_selector is None:
+            self._region_selector = RegionSelector(self._mesh, self._exterior_faces or {})
+        view = self._camera.get_view_matrix()
+        proj = self._camera.get_projection_matrix(width / max(height, 1))
+        found = self._region_selector.select(polygon, view, proj, width, height, self._selection.target,
+                                             front_only, self._visible_parts)
+        self._selection.apply(found, mode)
+        self._sync_selected_parts()
+        self._on_selection_changed()
+        return found
+
+    def clear_selection(self):
+        """영역 선택 해제"""
+        self._selection.clear()
+        self._sync_selected_parts()
+        self._on_selection_changed()
+
+    def _on_selection_changed(self):
+        """선택 변경 후 (하이라이트 버퍼 갱신 등, 백엔드별)"""
+        pass
+
+    def begin_interaction(self):
+        """카메라 조작 시작/진행 (마우스 드래그, 휠) - LOD 지원 백엔드만 사용"""
+        pass
+
+    def end_interaction(self):
+        """카메라 조작 종료 (움직임이 멈춘 뒤 호출) - 원래 디테일로 복원"""
+        pass
+
+    @property
+    def interaction_settle_ms(self) -> int:
+        """마지막 움직임 후 end_interaction까지 대기 시간 (ms)"""
+        return 200
+
+    def get_stats(self) -> Dict:
+        """렌더링 통계 (버퍼 크기 등, 백엔드별)"""
+        return {}
+
+    @property
+    def performance_monitor(self):
+        """프레임 기록 (PerformanceMonitor - HUD/trace 내보내기, 지원하지 않는 백엔드는 None)"""
+        return None
+
+    @property
+    def loading_progress(self) -> Optional[float]:
+        """점진적 로드 진행률 (0-1, 로드 중이 아니거나 지원하지 않는 백엔드는 None)"""
+        return None
+
     @property
     def name(self) -> str:
         """백엔드 이름"""
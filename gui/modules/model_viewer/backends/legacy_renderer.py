@@ -1,20 +1,33 @@
 """Legacy OpenGL Renderer
 
-Fixed-pipeline OpenGL (glBegin/glEnd) - 최대 호환성
+Fixed-pipeline OpenGL (client-side vertex array + display list) - 최대 호환성
 """
+from typing import Callable, Dict, List, Optional, Tuple
+
 from OpenGL.GL import *
+from OpenGL import GL
 import numpy as np
 
 from .base_renderer import BaseRenderer
+from ..core.frame_state import apply_frame_state
+from ..core.render_cache import RenderCache, cached_skin
+
+# 솔리드 기본 불투명도 (엣지가 살짝 비치도록)
+SOLID_ALPHA = 0.85
 
 
 class LegacyRenderer(BaseRenderer):
-    """Legacy OpenGL 렌더러 (glBegin/glEnd)
+    """Legacy OpenGL 렌더러 (VBO 없이 OpenGL 1.1 기능만 사용)
+
+    VBO가 제대로 동작하지 않는 원격 X/VNC 환경의 대체 백엔드입니다.
+    면마다 glBegin/glEnd를 호출하는 대신 외곽면 IndexedSkin (VBO 백엔드와 같은 버퍼)을
+    NumPy client-side 배열로 두고 Part별 인덱스 구간을 glDrawElements 한 번으로 그립니다.
 
     Features:
-    - 최대 호환성 (OpenGL 2.1+)
-    - 간단한 구현
-    - Part별 색상
+    - 최대 호환성 (OpenGL 1.1 vertex array / display list)
+    - Part별 display list 캐시 (선택): 간접 렌더링(원격 GLX)에서도 지오메트리는 한 번만 전송
+    - Part 색상/하이라이트/투명도는 glColor로 지정 (display list 재컴파일 없음)
+    - 면 단위 법선 (GL_FLAT 조명)
     - Wireframe/Solid/Nodes
     """
 
@@ -23,6 +36,67 @@ class LegacyRenderer(BaseRenderer):
         self._width = 1
         self._height = 1
 
+        # Part 조각 캐시 (같은 메쉬/백엔드 교체 시 스킨 재사용)
+        self._render_cache = RenderCache()
+
+        # Client-side 배열 (외곽면 스킨, Part 단위 연속)
+        self._skin = None
+        self._positions: Optional[np.ndarray] = None  # (V, 3) float32
+        self._normals: Optional[np.ndarray] = None  # (V, 3) float32 (provoking 정점이 면 법선)
+        self._skin_rank: Dict[int, int] = {}  # part_id → skin Part 순번
+        self._beam_lines: Dict[int, np.ndarray] = {}  # part_id → (2K, 3) float32
+        self._node_points: Optional[np.ndarray] = None  # visible Part 노드 (visible 변경 시 재생성)
+
+        # Display list 캐시 {(종류, part_id): list id} - 지오메트리만 (색상은 그릴 때 glColor)
+        self._use_display_lists = True
+        self._display_lists: Dict[Tuple[str, Optional[int]], int] = {}
+        self._stale_lists: List[int] = []  # 다음 render()에서 삭제 (GL 컨텍스트 필요)
+
+    def set_mesh(self, mesh):
+        """메쉬 설정 - 외곽면 스킨을 client-side 배열로 준비 (GL 호출 없음)"""
+        super().set_mesh(mesh)
+        self._release_display_lists()
+        self._skin = self._positions = self._normals = self._node_points = None
+        self._skin_rank = {}
+        self._beam_lines = {}
+        if not mesh or len(mesh.nodes) == 0:
+            return
+
+        cached = self._cached_skin
+        if cached is not None and cached.skin is not None:
+            skin = cached.skin
+        elif self._exterior_faces:
+            skin, signatures, built = cached_skin(self._render_cache, mesh.nodes, self._exterior_faces,
+                                                  self._part_colors)
+            print(f"[Legacy Renderer] Skin parts: {len(skin.part_ids) - built} cached, {built} built")
+            self._save_skin_cache(skin, signatures)
+        else:
+            skin = None
+
+        if skin is not None:
+            self._skin = skin
+            self._positions = np.ascontiguousarray(skin.vertices[:, 0:3])
+            self._normals = np.ascontiguousarray(skin.vertices[:, 3:6])
+            self._skin_rank = {int(pid): i for i, pid in enumerate(skin.part_ids)}
+
+        for pid in mesh.part_elements:
+            _, lines = mesh.beam_lines(pid)
+            if len(lines):
+                self._beam_lines[pid] = np.ascontiguousarray(mesh.nodes[lines.ravel()], dtype=np.float32)
+
+    def set_visible_parts(self, part_ids):
+        super().set_visible_parts(part_ids)
+        # 노드 포인트는 visible Part 전체가 한 배열
+        self._node_points = None
+        self._discard_display_list(('nodes', None))
+
+    def set_display_lists(self, enabled: bool):
+        """Part별 display list 캐시 사용 여부 (끄면 매 프레임 client-side 배열에서 그림)"""
+        if enabled == self._use_display_lists:
+            return
+        self._use_display_lists = enabled
+        self._release_display_lists()
+
     def initialize(self):
         """OpenGL 초기화"""
         print("[Legacy Renderer] Initializing...")
@@ -80,8 +154,15 @@ class LegacyRenderer(BaseRenderer):
 
     def render(self):
         """메인 렌더링"""
+        # 오버레이 QPainter가 바꾼 상태 복원 (frame_state 참고)
+        apply_frame_state(GL)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
+        # 이전 메쉬/설정의 display list 해제
+        for list_id in self._stale_lists:
+            glDeleteLists(list_id, 1)
+        self._stale_lists = []
+
         if not self._mesh or len(self._mesh.nodes) == 0:
             return
 
@@ -101,7 +182,9 @@ class LegacyRenderer(BaseRenderer):
         # 그리드
         self._draw_grid()
 
-        # 렌더링
+        # 렌더링 (모든 지오메트리는 client-side 배열, 위치는 패스마다 지정)
+        glEnableClientState(GL_VERTEX_ARRAY)
+
         if self._show_solid:
             glEnable(GL_POLYGON_OFFSET_FILL)
             glPolygonOffset(1.0, 1.0)
@@ -112,13 +195,21 @@ class LegacyRenderer(BaseRenderer):
             self._draw_edges()  # 외곽 엣지만 (검은색 윤곽선)
 
         if self._show_wireframe:
-            self._draw_wireframe()  # 모든 엣지 (Part 색상)
+            self._draw_wireframe()  # 외곽면 엣지 (Part 색상)
+
+        # Beam 요소 (면이 없으므로 모든 모드에서 선으로 표시)
+        self._draw_beams()
 
         if self._show_nodes:
             self._draw_nodes()
 
+        glDisableClientState(GL_VERTEX_ARRAY)
+
     def _draw_grid(self):
-        """그리드 & 축"""
+        """그리드 & 축 (전역 원점, 메쉬는 origin 기준 로컬 좌표)"""
+        glPushMatrix()
+        glTranslated(*(-self._mesh.origin))
+
         glColor3f(0.3, 0.3, 0.3)
         glBegin(GL_LINES)
         for i in range(-10, 11):
@@ -136,120 +227,145 @@ class LegacyRenderer(BaseRenderer):
         glColor3f(0, 0, 1); glVertex3f(0, 0, 0); glVertex3f(0, 0, 20)
         glEnd()
         glLineWidth(1.5)
+        glPopMatrix()
 
-    def _draw_wireframe(self):
-        """와이어프레임"""
-        for pid in self._visible_parts:
-            if pid not in self._mesh.part_elements:
-                continue
-            color = self._part_colors.get(pid, (0.7, 0.7, 0.7))
-            glColor3f(*color)
+    # ========== Display list ==========
+
+    def _draw_cached(self, key: Tuple[str, Optional[int]], draw: Callable[[], None]):
+        """지오메트리 그리기 - display list 사용 시 처음 그릴 때 컴파일하며 그리고 이후 glCallList
 
-            glBegin(GL_LINES)
-            for elem_idx in self._mesh.part_elements[pid]:
-                node_indices = self._mesh.elements[elem_idx]
-                n = len(node_indices)
-
-                if n == 4:  # Shell
-                    edges = [(0,1),(1,2),(2,3),(3,0)]
-                elif n == 8:  # Hex
-                    edges = [(0,1),(1,2),(2,3),(3,0),(4,5),(5,6),(6,7),(7,4),(0,4),(1,5),(2,6),(3,7)]
-                else:
-                    continue
-
-                for i, j in edges:
-                    idx1, idx2 = node_indices[i], node_indices[j]
-                    p1 = self._mesh.nodes[idx1]
-                    p2 = self._mesh.nodes[idx2]
-                    glVertex3f(p1[0], p1[1], p1[2])
-                    glVertex3f(p2[0], p2[1], p2[2])
-            glEnd()
+        배열 포인터 설정 (gl*Pointer, glEnableClientState)은 display list에 기록되지 않으므로
+        draw는 컴파일 시점의 배열을 그대로 복사해 둡니다.
+        """
+        if not self._use_display_lists:
+            draw()
+            return
+        list_id = self._display_lists.get(key)
+        if list_id is not None:
+            glCallList(list_id)
+            return
+        list_id = glGenLists(1)
+        if not list_id:  # 할당 실패 → 직접 그림
+            draw()
+            return
+        glNewList(list_id, GL_COMPILE_AND_EXECUTE)
+        draw()
+        glEndList()
+        self._display_lists[key] = list_id
+
+    def _discard_display_list(self, key: Tuple[str, Optional[int]]):
+        list_id = self._display_lists.pop(key, None)
+        if list_id is not None:
+            self._stale_lists.append(list_id)
+
+    def _release_display_lists(self):
+        self._stale_lists.extend(self._display_lists.values())
+        self._display_lists = {}
+
+    # ========== 그리기 ==========
+
+    def _skin_parts(self) -> List[int]:
+        """그릴 외곽면 Part (skin 순서)"""
+        return sorted((pid for pid in self._visible_parts if pid in self._skin_rank),
+                      key=self._skin_rank.__getitem__)
+
+    def _draw_part_range(self, kind: str, pid: int, mode, indices: np.ndarray, offsets: np.ndarray):
+        """Part 인덱스 구간 하나를 glDrawElements (현재 정점 배열 기준)"""
+        rank = self._skin_rank[pid]
+        start, end = int(offsets[rank]), int(offsets[rank + 1])
+        if end > start:
+            part_indices = np.ascontiguousarray(indices[start:end], dtype=np.uint32)
+            self._draw_cached((kind, pid), lambda: glDrawElements(
+                mode, part_indices.size, GL_UNSIGNED_INT, part_indices))
+
+    def _draw_wireframe(self):
+        """와이어프레임 (외곽면 엣지, Part 색상)"""
+        self._draw_skin_edges(color=None)
 
     def _draw_solid(self):
-        """솔리드 (외곽면만 렌더링 - 성능 최적화)"""
-        if not self._exterior_faces:
+        """솔리드 (외곽면만 렌더링 - 면 단위 flat shading)
+
+        반투명 Part는 불투명 Part 다음에 깊이 버퍼를 쓰지 않고 그립니다.
+        """
+        parts = self._skin_parts()
+        if not parts:
             return
 
         glEnable(GL_LIGHTING)  # Enable lighting for surfaces
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
-        for pid in self._visible_parts:
-            if pid not in self._exterior_faces:
+        glShadeModel(GL_FLAT)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, self._positions)
+        glNormalPointer(GL_FLOAT, 0, self._normals)
+
+        translucent = self._attributes.translucent if self._attributes is not None else set()
+        for pass_parts, depth_write in (([p for p in parts if p not in translucent], True),
+                                        ([p for p in parts if p in translucent], False)):
+            if not pass_parts:
                 continue
-
-            color = self._part_colors.get(pid, (0.7, 0.7, 0.7))
-            glColor4f(color[0], color[1], color[2], 0.85)  # Slightly more opaque
-
-            glBegin(GL_QUADS)
-            # 외곽면만 렌더링 (내부 폴리곤 제외)
-            for elem_idx, face_indices in self._exterior_faces[pid]:
-                node_indices = self._mesh.elements[elem_idx]
-
-                # 면의 노드들 렌더링
-                for i in face_indices:
-                    idx = node_indices[i]
-                    p = self._mesh.nodes[idx]
-                    glVertex3f(p[0], p[1], p[2])
-            glEnd()
-
+            if not depth_write:
+                glDepthMask(GL_FALSE)
+            for pid in pass_parts:
+                opacity = self._attributes.opacity(pid) if self._attributes is not None else 1.0
+                glColor4f(*self._display_color(pid), SOLID_ALPHA * opacity)
+                self._draw_part_range('solid', pid, GL_TRIANGLES, self._skin.triangles,
+                                      self._skin.triangle_offsets)
+            if not depth_write:
+                glDepthMask(GL_TRUE)
+
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glShadeModel(GL_SMOOTH)
         glDisable(GL_BLEND)
         glDisable(GL_LIGHTING)  # Disable after solid rendering
 
     def _draw_edges(self):
         """외곽 엣지만 (검은색 윤곽선)"""
-        if not self._exterior_faces:
-            return
-
-        glColor3f(0.0, 0.0, 0.0)  # 검은색 윤곽선
         glLineWidth(1.0)
-        glBegin(GL_LINES)
+        self._draw_skin_edges(color=(0.0, 0.0, 0.0))
+        glLineWidth(1.5)
 
+    def _draw_skin_edges(self, color: Optional[tuple]):
+        """외곽면 엣지 (공유 엣지 1번씩, color가 None이면 Part 색상)"""
+        parts = self._skin_parts()
+        if not parts:
+            return
+
+        glVertexPointer(3, GL_FLOAT, 0, self._positions)
+        if color is not None:
+            glColor3f(*color)
+        for pid in parts:
+            if color is None:
+                glColor3f(*self._display_color(pid))
+            self._draw_part_range('edges', pid, GL_LINES, self._skin.edges, self._skin.edge_offsets)
+
+    def _draw_beams(self):
+        """Beam 선분 (Part 색상)"""
+        glLineWidth(2.5)
         for pid in self._visible_parts:
-            if pid not in self._exterior_faces:
+            points = self._beam_lines.get(pid)
+            if points is None:
                 continue
-
-            # 외곽면의 엣지만 그리기
-            for elem_idx, face_indices in self._exterior_faces[pid]:
-                node_indices = self._mesh.elements[elem_idx]
-
-                # Face 엣지 (사각형)
-                if len(face_indices) == 4:
-                    edges = [
-                        (face_indices[0], face_indices[1]),
-                        (face_indices[1], face_indices[2]),
-                        (face_indices[2], face_indices[3]),
-                        (face_indices[3], face_indices[0])
-                    ]
-
-                    for i, j in edges:
-                        idx1 = node_indices[i]
-                        idx2 = node_indices[j]
-                        p1 = self._mesh.nodes[idx1]
-                        p2 = self._mesh.nodes[idx2]
-                        glVertex3f(p1[0], p1[1], p1[2])
-                        glVertex3f(p2[0], p2[1], p2[2])
-
-        glEnd()
+            glColor3f(*self._display_color(pid))
+            self._draw_cached(('beams', pid), lambda points=points: (
+                glVertexPointer(3, GL_FLOAT, 0, points),
+                glDrawArrays(GL_LINES, 0, len(points))))
         glLineWidth(1.5)
 
     def _draw_nodes(self):
-        """노드 포인트"""
-        glColor3f(1, 1, 0)  # 노란색
-        glBegin(GL_POINTS)
+        """노드 포인트 (visible Part의 모든 노드)"""
+        if self._node_points is None:
+            used = np.zeros(len(self._mesh.nodes), dtype=bool)
+            used[self._mesh.cell_nodes(self._mesh.get_visible_elements(self._visible_parts))] = True
+            self._node_points = np.ascontiguousarray(self._mesh.nodes[used], dtype=np.float32)
+        points = self._node_points
+        if len(points) == 0:
+            return
 
-        # 표시할 part의 모든 노드 수집
-        node_indices = set()
-        for pid in self._visible_parts:
-            if pid in self._mesh.part_elements:
-                for elem_idx in self._mesh.part_elements[pid]:
-                    node_indices.update(self._mesh.elements[elem_idx])
-
-        # 노드 그리기
-        for idx in node_indices:
-            p = self._mesh.nodes[idx]
-            glVertex3f(p[0], p[1], p[2])
-        glEnd()
+        glColor3f(1, 1, 0)  # 노란색
+        self._draw_cached(('nodes', None), lambda: (
+            glVertexPointer(3, GL_FLOAT, 0, points),
+            glDrawArrays(GL_POINTS, 0, len(points))))
 
     @property
     def name(self) -> str:
@@ -5,13 +5,107 @@ Vertex Buffer Object (VBO)를 사용한 고성능 렌더링
 - Immediate mode (glBegin/glEnd) 대비 10-100배 속도 향상
 - 대용량 모델 (100만+ 요소) 실시간 렌더링
 """
+from dataclasses import replace
 from typing import Optional
 from OpenGL.GL import *
+from OpenGL import GL
 from OpenGL.arrays import vbo
 import numpy as np
 import ctypes
 
 from .base_renderer import BaseRenderer
+from ..core.frame_state import apply_frame_state
+from ..core.mesh_data import CELL_BEAM, element_face_loops, gather_cells
+from ..core import vertex_buffers as vb
+from ..core.vertex_buffers import PartRuns, color_update_ranges
+from ..core.render_cache import (RenderCache, VisibilityOptimizer, PerformanceMonitor,
+                                 cached_skin, cached_decimation)
+from ..core.lod import LODController, LODSettings, build_lod_levels
+from ..core.progressive import LoadedSkin, ProgressiveSkinLoader, SkinBatch, UploadQueue, upload_order
+from ..core.bvh import FaceBVH, PickHit
+from ..core.selection import NODES, PARTS
+from core.memory_registry import memory_registry
+
+# 외곽면 정점 속성은 버퍼별로 분리: 지오메트리 (x, y, z, nx, ny, nz) float32,
+# 표시 색상 RGBA uint8 (Part 속성 변경 시 해당 구간만 갱신), picking 색상 rgb float32
+GEOMETRY_STRIDE = 24
+GEOMETRY_NORMAL_OFFSET = 12
+
+
+class GLBuffer:
+    """구간씩 채울 수 있는 GL 버퍼 (glBufferSubData)
+
+    PyOpenGL vbo.VBO는 첫 bind에서 전체를 한 번에 올리므로, 점진적 로드는 크기만 먼저
+    할당하고 upload()로 나눠 채웁니다. 덜 채운 채로 bind하면 나머지를 한 번에 올립니다.
+    """
+
+    def __init__(self, data: np.ndarray, target=GL_ARRAY_BUFFER, usage=GL_STATIC_DRAW):
+        self.data = np.ascontiguousarray(data)
+        self.target = target
+        self.usage = usage
+        self._bytes = self.data.reshape(-1).view(np.uint8)
+        self._buffer = None
+        self._uploaded = 0
+
+    @property
+    def remaining(self) -> int:
+        """아직 올리지 않은 bytes"""
+        return self.data.nbytes - self._uploaded
+
+    def upload(self, max_bytes: int) -> int:
+        """다음 구간 업로드 (GL 컨텍스트 필요) → 올린 bytes"""
+        if self._buffer is None:
+            self._buffer = glGenBuffers(1)
+            glBindBuffer(self.target, self._buffer)
+            glBufferData(self.target, self.data.nbytes, None, self.usage)
+        else:
+            glBindBuffer(self.target, self._buffer)
+        chunk = self._bytes[self._uploaded:self._uploaded + max_bytes]
+        if chunk.nbytes:
+            glBufferSubData(self.target, self._uploaded, chunk.nbytes, chunk)
+        glBindBuffer(self.target, 0)
+        self._uploaded += chunk.nbytes
+        return chunk.nbytes
+
+    def write(self, start: int, values: np.ndarray):
+        """start 행부터 values로 덮어씀 - 이미 올린 구간만 glBufferSubData (GL 컨텍스트 필요)"""
+        self.data[start:start + len(values)] = values
+        row_bytes = self.data.nbytes // max(len(self.data), 1)
+        begin = start * row_bytes
+        end = min(begin + len(values) * row_bytes, self._uploaded)
+        if self._buffer is not None and end > begin:
+            glBindBuffer(self.target, self._buffer)
+            glBufferSubData(self.target, begin, end - begin, self._bytes[begin:end])
+            glBindBuffer(self.target, 0)
+
+    def bind(self):
+        if self._buffer is None or self.remaining:
+            self.upload(self.remaining)
+        glBindBuffer(self.target, self._buffer)
+
+    def unbind(self):
+        glBindBuffer(self.target, 0)
+
+    def delete(self):
+        if self._buffer is not None:
+            glDeleteBuffers(1, [self._buffer])
+            self._buffer = None
+        self._uploaded = 0
+
+    def __add__(self, offset: int) -> ctypes.c_void_p:
+        """정점 속성 포인터 (vbo.VBO + offset과 같은 용법)"""
+        return ctypes.c_void_p(offset)
+
+
+# 외곽면 버퍼 묶음 (dict) 키
+SKIN_BUFFERS = ('vbo', 'colors', 'pick', 'triangles', 'edges')
+
+
+def _multi_draws(runs: PartRuns, offsets: np.ndarray, per_item: int):
+    """visible Part 구간 → (counts, byte offsets) - glMultiDrawElements 인자"""
+    starts, counts = runs.ranges(offsets)
+    pointers = (ctypes.c_void_p * len(starts))(*(starts * per_item * 4).tolist())
+    return (counts * per_item).astype(np.int32), pointers
 
 
 class VBORenderer(BaseRenderer):
@@ -19,50 +113,116 @@ class VBORenderer(BaseRenderer):
 
     Features:
     - GPU 메모리 캐싱 (VBO)
-    - 외곽면만 렌더링
-    - Part별 색상
+    - 외곽면만 렌더링 (인덱스 버퍼: 정점 공유, 엣지 중복 제거)
+    - Part 단위 연속 버퍼: 표시/숨기기는 multi-draw 목록만 변경 (재업로드 없음)
+    - Part bbox frustum culling + 작은 Part culling (그릴 Part가 바뀔 때만 draw 목록 갱신)
+    - 인터랙션 LOD: 카메라 조작 중 단순화한 외곽면 (엣지 없음), 멈추면 원래 메쉬
+    - Part 단위 버퍼 캐시 (RenderCache): 모델이 바뀌면 내용이 바뀐 Part만 다시 생성
+    - CPU picking (외곽면 BVH 광선 검사, Beam만 GPU 색상 picking)
+    - Box/Lasso 영역 선택 하이라이트 (선택 면 삼각형 인덱스만 CPU 배열로 그림)
+    - 큰 모델 점진적 로드: 워커 스레드가 Part 묶음별 버퍼 생성, 프레임당 시간 예산 안에서 업로드,
+      올라간 묶음부터 그림 (다른 모델을 설정하면 취소). 묶음 버퍼가 그대로 전체 스킨의 구간이 됨
+    - Part별 색상, 면 단위 flat shading (provoking vertex)
+    - 정점 속성별 버퍼: 색상/하이라이트/투명도/Part 선택은 색상 버퍼의 바뀐 Part 구간만
+      glBufferSubData (위치/법선/인덱스는 그대로), 반투명 Part는 불투명 Part 다음에 그림
     - Wireframe/Solid/Nodes
     - Modern OpenGL pipeline
     """
 
-    def __init__(self):
+    def __init__(self, cache_memory_mb: int = 512):
+        """
+        Args:
+            cache_memory_mb: Part 버퍼 캐시 예산 (MB)
+        """
         super().__init__()
         self._width = 1
         self._height = 1
 
-        # VBO objects (Part별)
-        self._wireframe_vbo = None
-        self._edges_vbo = None       # 외곽 엣지 VBO
-        self._solid_vbo = None
+        # Part 단위 버퍼 캐시 ((part, mode, 내용 해시) → IndexedSkin 조각)
+        self._render_cache = RenderCache(max_memory_mb=cache_memory_mb)
+        self._part_signatures = {}       # {part_id: 외곽면 버퍼 내용 해시}
+
+        # 외곽면 인덱스 버퍼 (Solid/Edges/Wireframe/Picking 공용)
+        # GPU 버퍼는 구간 목록: 한 번에 만들면 구간 1개, 점진적 로드면 묶음마다 1개.
+        # 구간 = {SKIN_BUFFERS: GLBuffer - 'vbo' 지오메트리 (위치, 법선), 'colors' 표시 색상
+        #         (RGBA uint8), 'pick' picking 색상 (provoking 정점 = 면 ID), 'triangles'/'edges'
+        #         인덱스 (구간 로컬, Part 단위 연속), 'skin' 구간 IndexedSkin, 'vertex_base'
+        #         전체 스킨에서 첫 정점 위치, 'runs' PartRuns, 'draws'/'translucent_draws'/
+        #         'edge_draws' (counts, byte offsets) - glMultiDrawElements, 'ready' 업로드 완료}
+        self._skin = None                # IndexedSkin (CPU 사본, Part 범위 - 점진적 로드 중에는 None)
+        self._skin_segments = []
+        self._part_runs = None           # PartRuns (전체 스킨 Part 순서, LOD 레벨 draw 목록용)
+        self._translucent_parts = set()
+        self._dirty_color_parts = set()  # 표시 색상이 바뀐 Part (다음 프레임에 색상 버퍼 갱신)
+
+        # Culling (visible Part 중 이번 프레임에 그릴 Part)
+        self._visibility = VisibilityOptimizer()
+        self._culling_enabled = True
+        self._drawn_parts = set()
+        self._monitor = PerformanceMonitor()
+
+        # 인터랙션 LOD (레벨별 (IndexedSkin, 정점 VBO, 삼각형 IBO, draw 목록))
+        self._lod = LODController()
+        self._lod_levels = []
+
+        # 점진적 로드 (외곽면 수가 progressive_min_faces 이상일 때)
+        self._progressive_min_faces = 200_000
+        self._upload_budget_ms = 4.0
+        self._loader = None              # ProgressiveSkinLoader (로드 중에만)
+        self._upload_queue = UploadQueue()
+        self._loaded_skin = None         # 워커 완료 결과 (LoadedSkin, 묶음 업로드가 끝나면 설치)
+
+        # VBO objects (비인덱스)
+        self._beams_vbo = None       # Beam 선분 VBO (Part별)
         self._nodes_vbo = None
         self._grid_vbo = None
         self._axes_vbo = None
 
-        # VBO data counts (Part별)
-        self._wireframe_counts = {}  # {part_id: vertex_count}
-        self._edges_counts = {}      # {part_id: vertex_count}
-        self._solid_counts = {}      # {part_id: vertex_count}
+        # VBO data counts
+        self._beams_counts = {}      # {part_id: vertex_count}
         self._nodes_count = 0
         self._grid_count = 0
         self._axes_count = 0
 
-        # Batched VBOs (전체 통합, 성능 최적화)
-        self._batched_solid_vbo = None
-        self._batched_solid_count = 0
-        self._batched_edges_vbo = None
-        self._batched_edges_count = 0
-
-        # Picking VBO (color-based element picking)
-        self._picking_vbo = None
-        self._picking_counts = {}    # {part_id: vertex_count}
-        self._elem_id_map = {}       # {color_id: element_index}
+        # Picking (color-based element picking, 면은 외곽면 정점의 picking 색상 사용)
+        self._picking_lines_vbo = None   # Beam picking (GL_LINES)
+        self._picking_lines_counts = {}  # {part_id: vertex_count}
+        self._pick_elements = np.zeros(0, dtype=np.int64)  # [color_id] → element_index
+        self._bvh = None                 # FaceBVH (첫 picking 때 생성)
+        self._last_hit = None            # 마지막 PickHit (요소/면/노드)
+        self._face_triangle_offsets = None  # 외곽면(스킨 순서)별 삼각형 범위
+        self._selection_triangles = None    # 선택 면 삼각형 [(스킨 구간, 구간 로컬 (T, 3) uint32)]
+        self._selection_lines = None        # 선택 Beam 선분 (2K, 3) float32
+        self._selection_points = None       # 선택 노드 (K, 3) float32
 
         # Selection
         self._selected_element = None  # Selected element index
+        self._selected_faces = None    # (요소 인덱스, 외곽면 노드 인덱스 목록) - 선택이 바뀔 때 한 번 찾음
 
         # Shader program (optional - for now use fixed pipeline with VBO)
         self._use_shaders = False
 
+        # 메모리 집계 (GPU 버퍼는 GL 컨텍스트에서만 해제 가능 - 집계만)
+        memory_registry.register("vbo renderer", category="gpu",
+                                 size_fn=lambda r: r.gpu_memory_bytes, owner=self)
+
+    @property
+    def gpu_memory_bytes(self) -> int:
+        """업로드된 VBO 데이터 크기 합계 (PyOpenGL VBO는 CPU 사본도 유지)"""
+        buffers = []
+        for group in (self._beams_vbo, self._picking_lines_vbo):
+            if group:
+                buffers.extend(group.values())
+        buffers.extend([self._nodes_vbo, self._grid_vbo, self._axes_vbo])
+        for group in self._lod_levels + self._skin_segments:
+            buffers.extend(group.get(name) for name in SKIN_BUFFERS)
+
+        total = 0
+        for buf in buffers:
+            data = getattr(buf, 'data', None) if buf is not None else None
+            total += getattr(data, 'nbytes', 0)
+        return total
+
     def initialize(self):
         """OpenGL 초기화"""
         print("[VBO Renderer] Initializing...")
@@ -126,22 +286,105 @@ class VBORenderer(BaseRenderer):
             self._build_vbos()
             print(f"[VBO Renderer] VBOs ready!")
 
+    def set_progressive(self, min_faces: Optional[int] = None, budget_ms: Optional[float] = None):
+        """점진적 로드 설정 (다음 set_mesh부터)
+
+        Args:
+            min_faces: 외곽면이 이 수 이상이면 점진적 로드 (0이면 항상 한 번에)
+            budget_ms: 프레임당 GPU 업로드 시간 예산
+        """
+        if min_faces is not None:
+            self._progressive_min_faces = min_faces
+        if budget_ms is not None:
+            self._upload_budget_ms = budget_ms
+
+    @property
+    def loading_progress(self) -> Optional[float]:
+        """점진적 로드 진행률 (그릴 수 있는 면 비율, 로드 중이 아니면 None)"""
+        if self._loader is None:
+            return None
+        ready = sum(segment['faces'] for segment in self._skin_segments if segment['ready'])
+        return min(ready / max(self._loader.faces_total, 1), 0.99)
+
     def set_visible_parts(self, part_ids: set):
-        """표시할 Part 설정 - Batched VBO 재생성"""
+        """표시할 Part 설정 - draw 목록만 갱신 (GPU 버퍼는 그대로)"""
         super().set_visible_parts(part_ids)
 
-        # Batched VBO 재생성 (가시성 변경 시)
-        if self._mesh and self._exterior_faces:
-            # 기존 batched VBO 삭제
-            if self._batched_solid_vbo:
-                self._batched_solid_vbo.delete()
-                self._batched_solid_vbo = None
-            if self._batched_edges_vbo:
-                self._batched_edges_vbo.delete()
-                self._batched_edges_vbo = None
+        self._visibility.set_visible_parts(self._visible_parts)
+        self._set_drawn_parts(self._visible_parts)
+
+    def set_culling(self, enabled: bool = True, min_screen_size: Optional[float] = None):
+        """Culling 설정
+
+        Args:
+            enabled: frustum/작은 Part culling 사용 여부
+            min_screen_size: 이보다 작게 투영되는 Part 제외 (픽셀, 0이면 끔)
+        """
+        self._culling_enabled = enabled
+        if min_screen_size is not None:
+            self._visibility.min_screen_size = min_screen_size
+        if not enabled:
+            self._set_drawn_parts(self._visible_parts)
+
+    def set_lod(self, settings: LODSettings):
+        """인터랙션 LOD 설정 (레벨 구성이 바뀌므로 LOD 버퍼 재생성)"""
+        self._lod.settings = settings
+        if self._skin is not None:
+            with self._monitor.rebuild('lod'):
+                self._build_lod_vbos()
+
+    def begin_interaction(self):
+        self._lod.begin_interaction()
+
+    def end_interaction(self):
+        self._lod.end_interaction()
+
+    @property
+    def interaction_settle_ms(self) -> int:
+        return self._lod.settings.settle_ms
 
-            # 새로 생성
-            self._build_batched_vbos()
+    def _set_drawn_parts(self, part_ids: set):
+        """그릴 Part가 바뀌었을 때만 draw 목록 갱신"""
+        if part_ids == self._drawn_parts:
+            return
+        self._drawn_parts = set(part_ids)
+        self._update_draw_lists()
+
+    def _cull(self, view: np.ndarray, proj: np.ndarray):
+        """카메라 기준 culling → 그릴 Part 갱신, 통계 기록"""
+        if not self._culling_enabled:
+            return
+        drawn = self._visibility.cull(view, proj, self._height)
+        stats = self._visibility.last_stats
+        self._monitor.record_culling(stats['tested'], stats['frustum_culled'], stats['small_culled'])
+        self._set_drawn_parts(drawn)
+
+    @property
+    def performance_monitor(self) -> PerformanceMonitor:
+        return self._monitor
+
+    def get_stats(self) -> dict:
+        """인덱스 버퍼 통계 (비인덱스 버퍼 대비 절약한 메모리 포함)"""
+        stats = {'gpu_bytes': self.gpu_memory_bytes}
+        skin = self._skin
+        if skin is not None:
+            stats.update({
+                'nodes': len(self._mesh.nodes),
+                'vertices': len(skin.vertices),
+                'triangles': len(skin.triangles),
+                'edges': len(skin.edges),
+                'face_edges': skin.face_edge_count,
+                'indexed_bytes': skin.nbytes,
+                'unindexed_bytes': skin.unindexed_nbytes,
+                'saved_bytes': skin.unindexed_nbytes - skin.nbytes,
+            })
+        stats.update(self._monitor.get_stats())
+        stats['cache'] = self._render_cache.get_stats()
+        stats['drawn_parts'] = len(self._drawn_parts)
+        stats['lod_level'] = self._lod.level
+        stats['lod_triangles'] = [len(level['skin'].triangles) for level in self._lod_levels]
+        stats['bvh_bytes'] = self._bvh.nbytes if self._bvh is not None else 0
+        return stats
 
     def _build_vbos(self):
         """VBO 생성 (GPU 메모리에 업로드)"""
@@ -151,20 +394,35 @@ class VBORenderer(BaseRenderer):
         # Clear old VBOs
         self._clear_vbos()
 
-        # Build wireframe VBO (외곽면 기반)
-        self._build_wireframe_vbo()
-
-        # Build edges VBO (외곽 엣지만, 검은색)
-        self._build_edges_vbo()
-
-        # Build solid VBO (외곽면만)
-        self._build_solid_vbo()
-
-        # Build picking VBO (color-based element picking)
+        # Culling용 Part bbox (로컬 좌표)
+        part_bounds = self._mesh.part_bounds()
+        self._visibility.set_all_part_bounds(*part_bounds)
+        self._visibility.set_visible_parts(self._visible_parts)
+
+        face_count = sum(len(faces) for faces in self._exterior_faces.values()) if self._exterior_faces else 0
+        disk_skin = self._cached_skin is not None and self._cached_skin.skin is not None
+        if 0 < self._progressive_min_faces <= face_count and not disk_skin:
+            # 큰 모델: 외곽면/LOD는 워커 스레드에서 만들고 render()에서 나눠 업로드
+            self._start_progressive(*part_bounds)
+        else:
+            # Build skin VBO (외곽면 정점 + 인덱스, Solid/Edges/Wireframe/Picking 공용)
+            with self._monitor.rebuild('skin'):
+                self._build_skin_vbos()
+
+            # Build LOD VBOs (인터랙션 중 단순화 외곽면)
+            with self._monitor.rebuild('lod'):
+                self._build_lod_vbos()
+
+        # Build beams VBO (Beam 요소 선분)
+        with self._monitor.rebuild('beams'):
+            self._build_beams_vbo()
+
+        # Build picking VBO (Beam 선분, 면은 외곽면 정점 사용)
         self._build_picking_vbo()
 
         # Build nodes VBO
-        self._build_nodes_vbo()
+        with self._monitor.rebuild('nodes'):
+            self._build_nodes_vbo()
 
         # Build grid VBO
         self._build_grid_vbo()
@@ -172,318 +430,314 @@ class VBORenderer(BaseRenderer):
         # Build axes VBO
         self._build_axes_vbo()
 
-        # Build batched VBOs (성능 최적화)
-        self._build_batched_vbos()
+        # 선택 하이라이트는 새 스킨 기준으로 다시 생성
+        self._on_selection_changed()
 
-    def _build_batched_vbos(self):
-        """Batched VBO 생성 (모든 visible Part를 하나의 VBO로 통합)
+    def _build_skin_vbos(self):
+        """외곽면 인덱스 버퍼 생성
 
-        Draw call 수를 대폭 줄여 렌더링 성능 향상
-        - Part별 개별 draw call → 단일 draw call
-        - CPU-GPU 통신 오버헤드 최소화
+        - 정점 VBO: Part별 고유 노드 (위치 + 면 법선 + Part 색상 + picking 색상)
+        - 삼각형/엣지 인덱스: 전체 Part를 Part 순서로 연속 배치
+        - visible Part는 draw 목록 (_update_draw_lists)으로만 선택
         """
-        if not self._exterior_faces or not self._visible_parts:
+        if not self._exterior_faces:
             return
 
-        # Solid batched VBO (모든 visible Part)
-        solid_vertices = []
-        for pid in self._visible_parts:
-            if pid not in self._exterior_faces:
-                continue
+        skin = self._build_skin()
+        self._set_skin(skin, [self._skin_segment(skin)])
 
-            color = self._part_colors.get(pid, (0.7, 0.7, 0.7))
-
-            for elem_idx, face_indices in self._exterior_faces[pid]:
-                node_indices = self._mesh.elements[elem_idx]
-
-                if len(face_indices) == 4:
-                    # Triangle 1: 0-1-2
-                    for i in [face_indices[0], face_indices[1], face_indices[2]]:
-                        idx = node_indices[i]
-                        p = self._mesh.nodes[idx]
-                        solid_vertices.extend([p[0], p[1], p[2]])
-                        solid_vertices.extend(color)
-
-                    # Triangle 2: 0-2-3
-                    for i in [face_indices[0], face_indices[2], face_indices[3]]:
-                        idx = node_indices[i]
-                        p = self._mesh.nodes[idx]
-                        solid_vertices.extend([p[0], p[1], p[2]])
-                        solid_vertices.extend(color)
-
-        if solid_vertices:
-            vertex_data = np.array(solid_vertices, dtype=np.float32)
-            self._batched_solid_vbo = vbo.VBO(vertex_data)
-            self._batched_solid_count = len(solid_vertices) // 6
-            print(f"[VBO Renderer] Batched Solid VBO: {self._batched_solid_count} vertices")
-
-        # Edges batched VBO (모든 visible Part)
-        edges_vertices = []
-        black = (0.0, 0.0, 0.0)
-
-        for pid in self._visible_parts:
-            if pid not in self._exterior_faces:
-                continue
+    def _skin_buffers(self, skin, picking: bool = False) -> dict:
+        """외곽면 속성별 GL 버퍼 (아직 업로드 전, 비어 있는 인덱스는 None)
 
-            for elem_idx, face_indices in self._exterior_faces[pid]:
-                node_indices = self._mesh.elements[elem_idx]
-
-                if len(face_indices) == 4:
-                    edges = [
-                        (face_indices[0], face_indices[1]),
-                        (face_indices[1], face_indices[2]),
-                        (face_indices[2], face_indices[3]),
-                        (face_indices[3], face_indices[0])
-                    ]
-
-                    for i, j in edges:
-                        idx1 = node_indices[i]
-                        idx2 = node_indices[j]
-                        p1 = self._mesh.nodes[idx1]
-                        p2 = self._mesh.nodes[idx2]
-
-                        edges_vertices.extend([p1[0], p1[1], p1[2]])
-                        edges_vertices.extend(black)
-                        edges_vertices.extend([p2[0], p2[1], p2[2]])
-                        edges_vertices.extend(black)
-
-        if edges_vertices:
-            vertex_data = np.array(edges_vertices, dtype=np.float32)
-            self._batched_edges_vbo = vbo.VBO(vertex_data)
-            self._batched_edges_count = len(edges_vertices) // 6
-            print(f"[VBO Renderer] Batched Edges VBO: {self._batched_edges_count} vertices")
-
-    def _build_wireframe_vbo(self):
-        """와이어프레임 VBO 생성 (Part별)"""
-        if not self._mesh:
-            return
+        Args:
+            skin: IndexedSkin
+            picking: picking 색상 버퍼도 생성 (LOD 레벨은 GPU picking에 쓰지 않음)
+        """
+        buffers = {
+            'vbo': GLBuffer(skin.vertices[:, :6]),
+            'colors': GLBuffer(self._attributes.vertex_colors(skin.part_ids, skin.vertex_offsets),
+                               usage=GL_DYNAMIC_DRAW),
+            'triangles': GLBuffer(skin.triangles, GL_ELEMENT_ARRAY_BUFFER) if len(skin.triangles) else None,
+            'edges': GLBuffer(skin.edges, GL_ELEMENT_ARRAY_BUFFER) if len(skin.edges) else None,
+        }
+        if picking:
+            buffers['pick'] = GLBuffer(skin.vertices[:, 9:12])
+        return buffers
+
+    @staticmethod
+    def _delete_buffers(group: dict):
+        for name in SKIN_BUFFERS:
+            if group.get(name) is not None:
+                group[name].delete()
+
+    def _skin_segment(self, skin, vertex_base: int = 0) -> dict:
+        """외곽면 GPU 버퍼 구간 (skin: 구간 IndexedSkin, vertex_base: 전체 스킨에서 첫 정점 위치)
+
+        구간에는 Part 범위만 필요하므로 정점 CPU 사본은 GL 버퍼에만 남김 (묶음 스킨 중복 방지)
+        """
+        buffers = self._skin_buffers(skin, picking=True)
+        return dict(buffers, skin=replace(skin, vertices=skin.vertices[:0]), vertex_base=vertex_base,
+                    part_ids=set(skin.part_ids.tolist()), faces=len(skin.pick_elements) - 1,
+                    runs=PartRuns(skin.part_ids.tolist()), draws=None, translucent_draws=None,
+                    edge_draws=None, ready=False)
 
-        # Part별로 VBO 생성 (색상 포함)
-        wireframe_data = {}
+    def _set_skin(self, skin, segments: list):
+        """외곽면 스킨과 GPU 버퍼 구간 설정 → Part 구간 draw 목록
 
-        for pid in self._mesh.part_elements.keys():
-            if pid not in self._mesh.part_elements:
+        Args:
+            skin: 전체 IndexedSkin
+            segments: skin을 순서대로 나눈 구간 (_skin_segment)
+        """
+        self._skin = skin
+        self._skin_segments = segments
+        for segment in segments:
+            segment['ready'] = True
+
+        self._part_runs = PartRuns(skin.part_ids.tolist())
+        self._drawn_parts = set(self._visible_parts)
+        self._update_draw_lists()
+
+        mb = 1024 * 1024
+        saved = skin.unindexed_nbytes - skin.nbytes
+        print(f"[VBO Renderer] Indexed skin: {len(skin.vertices):,} vertices "
+              f"({len(self._mesh.nodes):,} nodes), {len(skin.triangles):,} triangles, "
+              f"{len(skin.edges):,} edges ({skin.face_edge_count:,} before dedup)")
+        print(f"[VBO Renderer] Skin memory: {skin.nbytes / mb:.1f} MB "
+              f"(non-indexed {skin.unindexed_nbytes / mb:.1f} MB, saved {saved / mb:.1f} MB)")
+
+    def _build_skin(self):
+        """Part별 외곽면 조각을 캐시에서 모아 IndexedSkin 구성 (바뀐 Part만 생성)
+
+        디스크 캐시에 같은 메쉬의 스킨이 있으면 그대로 사용 (memory-map)
+        """
+        cached = self._cached_skin
+        if cached is not None and cached.skin is not None:
+            self._part_signatures = cached.signatures
+            print(f"[VBO Renderer] Skin parts: {len(cached.skin.part_ids)} from disk cache")
+            return cached.skin
+
+        skin, self._part_signatures, built = cached_skin(
+            self._render_cache, self._mesh.nodes, self._exterior_faces, self._part_colors)
+        print(f"[VBO Renderer] Skin parts: {len(skin.part_ids) - built} cached, {built} built")
+        self._save_skin_cache(skin, self._part_signatures)
+        return skin
+
+    def _decimate_cached(self, resolution: int, bounds) -> 'vb.IndexedSkin':
+        """LOD 레벨 (Part별 캐시)"""
+        return cached_decimation(self._render_cache, self._skin, self._part_signatures, resolution, bounds)
+
+    def _build_lod_vbos(self):
+        """인터랙션 LOD 버퍼 생성 (vertex clustering, 외곽면 Part 순서 유지)"""
+        for level in self._lod_levels:
+            self._delete_buffers(level)
+        self._lod_levels = []
+        if self._skin is None:
+            return
+        self._set_lod_levels(build_lod_levels(self._skin, self._lod.settings, self._decimate_cached))
+
+    def _set_lod_levels(self, skins: list):
+        """LOD 레벨 스킨 → 버퍼 (인터랙션 중 처음 그릴 때 업로드)"""
+        for skin in skins:
+            self._lod_levels.append(dict(self._skin_buffers(skin), skin=skin, draws=None,
+                                         translucent_draws=None))
+        self._lod.set_levels([len(self._skin.triangles)] +
+                             [len(level['skin'].triangles) for level in self._lod_levels])
+        if self._part_runs is not None:
+            self._update_draw_lists()
+
+        if self._lod_levels:
+            counts = ', '.join(f"{len(level['skin'].triangles):,}" for level in self._lod_levels)
+            print(f"[VBO Renderer] LOD levels: {counts} triangles")
+
+    def _update_draw_lists(self):
+        """그릴 Part 구간 → (counts, byte offsets) draw 목록 (반투명 Part 삼각형은 별도 목록)"""
+        translucent = self._drawn_parts & self._translucent_parts
+        for segment in self._skin_segments:
+            if segment['ready']:
+                self._update_group_draws(segment, segment['runs'], translucent, edges=True)
+        if self._part_runs is not None:
+            for level in self._lod_levels:
+                self._update_group_draws(level, self._part_runs, translucent)
+
+    def _update_group_draws(self, group: dict, runs: PartRuns, translucent: set, edges: bool = False):
+        """버퍼 묶음 (스킨 구간 / LOD 레벨) 하나의 draw 목록"""
+        skin = group['skin']
+        group['translucent_draws'] = None
+        if translucent:
+            runs.set_visible(translucent)
+            group['translucent_draws'] = _multi_draws(runs, skin.triangle_offsets, 3)
+        runs.set_visible(self._drawn_parts - translucent)
+        group['draws'] = _multi_draws(runs, skin.triangle_offsets, 3)
+        if edges:
+            runs.set_visible(self._drawn_parts)
+            group['edge_draws'] = _multi_draws(runs, skin.edge_offsets, 2)
+
+    # ========== Part 표시 속성 ==========
+
+    def _on_part_attributes_changed(self, part_ids: set):
+        """표시 색상이 바뀐 Part - GL 컨텍스트가 있는 다음 render()에서 반영"""
+        self._dirty_color_parts |= part_ids
+
+    def _update_part_colors(self):
+        """바뀐 Part의 정점 구간만 색상 버퍼에 다시 씀 (지오메트리/인덱스는 그대로)"""
+        changed, self._dirty_color_parts = self._dirty_color_parts, set()
+        groups = [(group['skin'], group['colors']) for group in self._skin_segments + self._lod_levels]
+        for skin, color_vbo in groups:
+            starts, counts = color_update_ranges(skin.part_ids, skin.vertex_offsets, changed)
+            if len(starts) == 0:
                 continue
-
-            color = self._part_colors.get(pid, (0.7, 0.7, 0.7))
-            vertices = []
-
-            # 외곽면의 엣지만 렌더링
-            if self._exterior_faces and pid in self._exterior_faces:
-                for elem_idx, face_indices in self._exterior_faces[pid]:
-                    node_indices = self._mesh.elements[elem_idx]
-                    n = len(node_indices)
-
-                    # Face 엣지 정의
-                    if n == 4:  # Shell
-                        edges = [(0,1),(1,2),(2,3),(3,0)]
-                    elif n == 8:  # Hex
-                        # 외곽면의 엣지만 (face_indices를 사용)
-                        edges = [
-                            (face_indices[0], face_indices[1]),
-                            (face_indices[1], face_indices[2]),
-                            (face_indices[2], face_indices[3]),
-                            (face_indices[3], face_indices[0])
-                        ]
-                    else:
-                        continue
-
-                    for i, j in edges:
-                        if n == 4:
-                            idx1, idx2 = node_indices[i], node_indices[j]
-                        else:  # Hex
-                            idx1, idx2 = node_indices[i], node_indices[j]
-
-                        p1 = self._mesh.nodes[idx1]
-                        p2 = self._mesh.nodes[idx2]
-
-                        # Vertex 1 (position + color)
-                        vertices.extend([p1[0], p1[1], p1[2]])
-                        vertices.extend(color)
-
-                        # Vertex 2 (position + color)
-                        vertices.extend([p2[0], p2[1], p2[2]])
-                        vertices.extend(color)
-
-            if vertices:
-                # Create VBO
-                vertex_data = np.array(vertices, dtype=np.float32)
-                wireframe_data[pid] = vbo.VBO(vertex_data)
-                self._wireframe_counts[pid] = len(vertices) // 6  # 6 floats per vertex (xyz + rgb)
-
-        self._wireframe_vbo = wireframe_data
-
-    def _build_edges_vbo(self):
-        """외곽 엣지 VBO 생성 (검은색 윤곽선)"""
-        if not self._exterior_faces:
+            colors = self._attributes.vertex_colors(skin.part_ids, skin.vertex_offsets)
+            for start, count in zip(starts.tolist(), counts.tolist()):
+                color_vbo.write(start, colors[start:start + count])
+
+        # Beam은 Part별 작은 선분 버퍼 - 바뀐 Part만 다시 생성
+        for pid in changed & set(self._beams_vbo or {}):
+            _, lines = self._mesh.beam_lines(pid)
+            self._beams_vbo[pid].delete()
+            self._beams_vbo[pid] = vbo.VBO(
+                vb.line_vertices(self._mesh.nodes, lines, self._display_color(pid)).ravel())
+
+        # 반투명 Part가 바뀌면 draw 목록 분리
+        translucent = self._attributes.translucent
+        if translucent != self._translucent_parts:
+            self._translucent_parts = translucent
+            self._update_draw_lists()
+
+    # ========== 점진적 로드 ==========
+
+    def _start_progressive(self, part_ids: np.ndarray, mins: np.ndarray, maxs: np.ndarray):
+        """워커 스레드에서 외곽면 묶음 생성 시작 (visible Part, 큰 Part 먼저)"""
+        cache, settings = self._render_cache, self._lod.settings
+
+        def build_lod(skin, signatures):
+            # 워커에서 실행 - 렌더러(self)를 잡지 않음
+            return build_lod_levels(skin, settings, lambda resolution, bounds: cached_decimation(
+                cache, skin, signatures, resolution, bounds))
+
+        order = upload_order(part_ids, mins, maxs, self._visible_parts)
+        self._loader = ProgressiveSkinLoader(cache, self._mesh.nodes, self._exterior_faces,
+                                             self._part_colors, order, finish=build_lod)
+        self._loader.start()
+        print(f"[VBO Renderer] Progressive load: {self._loader.faces_total:,} faces "
+              f"in {len(self._loader.batches)} batches")
+
+    def _cancel_progressive(self):
+        """로드 중단 - 아직 설치 전이면 올리던 묶음 버퍼도 해제"""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+        self._upload_queue.clear()
+        self._loaded_skin = None
+        if self._skin is None:
+            for segment in self._skin_segments:
+                self._delete_buffers(segment)
+            self._skin_segments = []
+
+    def _pump_progressive(self):
+        """워커 결과를 업로드 대기열에 넣고 예산 안에서 업로드 (render()에서 매 프레임)"""
+        loader = self._loader
+        for result in loader.poll():
+            if isinstance(result, SkinBatch):
+                segment = self._skin_segment(result.skin, result.vertex_base)
+                self._skin_segments.append(segment)
+                self._upload_queue.push(segment, [segment[name] for name in SKIN_BUFFERS if segment.get(name)])
+            elif isinstance(result, LoadedSkin):
+                self._loaded_skin = result
+        if loader.error is not None:
+            print(f"[VBO Renderer] Progressive load failed: {loader.error}")
+            self._cancel_progressive()
             return
 
-        edges_data = {}
-        black = (0.0, 0.0, 0.0)  # 검은색
+        # 그릴 Part가 있는 묶음 먼저
+        drawn = self._drawn_parts
+        translucent = drawn & self._translucent_parts
+        done = self._upload_queue.step(self._upload_budget_ms, priority=lambda segment: (
+            0 if drawn.intersection(segment['part_ids']) else 1))
+        for segment in done:
+            segment['ready'] = True
+            self._update_group_draws(segment, segment['runs'], translucent, edges=True)
+
+        # 모든 묶음이 올라가면 전체 스킨 설치 (묶음 버퍼가 곧 전체 스킨 구간)
+        if self._loaded_skin is not None and not len(self._upload_queue):
+            self._install_progressive(self._loaded_skin)
+
+    def _install_progressive(self, result: LoadedSkin):
+        """워커 완료 + 묶음 업로드 완료 → 전체 스킨 설정 (GPU 버퍼는 묶음 구간 그대로)"""
+        self._loader = None
+        self._loaded_skin = None
+
+        self._part_signatures = result.signatures
+        print(f"[VBO Renderer] Skin parts: {len(result.skin.part_ids) - result.built} cached, "
+              f"{result.built} built")
+        self._save_skin_cache(result.skin, result.signatures)
+        self._set_skin(result.skin, self._skin_segments)
+        self._set_lod_levels(result.extra or [])
+
+        # 외곽면 picking ID와 선택 하이라이트는 새 스킨 기준
+        for vbo_obj in (self._picking_lines_vbo or {}).values():
+            vbo_obj.delete()
+        self._build_picking_vbo()
+        self._on_selection_changed()
+
+    def _build_beams_vbo(self):
+        """Beam 선분 VBO 생성 (Part 색상, Part별)"""
+        beams_data = {}
 
         for pid in self._mesh.part_elements.keys():
-            if pid not in self._exterior_faces:
+            _, lines = self._mesh.beam_lines(pid)
+            if len(lines) == 0:
                 continue
 
-            vertices = []
-
-            # 외곽면의 엣지만
-            for elem_idx, face_indices in self._exterior_faces[pid]:
-                node_indices = self._mesh.elements[elem_idx]
-
-                # Face 엣지 (사각형)
-                if len(face_indices) == 4:
-                    edges = [
-                        (face_indices[0], face_indices[1]),
-                        (face_indices[1], face_indices[2]),
-                        (face_indices[2], face_indices[3]),
-                        (face_indices[3], face_indices[0])
-                    ]
-
-                    for i, j in edges:
-                        idx1 = node_indices[i]
-                        idx2 = node_indices[j]
-                        p1 = self._mesh.nodes[idx1]
-                        p2 = self._mesh.nodes[idx2]
-
-                        # Vertex 1
-                        vertices.extend([p1[0], p1[1], p1[2]])
-                        vertices.extend(black)
-
-                        # Vertex 2
-                        vertices.extend([p2[0], p2[1], p2[2]])
-                        vertices.extend(black)
-
-            if vertices:
-                vertex_data = np.array(vertices, dtype=np.float32)
-                edges_data[pid] = vbo.VBO(vertex_data)
-                self._edges_counts[pid] = len(vertices) // 6
-
-        self._edges_vbo = edges_data
-
-    def _build_solid_vbo(self):
-        """솔리드 VBO 생성 (외곽면만, Part별)"""
-        if not self._exterior_faces:
-            return
-
-        solid_data = {}
+            vertex_data = vb.line_vertices(self._mesh.nodes, lines, self._display_color(pid))
+            beams_data[pid] = vbo.VBO(vertex_data.ravel())
+            self._beams_counts[pid] = len(vertex_data)
 
-        for pid in self._visible_parts:
-            if pid not in self._exterior_faces:
-                continue
-
-            color = self._part_colors.get(pid, (0.7, 0.7, 0.7))
-            vertices = []
-
-            # 외곽면만 렌더링
-            for elem_idx, face_indices in self._exterior_faces[pid]:
-                node_indices = self._mesh.elements[elem_idx]
-
-                # Quad face → 2 triangles
-                # face_indices: [0, 1, 2, 3]
-                if len(face_indices) == 4:
-                    # Triangle 1: 0-1-2
-                    for i in [face_indices[0], face_indices[1], face_indices[2]]:
-                        idx = node_indices[i]
-                        p = self._mesh.nodes[idx]
-                        vertices.extend([p[0], p[1], p[2]])
-                        vertices.extend(color)
-
-                    # Triangle 2: 0-2-3
-                    for i in [face_indices[0], face_indices[2], face_indices[3]]:
-                        idx = node_indices[i]
-                        p = self._mesh.nodes[idx]
-                        vertices.extend([p[0], p[1], p[2]])
-                        vertices.extend(color)
-
-            if vertices:
-                vertex_data = np.array(vertices, dtype=np.float32)
-                solid_data[pid] = vbo.VBO(vertex_data)
-                self._solid_counts[pid] = len(vertices) // 6
-
-        self._solid_vbo = solid_data
+        self._beams_vbo = beams_data
 
     def _build_picking_vbo(self):
-        """Picking VBO 생성 (요소별 고유 색상)
+        """Picking 데이터 생성 (요소별 고유 색상)
 
-        각 요소를 고유한 색상 ID로 렌더링하여 클릭 시 요소를 식별
-        색상 ID는 24비트 RGB (16,777,216개 요소 지원)
+        각 외곽면/Beam을 고유한 색상 ID로 렌더링하여 클릭 시 요소를 식별
+        색상 ID는 24비트 RGB (16,777,216개 지원), ID → 요소 인덱스는 배열 조회
+        - 외곽면: 외곽면 정점의 picking 색상 (provoking 정점 = 면 ID)
+        - Beam: 별도 선분 VBO (GL_LINES)
         """
-        if not self._exterior_faces:
-            return
-
-        picking_data = {}
-        self._elem_id_map = {}  # Clear mapping
-        color_id = 1  # Start from 1 (0 is background)
+        lines_data = {}
+        # _pick_elements[color_id] = 요소 인덱스 (0은 배경)
+        pick_elements = [self._skin.pick_elements if self._skin is not None
+                         else np.full(1, -1, dtype=np.int64)]
+        color_id = len(pick_elements[0])
 
         for pid in self._mesh.part_elements.keys():
-            if pid not in self._exterior_faces:
+            beam_indices, lines = self._mesh.beam_lines(pid)
+            if len(lines) == 0:
                 continue
 
-            vertices = []
-
-            # 외곽면만 렌더링
-            for elem_idx, face_indices in self._exterior_faces[pid]:
-                # 요소 인덱스를 RGB 색상으로 인코딩
-                r = (color_id >> 16) & 0xFF
-                g = (color_id >> 8) & 0xFF
-                b = color_id & 0xFF
-                color = (r / 255.0, g / 255.0, b / 255.0)
-
-                # Color ID → Element Index 매핑 저장
-                self._elem_id_map[color_id] = elem_idx
-                color_id += 1
-
-                node_indices = self._mesh.elements[elem_idx]
-
-                # Quad face → 2 triangles (solid와 동일한 구조)
-                if len(face_indices) == 4:
-                    # Triangle 1: 0-1-2
-                    for i in [face_indices[0], face_indices[1], face_indices[2]]:
-                        idx = node_indices[i]
-                        p = self._mesh.nodes[idx]
-                        vertices.extend([p[0], p[1], p[2]])
-                        vertices.extend(color)
-
-                    # Triangle 2: 0-2-3
-                    for i in [face_indices[0], face_indices[2], face_indices[3]]:
-                        idx = node_indices[i]
-                        p = self._mesh.nodes[idx]
-                        vertices.extend([p[0], p[1], p[2]])
-                        vertices.extend(color)
-
-            if vertices:
-                vertex_data = np.array(vertices, dtype=np.float32)
-                picking_data[pid] = vbo.VBO(vertex_data)
-                self._picking_counts[pid] = len(vertices) // 6
-
-        self._picking_vbo = picking_data
-        print(f"[VBO Renderer] Picking VBO built: {len(self._elem_id_map)} elements")
+            vertex_data = vb.picking_line_vertices(self._mesh.nodes, lines, color_id)
+            pick_elements.append(beam_indices)
+            color_id += len(lines)
+
+            lines_data[pid] = vbo.VBO(vertex_data.ravel())
+            self._picking_lines_counts[pid] = len(vertex_data)
+
+        self._pick_elements = np.concatenate(pick_elements)
+        self._picking_lines_vbo = lines_data
+        print(f"[VBO Renderer] Picking VBO built: {len(self._pick_elements) - 1} elements")
 
     def _build_nodes_vbo(self):
         """노드 VBO 생성"""
         if not self._mesh:
             return
 
-        vertices = []
-
         # 표시할 part의 모든 노드 수집
-        node_indices = set()
-        for pid in self._visible_parts:
-            if pid in self._mesh.part_elements:
-                for elem_idx in self._mesh.part_elements[pid]:
-                    node_indices.update(self._mesh.elements[elem_idx])
-
-        # 노드 데이터 생성
-        for idx in node_indices:
-            p = self._mesh.nodes[idx]
-            vertices.extend([p[0], p[1], p[2]])
-            vertices.extend([1.0, 1.0, 0.0])  # Yellow
-
-        if vertices:
-            vertex_data = np.array(vertices, dtype=np.float32)
-            self._nodes_vbo = vbo.VBO(vertex_data)
-            self._nodes_count = len(vertices) // 6
+        used = np.zeros(len(self._mesh.nodes), dtype=bool)
+        used[self._mesh.cell_nodes(self._mesh.get_visible_elements(self._visible_parts))] = True
+        node_indices = np.flatnonzero(used)
+
+        if len(node_indices):
+            vertex_data = vb.point_vertices(self._mesh.nodes, node_indices, (1.0, 1.0, 0.0))  # Yellow
+            self._nodes_vbo = vbo.VBO(vertex_data.ravel())
+            self._nodes_count = len(vertex_data)
 
     def _build_grid_vbo(self):
         """그리드 VBO 생성"""
@@ -523,25 +777,33 @@ class VBORenderer(BaseRenderer):
 
     def _clear_vbos(self):
         """VBO 메모리 해제"""
-        if self._wireframe_vbo:
-            for vbo_obj in self._wireframe_vbo.values():
+        self._cancel_progressive()
+        for segment in self._skin_segments:
+            self._delete_buffers(segment)
+        self._skin_segments = []
+        self._skin = None
+        self._part_runs = None
+        self._dirty_color_parts = set()
+        self._translucent_parts = set()
+        self._bvh = None
+        self._last_hit = None
+        self._face_triangle_offsets = None
+        self._selected_faces = None
+
+        for level in self._lod_levels:
+            self._delete_buffers(level)
+        self._lod_levels = []
+        self._lod.set_levels([0])
+
+        if self._beams_vbo:
+            for vbo_obj in self._beams_vbo.values():
                 vbo_obj.delete()
-            self._wireframe_vbo = None
+            self._beams_vbo = None
 
-        if self._edges_vbo:
-            for vbo_obj in self._edges_vbo.values():
+        if self._picking_lines_vbo:
+            for vbo_obj in self._picking_lines_vbo.values():
                 vbo_obj.delete()
-            self._edges_vbo = None
-
-        if self._solid_vbo:
-            for vbo_obj in self._solid_vbo.values():
-                vbo_obj.delete()
-            self._solid_vbo = None
-
-        if self._picking_vbo:
-            for vbo_obj in self._picking_vbo.values():
-                vbo_obj.delete()
-            self._picking_vbo = None
+            self._picking_lines_vbo = None
 
         if self._nodes_vbo:
             self._nodes_vbo.delete()
@@ -555,21 +817,17 @@ class VBORenderer(BaseRenderer):
             self._axes_vbo.delete()
             self._axes_vbo = None
 
-        if self._batched_solid_vbo:
-            self._batched_solid_vbo.delete()
-            self._batched_solid_vbo = None
-
-        if self._batched_edges_vbo:
-            self._batched_edges_vbo.delete()
-            self._batched_edges_vbo = None
-
     def render(self):
         """메인 렌더링 (VBO 사용)"""
+        # 오버레이 QPainter가 바꾼 상태 복원 (frame_state 참고)
+        apply_frame_state(GL)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
         if not self._mesh or len(self._mesh.nodes) == 0:
             return
 
+        self._monitor.frame_start()
+
         # 투영 행렬
         glMatrixMode(GL_PROJECTION)
         glLoadIdentity()
@@ -583,6 +841,20 @@ class VBORenderer(BaseRenderer):
         view = self._camera.get_view_matrix()
         glLoadMatrixf(view.T.astype(np.float32))
 
+        # 절두체 밖 / 화면에서 너무 작은 Part 제외
+        with self._monitor.section('cull'):
+            self._cull(view, proj)
+
+        # Part 색상/하이라이트/투명도 변경: 색상 버퍼의 바뀐 Part 구간만 갱신
+        if self._dirty_color_parts:
+            with self._monitor.rebuild('colors'):
+                self._update_part_colors()
+
+        # 점진적 로드: 준비된 묶음을 예산 안에서 업로드 (보이는 Part 먼저)
+        if self._loader is not None:
+            with self._monitor.section('upload'):
+                self._pump_progressive()
+
         # Enable vertex arrays (한 번만)
         glEnableClientState(GL_VERTEX_ARRAY)
         glEnableClientState(GL_COLOR_ARRAY)
@@ -590,49 +862,65 @@ class VBORenderer(BaseRenderer):
         # 그리드
         self._draw_grid_vbo()
 
-        # 렌더링 (Batched VBO 사용 - 최적화)
+        # 렌더링 (외곽면 인덱스 버퍼, visible Part 단일 draw call)
         if self._show_solid:
-            glEnable(GL_POLYGON_OFFSET_FILL)
-            glPolygonOffset(1.0, 1.0)
-            # Batched VBO가 있으면 사용 (훨씬 빠름)
-            if self._batched_solid_vbo:
-                self._draw_batched_solid()
-            else:
-                self._draw_solid_vbo()  # Fallback
-            glDisable(GL_POLYGON_OFFSET_FILL)
-
-        if self._show_edges:
-            # Batched VBO가 있으면 사용 (훨씬 빠름)
-            if self._batched_edges_vbo:
-                self._draw_batched_edges()
-            else:
-                self._draw_edges_vbo()  # Fallback
-
-        if self._show_wireframe:
-            self._draw_wireframe_vbo()  # 모든 엣지 (Part 색상)
+            with self._monitor.section('solid'):
+                glEnable(GL_POLYGON_OFFSET_FILL)
+                glPolygonOffset(1.0, 1.0)
+                self._draw_skin_solid()
+                glDisable(GL_POLYGON_OFFSET_FILL)
+
+        # 인터랙션 중에는 엣지 생략 (LOD 설정)
+        draw_edges = self._lod.draw_edges
+        with self._monitor.section('edges'):
+            if self._show_edges and draw_edges:
+                self._draw_skin_edges(color=(0.0, 0.0, 0.0))  # 검은색 윤곽선
+
+            if self._show_wireframe and draw_edges:
+                self._draw_skin_edges()  # 외곽면 엣지 (Part 색상)
+
+        # Beam 요소 (면이 없으므로 모든 모드에서 선으로 표시)
+        with self._monitor.section('beams'):
+            self._draw_beams_vbo()
 
         if self._show_nodes:
-            self._draw_nodes_vbo()
+            with self._monitor.section('nodes'):
+                self._draw_nodes_vbo()
 
         # 선택된 요소 하이라이트
-        if self._selected_element is not None:
-            self._draw_selected_element()
+        with self._monitor.section('selection'):
+            if self._selected_element is not None:
+                self._draw_selected_element()
+            self._draw_selection()
 
         # Disable vertex arrays
         glDisableClientState(GL_VERTEX_ARRAY)
         glDisableClientState(GL_COLOR_ARRAY)
 
+        # 인터랙션 중에는 GPU 완료까지 기다려 실제 프레임 시간으로 LOD 레벨 조정
+        if self._lod.interacting:
+            with self._monitor.section('finish'):
+                glFinish()
+        self._monitor.frame_end()
+        if self._lod.interacting:
+            self._lod.record_frame(self._monitor.get_last_frame_time())
+
     def _draw_grid_vbo(self):
         """그리드 & 축 (VBO)"""
         if not self._grid_vbo or not self._axes_vbo:
             return
 
+        # 그리드/축은 전역 원점에 표시 (메쉬는 origin 기준 로컬 좌표)
+        glPushMatrix()
+        glTranslated(*(-self._mesh.origin))
+
         # Grid
         self._grid_vbo.bind()
         glVertexPointer(3, GL_FLOAT, 24, self._grid_vbo)  # stride=24 (6 floats * 4 bytes)
         glColorPointer(3, GL_FLOAT, 24, self._grid_vbo + 12)  # offset=12 (3 floats * 4 bytes)
         glDrawArrays(GL_LINES, 0, self._grid_count)
         self._grid_vbo.unbind()
+        self._monitor.record_draw_call(self._grid_count)
 
         # Axes (thicker)
         glLineWidth(3.0)
@@ -641,72 +929,138 @@ class VBORenderer(BaseRenderer):
         glColorPointer(3, GL_FLOAT, 24, self._axes_vbo + 12)
         glDrawArrays(GL_LINES, 0, self._axes_count)
         self._axes_vbo.unbind()
+        self._monitor.record_draw_call(self._axes_count)
         glLineWidth(1.5)
+        glPopMatrix()
+
+    def _bind_skin(self, skin_vbo: GLBuffer, color_vbo: GLBuffer, normals: bool = False,
+                   picking: bool = False):
+        """외곽면 속성 버퍼 바인딩 (지오메트리 + 표시 색상 RGBA, picking이면 picking 색상 rgb)
 
-    def _draw_edges_vbo(self):
-        """외곽 엣지 (VBO, 검은색 윤곽선)"""
-        if not self._edges_vbo:
+        포인터는 호출 시점에 바인딩된 버퍼를 가리키므로 지오메트리를 마지막에 바인딩합니다.
+        """
+        color_vbo.bind()
+        if picking:
+            glColorPointer(3, GL_FLOAT, 0, color_vbo + 0)
+        else:
+            glColorPointer(4, GL_UNSIGNED_BYTE, 0, color_vbo + 0)
+        skin_vbo.bind()
+        glVertexPointer(3, GL_FLOAT, GEOMETRY_STRIDE, skin_vbo + 0)
+        if normals:
+            glNormalPointer(GL_FLOAT, GEOMETRY_STRIDE, skin_vbo + GEOMETRY_NORMAL_OFFSET)
+
+    def _draw_indexed(self, ibo, mode, draws):
+        """인덱스 버퍼의 여러 구간을 한 번에 그리기 (uint32, glMultiDrawElements)"""
+        counts, offsets = draws
+        if len(counts) == 0:
             return
+        ibo.bind()
+        glMultiDrawElements(mode, counts, GL_UNSIGNED_INT, offsets, len(counts))
+        ibo.unbind()
+        indices = int(counts.sum())
+        if mode == GL_TRIANGLES:
+            self._monitor.record_draw_call(triangles=indices // 3)
+        else:
+            self._monitor.record_draw_call(vertex_count=indices)
+
+    def _skin_draws(self, kind: str) -> list:
+        """그릴 외곽면 [(지오메트리, 색상, 인덱스 버퍼, draw 목록)] - 업로드가 끝난 구간마다
 
-        glLineWidth(1.0)  # 얇은 윤곽선
+        Args:
+            kind: 'triangles' (불투명 Part), 'translucent' (반투명 Part) 또는 'edges'
+        """
+        ibo, draws = {
+            'triangles': ('triangles', 'draws'),
+            'translucent': ('triangles', 'translucent_draws'),
+            'edges': ('edges', 'edge_draws'),
+        }[kind]
+        return [(segment['vbo'], segment['colors'], segment[ibo], segment[draws])
+                for segment in self._skin_segments
+                if segment['ready'] and segment[ibo] is not None and segment[draws] is not None]
+
+    def _draw_skin(self, entries: list, mode, normals: bool = False):
+        for skin_vbo, color_vbo, ibo, draws in entries:
+            self._bind_skin(skin_vbo, color_vbo, normals=normals)
+            self._draw_indexed(ibo, mode, draws)
+            skin_vbo.unbind()
+
+    def _draw_skin_solid(self):
+        """솔리드 (외곽면 삼각형, 면 단위 flat shading)
+
+        정점은 노드 단위로 공유하고, 각 삼각형의 마지막(provoking) 정점이
+        그 면의 법선을 가지므로 GL_FLAT에서 면마다 한 법선으로 조명됩니다.
+        인터랙션 LOD 레벨은 정점 법선이므로 GL_SMOOTH로 그립니다.
+        반투명 Part는 불투명 Part 다음에 깊이 버퍼를 쓰지 않고 그립니다.
+        """
+        level = self._lod.level
+        if level > 0:
+            lod = self._lod_levels[level - 1]
+            opaque = [(lod['vbo'], lod['colors'], lod['triangles'], lod['draws'])]
+            translucent = [(lod['vbo'], lod['colors'], lod['triangles'], lod['translucent_draws'])] \
+                if lod['translucent_draws'] is not None else []
+        else:
+            opaque, translucent = self._skin_draws('triangles'), self._skin_draws('translucent')
+        if not opaque and not translucent:
+            return
 
-        for pid in self._visible_parts:
-            if pid not in self._edges_vbo:
-                continue
+        glEnable(GL_LIGHTING)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glShadeModel(GL_SMOOTH if level > 0 else GL_FLAT)
+        glEnableClientState(GL_NORMAL_ARRAY)
 
-            vbo_obj = self._edges_vbo[pid]
-            count = self._edges_counts[pid]
+        self._draw_skin(opaque, GL_TRIANGLES, normals=True)
+        if translucent:
+            glDepthMask(GL_FALSE)
+            self._draw_skin(translucent, GL_TRIANGLES, normals=True)
+            glDepthMask(GL_TRUE)
 
-            vbo_obj.bind()
-            glVertexPointer(3, GL_FLOAT, 24, vbo_obj)
-            glColorPointer(3, GL_FLOAT, 24, vbo_obj + 12)
-            glDrawArrays(GL_LINES, 0, count)
-            vbo_obj.unbind()
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glShadeModel(GL_SMOOTH)
+        glDisable(GL_BLEND)
+        glDisable(GL_LIGHTING)
 
-        glLineWidth(1.5)
+    def _draw_skin_edges(self, color: Optional[tuple] = None):
+        """외곽면 엣지 (공유 엣지 1번씩)
 
-    def _draw_wireframe_vbo(self):
-        """와이어프레임 (VBO)"""
-        if not self._wireframe_vbo:
+        Args:
+            color: 단색 (None이면 Part 색상)
+        """
+        entries = self._skin_draws('edges')
+        if not entries:
             return
 
-        for pid in self._visible_parts:
-            if pid not in self._wireframe_vbo:
-                continue
+        if color is not None:
+            glLineWidth(1.0)  # 얇은 윤곽선
+            glDisableClientState(GL_COLOR_ARRAY)
+            glColor3f(*color)
 
-            vbo_obj = self._wireframe_vbo[pid]
-            count = self._wireframe_counts[pid]
+        self._draw_skin(entries, GL_LINES)
 
-            vbo_obj.bind()
-            glVertexPointer(3, GL_FLOAT, 24, vbo_obj)
-            glColorPointer(3, GL_FLOAT, 24, vbo_obj + 12)
-            glDrawArrays(GL_LINES, 0, count)
-            vbo_obj.unbind()
+        if color is not None:
+            glEnableClientState(GL_COLOR_ARRAY)
+            glLineWidth(1.5)
 
-    def _draw_solid_vbo(self):
-        """솔리드 (VBO, 외곽면만)"""
-        if not self._solid_vbo:
+    def _draw_beams_vbo(self):
+        """Beam 선분 (VBO, Part 색상)"""
+        if not self._beams_vbo:
             return
 
-        glEnable(GL_LIGHTING)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glLineWidth(2.5)
 
-        for pid in self._visible_parts:
-            if pid not in self._solid_vbo:
+        for pid in self._drawn_parts:
+            if pid not in self._beams_vbo:
                 continue
 
-            vbo_obj = self._solid_vbo[pid]
-            count = self._solid_counts[pid]
-
+            vbo_obj = self._beams_vbo[pid]
             vbo_obj.bind()
             glVertexPointer(3, GL_FLOAT, 24, vbo_obj)
             glColorPointer(3, GL_FLOAT, 24, vbo_obj + 12)
-            glDrawArrays(GL_TRIANGLES, 0, count)
+            glDrawArrays(GL_LINES, 0, self._beams_counts[pid])
             vbo_obj.unbind()
+            self._monitor.record_draw_call(self._beams_counts[pid])
 
-        glDisable(GL_BLEND)
-        glDisable(GL_LIGHTING)
+        glLineWidth(1.5)
 
     def _draw_nodes_vbo(self):
         """노드 포인트 (VBO)"""
@@ -718,62 +1072,80 @@ class VBORenderer(BaseRenderer):
         glColorPointer(3, GL_FLOAT, 24, self._nodes_vbo + 12)
         glDrawArrays(GL_POINTS, 0, self._nodes_count)
         self._nodes_vbo.unbind()
-
-    def _draw_batched_solid(self):
-        """Batched Solid VBO (단일 draw call - 최적화)"""
-        if not self._batched_solid_vbo:
-            return
-
-        glEnable(GL_LIGHTING)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
-        self._batched_solid_vbo.bind()
-        glVertexPointer(3, GL_FLOAT, 24, self._batched_solid_vbo)
-        glColorPointer(3, GL_FLOAT, 24, self._batched_solid_vbo + 12)
-        glDrawArrays(GL_TRIANGLES, 0, self._batched_solid_count)
-        self._batched_solid_vbo.unbind()
-
-        glDisable(GL_BLEND)
-        glDisable(GL_LIGHTING)
-
-    def _draw_batched_edges(self):
-        """Batched Edges VBO (단일 draw call - 최적화)"""
-        if not self._batched_edges_vbo:
-            return
-
-        glLineWidth(1.0)
-
-        self._batched_edges_vbo.bind()
-        glVertexPointer(3, GL_FLOAT, 24, self._batched_edges_vbo)
-        glColorPointer(3, GL_FLOAT, 24, self._batched_edges_vbo + 12)
-        glDrawArrays(GL_LINES, 0, self._batched_edges_count)
-        self._batched_edges_vbo.unbind()
-
-        glLineWidth(1.5)
+        self._monitor.record_draw_call(self._nodes_count)
 
     def _draw_picking_vbo(self):
         """Picking 버퍼 렌더링 (요소별 고유 색상)"""
-        if not self._picking_vbo:
-            return
-
         glDisable(GL_LIGHTING)
         glDisable(GL_BLEND)
 
-        for pid in self._visible_parts:
-            if pid not in self._picking_vbo:
+        # 외곽면: provoking 정점의 picking 색상으로 면 전체를 칠함
+        # (picking ID는 전체 스킨 면 순번이므로 설치 전 로드 중 묶음은 제외)
+        segments = [segment for segment in self._skin_segments if segment['triangles'] is not None] \
+            if self._skin is not None else []
+        if segments:
+            glShadeModel(GL_FLAT)
+            for segment in segments:
+                self._bind_skin(segment['vbo'], segment['pick'], picking=True)
+                for draws in (segment['draws'], segment['translucent_draws']):
+                    if draws is not None:
+                        self._draw_indexed(segment['triangles'], GL_TRIANGLES, draws)
+                segment['vbo'].unbind()
+            glShadeModel(GL_SMOOTH)
+
+        # Beam: 굵은 선으로 그려 클릭하기 쉽게
+        glLineWidth(6.0)
+        for pid in self._drawn_parts:
+            if not self._picking_lines_vbo or pid not in self._picking_lines_vbo:
                 continue
 
-            vbo_obj = self._picking_vbo[pid]
-            count = self._picking_counts[pid]
-
+            vbo_obj = self._picking_lines_vbo[pid]
             vbo_obj.bind()
             glVertexPointer(3, GL_FLOAT, 24, vbo_obj)
             glColorPointer(3, GL_FLOAT, 24, vbo_obj + 12)
-            glDrawArrays(GL_TRIANGLES, 0, count)
+            glDrawArrays(GL_LINES, 0, self._picking_lines_counts[pid])
             vbo_obj.unbind()
+        glLineWidth(1.5)
+
+    def pick(self, x: int, y: int) -> Optional[PickHit]:
+        """마우스 좌표의 외곽면 교점 (CPU BVH, GL 불필요)
+
+        Args:
+            x: 윈도우 X 좌표
+            y: 윈도우 Y 좌표 (top-down)
+
+        Returns:
+            PickHit (요소, 면, 가장 가까운 노드, Part) - 없으면 None
+        """
+        if not self._exterior_faces or self._camera is None:
+            return None
+        if self._bvh is None:
+            with self._monitor.rebuild('bvh'):
+                self._bvh = FaceBVH(self._mesh.nodes, self._exterior_faces)
+            print(f"[Picking] BVH built: {len(self._bvh):,} faces, {self._bvh.nbytes / 1024 / 1024:.1f} MB")
+        origin, direction = self._camera.get_ray(x, y, self._width, self._height)
+        return self._bvh.raycast(origin, direction, self._visible_parts)
 
     def pick_element(self, x: int, y: int) -> Optional[int]:
+        """마우스 좌표에서 요소 선택
+
+        외곽면은 CPU BVH 광선 검사, 면이 없거나 맞지 않으면 Beam 선분을 GPU 색상 picking
+        """
+        hit = self.pick(x, y)
+        self._last_hit = hit
+        if hit is not None:
+            self._selected_element = hit.element
+            print(f"[Picking] Element {hit.element} selected (part {hit.part_id}, node {hit.node})")
+            return hit.element
+        if not self._picking_lines_vbo:
+            return None
+        return self._pick_element_gpu(x, y)
+
+    def get_last_hit(self) -> Optional[PickHit]:
+        """마지막 picking 교점 (면/노드 정보)"""
+        return self._last_hit
+
+    def _pick_element_gpu(self, x: int, y: int) -> Optional[int]:
         """마우스 좌표에서 요소 선택 (GPU picking)
 
         Args:
@@ -783,13 +1155,14 @@ class VBORenderer(BaseRenderer):
         Returns:
             선택된 요소 인덱스 (없으면 None)
         """
-        if not self._picking_vbo or not self._elem_id_map:
+        if len(self._pick_elements) <= 1:
             return None
 
         # Y 좌표 뒤집기 (OpenGL은 bottom-up)
         y_gl = self._height - y
 
-        # Picking 렌더링
+        # Picking 렌더링 (paintGL 밖에서 호출되므로 상태도 따로 복원)
+        apply_frame_state(GL)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
         # 투영 & 뷰 행렬 (일반 렌더링과 동일)
@@ -821,11 +1194,11 @@ class VBORenderer(BaseRenderer):
         pixel = glReadPixels(x, y_gl, 1, 1, GL_RGB, GL_UNSIGNED_BYTE)
 
         # RGB → Color ID 디코딩
-        r, g, b = pixel[0][0]
+        r, g, b = (int(c) for c in pixel[0][0])  # uint8 시프트 오버플로 방지
         color_id = (r << 16) | (g << 8) | b
 
         # Color ID → Element Index 변환
-        elem_idx = self._elem_id_map.get(color_id)
+        elem_idx = int(self._pick_elements[color_id]) if 0 < color_id < len(self._pick_elements) else None
 
         if elem_idx is not None:
             self._selected_element = elem_idx
@@ -841,28 +1214,106 @@ class VBORenderer(BaseRenderer):
         """선택된 요소 설정"""
         self._selected_element = elem_idx
 
+    def _on_selection_changed(self):
+        """영역 선택 → 하이라이트 배열 (선택 면의 스킨 삼각형, Beam 선분, 노드)"""
+        self._selection_triangles = self._selection_lines = self._selection_points = None
+        selection = self._selection
+        if self._mesh is None or selection.count() == 0:
+            return
+        if selection.target == NODES:
+            self._selection_points = np.ascontiguousarray(self._mesh.nodes[selection.indices], dtype=np.float32)
+            return
+
+        elements = selection.indices
+        if selection.target == PARTS:
+            elements = np.sort(self._mesh.get_visible_elements(set(selection.indices.tolist())))
+        beams = elements[self._mesh.cell_types[elements] == CELL_BEAM]
+        if len(beams):
+            self._selection_lines = np.ascontiguousarray(
+                self._mesh.nodes[self._mesh.cell_nodes(beams)], dtype=np.float32)
+        if selection.target == PARTS:
+            return  # 선택 Part의 면은 Part 표시 색상으로 (PartAttributes)
+
+        skin = self._skin
+        if skin is None or not self._exterior_faces:
+            return
+        if self._face_triangle_offsets is None:
+            # 스킨 면 순서 = Part 순서로 이어 붙인 외곽면, 사각형은 삼각형 2개
+            per_face = np.concatenate([np.where(self._exterior_faces[int(pid)].nodes[:, 3] < 0, 1, 2)
+                                       for pid in skin.part_ids])
+            self._face_triangle_offsets = np.concatenate([[0], np.cumsum(per_face)])
+        faces = np.flatnonzero(np.isin(skin.pick_elements[1:], elements))
+        positions, _ = gather_cells(self._face_triangle_offsets, faces)
+        segments = self._skin_segments
+        local = vb.split_indices(skin.triangles[positions], [segment['vertex_base'] for segment in segments])
+        self._selection_triangles = [(segment, triangles) for segment, triangles in zip(segments, local)
+                                     if len(triangles)]
+
+    def _draw_selection(self):
+        """영역 선택 하이라이트 (반투명 노란 면, 굵은 Beam 선, 큰 노드 점)"""
+        if self._selection_triangles is None and self._selection_lines is None \
+                and self._selection_points is None:
+            return
+
+        glDisable(GL_LIGHTING)
+        glDisableClientState(GL_COLOR_ARRAY)
+        if self._selection_triangles:
+            # Solid는 polygon offset으로 밀려 있으므로 같은 면 위에 그려짐
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            glColor4f(1.0, 1.0, 0.0, 0.5)
+            for segment, triangles in self._selection_triangles:
+                segment['vbo'].bind()
+                glVertexPointer(3, GL_FLOAT, GEOMETRY_STRIDE, segment['vbo'] + 0)
+                glDrawElements(GL_TRIANGLES, triangles.size, GL_UNSIGNED_INT, triangles)
+                self._monitor.record_draw_call(triangles=len(triangles))
+                segment['vbo'].unbind()
+            glDisable(GL_BLEND)
+
+        glColor3f(1.0, 1.0, 0.0)
+        if self._selection_lines is not None:
+            glLineWidth(4.0)
+            glVertexPointer(3, GL_FLOAT, 0, self._selection_lines)
+            glDrawArrays(GL_LINES, 0, len(self._selection_lines))
+            self._monitor.record_draw_call(len(self._selection_lines))
+            glLineWidth(1.5)
+        if self._selection_points is not None:
+            glPointSize(8.0)
+            glVertexPointer(3, GL_FLOAT, 0, self._selection_points)
+            glDrawArrays(GL_POINTS, 0, len(self._selection_points))
+            self._monitor.record_draw_call(len(self._selection_points))
+            glPointSize(4.0)
+        glEnableClientState(GL_COLOR_ARRAY)
+
     def _draw_selected_element(self):
         """선택된 요소 하이라이트 (굵은 빨간색 외곽선)"""
-        if self._selected_element is None or not self._exterior_faces:
+        if self._selected_element is None:
             return
 
         elem_idx = self._selected_element
 
-        # 선택된 요소가 어느 Part의 어느 face인지 찾기
-        selected_face = None
-        for pid, faces in self._exterior_faces.items():
-            for e_idx, face_indices in faces:
-                if e_idx == elem_idx:
-                    selected_face = (e_idx, face_indices)
-                    break
-            if selected_face:
-                break
-
-        if not selected_face:
+        # Beam은 선분 자체를 강조
+        if self._mesh.cell_types[elem_idx] == CELL_BEAM:
+            glDisable(GL_LIGHTING)
+            glLineWidth(4.0)
+            glColor3f(1.0, 1.0, 0.0)
+            glBegin(GL_LINES)
+            for idx in self._mesh.elements[elem_idx]:
+                p = self._mesh.nodes[idx]
+                glVertex3f(p[0], p[1], p[2])
+            glEnd()
+            glLineWidth(1.5)
             return
 
-        elem_idx, face_indices = selected_face
-        node_indices = self._mesh.elements[elem_idx]
+        if not self._exterior_faces:
+            return
+
+        # 선택된 요소의 외곽면은 선택이 바뀔 때만 찾음 (매 프레임 전체 외곽면을 훑지 않음)
+        if self._selected_faces is None or self._selected_faces[0] != elem_idx:
+            self._selected_faces = (elem_idx, element_face_loops(self._exterior_faces, elem_idx))
+        loops = self._selected_faces[1]
+        if not loops:
+            return
 
         # 하이라이트 색상 (밝은 노란색)
         highlight_color = (1.0, 1.0, 0.0)
@@ -872,12 +1323,11 @@ class VBORenderer(BaseRenderer):
         glLineWidth(4.0)  # 굵은 선
         glColor3f(*highlight_color)
 
-        glBegin(GL_LINE_LOOP)
-        for i in face_indices:
-            idx = node_indices[i]
-            p = self._mesh.nodes[idx]
-            glVertex3f(p[0], p[1], p[2])
-        glEnd()
+        for loop in loops:
+            glBegin(GL_LINE_LOOP)
+            for p in self._mesh.nodes[loop]:
+                glVertex3f(p[0], p[1], p[2])
+            glEnd()
 
         glLineWidth(1.5)  # 원래대로
 
@@ -0,0 +1,237 @@
+"""외곽면 BVH (Bounding Volume Hierarchy) - CPU picking
+
+GL 컨텍스트 없이 마우스 광선과 외곽면의 가장 가까운 교점을 찾습니다.
+(색상 ID로 장면을 다시 그리고 glReadPixels/glFinish를 기다리는 GPU picking 대체)
+
+구조 (NumPy로 생성, 포인터 없는 배열):
+- 면 중심의 Morton 코드 순으로 정렬 → 연속 leaf_size개 면이 한 leaf
+- 위 레벨은 아래 레벨의 연속 BRANCH개 노드를 묶음 (노드 i의 자식 = i*BRANCH ... i*BRANCH+BRANCH-1)
+- 탐색: 레벨마다 광선과 겹치는 노드만 남기는 벡터화 slab test, leaf 면은 Möller-Trumbore
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .mesh_data import PartFaces
+
+# 한 노드의 자식 수 (넓을수록 레벨 수가 줄어 NumPy 호출이 적음)
+BRANCH = 8
+# Morton 코드 축당 비트 수
+MORTON_BITS = 10
+
+_BRANCH_RANGE = np.arange(BRANCH)
+
+
+@dataclass
+class PickHit:
+    """광선 교점"""
+    element: int  # 요소 인덱스
+    face: int  # 외곽면 순번 (exterior_faces를 Part 순서로 이어 붙인 순서)
+    node: int  # 교점에 가장 가까운 면의 노드 인덱스
+    part_id: int
+    point: np.ndarray  # 교점 (로컬 좌표)
+    distance: float  # 광선 시작점부터 거리
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """10비트 정수의 비트 사이에 0 두 개씩 삽입 (3D Morton 코드용)"""
+    v = values.astype(np.uint64) & 0x3FF
+    v = (v | (v << 16)) & 0x030000FF
+    v = (v | (v << 8)) & 0x0300F00F
+    v = (v | (v << 4)) & 0x030C30C3
+    v = (v | (v << 2)) & 0x09249249
+    return v
+
+
+def morton_codes(points: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """(N, 3) 좌표 → 30비트 Morton 코드 (공간적으로 가까운 점이 가까운 코드)"""
+    scale = (1 << MORTON_BITS) - 1
+    extent = np.maximum(hi - lo, 1e-12)
+    cells = np.clip((points - lo) / extent * scale, 0, scale).astype(np.int64)
+    return (_spread_bits(cells[:, 0]) << 2) | (_spread_bits(cells[:, 1]) << 1) | _spread_bits(cells[:, 2])
+
+
+def _cross(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """np.cross (작은 배열에서는 np.cross의 축 처리 비용이 계산보다 큼)"""
+    return np.stack([a[..., 1] * b[..., 2] - a[..., 2] * b[..., 1],
+                     a[..., 2] * b[..., 0] - a[..., 0] * b[..., 2],
+                     a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]], axis=-1)
+
+
+def _ray_boxes(origin: np.ndarray, inv_dir: np.ndarray,
+               mins: np.ndarray, maxs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Slab test → (겹침 여부, 진입 거리) - 호출 측에서 np.errstate(invalid='ignore')"""
+    t1 = (mins - origin) * inv_dir
+    t2 = (maxs - origin) * inv_dir
+    # 축에 평행한 광선의 0 * inf = nan은 fmin/fmax가 무시
+    t_near = np.fmax(np.fmin(t1, t2).max(axis=1), 0.0)
+    t_far = np.fmax(t1, t2).min(axis=1)
+    return t_near <= t_far, t_near
+
+
+def _ray_triangles(origin: np.ndarray, direction: np.ndarray,
+                   a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Möller-Trumbore → 교점 거리 (교차하지 않으면 inf, 양면)"""
+    e1, e2 = b - a, c - a
+    p = _cross(direction, e2)
+    det = np.einsum('ij,ij->i', e1, p)
+    valid = np.abs(det) > 1e-12
+    inv_det = np.where(valid, 1.0 / np.where(valid, det, 1.0), 0.0)
+    s = origin - a
+    u = np.einsum('ij,ij->i', s, p) * inv_det
+    q = _cross(s, e1)
+    v = (q @ direction) * inv_det
+    t = np.einsum('ij,ij->i', e2, q) * inv_det
+    hit = valid & (u >= 0) & (v >= 0) & (u + v <= 1) & (t > 0)
+    return np.where(hit, t, np.inf)
+
+
+class FaceBVH:
+    """외곽면 BVH
+
+    사용 예시:
+        bvh = FaceBVH(mesh.nodes, mesh.extract_exterior_faces())
+        origin, direction = camera.get_ray(x, y, width, height)
+        hit = bvh.raycast(origin, direction, visible_parts)
+    """
+
+    def __init__(self, nodes: np.ndarray, exterior_faces: Dict[int, 'PartFaces'], leaf_size: int = 8):
+        """
+        Args:
+            nodes: (N, 3) 노드 좌표 (로컬)
+            exterior_faces: {part_id: PartFaces}
+            leaf_size: leaf 하나의 면 수
+        """
+        self._nodes = nodes
+        self._leaf_size = leaf_size
+        self.part_ids = np.array(list(exterior_faces.keys()), dtype=np.int64)
+        self._part_rank = {int(pid): i for i, pid in enumerate(self.part_ids)}
+
+        counts = [len(f) for f in exterior_faces.values()]
+        face_count = int(sum(counts))
+        if face_count:
+            face_nodes = np.concatenate([f.nodes for f in exterior_faces.values()])
+            self.face_elements = np.concatenate([f.elements for f in exterior_faces.values()])
+        else:
+            face_nodes = np.zeros((0, 4), dtype=np.int32)
+            self.face_elements = np.zeros(0, dtype=np.int64)
+        face_rank = np.repeat(np.arange(len(counts), dtype=np.int32), counts)
+
+        # 삼각형은 4번째 노드를 3번째로 채워 두 번째 삼각형이 퇴화 (교차 없음)
+        closed = np.where(face_nodes < 0, face_nodes[:, 2:3], face_nodes)
+        corners = nodes[closed]
+        face_min, face_max = corners.min(axis=1), corners.max(axis=1)
+
+        # Morton 순서로 정렬
+        if face_count:
+            lo, hi = face_min.min(axis=0), face_max.max(axis=0)
+            order = np.argsort(morton_codes(corners.mean(axis=1), lo, hi), kind='stable')
+        else:
+            order = np.zeros(0, dtype=np.int64)
+        self._order = order.astype(np.int64)                 # 정렬 위치 → 원래 면 순번
+        self._face_nodes = closed[order]
+        self._face_rank = face_rank[order]
+
+        # 레벨별 bbox (0 = leaf, 마지막 = 루트)
+        self._levels: List[Tuple[np.ndarray, np.ndarray]] = []
+        if face_count:
+            starts = np.arange(0, face_count, leaf_size)
+            mins = np.minimum.reduceat(face_min[order], starts)
+            maxs = np.maximum.reduceat(face_max[order], starts)
+            self._levels.append((mins, maxs))
+            while len(mins) > 1:
+                starts = np.arange(0, len(mins), BRANCH)
+                mins = np.minimum.reduceat(mins, starts)
+                maxs = np.maximum.reduceat(maxs, starts)
+                self._levels.append((mins, maxs))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def nbytes(self) -> int:
+        level_bytes = sum(mins.nbytes + maxs.nbytes for mins, maxs in self._levels)
+        return (level_bytes + self._order.nbytes + self._face_nodes.nbytes
+                + self._face_rank.nbytes + self.face_elements.nbytes)
+
+    def raycast(self, origin: np.ndarray, direction: np.ndarray,
+                visible_parts: Optional[Set[int]] = None) -> Optional[PickHit]:
+        """광선과 가장 가까운 외곽면 교점
+
+        Args:
+            origin: (3,) 광선 시작점 (로컬 좌표)
+            direction: (3,) 광선 방향
+            visible_parts: 검사할 Part ID (None이면 전체)
+
+        Returns:
+            PickHit (교점이 없으면 None)
+        """
+        if not self._levels:
+            return None
+        origin = np.asarray(origin, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        with np.errstate(divide='ignore'):
+            inv_dir = 1.0 / direction
+
+        # 루트 → leaf: 광선과 겹치는 노드만 남김
+        frontier = np.zeros(1, dtype=np.int64)
+        t_near = np.zeros(1)
+        with np.errstate(invalid='ignore'):
+            for depth in range(len(self._levels) - 1, -1, -1):
+                mins, maxs = self._levels[depth]
+                hit, t_near = _ray_boxes(origin, inv_dir, mins[frontier], maxs[frontier])
+                frontier, t_near = frontier[hit], t_near[hit]
+                if len(frontier) == 0:
+                    return None
+                if depth > 0:
+                    children = (frontier[:, None] * BRANCH + _BRANCH_RANGE).ravel()
+                    frontier = children[children < len(self._levels[depth - 1][0])]
+
+        # 가까운 leaf부터 묶음으로 검사, 확정된 교점보다 먼 leaf는 생략
+        leaf_order = np.argsort(t_near, kind='stable')
+        frontier, t_near = frontier[leaf_order], t_near[leaf_order]
+        visible = None
+        if visible_parts is not None:
+            visible = np.zeros(len(self.part_ids), dtype=bool)
+            ranks = [self._part_rank[pid] for pid in visible_parts if pid in self._part_rank]
+            visible[ranks] = True
+
+        best_t, best_face = np.inf, -1
+        batch = 64
+        for start in range(0, len(frontier), batch):
+            if t_near[start] > best_t:
+                break
+            leaves = frontier[start:start + batch]
+            faces = (leaves[:, None] * self._leaf_size + np.arange(self._leaf_size)).ravel()
+            faces = faces[faces < len(self._order)]
+            if visible is not None:
+                faces = faces[visible[self._face_rank[faces]]]
+            if len(faces) == 0:
+                continue
+
+            # 면마다 삼각형 (0, 1, 2), (0, 2, 3)을 한 번에 검사
+            corners = self._nodes[self._face_nodes[faces]].astype(np.float64)
+            t = _ray_triangles(origin, direction, np.concatenate([corners[:, 0], corners[:, 0]]),
+                               corners[:, 1:3].transpose(1, 0, 2).reshape(-1, 3),
+                               corners[:, 2:4].transpose(1, 0, 2).reshape(-1, 3))
+            t = np.minimum(t[:len(faces)], t[len(faces):])
+            nearest = int(np.argmin(t))
+            if t[nearest] < best_t:
+                best_t, best_face = float(t[nearest]), int(faces[nearest])
+
+        if best_face < 0:
+            return None
+
+        point = origin + best_t * direction
+        face_nodes = self._face_nodes[best_face]
+        distances = np.linalg.norm(self._nodes[face_nodes] - point, axis=1)
+        return PickHit(
+            element=int(self.face_elements[self._order[best_face]]),
+            face=int(self._order[best_face]),
+            node=int(face_nodes[np.argmin(distances)]),
+            part_id=int(self.part_ids[self._face_rank[best_face]]),
+            point=point,
+            distance=best_t,
+        )
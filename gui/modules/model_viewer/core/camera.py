@@ -62,6 +62,31 @@ class Camera:
         """
         return perspective(self.fov, aspect, self.near, self.far)
 
+    def get_frustum_planes(self, aspect: float) -> np.ndarray:
+        """현재 뷰의 절두체 평면 (6, 4)"""
+        proj = self.get_projection_matrix(aspect)
+        return frustum_planes(proj.astype(np.float64) @ self.get_view_matrix())
+
+    def get_ray(self, x: float, y: float, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        """화면 좌표 → 광선 (CPU picking)
+
+        Args:
+            x, y: 윈도우 좌표 (top-down)
+            width, height: 뷰포트 크기
+
+        Returns:
+            (origin, direction): near 평면 위 시작점, 단위 방향 (float64, 메쉬와 같은 로컬 좌표)
+        """
+        proj = self.get_projection_matrix(width / max(height, 1)).astype(np.float64)
+        inverse = np.linalg.inv(proj @ self.get_view_matrix())
+        ndc_x = 2.0 * x / max(width, 1) - 1.0
+        ndc_y = 1.0 - 2.0 * y / max(height, 1)
+        near = inverse @ [ndc_x, ndc_y, -1.0, 1.0]
+        far = inverse @ [ndc_x, ndc_y, 1.0, 1.0]
+        origin = near[:3] / near[3]
+        direction = far[:3] / far[3] - origin
+        return origin, direction / np.linalg.norm(direction)
+
     def rotate(self, delta_azim: float, delta_elev: float):
         """회전
 
@@ -238,3 +263,23 @@ def perspective(fov: float, aspect: float, near: float, far: float) -> np.ndarra
     mat[3, 2] = -1.0
 
     return mat
+
+
+def frustum_planes(view_proj: np.ndarray) -> np.ndarray:
+    """뷰-투영 행렬에서 절두체 평면 추출 (Gribb-Hartmann)
+
+    Args:
+        view_proj: 4x4 (projection @ view)
+
+    Returns:
+        (6, 4) 평면 (a, b, c, d) - left, right, bottom, top, near, far
+        법선은 단위 벡터, 절두체 안쪽에서 a*x + b*y + c*z + d >= 0
+    """
+    m = np.asarray(view_proj, dtype=np.float64)
+    planes = np.array([
+        m[3] + m[0], m[3] - m[0],
+        m[3] + m[1], m[3] - m[1],
+        m[3] + m[2], m[3] - m[2],
+    ])
+    planes /= np.linalg.norm(planes[:, :3], axis=1)[:, None]
+    return planes
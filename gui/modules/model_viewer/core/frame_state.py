@@ -0,0 +1,35 @@
+"""프레임 GL 상태 복원
+
+GLWidget은 GL 렌더링 위에 QPainter로 오버레이(로딩 바, 선택 경로, HUD)를 그립니다.
+QPainter.end()는 GL 상태를 Qt 기본값으로 되돌리므로(depth test/blend 꺼짐 등)
+initialize()에서 한 번만 켠 상태에 기대면 다음 프레임부터 depth test 없이 그려집니다.
+렌더러는 GL 패스를 시작할 때마다 apply_frame_state()로 필요한 상태를 다시 설정합니다.
+
+GL 모듈을 인자로 받으므로 OpenGL 없이도 (기록용 가짜 모듈로) 테스트할 수 있습니다.
+"""
+
+
+def apply_frame_state(gl):
+    """렌더러가 가정하는 고정 GL 상태 설정 (glClear 전에 호출)
+
+    depth mask가 꺼져 있으면 glClear가 depth 버퍼를 지우지 않으므로 clear보다 먼저 호출합니다.
+
+    Args:
+        gl: OpenGL.GL 모듈 (또는 같은 이름을 가진 객체)
+    """
+    gl.glUseProgram(0)
+    gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+    gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    # Depth test
+    gl.glEnable(gl.GL_DEPTH_TEST)
+    gl.glDepthFunc(gl.GL_LESS)
+    gl.glDepthMask(gl.GL_TRUE)
+
+    # QPainter가 켜 두거나 바꾸는 상태
+    gl.glDisable(gl.GL_BLEND)
+    gl.glDisable(gl.GL_SCISSOR_TEST)
+    gl.glDisable(gl.GL_STENCIL_TEST)
+    gl.glDisable(gl.GL_CULL_FACE)
+    gl.glColorMask(gl.GL_TRUE, gl.GL_TRUE, gl.GL_TRUE, gl.GL_TRUE)
+    gl.glShadeModel(gl.GL_SMOOTH)
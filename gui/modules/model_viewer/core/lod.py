@@ -0,0 +1,221 @@
+"""인터랙션 LOD (Level of Detail)
+
+카메라를 움직이는 동안에는 단순화한 외곽면을 그리고, 멈추면 원래 메쉬로 복원합니다.
+
+- 단순화: Part별 vertex clustering (격자 셀 하나의 정점을 평균 위치 하나로 합침)
+  메쉬 로드 시 NumPy로 미리 계산 (GL 불필요)
+- 레벨 선택: 인터랙션 중 프레임 시간이 목표보다 길면 더 거친 레벨, 충분히 짧으면 더 세밀한 레벨
+"""
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from .vertex_buffers import IndexedSkin, SKIN_FLOATS_PER_VERTEX
+
+
+@dataclass
+class LODSettings:
+    """인터랙션 LOD 설정"""
+    enabled: bool = True
+    # 외곽면 삼각형이 이보다 적으면 LOD를 만들지 않음
+    min_triangles: int = 200_000
+    # 레벨별 격자 해상도 (모델 최장 변 기준 셀 수, 세밀한 순)
+    resolutions: Tuple[int, ...] = (256, 128, 64, 32)
+    # 이전 레벨 대비 삼각형이 이 비율 이상 남으면 그 레벨은 건너뜀
+    min_reduction: float = 0.7
+    # 인터랙션 중 목표 프레임 시간 (ms)
+    target_frame_ms: float = 33.0
+    # 마지막 움직임 후 원래 메쉬로 복원하기까지 대기 (ms)
+    settle_ms: int = 200
+    # 인터랙션 중 엣지 숨기기
+    hide_edges: bool = True
+
+
+def decimate_skin(skin: IndexedSkin, resolution: int,
+                  bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> IndexedSkin:
+    """Vertex clustering으로 외곽면 단순화
+
+    정점을 (Part, 격자 셀) 단위로 묶어 평균 위치 하나로 합치고, 퇴화/중복 삼각형을 제거합니다.
+    Part 경계를 넘어 합치지 않으므로 Part 범위(triangle_offsets)와 색상은 유지됩니다.
+    법선은 면 법선의 면적 가중 평균 (smooth shading), 엣지와 picking 색상은 없습니다.
+
+    Args:
+        skin: build_indexed_skin 결과
+        resolution: 최장 변 기준 셀 수
+        bounds: (min, max) 격자 범위 (None이면 정점 범위)
+
+    Returns:
+        같은 Part 순서의 IndexedSkin (edges 비어 있음)
+    """
+    vertices = skin.vertices
+    part_count = len(skin.part_ids)
+    triangle_counts = np.diff(skin.triangle_offsets)
+
+    # 정점 → Part 순번 (정점은 자기 Part의 삼각형에서만 참조됨)
+    vertex_rank = np.zeros(len(vertices), dtype=np.int64)
+    vertex_rank[skin.triangles.ravel()] = np.repeat(np.arange(part_count), triangle_counts * 3)
+
+    positions = vertices[:, :3].astype(np.float64)
+    lo, hi = bounds if bounds is not None else (positions.min(axis=0), positions.max(axis=0))
+    cell = max(float(np.max(np.asarray(hi) - lo)), 1e-12) / resolution
+    cells = np.clip(((positions - lo) / cell).astype(np.int64), 0, resolution)
+    side = resolution + 1
+    keys = ((vertex_rank * side + cells[:, 0]) * side + cells[:, 1]) * side + cells[:, 2]
+    cluster_keys, cluster_of = np.unique(keys, return_inverse=True)
+    cluster_count = len(cluster_keys)
+
+    # 클러스터 위치 = 소속 정점 평균, 색상 = Part 색상
+    members = np.bincount(cluster_of, minlength=cluster_count)
+    out = np.zeros((cluster_count, SKIN_FLOATS_PER_VERTEX), dtype=np.float32)
+    for axis in range(3):
+        out[:, axis] = np.bincount(cluster_of, weights=positions[:, axis], minlength=cluster_count) / members
+    out[cluster_of, 6:9] = vertices[:, 6:9]
+
+    # 삼각형 재매핑 → 퇴화 제거 → 중복 제거 (Part 순서 유지)
+    triangles = cluster_of[skin.triangles]
+    tri_rank = np.repeat(np.arange(part_count), triangle_counts)
+    keep = ((triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2])
+            & (triangles[:, 0] != triangles[:, 2]))
+    triangles, tri_rank = triangles[keep], tri_rank[keep]
+    if len(triangles):
+        canonical = np.sort(triangles, axis=1)
+        order = np.lexsort(canonical.T[::-1])
+        sorted_rows = canonical[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (sorted_rows[1:] != sorted_rows[:-1]).any(axis=1)
+        unique = np.sort(order[first])
+        triangles, tri_rank = triangles[unique], tri_rank[unique]
+
+    # 정점 법선 (면적 가중 면 법선 합)
+    corners = out[:, :3].astype(np.float64)[triangles]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    flat = triangles.ravel()
+    for axis in range(3):
+        out[:, 3 + axis] = np.bincount(flat, weights=np.repeat(cross[:, axis], 3), minlength=cluster_count)
+    lengths = np.linalg.norm(out[:, 3:6], axis=1)
+    out[lengths > 0, 3:6] /= lengths[lengths > 0, None]
+
+    triangle_offsets = np.zeros(part_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tri_rank, minlength=part_count), out=triangle_offsets[1:])
+    # 클러스터 키가 Part 순번 순이므로 정점도 Part 단위 연속
+    vertex_offsets = np.searchsorted(cluster_keys // side ** 3, np.arange(part_count + 1))
+    return IndexedSkin(
+        vertices=out,
+        triangles=triangles.astype(np.uint32),
+        edges=np.zeros((0, 2), dtype=np.uint32),
+        part_ids=skin.part_ids,
+        vertex_offsets=vertex_offsets.astype(np.int64),
+        face_offsets=np.zeros(part_count + 1, dtype=np.int64),
+        triangle_offsets=triangle_offsets,
+        edge_offsets=np.zeros(part_count + 1, dtype=np.int64),
+        pick_elements=np.full(1, -1, dtype=np.int64),
+    )
+
+
+def build_lod_levels(skin: IndexedSkin, settings: LODSettings,
+                     decimate: Optional[Callable[[int, Tuple[np.ndarray, np.ndarray]], IndexedSkin]] = None
+                     ) -> List[IndexedSkin]:
+    """설정에 따른 LOD 레벨 목록 (세밀한 순, 작은 모델이면 빈 목록)
+
+    Args:
+        skin: 원래 외곽면
+        settings: LOD 설정
+        decimate: (resolution, bounds) → 단순화 결과 (None이면 decimate_skin, Part 캐시용)
+    """
+    if not settings.enabled or len(skin.triangles) < settings.min_triangles:
+        return []
+    if decimate is None:
+        decimate = lambda resolution, bounds: decimate_skin(skin, resolution, bounds)
+
+    positions = skin.vertices[:, :3]
+    bounds = (positions.min(axis=0).astype(np.float64), positions.max(axis=0).astype(np.float64))
+    levels = []
+    previous = len(skin.triangles)
+    for resolution in sorted(settings.resolutions, reverse=True):
+        level = decimate(resolution, bounds)
+        if len(level.triangles) == 0:
+            break
+        if len(level.triangles) <= previous * settings.min_reduction:
+            levels.append(level)
+            previous = len(level.triangles)
+    return levels
+
+
+class LODController:
+    """인터랙션 상태와 프레임 시간으로 LOD 레벨 선택
+
+    레벨 0 = 원래 메쉬, 1..level_count = build_lod_levels 순서 (1이 가장 세밀).
+    인터랙션 중 프레임 시간 이동 평균이 목표 범위 (target * [fast_factor, slow_factor])를
+    벗어나면, 삼각형 수에 비례한다고 보고 목표 안에 드는 가장 세밀한 레벨로 바꿉니다.
+    선택한 레벨은 다음 인터랙션에 재사용합니다.
+    """
+
+    def __init__(self, settings: Optional[LODSettings] = None,
+                 slow_factor: float = 1.25, fast_factor: float = 0.5, smoothing: float = 0.3):
+        self.settings = settings or LODSettings()
+        self.slow_factor = slow_factor
+        self.fast_factor = fast_factor
+        self.smoothing = smoothing
+        self._triangles: List[int] = [0]
+        self._interaction_level = 0
+        self._interacting = False
+        self._frame_ms: Optional[float] = None
+
+    def set_levels(self, triangle_counts: List[int]):
+        """레벨별 삼각형 수 [원래 메쉬, LOD 1, ...] (메쉬 변경 시) - 처음에는 가장 세밀한 LOD부터"""
+        self._triangles = [max(int(n), 1) for n in triangle_counts] or [1]
+        self._interaction_level = min(1, self.level_count)
+        self._frame_ms = None
+
+    @property
+    def level_count(self) -> int:
+        """LOD 레벨 수 (원래 메쉬 제외)"""
+        return len(self._triangles) - 1
+
+    @property
+    def interacting(self) -> bool:
+        return self._interacting
+
+    @property
+    def level(self) -> int:
+        """지금 그릴 레벨 (인터랙션 중이 아니면 0)"""
+        if not self._interacting or not self.settings.enabled:
+            return 0
+        return min(self._interaction_level, self.level_count)
+
+    @property
+    def draw_edges(self) -> bool:
+        """엣지를 그릴지 (인터랙션 중에는 설정에 따라 숨김)"""
+        return not (self._interacting and self.settings.enabled and self.settings.hide_edges)
+
+    def begin_interaction(self):
+        self._interacting = True
+
+    def end_interaction(self):
+        self._interacting = False
+        self._frame_ms = None
+
+    def record_frame(self, frame_ms: float) -> int:
+        """인터랙션 중 프레임 시간 기록 → 레벨 조정
+
+        Returns:
+            다음 프레임 레벨
+        """
+        if not self._interacting or self.level_count == 0:
+            return self.level
+        self._frame_ms = frame_ms if self._frame_ms is None \
+            else self._frame_ms + self.smoothing * (frame_ms - self._frame_ms)
+
+        target = self.settings.target_frame_ms
+        if target * self.fast_factor <= self._frame_ms <= target * self.slow_factor:
+            return self.level
+
+        # 삼각형당 비용으로 레벨별 프레임 시간 예측 → 목표 안의 가장 세밀한 레벨
+        ms_per_triangle = self._frame_ms / self._triangles[self._interaction_level]
+        level = next((i for i, n in enumerate(self._triangles) if n * ms_per_triangle <= target),
+                     self.level_count)
+        if level != self._interaction_level:
+            self._interaction_level = level
+            self._frame_ms = None
+        return self.level
@@ -1,13 +1,393 @@
 """Mesh data structure for 3D rendering
 
 초고속 렌더링을 위한 최소 데이터 구조
+
+요소 연결성은 CSR 형식의 혼합 토폴로지입니다:
+    offsets (M+1,), connectivity (offsets[-1],), cell_types (M,)
+요소 i의 노드 인덱스는 connectivity[offsets[i]:offsets[i + 1]] 이고,
+Shell(quad/tri), Solid(hex/penta/tet), Beam(2-node)을 한 메쉬에 담습니다.
 """
 import numpy as np
 from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 if TYPE_CHECKING:
-    from gui.app_context import ParsedModelData
+    from core.model_data import ParsedModelData
+
+
+# ID 범위가 노드 수의 이 배수 이하이면 밀집 조회 테이블 사용 (아니면 searchsorted)
+DENSE_LUT_MAX_RATIO = 4
+
+# 셀 타입 코드 (cell_types 값)
+CELL_BEAM = 0
+CELL_TRI = 1
+CELL_QUAD = 2
+CELL_TET = 3
+CELL_PENTA = 4
+CELL_HEX = 5
+
+CELL_NAMES = ('beam', 'tri', 'quad', 'tet', 'penta', 'hex')
+CELL_NODE_COUNTS = np.array([2, 3, 4, 4, 6, 8], dtype=np.int64)
+SHELL_CELLS = (CELL_TRI, CELL_QUAD)
+SOLID_CELLS = (CELL_TET, CELL_PENTA, CELL_HEX)
+
+# 셀 타입별 면 정의 (셀 로컬 노드 인덱스, 기존 Hex 면 순서/방향 유지)
+# Penta는 삼각형 (0,1,2)-(3,4,5)와 i -> i+3 수직 변으로 구성된 표준 wedge 배치
+CELL_FACES = {
+    CELL_TRI: ((0, 1, 2),),
+    CELL_QUAD: ((0, 1, 2, 3),),
+    CELL_TET: ((0, 2, 1), (0, 1, 3), (1, 2, 3), (0, 3, 2)),
+    CELL_PENTA: ((0, 2, 1), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)),
+    CELL_HEX: (
+        (0, 1, 2, 3),  # Bottom
+        (4, 5, 6, 7),  # Top
+        (0, 1, 5, 4),  # Front
+        (2, 3, 7, 6),  # Back
+        (0, 3, 7, 4),  # Left
+        (1, 2, 6, 5),  # Right
+    ),
+}
+
+# 셀 타입별 변 (와이어프레임용, 셀 로컬 노드 인덱스)
+CELL_EDGES = {
+    CELL_BEAM: ((0, 1),),
+    CELL_TRI: ((0, 1), (1, 2), (2, 0)),
+    CELL_QUAD: ((0, 1), (1, 2), (2, 3), (3, 0)),
+    CELL_TET: ((0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3)),
+    CELL_PENTA: ((0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (0, 3), (1, 4), (2, 5)),
+    CELL_HEX: ((0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4),
+               (0, 4), (1, 5), (2, 6), (3, 7)),
+}
+
+# LS-DYNA 요소 키워드 분류 (ModelStore etype 코드와 동일)
+_ETYPE_SHELL, _ETYPE_SOLID, _ETYPE_BEAM = 0, 1, 2
+_ETYPE_CODES = {'shell': _ETYPE_SHELL, 'solid': _ETYPE_SOLID, 'beam': _ETYPE_BEAM}
+
+
+def _build_face_table():
+    """CELL_FACES -> 면 정의 테이블
+
+    Returns:
+        face_local (D, 4) int8: 셀 로컬 노드 인덱스 (삼각형은 -1)
+        face_cell_types (D,) int8
+        cell_face_ids {cell_type: face id 배열}
+        collapsed (D, 4) int16: 사각형 면에서 위치 p의 노드를 뺀 삼각형 면 id (퇴화 면용)
+    """
+    local, cell_types, cell_face_ids = [], [], {}
+    for cell_type, face_defs in CELL_FACES.items():
+        cell_face_ids[cell_type] = np.arange(len(local), len(local) + len(face_defs), dtype=np.uint8)
+        for face_def in face_defs:
+            local.append(tuple(face_def) + (-1,) * (4 - len(face_def)))
+            cell_types.append(cell_type)
+
+    base_count = len(local)
+    collapsed = np.full((base_count, 4), -1, dtype=np.int16)
+    for face_id in range(base_count):
+        if local[face_id][3] < 0:
+            continue
+        for pos in range(4):
+            collapsed[face_id, pos] = len(local)
+            local.append(tuple(v for k, v in enumerate(local[face_id]) if k != pos) + (-1,))
+            cell_types.append(cell_types[face_id])
+
+    return (np.array(local, dtype=np.int8), np.array(cell_types, dtype=np.int8),
+            cell_face_ids, collapsed)
+
+
+FACE_LOCAL, FACE_CELL_TYPES, _CELL_FACE_IDS, _COLLAPSED_FACES = _build_face_table()
+_FACE_IS_SOLID = np.isin(FACE_CELL_TYPES, SOLID_CELLS)
+
+# 64비트 해시 상수 (splitmix64 계열)
+_HASH_MULTIPLIERS = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xBF58476D1CE4E5B9))
+
+
+def sorted_face_columns(face_nodes: np.ndarray) -> List[np.ndarray]:
+    """면 노드 (F, 4) 행 정렬 -> 오름차순 열 4개 (정렬 네트워크, 삼각형의 -1은 맨 앞)"""
+    a, b, c, d = (face_nodes[:, k] for k in range(4))
+    a, b = np.minimum(a, b), np.maximum(a, b)
+    c, d = np.minimum(c, d), np.maximum(c, d)
+    a, c = np.minimum(a, c), np.maximum(a, c)
+    b, d = np.minimum(b, d), np.maximum(b, d)
+    b, c = np.minimum(b, c), np.maximum(b, c)
+    return [a, b, c, d]
+
+
+def face_keys(columns: List[np.ndarray], node_count: int) -> Tuple[np.ndarray, bool]:
+    """정렬된 면 노드 열 -> 방향과 무관한 uint64 키
+
+    노드 인덱스+1 (-1 -> 0) 4개가 64비트에 들어가면 (노드 < 65535) 비트 단위로 묶은
+    정확한 키를 만듭니다. 아니면 상위 비트에 최소 노드, 하위 비트에 나머지 3개 노드의
+    해시를 넣습니다 (충돌은 최소 노드가 같은 면끼리만 가능, 호출 측에서 확인).
+    최소 노드가 상위에 있어 요소 순서와 키 순서가 비슷하므로 정렬/수집이 캐시 친화적입니다.
+
+    Returns:
+        (keys, exact)
+    """
+    bits = max(int(node_count + 1).bit_length(), 1)
+    exact = 4 * bits <= 64
+
+    if exact:
+        shift = np.uint64(bits)
+        keys = np.zeros(len(columns[0]), dtype=np.uint64)
+        for values in columns:
+            keys <<= shift
+            keys |= (values + 1).astype(np.uint64)
+        return keys, True
+
+    hashed = np.zeros(len(columns[0]), dtype=np.uint64)
+    for col, values in enumerate(columns[1:]):
+        hashed ^= (values + 1).astype(np.uint64)
+        hashed *= _HASH_MULTIPLIERS[col % 2]
+        hashed ^= hashed >> np.uint64(31)
+    hashed >>= np.uint64(bits)
+    keys = (columns[0] + 1).astype(np.uint64) << np.uint64(64 - bits)
+    keys |= hashed
+    return keys, False
+
+
+def boundary_faces(face_nodes: np.ndarray, node_count: int) -> np.ndarray:
+    """한 번만 나타나는 면 (다른 요소와 공유하지 않는 면) 마스크
+
+    행을 정렬한 노드를 face_keys()로 묶고 np.unique(return_counts=True)로 셉니다.
+    (return_index를 쓰지 않아야 np.unique가 빠른 quicksort argsort를 사용)
+    해시 키는 같은 키로 묶인 면의 노드가 실제로 같은지 확인하고, 충돌이 있으면
+    정렬된 행 전체에 대한 np.unique(axis=0)로 다시 셉니다.
+    """
+    if len(face_nodes) == 0:
+        return np.zeros(0, dtype=bool)
+
+    columns = sorted_face_columns(face_nodes)
+    keys, exact = face_keys(columns, node_count)
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    del keys
+
+    if not exact:
+        representative = np.empty(len(counts), dtype=np.int64)
+        representative[inverse] = np.arange(len(inverse))
+        representative = representative[inverse]
+        if not all(np.array_equal(values, values[representative]) for values in columns):
+            _, inverse, counts = np.unique(np.stack(columns, axis=1), axis=0,
+                                           return_inverse=True, return_counts=True)
+            inverse = inverse.reshape(-1)
+
+    return counts[inverse] == 1
+
+
+@dataclass
+class PartFaces:
+    """Part의 외곽면 (배열 기반)
+
+    반복하면 기존 형식의 (elem_idx, face_indices) 튜플을 돌려줍니다.
+    """
+    # (K,) 요소 인덱스
+    elements: np.ndarray
+    # (K, 4) int8 요소 로컬 노드 인덱스 (삼각형은 4번째 칸 -1)
+    local: np.ndarray
+    # (K, 4) int32 노드 인덱스 (원래 감기 방향, 삼각형은 4번째 칸 -1)
+    nodes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __getitem__(self, index: int) -> Tuple[int, List[int]]:
+        local = self.local[index]
+        return int(self.elements[index]), local[:3 if local[3] < 0 else 4].tolist()
+
+    def __iter__(self):
+        for elem_idx, local in zip(self.elements.tolist(), self.local.tolist()):
+            yield elem_idx, (local if local[3] >= 0 else local[:3])
+
+    @property
+    def triangles(self) -> np.ndarray:
+        """(K,) 삼각형 면 마스크"""
+        return self.nodes[:, 3] < 0
+
+
+def element_face_loops(exterior_faces: Dict[int, PartFaces], elem_idx: int) -> List[np.ndarray]:
+    """요소의 외곽면 노드 인덱스 목록 (면마다 삼각형 3개/사각형 4개, 원래 감기 방향)
+
+    Part별 요소 배열을 벡터 비교하므로 Python 반복은 Part 수만큼입니다.
+    """
+    loops = []
+    for faces in exterior_faces.values():
+        for row in np.flatnonzero(faces.elements == elem_idx):
+            quad = faces.nodes[row]
+            loops.append(quad[:3] if quad[3] < 0 else quad)
+    return loops
+
+
+def map_node_ids(node_ids: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """노드 ID -> 노드 인덱스 (벡터화, 없는 ID는 -1)
+
+    ID가 촘촘하면 (최대-최소 범위 <= 노드 수 x DENSE_LUT_MAX_RATIO) 밀집 조회 테이블,
+    아니면 정렬된 ID에 대한 np.searchsorted를 사용합니다.
+    중복 ID는 마지막 노드를 가리킵니다.
+
+    Returns:
+        query와 같은 shape의 int64 인덱스 배열
+    """
+    node_ids = np.asarray(node_ids, dtype=np.int64)
+    query = np.asarray(query, dtype=np.int64)
+    if len(node_ids) == 0:
+        return np.full(query.shape, -1, dtype=np.int64)
+
+    id_min = int(node_ids.min())
+    span = int(node_ids.max()) - id_min + 1
+
+    if span <= max(len(node_ids) * DENSE_LUT_MAX_RATIO, 1024):
+        lut = np.full(span + 1, -1, dtype=np.int64)   # 마지막 칸: 범위 밖 ID
+        lut[node_ids - id_min] = np.arange(len(node_ids))
+        offset = query - id_min
+        offset[(offset < 0) | (offset >= span)] = span
+        return lut[offset]
+
+    order = np.argsort(node_ids, kind='stable')
+    sorted_ids = node_ids[order]
+    pos = np.searchsorted(sorted_ids, query, side='right') - 1
+    pos_clipped = np.clip(pos, 0, None)
+    found = (pos >= 0) & (sorted_ids[pos_clipped] == query)
+    return np.where(found, order[pos_clipped], -1)
+
+
+def group_by_part(element_pids: np.ndarray) -> Dict[int, np.ndarray]:
+    """Part ID별 요소 인덱스 (argsort + np.unique, Part 내 요소 순서 유지)"""
+    element_pids = np.asarray(element_pids)
+    if len(element_pids) == 0:
+        return {}
+    order = np.argsort(element_pids, kind='stable').astype(np.int32)
+    unique_pids, starts = np.unique(element_pids[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+    return {int(pid): order[start:end] for pid, start, end in zip(unique_pids, starts, ends)}
+
+
+
+
+def classify_cells(etype, connectivity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """요소 키워드 타입 + 노드 목록 -> (셀 타입, 정규화된 (M, 8) 노드 목록)
+
+    LS-DYNA 퇴화 요소 규칙 (0은 빈 노드 칸, 앞 노드로 채움):
+    - Shell: N3 == N4 이면 tri
+    - Solid: N4 == ... == N8 (또는 N3 == N4, N5 == ... == N8) 이면 tet,
+      N5 == N6 및 N7 == N8 (또는 N3 == N4 및 N7 == N8) 이면 penta
+    - 그 밖의 퇴화 hex (예: N5 == ... == N8 pyramid)는 hex로 두고 면 추출 시 중복 노드를 접습니다
+    - Beam: N1, N2 (N3는 방향 노드)
+
+    Args:
+        etype: (M,) 요소 키워드 타입 코드 (0 shell, 1 solid, 2 beam) 또는 'shell'/'solid'/'beam'
+        connectivity: (M, W) 노드 ID (W <= 8)
+
+    Returns:
+        (cell_types int8 (M,), canonical (M, 8)) - 셀의 노드는 canonical[:, :CELL_NODE_COUNTS[type]]
+    """
+    conn = np.asarray(connectivity)
+    if conn.ndim == 1:
+        conn = conn.reshape(len(conn), -1)
+    count, width = conn.shape
+    if isinstance(etype, str):
+        etype = np.full(count, _ETYPE_CODES.get(etype, _ETYPE_SHELL), dtype=np.int8)
+    etype = np.broadcast_to(np.asarray(etype, dtype=np.int8), (count,))
+
+    if count == 0 or width == 0:
+        return np.zeros(count, dtype=np.int8), np.zeros((count, 8), dtype=conn.dtype)
+
+    # 빈 노드 칸(0)은 앞 노드로 채움 -> 일반 퇴화 규칙으로 처리
+    c = np.empty((count, 8), dtype=conn.dtype)
+    c[:, :min(width, 8)] = conn[:, :8]
+    c[:, width:] = 0
+    for k in range(1, 8):
+        c[:, k] = np.where(c[:, k] == 0, c[:, k - 1], c[:, k])
+
+    cell_types = np.full(count, CELL_HEX, dtype=np.int8)
+    canonical = c.copy()
+
+    shell = etype == _ETYPE_SHELL
+    cell_types[shell] = np.where(c[shell, 3] == c[shell, 2], CELL_TRI, CELL_QUAD)
+    cell_types[etype == _ETYPE_BEAM] = CELL_BEAM
+
+    solid = ~shell & (etype != _ETYPE_BEAM)
+    top_collapsed = (c[:, 4] == c[:, 5]) & (c[:, 5] == c[:, 6]) & (c[:, 6] == c[:, 7])
+    tet_a = solid & top_collapsed & (c[:, 3] == c[:, 4])
+    tet_b = solid & top_collapsed & (c[:, 2] == c[:, 3]) & ~tet_a
+    rest = solid & ~top_collapsed
+    penta_a = rest & (c[:, 4] == c[:, 5]) & (c[:, 6] == c[:, 7])
+    penta_b = rest & ~penta_a & (c[:, 2] == c[:, 3]) & (c[:, 6] == c[:, 7])
+
+    cell_types[tet_a | tet_b] = CELL_TET
+    cell_types[penta_a | penta_b] = CELL_PENTA
+    canonical[tet_b, :4] = c[tet_b][:, [0, 1, 2, 4]]
+    # N1 N2 N3 N4 N5 N5 N6 N6: 삼각형 (N1,N2,N5)-(N4,N3,N6)
+    canonical[penta_a, :6] = c[penta_a][:, [0, 1, 4, 3, 2, 6]]
+    canonical[penta_b, :6] = c[penta_b][:, [0, 1, 2, 4, 5, 6]]
+
+    return cell_types, canonical
+
+
+def gather_cells(offsets: np.ndarray, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR에서 여러 셀의 구간 위치를 한 번에 모음
+
+    Returns:
+        (positions, counts): connectivity[positions]가 선택한 셀들의 노드를 이어 붙인 배열
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    starts = offsets[indices]
+    counts = offsets[indices + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64), counts
+    # 셀마다 starts[i], starts[i]+1, ... (repeat + arange)
+    run_starts = np.cumsum(counts) - counts
+    positions = np.arange(total, dtype=np.int64) + np.repeat(starts - run_starts, counts)
+    return positions, counts
+
+
+class CellConnectivity:
+    """CSR 연결성의 요소별 뷰 (기존 mesh.elements 호환)
+
+    elements[i]는 요소 i의 노드 인덱스 배열이고, 슬라이스/배열 인덱싱과
+    np.asarray()는 마지막 노드를 반복해 채운 (k, 최대 노드 수) 2D 배열을 반환합니다.
+    """
+    __slots__ = ('offsets', 'connectivity')
+
+    def __init__(self, offsets: np.ndarray, connectivity: np.ndarray):
+        self.offsets = offsets
+        self.connectivity = connectivity
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"element index {index} out of range")
+            return self.connectivity[self.offsets[index]:self.offsets[index + 1]]
+        return self.padded(np.arange(len(self))[index])
+
+    def __iter__(self):
+        conn = self.connectivity
+        for start, end in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist()):
+            yield conn[start:end]
+
+    def __array__(self, dtype=None, copy=None):
+        arr = self.padded()
+        return arr if dtype is None else arr.astype(dtype)
+
+    def padded(self, indices=None, width: Optional[int] = None) -> np.ndarray:
+        """(k, width) 노드 인덱스 배열 (짧은 셀은 마지막 노드 반복)"""
+        starts = self.offsets[:-1]
+        counts = np.diff(self.offsets)
+        if indices is not None:
+            starts = starts[indices]
+            counts = counts[indices]
+        if width is None:
+            width = int(counts.max()) if len(counts) else 0
+        cols = np.minimum(np.arange(width)[None, :], counts[:, None] - 1)
+        return self.connectivity[starts[:, None] + cols]
+
+    def tolist(self) -> List[List[int]]:
+        return [cell.tolist() for cell in self]
 
 
 @dataclass
@@ -15,13 +395,24 @@ class MeshData:
     """3D 메쉬 데이터
 
     빠른 렌더링을 위해 numpy 배열 사용
+
+    좌표는 모델 원점(origin, float64) 기준 float32 로컬 좌표로 저장합니다.
+    전역 좌표가 큰 모델(예: 차량 mm 좌표 ~5000)도 float32 정밀도를 잃지 않으며,
+    렌더러/피킹/공간 인덱스는 모두 로컬 좌표계에서 동작합니다.
+    사용자에게 보여줄 좌표는 to_world()로 변환합니다.
+
+    요소는 CSR 혼합 토폴로지(offsets/connectivity/cell_types)로 저장하며,
+    elements는 요소별 노드 인덱스를 돌려주는 호환 뷰입니다.
     """
-    # 노드 좌표: (N, 3) array - [x, y, z]
+    # 노드 좌표: (N, 3) float32 array - origin 기준 로컬 [x, y, z]
     nodes: np.ndarray
 
-    # 요소 연결성: (M, 4 or 8) array - node indices
-    # Shell: 4개, Solid: 8개
-    elements: np.ndarray
+    # 요소 i의 노드: connectivity[offsets[i]:offsets[i + 1]]
+    offsets: np.ndarray        # (M + 1,) int64
+    connectivity: np.ndarray   # (offsets[-1],) int32 node indices
+
+    # 요소 셀 타입: (M,) int8 (CELL_BEAM, CELL_TRI, CELL_QUAD, CELL_TET, CELL_PENTA, CELL_HEX)
+    cell_types: np.ndarray
 
     # Part별 요소 인덱스: {part_id: [elem_idx1, elem_idx2, ...]}
     part_elements: Dict[int, np.ndarray]
@@ -29,132 +420,233 @@ class MeshData:
     # Part 정보: {part_id: part_name}
     part_names: Dict[int, str]
 
-    # 요소 타입: 'shell' or 'solid'
-    element_type: str
-
-    # Bounding box: (min_xyz, max_xyz)
+    # Bounding box: (min_xyz, max_xyz) - 로컬 좌표
     bounds: Tuple[np.ndarray, np.ndarray]
 
+    # 모델 원점 (float64, 전역 좌표 = origin + nodes)
+    origin: np.ndarray = field(default_factory=lambda: np.zeros(3))
+
+    _elements: Optional[CellConnectivity] = field(default=None, init=False, repr=False, compare=False)
+    _exterior_faces: Optional[Dict[int, 'PartFaces']] = field(default=None, init=False, repr=False,
+                                                              compare=False)
+
     @property
     def part_ids(self) -> set:
         """Get set of all part IDs"""
         return set(self.part_elements.keys())
 
+    # ========== 요소 토폴로지 ==========
+
+    @property
+    def elements(self) -> CellConnectivity:
+        """요소별 노드 인덱스 뷰 (elements[i] -> 요소 i의 노드 인덱스)"""
+        if self._elements is None:
+            self._elements = CellConnectivity(self.offsets, self.connectivity)
+        return self._elements
+
+    @property
+    def nodes_per_cell(self) -> np.ndarray:
+        """(M,) 요소별 노드 수"""
+        return np.diff(self.offsets)
+
+    @property
+    def element_type(self) -> str:
+        """요소 분류 요약: 'shell', 'solid', 'beam' 또는 'mixed' (표시용)"""
+        present = set(np.unique(self.cell_types).tolist())
+        kinds = [name for name, types in (('shell', SHELL_CELLS), ('solid', SOLID_CELLS),
+                                          ('beam', (CELL_BEAM,)))
+                 if present.intersection(types)]
+        if len(kinds) == 1:
+            return kinds[0]
+        return 'mixed' if kinds else 'shell'
+
+    def type_counts(self) -> Dict[str, int]:
+        """셀 타입별 요소 수 {'hex': n, 'quad': n, ...}"""
+        counts = np.bincount(self.cell_types, minlength=len(CELL_NAMES))
+        return {CELL_NAMES[t]: int(n) for t, n in enumerate(counts) if n}
+
+    def cell_name(self, elem_idx: int) -> str:
+        """요소 셀 타입 이름 ('hex', 'quad', 'beam', ...)"""
+        return CELL_NAMES[int(self.cell_types[elem_idx])]
+
+    def cell_nodes(self, indices) -> np.ndarray:
+        """여러 요소의 노드 인덱스를 이어 붙인 배열 (중복 포함)"""
+        positions, _ = gather_cells(self.offsets, indices)
+        return self.connectivity[positions]
+
+    def beam_lines(self, part_id: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Beam 요소 선분
+
+        Returns:
+            (elem_indices (K,), node_indices (K, 2))
+        """
+        beam = self.cell_types == CELL_BEAM
+        if part_id is None:
+            elem_indices = np.flatnonzero(beam)
+        else:
+            elem_indices = np.asarray(self.part_elements.get(part_id, ()), dtype=np.int64)
+            elem_indices = elem_indices[beam[elem_indices]]
+        starts = self.offsets[elem_indices]
+        return elem_indices, self.connectivity[starts[:, None] + np.arange(2)]
+
+    # ========== 좌표계 변환 ==========
+
+    def to_world(self, points) -> np.ndarray:
+        """로컬 좌표 -> 전역 좌표 (float64)"""
+        return np.asarray(points, dtype=np.float64) + self.origin
+
+    def to_local(self, points) -> np.ndarray:
+        """전역 좌표 -> 로컬 좌표 (float32)"""
+        return (np.asarray(points, dtype=np.float64) - self.origin).astype(np.float32)
+
+    def world_nodes(self, indices=None) -> np.ndarray:
+        """노드 전역 좌표 (float64, indices가 없으면 전체)"""
+        local = self.nodes if indices is None else self.nodes[indices]
+        return self.to_world(local)
+
+    @property
+    def world_bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """전역 좌표 Bounding box"""
+        return self.to_world(self.bounds[0]), self.to_world(self.bounds[1])
+
+    @staticmethod
+    def localize(world_nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """전역 좌표(float64) -> (로컬 float32 좌표, 원점, 로컬 bounds)
+
+        원점은 bbox 중심을 정수로 반올림한 값입니다 (로컬 좌표 크기 최소화).
+        """
+        world_nodes = np.asarray(world_nodes, dtype=np.float64)
+        if len(world_nodes) == 0:
+            return np.zeros((0, 3), dtype=np.float32), np.zeros(3), (np.zeros(3), np.zeros(3))
+
+        world_min = world_nodes.min(axis=0)
+        world_max = world_nodes.max(axis=0)
+        origin = np.round((world_min + world_max) * 0.5)
+        local = (world_nodes - origin).astype(np.float32)
+        return local, origin, (local.min(axis=0), local.max(axis=0))
+
+    @classmethod
+    def empty(cls) -> 'MeshData':
+        """빈 메쉬"""
+        return cls(
+            nodes=np.zeros((0, 3), dtype=np.float32),
+            offsets=np.zeros(1, dtype=np.int64),
+            connectivity=np.zeros(0, dtype=np.int32),
+            cell_types=np.zeros(0, dtype=np.int8),
+            part_elements={},
+            part_names={},
+            bounds=(np.zeros(3), np.zeros(3))
+        )
+
     @classmethod
     def from_parsed_model(cls, model: 'ParsedModelData') -> 'MeshData':
-        """ParsedModelData에서 MeshData 생성
+        """ParsedModelData에서 MeshData 생성 (Shell, Solid, Beam 모두 포함)
 
-        빠른 변환을 위해 최소한의 처리만 수행
+        열 기반 저장소(model.store)가 있으면 저장소 배열을 그대로 사용하고,
+        없으면 노드/요소 객체 목록에서 배열을 만든 뒤 from_arrays()로 처리합니다.
         """
+        store = getattr(model, 'store', None)
+        if store is not None:
+            node_rows = store.nodes.live_rows()
+            if len(node_rows) == 0:
+                return cls.empty()
+
+            # 저장소 행 순서 (파일 순서) 그대로 모든 타입
+            elem_rows = store.elements.live_rows()
+            return cls.from_arrays(
+                node_ids=store.nodes.get('nid', node_rows),
+                world_nodes=store.nodes.get('xyz', node_rows),
+                connectivity=store.elements.get('nodes', elem_rows),
+                element_pids=store.elements.get('pid', elem_rows),
+                element_type=store.elements.get('etype', elem_rows),
+                parts=store.parts,
+            )
+
         # 노드 데이터 추출
         nodes_list = model.nodes if model.nodes else []
         if not nodes_list:
-            # 빈 메쉬
-            return cls(
-                nodes=np.zeros((0, 3), dtype=np.float32),
-                elements=np.zeros((0, 4), dtype=np.int32),
-                part_elements={},
-                part_names={},
-                element_type='shell',
-                bounds=(np.zeros(3), np.zeros(3))
-            )
-
-        # 노드 ID -> 인덱스 매핑 및 좌표 추출 (최적화: 직접 numpy 생성)
-        node_count = len(nodes_list)
-        node_id_to_idx = {}
-        nodes_array = np.empty((node_count, 3), dtype=np.float32)
+            return cls.empty()
 
-        for idx, node in enumerate(nodes_list):
-            node_id = getattr(node, 'nid', idx + 1)
-            node_id_to_idx[node_id] = idx
-            nodes_array[idx, 0] = getattr(node, 'x', 0.0)
-            nodes_array[idx, 1] = getattr(node, 'y', 0.0)
-            nodes_array[idx, 2] = getattr(node, 'z', 0.0)
+        node_ids = np.fromiter((getattr(node, 'nid', idx + 1) for idx, node in enumerate(nodes_list)),
+                               dtype=np.int64, count=len(nodes_list))
+        world_nodes = np.array([(getattr(node, 'x', 0.0), getattr(node, 'y', 0.0), getattr(node, 'z', 0.0))
+                                for node in nodes_list], dtype=np.float64)
 
         # Handle both dict structure (new parser) and legacy list structure
-        elements_list = []
-        elem_type = 'shell'
-        nodes_per_elem = 4
-
         if hasattr(model, 'elements') and isinstance(model.elements, dict):
-            # New parser returns dict: {'shell': [...], 'solid': [...]}
-            elements_list = model.elements.get('solid', [])
-            if elements_list:
-                elem_type = 'solid'
-                nodes_per_elem = 8
-            else:
-                elements_list = model.elements.get('shell', [])
-                elem_type = 'shell'
-                nodes_per_elem = 4
+            # New parser returns dict: {'shell': [...], 'solid': [...], 'beam': [...]}
+            groups = [(name, model.elements.get(name) or []) for name in ('shell', 'solid', 'beam')]
         else:
-            # Legacy structure: model.shells and model.solids as lists
-            elements_list = model.shells if model.shells else []
-            elem_type = 'shell'
-            nodes_per_elem = 4
-
-            # Shell이 없으면 Solid 사용
-            if not elements_list:
-                elements_list = model.solids if model.solids else []
-                elem_type = 'solid'
-                nodes_per_elem = 8
-
-        # 요소 데이터 추출 (최적화: 직접 numpy 생성)
-        elem_count = len(elements_list)
-        elements_array = np.empty((elem_count, nodes_per_elem), dtype=np.int32)
-        part_elem_dict = {}
+            # Legacy structure: model.shells, model.solids, model.beams as lists
+            groups = [(name, getattr(model, attr, None) or [])
+                      for name, attr in (('shell', 'shells'), ('solid', 'solids'), ('beam', 'beams'))]
+
+        elements_list = [elem for _, elems in groups for elem in elems]
+        element_types = np.concatenate([np.full(len(elems), _ETYPE_CODES[name], dtype=np.int8)
+                                        for name, elems in groups])
 
+        # 요소 노드 ID (부족한 노드는 0으로 패딩)
+        connectivity = np.zeros((len(elements_list), 8), dtype=np.int64)
         for elem_idx, elem in enumerate(elements_list):
-            # 노드 리스트 추출
-            if elem_type == 'shell':
-                node_list = getattr(elem, 'nodes', [0, 0, 0, 0])
-            else:  # solid
-                node_list = getattr(elem, 'nodes', [0] * 8)
-
-            # 노드 ID를 인덱스로 변환하여 직접 배열에 저장
-            for i in range(nodes_per_elem):
-                nid = node_list[i] if i < len(node_list) else 0
-                elements_array[elem_idx, i] = node_id_to_idx.get(int(nid), 0)
-
-            # Part ID 추출
-            pid = getattr(elem, 'pid', 0)
-            if pid not in part_elem_dict:
-                part_elem_dict[pid] = []
-            part_elem_dict[pid].append(elem_idx)
-
-        # Part별 요소 인덱스를 numpy 배열로 변환
-        part_elements = {
-            pid: np.array(indices, dtype=np.int32)
-            for pid, indices in part_elem_dict.items()
-        }
+            node_list = list(getattr(elem, 'nodes', ()))[:8]
+            connectivity[elem_idx, :len(node_list)] = node_list
+        element_pids = np.fromiter((getattr(elem, 'pid', 0) for elem in elements_list),
+                                   dtype=np.int64, count=len(elements_list))
+
+        return cls.from_arrays(node_ids, world_nodes, connectivity, element_pids, element_types,
+                               model.parts if model.parts else [])
+
+    @classmethod
+    def from_arrays(cls, node_ids: np.ndarray, world_nodes: np.ndarray,
+                    connectivity: np.ndarray, element_pids: np.ndarray,
+                    element_type='shell', parts=()) -> 'MeshData':
+        """배열에서 MeshData 생성 (벡터화)
 
-        # Part 이름 추출
-        parts_list = model.parts if model.parts else []
+        Args:
+            node_ids: (N,) 노드 ID
+            world_nodes: (N, 3) 전역 좌표
+            connectivity: (M, W) 요소 노드 ID (W <= 8, 빈 칸은 0)
+            element_pids: (M,) 요소 Part ID
+            element_type: 'shell'/'solid'/'beam' 또는 요소별 타입 코드 배열 (0 shell, 1 solid, 2 beam)
+            parts: pid/name 속성을 가진 Part 목록 (이름 표시용)
+        """
+        if len(node_ids) == 0:
+            return cls.empty()
+
+        nodes_array, origin, bounds = cls.localize(world_nodes)
+
+        # 퇴화 요소 분류 (노드 ID 기준) -> CSR
+        cell_types, canonical = classify_cells(element_type, connectivity)
+        counts = CELL_NODE_COUNTS[cell_types]
+        offsets = np.zeros(len(cell_types) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        cell_node_ids = canonical[np.arange(8)[None, :] < counts[:, None]]
+
+        # 노드 ID -> 인덱스 일괄 변환 (없는 노드는 0)
+        indices = map_node_ids(node_ids, cell_node_ids)
+        indices[indices < 0] = 0
+
+        part_elements = group_by_part(element_pids)
+
+        # Part 이름 (없는 경우 기본값)
         part_names = {}
-        for part in parts_list:
+        for part in parts:
             pid = getattr(part, 'pid', 0)
-            name = getattr(part, 'name', f'Part {pid}')
+            name = getattr(part, 'name', '')
             part_names[pid] = name if name else f'Part {pid}'
-
-        # Part 이름이 없는 경우 기본값
-        for pid in part_elements.keys():
+        for pid in part_elements:
             if pid not in part_names:
                 part_names[pid] = f'Part {pid}'
 
-        # Bounding box 계산
-        if len(nodes_array) > 0:
-            min_bounds = nodes_array.min(axis=0)
-            max_bounds = nodes_array.max(axis=0)
-        else:
-            min_bounds = np.zeros(3)
-            max_bounds = np.zeros(3)
-
         return cls(
             nodes=nodes_array,
-            elements=elements_array,
+            offsets=offsets,
+            connectivity=indices.astype(np.int32),
+            cell_types=cell_types,
             part_elements=part_elements,
             part_names=part_names,
-            element_type=elem_type,
-            bounds=(min_bounds, max_bounds)
+            bounds=bounds,
+            origin=origin,
         )
 
     def get_center(self) -> np.ndarray:
@@ -186,62 +678,130 @@ class MeshData:
             return np.concatenate(indices_list)
         return np.array([], dtype=np.int32)
 
-    def extract_exterior_faces(self) -> Dict[int, List[Tuple]]:
-        """외곽면만 추출 (내부 폴리곤 제거)
+    def element_parts(self) -> np.ndarray:
+        """(M,) 요소별 Part ID"""
+        pids = np.zeros(len(self.cell_types), dtype=np.int64)
+        for pid, elem_indices in self.part_elements.items():
+            pids[elem_indices] = pid
+        return pids
 
-        Solid 요소의 경우 인접 요소와 공유하는 면은 내부면이므로 제외
-        Shell 요소는 이미 외곽면이므로 그대로 유지
+    def part_bounds(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Part별 bounding box (로컬 좌표, 요소가 없는 Part는 0)
 
         Returns:
-            {part_id: [(elem_idx, face_indices), ...]}
-            face_indices: Shell은 [0,1,2,3], Hex는 면별 인덱스
+            (part_ids (P,), mins (P, 3), maxs (P, 3))
         """
-        if self.element_type == 'shell':
-            # Shell은 이미 외곽면
-            result = {}
-            for pid, elem_indices in self.part_elements.items():
-                result[pid] = [(idx, [0, 1, 2, 3]) for idx in elem_indices]
-            return result
-
-        # Solid 요소: 면 해싱으로 외곽면 추출
-        # 최적화: elem_idx -> part_id 역매핑 생성
-        elem_to_part = {}
-        for pid, elem_indices in self.part_elements.items():
-            for elem_idx in elem_indices:
-                elem_to_part[int(elem_idx)] = pid
-
-        face_count = {}  # {sorted_face_tuple: count}
-        face_to_elem = {}  # {sorted_face_tuple: (elem_idx, face_idx)}
-
-        hex_faces = [
-            [0, 1, 2, 3],  # Bottom
-            [4, 5, 6, 7],  # Top
-            [0, 1, 5, 4],  # Front
-            [2, 3, 7, 6],  # Back
-            [0, 3, 7, 4],  # Left
-            [1, 2, 6, 5],  # Right
-        ]
-
-        # 모든 면을 해싱
-        for elem_idx, node_indices in enumerate(self.elements):
-            if len(node_indices) != 8:
+        part_ids = np.array(list(self.part_elements.keys()), dtype=np.int64)
+        mins = np.zeros((len(part_ids), 3))
+        maxs = np.zeros((len(part_ids), 3))
+        for i, elem_indices in enumerate(self.part_elements.values()):
+            if len(elem_indices) == 0:
                 continue
-            for face_idx, face_def in enumerate(hex_faces):
-                # 면을 구성하는 노드 인덱스
-                face_nodes = tuple(sorted([node_indices[i] for i in face_def]))
-                face_count[face_nodes] = face_count.get(face_nodes, 0) + 1
-                face_to_elem[face_nodes] = (elem_idx, face_idx)
-
-        # 카운트가 1인 면만 외곽면 (공유되지 않은 면)
-        exterior_faces = {}
-        for face_nodes, count in face_count.items():
-            if count == 1:
-                elem_idx, face_idx = face_to_elem[face_nodes]
-                # Part ID를 O(1)로 찾기
-                pid = elem_to_part.get(elem_idx)
-                if pid is not None:
-                    if pid not in exterior_faces:
-                        exterior_faces[pid] = []
-                    exterior_faces[pid].append((elem_idx, hex_faces[face_idx]))
-
-        return exterior_faces
+            coords = self.nodes[self.cell_nodes(elem_indices)]
+            mins[i] = coords.min(axis=0)
+            maxs[i] = coords.max(axis=0)
+        return part_ids, mins, maxs
+
+    def cell_faces(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """모든 Shell/Solid 요소의 면 (CELL_FACES 기준, 셀 타입별 요소 순서)
+
+        퇴화 면은 연속(순환) 중복 노드를 접어 삼각형으로 만들고, 노드가 3개 미만이면 버립니다.
+
+        Returns:
+            (face_elems (F,) int32, face_ids (F,) uint8, face_nodes (F, 4) int32)
+            face_ids는 FACE_LOCAL 행 (셀 로컬 노드 인덱스), 삼각형은 4번째 칸 -1
+        """
+        elems, ids, nodes = [], [], []
+        for cell_type, type_face_ids in _CELL_FACE_IDS.items():
+            rows = np.flatnonzero(self.cell_types == cell_type).astype(np.int32)
+            if len(rows) == 0:
+                continue
+            count = int(CELL_NODE_COUNTS[cell_type])
+            if len(rows) == len(self.cell_types):
+                cells = self.connectivity.reshape(-1, count)   # 단일 타입: 복사 없음
+            else:
+                cells = self.connectivity[self.offsets[rows][:, None] + np.arange(count)]
+
+            local = FACE_LOCAL[type_face_ids]
+            faces = cells[:, np.where(local >= 0, local, 0)]   # (R, faces, 4)
+            faces[:, local < 0] = -1
+            elems.append(np.repeat(rows, len(type_face_ids)))
+            ids.append(np.tile(type_face_ids, len(rows)))
+            nodes.append(faces.reshape(-1, 4))
+
+        if not elems:
+            return (np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.uint8),
+                    np.zeros((0, 4), dtype=np.int32))
+
+        face_elems = np.concatenate(elems) if len(elems) > 1 else elems[0]
+        face_ids = np.concatenate(ids) if len(ids) > 1 else ids[0]
+        face_nodes = np.concatenate(nodes) if len(nodes) > 1 else nodes[0]
+
+        # 퇴화 면: 앞(순환) 노드와 같은 칸
+        dup = np.empty(face_nodes.shape, dtype=bool)
+        dup[:, 0] = face_nodes[:, 0] == face_nodes[:, 3]
+        dup[:, 1:] = face_nodes[:, 1:] == face_nodes[:, :-1]
+        dup_count = dup.sum(axis=1)
+        if not dup_count.any():
+            return face_elems, face_ids, face_nodes
+
+        # 사각형은 중복 1개까지 삼각형으로 접고, 삼각형은 중복이 있으면 버림
+        collapsible = (dup_count == 1) & (face_nodes[:, 3] >= 0)
+        collapse = np.flatnonzero(collapsible)
+        if len(collapse):
+            kept = ~dup[collapse]
+            face_nodes[collapse, :3] = face_nodes[collapse][kept].reshape(-1, 3)
+            face_nodes[collapse, 3] = -1
+            face_ids[collapse] = _COLLAPSED_FACES[face_ids[collapse], np.argmax(dup[collapse], axis=1)]
+
+        keep = (dup_count == 0) | collapsible
+        return face_elems[keep], face_ids[keep], face_nodes[keep]
+
+    def extract_exterior_faces(self) -> Dict[int, PartFaces]:
+        """외곽면만 추출 (내부 폴리곤 제거, 결과는 메쉬에 캐시)
+
+        Solid 요소(hex/penta/tet)의 경우 인접 요소와 공유하는 면은 내부면이므로 제외
+        Shell 요소(quad/tri)는 이미 외곽면이므로 그대로 유지, Beam은 면이 없음
+
+        Returns:
+            {part_id: PartFaces} - 반복하면 (elem_idx, face_indices) 튜플
+            face_indices: 요소 로컬 노드 인덱스 (quad 4개, tri 3개)
+        """
+        if self._exterior_faces is None:
+            self._exterior_faces = self._extract_exterior_faces()
+        return self._exterior_faces
+
+    def clear_exterior_faces(self):
+        """캐시된 외곽면 해제 (다음 호출 시 다시 추출)"""
+        self._exterior_faces = None
+
+    def set_exterior_faces(self, exterior_faces: Dict[int, PartFaces]):
+        """미리 추출된 외곽면 설정 (예: 디스크 캐시, 같은 메쉬에서 추출한 결과만)"""
+        self._exterior_faces = exterior_faces
+
+    def _extract_exterior_faces(self) -> Dict[int, PartFaces]:
+        face_elems, face_ids, face_nodes = self.cell_faces()
+        if len(face_elems) == 0:
+            return {}
+
+        # Solid 면: 정렬한 노드 행이 한 번만 나오면 외곽면
+        solid = _FACE_IS_SOLID[face_ids]
+        if solid.all():
+            exterior = boundary_faces(face_nodes, len(self.nodes))
+        else:
+            exterior = ~solid
+            if solid.any():
+                exterior[solid] = boundary_faces(face_nodes[solid], len(self.nodes))
+
+        face_rows = np.flatnonzero(exterior)
+        # 요소 순서 (요소 내에서는 면 정의 순서)
+        face_rows = face_rows[np.argsort(face_elems[face_rows], kind='stable')]
+        face_elems = face_elems[face_rows]
+        face_ids = face_ids[face_rows]
+        face_nodes = face_nodes[face_rows]
+
+        return {
+            pid: PartFaces(elements=face_elems[rows], local=FACE_LOCAL[face_ids[rows]],
+                           nodes=face_nodes[rows])
+            for pid, rows in group_by_part(self.element_parts()[face_elems]).items()
+        }
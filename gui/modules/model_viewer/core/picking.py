@@ -7,6 +7,9 @@ from OpenGL.GL import *
 from typing import Optional, Tuple
 import ctypes
 
+# SelectionManager는 GL 없이 쓰도록 selection 모듈로 이동 (기존 import 경로 호환)
+from .selection import SelectionManager
+
 
 class ElementPicker:
     """GPU 기반 Element Picking
@@ -245,47 +248,3 @@ class ElementPicker:
         self._color_texture = None
         self._depth_buffer = None
         self._picking_shader = None
-
-
-class SelectionManager:
-    """선택된 요소 관리
-
-    - 선택/해제
-    - 다중 선택 (Ctrl+Click)
-    - 선택 정보 저장
-    """
-
-    def __init__(self):
-        self._selected_elements = set()  # 선택된 element ID들
-
-    def select(self, element_id: int, multi_select: bool = False):
-        """요소 선택
-
-        Args:
-            element_id: Element ID
-            multi_select: True이면 기존 선택 유지 (Ctrl+Click)
-        """
-        if not multi_select:
-            self._selected_elements.clear()
-
-        if element_id in self._selected_elements:
-            # 이미 선택된 경우 토글
-            self._selected_elements.remove(element_id)
-        else:
-            self._selected_elements.add(element_id)
-
-    def clear(self):
-        """모든 선택 해제"""
-        self._selected_elements.clear()
-
-    def is_selected(self, element_id: int) -> bool:
-        """선택 여부 확인"""
-        return element_id in self._selected_elements
-
-    def get_selected(self) -> set:
-        """선택된 요소 ID 집합 반환"""
-        return self._selected_elements.copy()
-
-    def count(self) -> int:
-        """선택된 요소 개수"""
-        return len(self._selected_elements)
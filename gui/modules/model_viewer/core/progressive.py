@@ -0,0 +1,233 @@
+"""점진적 로드 - 큰 모델의 외곽면 버퍼를 나눠서 만들고 나눠서 업로드
+
+메쉬 설정 한 번에 모든 VBO를 만들고 올리면 그동안 창이 멈추므로:
+- 워커 스레드가 Part 묶음마다 외곽면 조각을 만들어 큐로 전달 (ProgressiveSkinLoader)
+- GL 스레드는 매 프레임 시간 예산 안에서만 묶음 버퍼를 구간씩 업로드 (UploadQueue)
+- 업로드가 끝난 묶음은 바로 그림. 전체 스킨은 묶음을 순서대로 이어 붙인 것과 같으므로
+  (picking ID 포함) 묶음 버퍼가 그대로 전체 스킨의 GPU 버퍼 구간이 됨 (다시 올리지 않음)
+
+GL 없이 동작하는 부분만 둡니다 (GL 버퍼는 렌더러가 만들고 업로드 대상은 duck typing).
+"""
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+from .render_cache import RenderCache, assemble_skin, cached_skin_pieces
+
+# 워커가 한 번에 만드는 면 수 (작은 Part는 묶어서 build_indexed_skin 호출 수를 줄임)
+DEFAULT_BATCH_FACES = 1 << 16
+# glBufferSubData 한 번에 올리는 크기
+DEFAULT_CHUNK_BYTES = 4 << 20
+
+
+def upload_order(part_ids: np.ndarray, mins: np.ndarray, maxs: np.ndarray,
+                 visible_parts: Optional[Set[int]] = None) -> List[int]:
+    """먼저 만들고 올릴 Part 순서 - visible Part 먼저, 그 안에서 bbox가 큰 Part 먼저
+
+    Args:
+        part_ids: (P,) Part ID
+        mins, maxs: (P, 3) Part bbox (MeshData.part_bounds)
+        visible_parts: 표시 중인 Part (None이면 전체)
+    """
+    diagonal = np.linalg.norm(np.asarray(maxs) - np.asarray(mins), axis=1)
+    hidden = np.array([visible_parts is not None and int(pid) not in visible_parts for pid in part_ids],
+                      dtype=bool)
+    order = np.lexsort((-diagonal, hidden))
+    return [int(part_ids[i]) for i in order]
+
+
+def batch_parts(order: List[int], face_counts: Dict[int, int], batch_faces: int) -> List[List[int]]:
+    """순서를 유지하며 면 수가 batch_faces 이상이 되도록 Part를 묶음 (큰 Part는 혼자)"""
+    batches, current, faces = [], [], 0
+    for pid in order:
+        current.append(pid)
+        faces += face_counts[pid]
+        if faces >= batch_faces:
+            batches.append(current)
+            current, faces = [], 0
+    if current:
+        batches.append(current)
+    return batches
+
+
+@dataclass
+class SkinBatch:
+    """워커가 만든 Part 묶음 (바로 업로드해서 그릴 수 있는 독립 스킨)
+
+    정점 인덱스는 묶음 로컬이고, picking ID는 전체 스킨에서의 면 순번입니다.
+    """
+    part_ids: List[int]
+    skin: Any  # IndexedSkin (묶음 Part만)
+    face_count: int
+    vertex_base: int = 0  # 전체 스킨에서 이 묶음의 첫 정점 위치
+
+
+@dataclass
+class LoadedSkin:
+    """워커 완료 결과 - 묶음 순서로 Part를 배치한 전체 스킨 (= SkinBatch 스킨을 이어 붙인 것)"""
+    skin: Any  # IndexedSkin (묶음 Part 순서)
+    signatures: Dict[int, str]
+    built: int  # 새로 만든 Part 수 (나머지는 캐시)
+    extra: Any = None  # finish 콜백 결과 (예: LOD 레벨)
+
+
+class ProgressiveSkinLoader(threading.Thread):
+    """외곽면 스킨을 Part 묶음 단위로 만드는 워커 스레드
+
+    결과는 poll()로 GL 스레드에서 가져갑니다: 묶음마다 SkinBatch, 마지막에 LoadedSkin.
+    취소는 묶음 경계에서 확인하며, 취소된 로더는 더 이상 결과를 내지 않습니다.
+
+    사용 예시:
+        loader = ProgressiveSkinLoader(cache, mesh.nodes, faces, colors, order)
+        loader.start()
+        for result in loader.poll():  # 매 프레임
+            ...
+        loader.cancel()  # 다른 모델 로드 시
+    """
+
+    def __init__(self, cache: RenderCache, nodes: np.ndarray, exterior_faces: Dict[int, Any],
+                 part_colors: Dict[int, tuple], order: List[int],
+                 batch_faces: int = DEFAULT_BATCH_FACES,
+                 finish: Optional[Callable[[Any, Dict[int, str]], Any]] = None):
+        """
+        Args:
+            cache: Part 조각 캐시 (내용이 같은 Part는 다시 만들지 않음)
+            nodes: (N, 3) 노드 좌표 (로컬)
+            exterior_faces: {part_id: PartFaces}
+            part_colors: {part_id: (r, g, b)}
+            order: 만들 Part 순서 (upload_order, 외곽면이 없는 Part는 무시)
+            batch_faces: 묶음 하나의 최소 면 수
+            finish: 전체 스킨 완성 후 워커에서 호출 (skin, signatures) → LoadedSkin.extra
+        """
+        super().__init__(name="progressive-skin", daemon=True)
+        self._cache = cache
+        self._nodes = nodes
+        self._exterior_faces = exterior_faces
+        self._part_colors = part_colors
+        self._finish = finish
+
+        face_counts = {pid: len(faces) for pid, faces in exterior_faces.items()}
+        ordered = [pid for pid in order if pid in face_counts]
+        listed = set(ordered)
+        ordered += [pid for pid in face_counts if pid not in listed]
+        self.batches = batch_parts(ordered, face_counts, batch_faces)
+        self.faces_total = sum(face_counts.values())
+        self.faces_built = 0
+        self.error: Optional[BaseException] = None
+
+        self._results: "queue.Queue" = queue.Queue()
+        self._cancel_event = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """중단 요청 (스레드 안전, 진행 중인 묶음이 끝나면 종료)"""
+        self._cancel_event.set()
+
+    @property
+    def progress(self) -> float:
+        """만든 면 비율 (0-1)"""
+        return self.faces_built / self.faces_total if self.faces_total else 1.0
+
+    def poll(self) -> List[Any]:
+        """지금까지 나온 결과 (SkinBatch / LoadedSkin, 기다리지 않음)"""
+        results = []
+        while True:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                return results
+
+    def run(self):
+        try:
+            pieces, signatures, built = {}, {}, 0
+            vertex_base = 0
+            for part_ids in self.batches:
+                if self.is_cancelled:
+                    return
+                faces = {pid: self._exterior_faces[pid] for pid in part_ids}
+                batch_pieces, batch_signatures, count = cached_skin_pieces(
+                    self._cache, self._nodes, faces, self._part_colors)
+                pieces.update(batch_pieces)
+                signatures.update(batch_signatures)
+                built += count
+
+                face_count = sum(len(f) for f in faces.values())
+                skin = assemble_skin(batch_pieces, faces, first_id=self.faces_built + 1)
+                self._results.put(SkinBatch(part_ids, skin, face_count, vertex_base))
+                self.faces_built += face_count
+                vertex_base += len(skin.vertices)
+
+            if self.is_cancelled:
+                return
+            # 묶음 순서 그대로 합침 - 업로드한 묶음 버퍼를 전체 스킨 구간으로 재사용
+            ordered = {pid: self._exterior_faces[pid] for part_ids in self.batches for pid in part_ids}
+            skin = assemble_skin(pieces, ordered)
+            signatures = {pid: signatures[pid] for pid in ordered}
+            extra = self._finish(skin, signatures) if self._finish is not None else None
+            if not self.is_cancelled:
+                self._results.put(LoadedSkin(skin, signatures, built, extra))
+        except Exception as e:  # GL 스레드에서 error로 확인
+            self.error = e
+
+
+class UploadQueue:
+    """GPU 업로드를 프레임당 시간 예산으로 나눔
+
+    항목은 (tag, buffers)이며 buffer는 remaining (남은 bytes)과 upload(max_bytes) → 올린 bytes를
+    제공합니다. 한 프레임에 최소 한 구간은 올리므로 예산이 작아도 로드는 끝납니다.
+    """
+
+    def __init__(self, chunk_bytes: int = DEFAULT_CHUNK_BYTES, clock: Callable[[], float] = time.perf_counter):
+        self.chunk_bytes = chunk_bytes
+        self._clock = clock
+        self._items: List[tuple] = []
+        self.last_bytes = 0  # 마지막 step에서 올린 bytes
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def pending_bytes(self) -> int:
+        return sum(buf.remaining for _, buffers in self._items for buf in buffers)
+
+    def push(self, tag: Any, buffers: List[Any]):
+        self._items.append((tag, buffers))
+
+    def clear(self) -> List[Any]:
+        """대기 항목 제거 → 제거된 tag 목록"""
+        tags = [tag for tag, _ in self._items]
+        self._items = []
+        return tags
+
+    def step(self, budget_ms: float, priority: Optional[Callable[[Any], int]] = None) -> List[Any]:
+        """예산 안에서 업로드 → 이번에 끝난 항목의 tag 목록
+
+        Args:
+            budget_ms: 이번 프레임 업로드 시간 예산
+            priority: tag → 순위 (작을수록 먼저, 같으면 넣은 순서)
+        """
+        self.last_bytes = 0
+        if not self._items:
+            return []
+        if priority is not None:
+            self._items.sort(key=lambda item: priority(item[0]))
+
+        start = self._clock()
+        done = []
+        while self._items:
+            tag, buffers = self._items[0]
+            for buf in buffers:
+                while buf.remaining > 0:
+                    if self.last_bytes and (self._clock() - start) * 1000 >= budget_ms:
+                        return done
+                    self.last_bytes += buf.upload(self.chunk_bytes)
+            self._items.pop(0)
+            done.append(tag)
+        return done
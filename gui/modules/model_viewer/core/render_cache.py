@@ -2,31 +2,43 @@
 
 VBO 데이터 캐싱 및 부분 업데이트
 """
+import hashlib
+import json
+import threading
 import numpy as np
-from typing import Dict, Set, Optional, Tuple
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Set, Optional, Tuple
+from dataclasses import dataclass, replace
 import time
 
+from core.memory_registry import memory_registry
+
+
+# (part_id, mode, version) - version은 Part 버퍼 내용 해시 (vertex_buffers.part_signature)
+CacheKey = Tuple[int, str, str]
+
 
 @dataclass
 class VBOCache:
-    """VBO 캐시 항목"""
-    vbo_id: int  # OpenGL VBO ID
-    vao_id: int  # OpenGL VAO ID
-    vertex_count: int  # Vertex 개수
-    data_hash: int  # 데이터 해시 (변경 감지)
-    last_used: float  # 마지막 사용 시간
+    """VBO 캐시 항목 (Part 하나, 모드 하나의 버퍼 데이터)"""
+    data: Any  # 업로드할 버퍼 데이터 (예: IndexedSkin 조각)
     memory_size: int  # 메모리 크기 (bytes)
+    release: Optional[Callable[[Any], None]] = None  # 제거 시 호출 (GL 버퍼 삭제 등)
 
 
 class RenderCache:
-    """렌더링 캐시 관리자
+    """Part 단위 GPU 버퍼 캐시
+
+    키는 (part_id, mode, version)이고 version은 Part 버퍼 내용의 해시이므로,
+    모델이 바뀌어도 내용이 같은 Part는 캐시를 그대로 쓰고 바뀐 Part만 다시 만듭니다.
 
     Features:
-    - VBO 재사용
-    - 부분 업데이트
-    - LRU 캐시
-    - 메모리 관리
+    - OrderedDict LRU (조회/삽입/제거 O(1))
+    - 메모리 예산 초과 시 가장 오래 안 쓴 항목부터 제거
+    - (part, mode)마다 최신 version 하나만 유지 (이전 버전은 새 버전 저장 시 제거)
+    - hit/miss/eviction 통계
+    - 스레드 안전 (점진적 로드 워커와 GL 스레드가 함께 사용)
     """
 
     def __init__(self, max_memory_mb: int = 512):
@@ -34,84 +46,212 @@ class RenderCache:
         Args:
             max_memory_mb: 최대 캐시 메모리 (MB)
         """
-        self._cache: Dict[str, VBOCache] = {}
+        self._cache: "OrderedDict[CacheKey, VBOCache]" = OrderedDict()
+        self._versions: Dict[Tuple[int, str], CacheKey] = {}  # (part, mode) → 현재 키
         self._max_memory = max_memory_mb * 1024 * 1024  # bytes
         self._current_memory = 0
+        self._lock = threading.RLock()
+
+        # 통계
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        # 캐시 데이터는 다시 만들 수 있음 - 전역 예산 초과 시 해제 대상
+        memory_registry.register("render_cache", category="gpu",
+                                 size_fn=lambda rc: rc.memory_bytes,
+                                 evict=lambda rc: rc.clear(), owner=self)
 
-    def get(self, key: str) -> Optional[VBOCache]:
-        """캐시 항목 가져오기
+    @property
+    def memory_bytes(self) -> int:
+        """현재 캐시 메모리 (bytes)"""
+        return self._current_memory
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._cache
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """캐시 데이터 가져오기 (가장 최근 사용으로 이동)
 
         Args:
-            key: 캐시 키 (예: "wireframe_part_123")
+            key: (part_id, mode, version)
 
         Returns:
-            캐시 항목 (없으면 None)
+            캐시 데이터 (없으면 None)
         """
-        if key in self._cache:
-            cache = self._cache[key]
-            cache.last_used = time.time()
-            return cache
-        return None
-
-    def put(self, key: str, cache: VBOCache):
-        """캐시 항목 저장
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry.data
+
+    def put(self, key: CacheKey, data: Any, memory_size: int,
+            release: Optional[Callable[[Any], None]] = None):
+        """캐시 데이터 저장
+
+        같은 (part, mode)의 이전 버전은 제거하고, 예산을 넘으면 LRU 항목부터 제거합니다.
+        예산보다 큰 항목 하나는 그대로 저장합니다.
 
         Args:
-            key: 캐시 키
-            cache: 캐시 항목
+            key: (part_id, mode, version)
+            data: 버퍼 데이터
+            memory_size: 크기 (bytes)
+            release: 제거 시 data를 인자로 호출
         """
-        # 기존 항목 제거
-        if key in self._cache:
-            old_cache = self._cache[key]
-            self._current_memory -= old_cache.memory_size
-
-        # 메모리 부족 시 LRU 제거
-        while self._current_memory + cache.memory_size > self._max_memory:
-            self._evict_lru()
-
-        # 저장
-        self._cache[key] = cache
-        self._current_memory += cache.memory_size
+        with self._lock:
+            previous = self._versions.get(key[:2])
+            if previous is not None:
+                self._remove(previous)
+
+            self._cache[key] = VBOCache(data, memory_size, release)
+            self._versions[key[:2]] = key
+            self._current_memory += memory_size
+
+            # 메모리 부족 시 LRU 제거 (방금 넣은 항목은 맨 뒤)
+            while self._current_memory > self._max_memory and len(self._cache) > 1:
+                self._evict_lru()
+
+    def get_or_build(self, key: CacheKey, build: Callable[[], Any],
+                     size: Callable[[Any], int] = lambda data: data.nbytes) -> Any:
+        """캐시 데이터 반환, 없으면 build()로 만들어 저장"""
+        data = self.get(key)
+        if data is None:
+            data = build()
+            self.put(key, data, size(data))
+        return data
+
+    def discard_part(self, part_id: int):
+        """Part의 모든 모드 항목 제거"""
+        with self._lock:
+            for key in [k for k in self._versions.values() if k[0] == part_id]:
+                self._remove(key)
+
+    def _remove(self, key: CacheKey):
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return
+        if self._versions.get(key[:2]) == key:
+            del self._versions[key[:2]]
+        self._current_memory -= entry.memory_size
+        if entry.release is not None:
+            entry.release(entry.data)
 
     def _evict_lru(self):
         """LRU (Least Recently Used) 항목 제거"""
         if not self._cache:
             return
-
-        # 가장 오래 사용하지 않은 항목 찾기
-        lru_key = min(self._cache.keys(), key=lambda k: self._cache[k].last_used)
-        lru_cache = self._cache.pop(lru_key)
-
-        # OpenGL 리소스 삭제
-        from OpenGL.GL import glDeleteBuffers, glDeleteVertexArrays
-        glDeleteBuffers(1, [lru_cache.vbo_id])
-        glDeleteVertexArrays(1, [lru_cache.vao_id])
-
-        self._current_memory -= lru_cache.memory_size
-
-        print(f"[Cache] Evicted LRU: {lru_key} ({lru_cache.memory_size / 1024 / 1024:.1f} MB)")
+        lru_key = next(iter(self._cache))
+        memory_size = self._cache[lru_key].memory_size
+        self._remove(lru_key)
+        self._evictions += 1
+        print(f"[Cache] Evicted LRU: {lru_key[:2]} ({memory_size / 1024 / 1024:.1f} MB)")
 
     def clear(self):
         """모든 캐시 제거"""
-        from OpenGL.GL import glDeleteBuffers, glDeleteVertexArrays
-
-        for cache in self._cache.values():
-            glDeleteBuffers(1, [cache.vbo_id])
-            glDeleteVertexArrays(1, [cache.vao_id])
-
-        self._cache.clear()
-        self._current_memory = 0
+        with self._lock:
+            for key in list(self._cache):
+                self._remove(key)
+            self._current_memory = 0
 
     def get_stats(self) -> Dict:
         """캐시 통계"""
+        lookups = self._hits + self._misses
         return {
             'items': len(self._cache),
             'memory_mb': self._current_memory / 1024 / 1024,
             'max_memory_mb': self._max_memory / 1024 / 1024,
-            'usage_percent': (self._current_memory / self._max_memory) * 100 if self._max_memory > 0 else 0
+            'usage_percent': (self._current_memory / self._max_memory) * 100 if self._max_memory > 0 else 0,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_rate': self._hits / lookups if lookups else 0.0,
+            'evictions': self._evictions,
         }
 
 
+def cached_skin_pieces(cache: RenderCache, nodes: np.ndarray, exterior_faces: Dict[int, Any],
+                       part_colors: Dict[int, tuple]) -> Tuple[Dict[int, Any], Dict[int, str], int]:
+    """Part별 외곽면 조각 (캐시에 없는 Part만 build_indexed_skin 한 번으로 생성)
+
+    Returns:
+        ({part_id: IndexedSkin 조각}, {part_id: 내용 해시}, 새로 만든 Part 수)
+    """
+    from .vertex_buffers import build_indexed_skin, part_signature, split_skin
+
+    signatures = {
+        pid: part_signature(nodes, part_faces.nodes, part_colors.get(pid, (0.7, 0.7, 0.7)))
+        for pid, part_faces in exterior_faces.items()
+    }
+    pieces = {pid: cache.get((pid, 'skin', signature)) for pid, signature in signatures.items()}
+    missing = {pid: exterior_faces[pid] for pid, piece in pieces.items() if piece is None}
+    if missing:
+        built = build_indexed_skin(nodes, missing, part_colors)
+        for pid, piece in zip(missing, split_skin(built)):
+            pieces[pid] = piece
+            cache.put((pid, 'skin', signatures[pid]), piece, piece.nbytes)
+    return pieces, signatures, len(missing)
+
+
+def assemble_skin(pieces: Dict[int, Any], exterior_faces: Dict[int, Any], first_id: int = 1) -> Any:
+    """조각을 exterior_faces의 Part 순서로 합침 (picking ID와 요소 인덱스는 현재 면 순서)
+
+    Args:
+        first_id: 첫 면의 picking ID (더 큰 스킨의 뒷부분이 될 조각이면 그 앞의 면 수 + 1)
+    """
+    from .vertex_buffers import merge_skins
+
+    skin = merge_skins([pieces[pid] for pid in exterior_faces], first_id)
+    face_elements = [f.elements for f in exterior_faces.values()]
+    return replace(skin, pick_elements=np.concatenate([[-1]] + face_elements).astype(np.int64))
+
+
+def cached_skin(cache: RenderCache, nodes: np.ndarray, exterior_faces: Dict[int, Any],
+                part_colors: Dict[int, tuple]) -> Tuple[Any, Dict[int, str], int]:
+    """Part별 외곽면 조각을 캐시에서 모아 IndexedSkin 구성
+
+    캐시에 없는 (새로 생기거나 내용이 바뀐) Part만 build_indexed_skin 한 번으로 만들고,
+    picking ID와 요소 인덱스는 현재 면 순서로 다시 매깁니다.
+
+    Returns:
+        (skin, {part_id: 내용 해시}, 새로 만든 Part 수)
+    """
+    pieces, signatures, built = cached_skin_pieces(cache, nodes, exterior_faces, part_colors)
+    return assemble_skin(pieces, exterior_faces), signatures, built
+
+
+def cached_decimation(cache: RenderCache, skin: Any, signatures: Dict[int, str],
+                      resolution: int, bounds: Tuple[np.ndarray, np.ndarray]) -> Any:
+    """LOD 레벨 (decimate_skin)을 Part별로 캐시
+
+    Vertex clustering은 Part 경계를 넘지 않으므로 같은 격자(resolution, bounds)에서는
+    Part 단위로 단순화해도 전체를 단순화한 결과와 같습니다.
+    """
+    from .lod import decimate_skin
+    from .vertex_buffers import merge_skins, split_skin
+
+    mode = f'lod{resolution}'
+    grid = hashlib.blake2b(np.asarray(bounds, dtype=np.float64).tobytes(), digest_size=8).hexdigest()
+    keys = {int(pid): (int(pid), mode, f'{signatures[pid]}:{grid}') for pid in skin.part_ids}
+    pieces = {pid: cache.get(key) for pid, key in keys.items()}
+    missing = [rank for rank, pid in enumerate(keys) if pieces[pid] is None]
+    if missing:
+        if len(missing) < len(keys):
+            parts = split_skin(skin)
+            source = merge_skins([parts[rank] for rank in missing])
+        else:
+            source = skin
+        for piece in split_skin(decimate_skin(source, resolution, bounds)):
+            pid = int(piece.part_ids[0])
+            pieces[pid] = piece
+            cache.put(keys[pid], piece, piece.nbytes)
+    return merge_skins([pieces[pid] for pid in keys])
+
+
 class PartBatcher:
     """Part별 렌더링 배치 최적화
 
@@ -163,14 +303,30 @@ class PartBatcher:
 class VisibilityOptimizer:
     """가시성 최적화
 
-    - Part별 가시성
-    - Frustum culling 준비
+    - Part별 가시성 (사용자 표시/숨기기)
+    - Frustum culling: Part bounding box가 절두체 밖이면 제외
+    - 작은 Part culling: 화면에 투영된 크기가 min_screen_size 픽셀 미만이면 제외
     - Occlusion culling 준비
+
+    Part bbox는 배열로 보관하여 프레임마다 모든 Part를 한 번에 검사합니다.
     """
 
-    def __init__(self):
+    def __init__(self, min_screen_size: float = 2.0):
+        """
+        Args:
+            min_screen_size: 이보다 작게 투영되는 Part는 제외 (픽셀, 0이면 끔)
+        """
         self._visible_parts: Set[int] = set()
         self._part_bounds: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self.min_screen_size = min_screen_size
+
+        # 검사용 배열 (set_part_bounds 후 다시 생성)
+        self._bound_ids: Optional[np.ndarray] = None
+        self._bound_min: Optional[np.ndarray] = None
+        self._bound_max: Optional[np.ndarray] = None
+
+        # 마지막 culling 통계
+        self.last_stats = {'tested': 0, 'frustum_culled': 0, 'small_culled': 0}
 
     def set_visible_parts(self, part_ids: Set[int]):
         """표시할 Part 설정"""
@@ -179,6 +335,14 @@ class VisibilityOptimizer:
     def set_part_bounds(self, part_id: int, min_bounds: np.ndarray, max_bounds: np.ndarray):
         """Part의 bounding box 설정"""
         self._part_bounds[part_id] = (min_bounds, max_bounds)
+        self._bound_ids = None
+
+    def set_all_part_bounds(self, part_ids: np.ndarray, mins: np.ndarray, maxs: np.ndarray):
+        """모든 Part bounding box 설정 (MeshData.part_bounds() 결과)"""
+        self._part_bounds = {int(pid): (lo, hi) for pid, lo, hi in zip(part_ids, mins, maxs)}
+        self._bound_ids = np.asarray(part_ids, dtype=np.int64)
+        self._bound_min = np.asarray(mins, dtype=np.float64)
+        self._bound_max = np.asarray(maxs, dtype=np.float64)
 
     def get_visible_parts(self) -> Set[int]:
         """표시할 Part ID 집합"""
@@ -188,89 +352,319 @@ class VisibilityOptimizer:
         """Part 가시성 확인"""
         return part_id in self._visible_parts
 
+    def _bounds_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._bound_ids is None:
+            ids = list(self._part_bounds)
+            self._bound_ids = np.array(ids, dtype=np.int64)
+            self._bound_min = np.array([self._part_bounds[pid][0] for pid in ids], dtype=np.float64).reshape(-1, 3)
+            self._bound_max = np.array([self._part_bounds[pid][1] for pid in ids], dtype=np.float64).reshape(-1, 3)
+        return self._bound_ids, self._bound_min, self._bound_max
+
     def frustum_cull(self, frustum_planes: np.ndarray) -> Set[int]:
-        """Frustum culling (향후 구현)
+        """Frustum culling
+
+        bbox에서 각 평면 법선 방향으로 가장 먼 꼭짓점(p-vertex)이 평면 밖이면
+        bbox 전체가 밖에 있으므로 제외합니다 (보수적 판정: 애매하면 표시).
 
         Args:
-            frustum_planes: 6개 평면 방정식
+            frustum_planes: (6, 4) 평면 방정식 (camera.frustum_planes)
 
         Returns:
-            보이는 Part ID 집합
+            보이는 Part ID 집합 (bbox가 없는 Part는 항상 포함)
         """
-        # TODO: Frustum culling 구현
-        # 지금은 모든 visible parts 반환
-        return self._visible_parts.copy()
+        ids, inside = self._frustum_mask(frustum_planes)
+        culled = set(ids[~inside].tolist())
+        self.last_stats = {'tested': len(ids), 'frustum_culled': len(culled), 'small_culled': 0}
+        return self._visible_parts - culled
+
+    def cull(self, view: np.ndarray, projection: np.ndarray, viewport_height: int) -> Set[int]:
+        """Frustum + 작은 Part culling
+
+        Args:
+            view: 4x4 뷰 행렬
+            projection: 4x4 원근 투영 행렬
+            viewport_height: 뷰포트 높이 (픽셀)
+
+        Returns:
+            이번 프레임에 그릴 Part ID 집합
+        """
+        from .camera import frustum_planes
+
+        view = np.asarray(view, dtype=np.float64)
+        projection = np.asarray(projection, dtype=np.float64)
+        ids, inside = self._frustum_mask(frustum_planes(projection @ view))
+        small = np.zeros(len(ids), dtype=bool)
+
+        if self.min_screen_size > 0 and len(ids):
+            # bounding sphere의 화면 투영 지름 (픽셀) = 2r * P[1,1] / depth * (height / 2)
+            center = (self._bound_min + self._bound_max) / 2.0
+            radius = np.linalg.norm(self._bound_max - self._bound_min, axis=1) / 2.0
+            depth = -(center @ view[2, :3] + view[2, 3])
+            # 카메라가 구 안/근처면 크게 보이므로 제외하지 않음
+            near = depth <= radius
+            pixels = radius * projection[1, 1] * viewport_height / np.where(near, 1.0, depth)
+            small = inside & ~near & (pixels < self.min_screen_size)
+
+        frustum_culled = set(ids[~inside].tolist())
+        small_culled = set(ids[small].tolist())
+        self.last_stats = {
+            'tested': len(ids),
+            'frustum_culled': len(frustum_culled & self._visible_parts),
+            'small_culled': len(small_culled & self._visible_parts),
+        }
+        return self._visible_parts - frustum_culled - small_culled
+
+    def _frustum_mask(self, frustum_planes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(part_ids, 절두체와 겹치는지 (P,) bool)"""
+        ids, mins, maxs = self._bounds_arrays()
+        planes = np.asarray(frustum_planes, dtype=np.float64)
+        normals, offsets = planes[:, :3], planes[:, 3]
+
+        # (P, 6, 3) p-vertex
+        p_vertex = np.where(normals[None, :, :] >= 0, maxs[:, None, :], mins[:, None, :])
+        distances = np.einsum('pkj,kj->pk', p_vertex, normals) + offsets
+        return ids, (distances >= 0).all(axis=1)
+
+
+# 프레임 기록 (ring buffer 한 칸)
+FRAME_DTYPE = np.dtype([
+    ('start', 'f8'),           # 모니터 생성 후 경과 시간 (s)
+    ('ms', 'f8'),              # 프레임 시간
+    ('draw_calls', 'i4'),
+    ('triangles', 'i8'),       # 제출한 삼각형 수
+    ('vertices', 'i8'),        # 제출한 정점 수 (선/점)
+    ('parts_tested', 'i4'),
+    ('frustum_culled', 'i4'),
+    ('small_culled', 'i4'),
+])
 
 
 class PerformanceMonitor:
     """렌더링 성능 모니터링
 
-    - FPS 추적
-    - Draw call 카운트
-    - 메모리 사용량
-    - 병목 지점 식별
+    - 프레임 시간 ring buffer (NumPy, 고정 크기) → FPS, 백분위수
+    - Draw call / 제출 삼각형 수
+    - Culling 통계 (frustum / 작은 Part)
+    - 구간 타이밍 (section) 과 버퍼 재생성 시간 (rebuild)
+    - Chrome trace (chrome://tracing, Perfetto) / JSON 내보내기
+
+    구간 시간은 CPU 제출 시간입니다 (GL은 비동기 - GPU 완료까지는 프레임 끝 glFinish 기준).
     """
 
-    def __init__(self):
-        self._frame_times = []
-        self._max_samples = 60  # 1초치 (60 FPS 기준)
+    def __init__(self, max_samples: int = 240, max_events: int = 4096):
+        """
+        Args:
+            max_samples: 보관할 프레임 수 (ring buffer)
+            max_events: 보관할 구간/재생성 이벤트 수
+        """
+        self._origin = time.perf_counter()
+        self._frames = np.zeros(max_samples, dtype=FRAME_DTYPE)
+        self._frame_count = 0  # 누적 프레임 수 (ring 위치 = count % max_samples)
+        self._current = np.zeros(1, dtype=FRAME_DTYPE)[0]
+        self._events = deque(maxlen=max_events)  # (name, category, start_s, dur_ms, frame)
+        self._rebuild_ms: Dict[str, float] = {}
+        self._start_time = None
 
-        self._draw_calls = 0
-        self._vertices_rendered = 0
+    @property
+    def max_samples(self) -> int:
+        return len(self._frames)
 
-        self._start_time = None
+    def _now(self) -> float:
+        return time.perf_counter() - self._origin
 
     def frame_start(self):
         """프레임 시작"""
-        self._start_time = time.time()
-        self._draw_calls = 0
-        self._vertices_rendered = 0
+        self._start_time = self._now()
+        self._current = np.zeros(1, dtype=FRAME_DTYPE)[0]
+        self._current['start'] = self._start_time
 
     def frame_end(self):
-        """프레임 종료"""
-        if self._start_time:
-            frame_time = time.time() - self._start_time
-            self._frame_times.append(frame_time)
-
-            # 최대 샘플 수 유지
-            if len(self._frame_times) > self._max_samples:
-                self._frame_times.pop(0)
+        """프레임 종료 → ring buffer 기록"""
+        if self._start_time is None:
+            return
+        self._current['ms'] = (self._now() - self._start_time) * 1000
+        self._frames[self._frame_count % len(self._frames)] = self._current
+        self._frame_count += 1
+        self._start_time = None
 
-    def record_draw_call(self, vertex_count: int):
+    def record_draw_call(self, vertex_count: int = 0, triangles: int = 0, calls: int = 1):
         """Draw call 기록
 
         Args:
-            vertex_count: 렌더링된 vertex 수
+            vertex_count: 렌더링된 vertex 수 (선/점)
+            triangles: 렌더링된 삼각형 수
+            calls: GL draw 호출 수 (glMultiDrawElements는 1)
         """
-        self._draw_calls += 1
-        self._vertices_rendered += vertex_count
+        self._current['draw_calls'] += calls
+        self._current['vertices'] += vertex_count
+        self._current['triangles'] += triangles
+
+    def record_culling(self, tested: int, frustum_culled: int, small_culled: int):
+        """Part culling 결과 기록
+
+        Args:
+            tested: 검사한 Part 수
+            frustum_culled: 절두체 밖으로 제외된 Part 수
+            small_culled: 화면에서 너무 작아 제외된 Part 수
+        """
+        self._current['parts_tested'] = tested
+        self._current['frustum_culled'] = frustum_culled
+        self._current['small_culled'] = small_culled
+
+    @contextmanager
+    def section(self, name: str, category: str = 'render'):
+        """구간 시간 기록 (trace 이벤트)
+
+        사용 예시:
+            with monitor.section('solid'):
+                draw_solid()
+        """
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._events.append((name, category, start, (self._now() - start) * 1000, self._frame_count))
+
+    @contextmanager
+    def rebuild(self, name: str):
+        """버퍼 재생성 시간 기록 (HUD에 마지막 값 표시, trace 이벤트)"""
+        start = self._now()
+        try:
+            yield
+        finally:
+            ms = (self._now() - start) * 1000
+            self._rebuild_ms[name] = ms
+            self._events.append((name, 'rebuild', start, ms, self._frame_count))
+
+    def frames(self) -> np.ndarray:
+        """보관 중인 프레임 기록 (오래된 순, FRAME_DTYPE)"""
+        size = len(self._frames)
+        if self._frame_count <= size:
+            return self._frames[:self._frame_count].copy()
+        split = self._frame_count % size
+        return np.concatenate([self._frames[split:], self._frames[:split]])
+
+    def _frame_times(self) -> np.ndarray:
+        return self._frames['ms'][:min(self._frame_count, len(self._frames))]
 
     def get_fps(self) -> float:
-        """현재 FPS"""
-        if not self._frame_times:
-            return 0.0
+        """현재 FPS (보관 중인 프레임 평균)"""
+        avg = self.get_avg_frame_time()
+        return 1000.0 / avg if avg > 0 else 0.0
 
-        avg_time = sum(self._frame_times) / len(self._frame_times)
-        return 1.0 / avg_time if avg_time > 0 else 0.0
+    def get_last_frame_time(self) -> float:
+        """마지막 프레임 시간 (ms)"""
+        if self._frame_count == 0:
+            return 0.0
+        return float(self._frames['ms'][(self._frame_count - 1) % len(self._frames)])
 
     def get_avg_frame_time(self) -> float:
         """평균 프레임 시간 (ms)"""
-        if not self._frame_times:
-            return 0.0
+        times = self._frame_times()
+        return float(times.mean()) if len(times) else 0.0
 
-        return (sum(self._frame_times) / len(self._frame_times)) * 1000
+    def get_frame_percentiles(self, percentiles=(50, 95, 99)) -> Dict[str, float]:
+        """프레임 시간 백분위수 (ms) {'p50': ..., 'p95': ..., 'p99': ...}"""
+        times = self._frame_times()
+        values = np.percentile(times, percentiles) if len(times) else np.zeros(len(percentiles))
+        return {f'p{p}': float(v) for p, v in zip(percentiles, values)}
 
     def get_stats(self) -> Dict:
-        """성능 통계"""
-        return {
+        """성능 통계 (카운터는 진행 중이거나 마지막으로 끝난 프레임 기준)"""
+        last = self._current
+        stats = {
             'fps': self.get_fps(),
             'avg_frame_time_ms': self.get_avg_frame_time(),
-            'draw_calls': self._draw_calls,
-            'vertices': self._vertices_rendered,
+            'last_frame_time_ms': self.get_last_frame_time(),
+            'frames': self._frame_count,
+            'draw_calls': int(last['draw_calls']),
+            'triangles': int(last['triangles']),
+            'vertices': int(last['vertices']),
+            'parts_tested': int(last['parts_tested']),
+            'frustum_culled': int(last['frustum_culled']),
+            'small_culled': int(last['small_culled']),
+            'rebuild_ms': dict(self._rebuild_ms),
         }
+        stats.update({f'{k}_ms': v for k, v in self.get_frame_percentiles().items()})
+        return stats
+
+    def export_trace(self, path: str, stats: Optional[Dict] = None):
+        """프레임 기록을 파일로 내보내기 (성능 버그 리포트 첨부용)
+
+        - *.json: Chrome trace 형식 (chrome://tracing, https://ui.perfetto.dev 에서 열기)
+          프레임/구간/재생성은 완료 이벤트(X), 프레임 카운터는 카운터 이벤트(C)
+        - otherData에 요약 통계 (stats, 렌더러 get_stats 등)
+
+        Args:
+            path: 저장 경로
+            stats: 함께 기록할 통계 (None이면 get_stats())
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(stats), f, default=_json_default)
+
+    def chrome_trace(self, stats: Optional[Dict] = None) -> Dict:
+        """Chrome trace 이벤트 형식 (dict) - 시간 단위 us"""
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': 'Model Viewer'}},
+                  {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1, 'args': {'name': 'render'}}]
+        first = self._frame_count - min(self._frame_count, len(self._frames))
+        for index, frame in enumerate(self.frames(), start=first):
+            ts = frame['start'] * 1e6
+            args = {name: frame[name].item() for name in FRAME_DTYPE.names if name not in ('start', 'ms')}
+            events.append({'name': 'frame', 'cat': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1,
+                           'ts': ts, 'dur': frame['ms'] * 1000, 'args': dict(args, frame=index)})
+            events.append({'name': 'frame stats', 'ph': 'C', 'pid': 1, 'ts': ts,
+                           'args': {'ms': frame['ms'], 'draw_calls': args['draw_calls'],
+                                    'triangles': args['triangles']}})
+        for name, category, start, ms, frame in self._events:
+            events.append({'name': name, 'cat': category, 'ph': 'X', 'pid': 1, 'tid': 1,
+                           'ts': start * 1e6, 'dur': ms * 1000, 'args': {'frame': frame}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': stats if stats is not None else self.get_stats()}
 
     def reset(self):
         """통계 리셋"""
-        self._frame_times.clear()
-        self._draw_calls = 0
-        self._vertices_rendered = 0
+        self._frames[:] = 0
+        self._frame_count = 0
+        self._current = np.zeros(1, dtype=FRAME_DTYPE)[0]
+        self._events.clear()
+        self._rebuild_ms.clear()
+        self._start_time = None
+
+
+def _json_default(value):
+    """NumPy 값 → JSON"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def format_hud(stats: Dict) -> List[str]:
+    """렌더러 통계 (get_stats) → HUD 문자열 줄
+
+    Args:
+        stats: VBORenderer.get_stats() 형식 (없는 항목은 생략)
+    """
+    lines = []
+    if 'fps' in stats:
+        lines.append(f"{stats['fps']:.0f} FPS  frame {stats.get('last_frame_time_ms', 0.0):.1f} ms  "
+                     f"p50 {stats.get('p50_ms', 0.0):.1f}  p95 {stats.get('p95_ms', 0.0):.1f}  "
+                     f"p99 {stats.get('p99_ms', 0.0):.1f}")
+    if 'draw_calls' in stats:
+        lines.append(f"draws {stats['draw_calls']}  triangles {stats.get('triangles', 0):,}  "
+                     f"vertices {stats.get('vertices', 0):,}")
+    if 'parts_tested' in stats:
+        lines.append(f"parts drawn {stats.get('drawn_parts', 0)}/{stats['parts_tested']}  culled "
+                     f"frustum {stats.get('frustum_culled', 0)}  small {stats.get('small_culled', 0)}"
+                     + (f"  LOD {stats['lod_level']}" if stats.get('lod_level') else ""))
+    if 'gpu_bytes' in stats:
+        cache = stats.get('cache', {})
+        line = f"VBO {stats['gpu_bytes'] / (1024 * 1024):.1f} MB"
+        if cache:
+            line += f"  cache hit {cache.get('hit_rate', 0.0) * 100:.0f}%"
+        lines.append(line)
+    rebuilds = stats.get('rebuild_ms')
+    if rebuilds:
+        lines.append("rebuild " + "  ".join(f"{name} {ms:.0f} ms" for name, ms in rebuilds.items()))
+    return lines
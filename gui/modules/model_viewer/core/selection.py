@@ -0,0 +1,429 @@
+"""영역 선택 (Box / Lasso) - GL 불필요
+
+현재 카메라로 면 중심/노드를 화면에 투영하고, 선택 영역 (사각형 또는 자유 곡선 다각형)
+안에 드는지 벡터화 point-in-polygon으로 판정합니다.
+
+- 앞면만 선택 (front_only): 외곽면을 저해상도 깊이 버퍼에 래스터화해 가려진 점 제외
+- 선택 모드: 교체 / 추가 / 제외
+- 대상: 요소 / 노드 / Part (선택 결과는 정렬된 NumPy 인덱스 배열)
+
+사용 예시:
+    selector = RegionSelector(mesh, mesh.extract_exterior_faces())
+    polygon = rectangle_polygon(x0, y0, x1, y1)
+    indices = selector.select(polygon, view, proj, width, height, target=ELEMENTS)
+    selection.apply(indices, ADD)
+"""
+from typing import Dict, Optional, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from .vertex_buffers import sorted_unique
+
+if TYPE_CHECKING:
+    from .mesh_data import MeshData, PartFaces
+
+# 선택 모드
+REPLACE = 'replace'
+ADD = 'add'
+SUBTRACT = 'subtract'
+
+# 선택 대상
+ELEMENTS = 'elements'
+NODES = 'nodes'
+PARTS = 'parts'
+
+# 깊이 버퍼 래스터화 한 번에 처리할 최대 픽셀 샘플 수
+_RASTER_CHUNK = 1 << 22
+
+
+def project_points(points: np.ndarray, view: np.ndarray, proj: np.ndarray,
+                   width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """로컬 좌표 → 윈도우 좌표
+
+    Args:
+        points: (N, 3) 좌표
+        view, proj: 4x4 뷰/투영 행렬
+        width, height: 뷰포트 크기
+
+    Returns:
+        (xy (N, 2) 윈도우 좌표 (top-down), depth (N,) 카메라 앞 거리 - 0 이하는 카메라 뒤)
+    """
+    view = np.asarray(view, dtype=np.float64)
+    proj = np.asarray(proj, dtype=np.float64)
+    eye = np.asarray(points, dtype=np.float64) @ view[:3, :3].T + view[:3, 3]
+    clip = eye @ proj[:, :3].T + proj[:, 3]
+    depth = -eye[:, 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ndc = clip[:, :2] / clip[:, 3:4]
+    xy = np.empty((len(eye), 2))
+    xy[:, 0] = (ndc[:, 0] + 1.0) * 0.5 * width
+    xy[:, 1] = (1.0 - ndc[:, 1]) * 0.5 * height
+    return xy, depth
+
+
+def rectangle_polygon(x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+    """두 모서리 → (4, 2) 사각형 다각형"""
+    return np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], dtype=np.float64)
+
+
+def points_in_polygon(xy: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """점이 다각형 안에 있는지 (even-odd 규칙, 자기 교차 lasso 허용)
+
+    다각형 bbox 밖의 점은 먼저 제외하고, 남은 점을 y로 정렬해 변마다 y 범위 안의 점에만
+    교차 여부를 누적합니다.
+
+    Args:
+        xy: (N, 2) 점
+        polygon: (K, 2) 꼭짓점 (닫지 않아도 됨)
+
+    Returns:
+        (N,) bool
+    """
+    polygon = np.asarray(polygon, dtype=np.float64)
+    inside = np.zeros(len(xy), dtype=bool)
+    if len(polygon) < 3 or len(xy) == 0:
+        return inside
+    lo, hi = polygon.min(axis=0), polygon.max(axis=0)
+    candidates = np.flatnonzero((xy[:, 0] >= lo[0]) & (xy[:, 0] <= hi[0])
+                                & (xy[:, 1] >= lo[1]) & (xy[:, 1] <= hi[1]))
+    if len(candidates) == 0:
+        return inside
+    if len(polygon) == 4 and _is_axis_aligned(polygon):
+        inside[candidates] = True
+        return inside
+
+    # y 정렬 → 변마다 y 범위에 드는 점만 검사 (점마다 평균 교차 변 수만큼만 계산)
+    order = np.argsort(xy[candidates, 1], kind='stable')
+    candidates = candidates[order]
+    px, py = xy[candidates, 0], xy[candidates, 1]
+    crossings = np.zeros(len(candidates), dtype=bool)
+    for (ax, ay), (bx, by) in zip(polygon, np.roll(polygon, -1, axis=0)):
+        if ay == by:
+            continue
+        # (ay > py) != (by > py) ⇔ min(ay, by) <= py < max(ay, by)
+        i0, i1 = np.searchsorted(py, [min(ay, by), max(ay, by)], side='left')
+        if i0 == i1:
+            continue
+        x_cross = ax + (py[i0:i1] - ay) * (bx - ax) / (by - ay)
+        crossings[i0:i1] ^= px[i0:i1] < x_cross
+    inside[candidates] = crossings
+    return inside
+
+
+def _is_axis_aligned(polygon: np.ndarray) -> bool:
+    """rectangle_polygon 형태의 사각형인지"""
+    x, y = polygon[:, 0], polygon[:, 1]
+    return x[0] == x[3] and x[1] == x[2] and y[0] == y[1] and y[2] == y[3]
+
+
+class DepthBuffer:
+    """저해상도 깊이 버퍼 (외곽면 CPU 래스터화)
+
+    픽셀마다 가장 가까운 면의 카메라 거리를 저장합니다. 삼각형은 픽셀 중심에서 1/거리를
+    선형 보간하고 (원근 보정), 픽셀 중심을 덮지 못하는 작은 삼각형은 꼭짓점/중심을 찍어 채웁니다.
+    카메라 뒤로 넘어가는 삼각형은 생략합니다.
+    """
+
+    def __init__(self, nodes: np.ndarray, face_nodes: np.ndarray, view: np.ndarray, proj: np.ndarray,
+                 width: int, height: int, resolution: int = 256, tolerance: float = 2.0):
+        """
+        Args:
+            nodes: (N, 3) 노드 좌표
+            face_nodes: (F, 4) 외곽면 노드 (삼각형은 4번째 -1)
+            view, proj: 카메라 행렬
+            width, height: 뷰포트 크기
+            resolution: 버퍼 긴 변 픽셀 수
+            tolerance: 가림 판정 여유 (버퍼 픽셀 크기 배수)
+        """
+        self.scale = resolution / max(width, height, 1)
+        self.width = max(int(np.ceil(width * self.scale)), 1)
+        self.height = max(int(np.ceil(height * self.scale)), 1)
+        # 거리 d에서 버퍼 픽셀 하나의 월드 크기 = d * pixel_size
+        self.pixel_size = 2.0 / (float(proj[1, 1]) * self.height)
+        self.tolerance = tolerance
+        self.depth = np.full(self.width * self.height, np.inf)
+
+        if len(face_nodes) == 0:
+            return
+        # 외곽면에 쓰인 노드만 투영
+        used = np.zeros(len(nodes), dtype=bool)
+        used[face_nodes[face_nodes >= 0]] = True
+        used_nodes = np.flatnonzero(used)
+        remap = np.cumsum(used) - 1
+        xy, depth = project_points(nodes[used_nodes], view, proj, width, height)
+        self._x, self._y, self._d = xy[:, 0] * self.scale, xy[:, 1] * self.scale, depth
+
+        # 사각형은 (0, 1, 2), (0, 2, 3) 삼각형
+        quads = face_nodes[:, 3] >= 0
+        triangles = remap[np.concatenate([face_nodes[:, :3], face_nodes[quads][:, [0, 2, 3]]])]
+        a, b, c = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+        front = (depth[a] > 0) & (depth[b] > 0) & (depth[c] > 0)
+        a, b, c = a[front], b[front], c[front]
+        self._rasterize(a, b, c)
+
+        # 작은 삼각형 보완: 꼭짓점, 중심
+        front = depth > 0
+        self._splat(self._x[front], self._y[front], depth[front])
+        self._splat((self._x[a] + self._x[b] + self._x[c]) / 3, (self._y[a] + self._y[b] + self._y[c]) / 3,
+                    3.0 / (1.0 / depth[a] + 1.0 / depth[b] + 1.0 / depth[c]))
+        del self._x, self._y, self._d
+
+    def _splat(self, x: np.ndarray, y: np.ndarray, depth: np.ndarray):
+        """점 하나씩 해당 픽셀에 기록"""
+        px = np.floor(x).astype(np.int64)
+        py = np.floor(y).astype(np.int64)
+        on_screen = (px >= 0) & (px < self.width) & (py >= 0) & (py < self.height)
+        np.minimum.at(self.depth, py[on_screen] * self.width + px[on_screen], depth[on_screen])
+
+    def _rasterize(self, a: np.ndarray, b: np.ndarray, c: np.ndarray):
+        """삼각형 (꼭짓점 a, b, c) → 덮는 픽셀 중심에 깊이 기록"""
+        x, y = self._x, self._y
+        xa, xb, xc, ya, yb, yc = x[a], x[b], x[c], y[a], y[b], y[c]
+        x0 = np.clip(np.ceil(np.minimum(np.minimum(xa, xb), xc) - 0.5), 0, self.width).astype(np.int64)
+        x1 = np.clip(np.floor(np.maximum(np.maximum(xa, xb), xc) - 0.5) + 1, 0, self.width).astype(np.int64)
+        y0 = np.clip(np.ceil(np.minimum(np.minimum(ya, yb), yc) - 0.5), 0, self.height).astype(np.int64)
+        y1 = np.clip(np.floor(np.maximum(np.maximum(ya, yb), yc) - 0.5) + 1, 0, self.height).astype(np.int64)
+        nx = np.maximum(x1 - x0, 0)
+        sizes = nx * np.maximum(y1 - y0, 0)
+        covering = np.flatnonzero(sizes > 0)
+        if len(covering) == 0:
+            return
+
+        # 샘플 수 기준으로 나눠 처리 (큰 삼각형이 많을 때 메모리 제한)
+        ends = np.cumsum(sizes[covering])
+        bounds = np.searchsorted(ends, np.arange(_RASTER_CHUNK, ends[-1], _RASTER_CHUNK), side='right')
+        for chunk in np.split(covering, bounds):
+            if len(chunk):
+                self._rasterize_chunk(a[chunk], b[chunk], c[chunk], x0[chunk], y0[chunk], nx[chunk], sizes[chunk])
+
+    def _rasterize_chunk(self, a, b, c, x0, y0, nx, sizes):
+        tri = np.repeat(np.arange(len(sizes)), sizes)
+        k = np.arange(len(tri)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        px = x0[tri] + k % nx[tri]
+        py = y0[tri] + k // nx[tri]
+        cx, cy = px + 0.5, py + 0.5
+
+        a, b, c = a[tri], b[tri], c[tri]
+        x, y = self._x, self._y
+        xa, xb, xc, ya, yb, yc = x[a], x[b], x[c], y[a], y[b], y[c]
+        area = (xb - xa) * (yc - ya) - (yb - ya) * (xc - xa)
+        w0 = (xb - cx) * (yc - cy) - (yb - cy) * (xc - cx)
+        w1 = (xc - cx) * (ya - cy) - (yc - cy) * (xa - cx)
+        w2 = area - w0 - w1
+        # 감기 방향과 무관하게 (양면) 안쪽 판정
+        sign = np.where(area < 0, -1.0, 1.0)
+        inside = (area != 0) & (w0 * sign >= 0) & (w1 * sign >= 0) & (w2 * sign >= 0)
+        if not inside.any():
+            return
+        d = self._d
+        a, b, c, w0, w1, w2 = a[inside], b[inside], c[inside], w0[inside], w1[inside], w2[inside]
+        inv_depth = (w0 / d[a] + w1 / d[b] + w2 / d[c]) / area[inside]
+        np.minimum.at(self.depth, py[inside] * self.width + px[inside], 1.0 / inv_depth)
+
+    def visible(self, xy: np.ndarray, depth: np.ndarray) -> np.ndarray:
+        """윈도우 좌표/거리의 점이 가려지지 않았는지
+
+        Args:
+            xy: (N, 2) 윈도우 좌표 (project_points 결과)
+            depth: (N,) 카메라 거리
+
+        Returns:
+            (N,) bool (화면 밖 또는 카메라 뒤는 False)
+        """
+        px = np.floor(xy[:, 0] * self.scale).astype(np.int64)
+        py = np.floor(xy[:, 1] * self.scale).astype(np.int64)
+        on_screen = (depth > 0) & (px >= 0) & (px < self.width) & (py >= 0) & (py < self.height)
+        visible = np.zeros(len(xy), dtype=bool)
+        pixel = py[on_screen] * self.width + px[on_screen]
+        point_depth = depth[on_screen]
+        visible[on_screen] = point_depth <= self.depth[pixel] + self.tolerance * self.pixel_size * point_depth
+        return visible
+
+
+class RegionSelector:
+    """메쉬 요소/노드/Part 영역 선택
+
+    선택 후보 (메쉬가 바뀔 때까지 재사용):
+    - 앞면만: 외곽면 중심 (→ 요소), 외곽면 노드, Beam 중심/노드 - 깊이 버퍼로 가림 판정
+    - 관통: 모든 요소 중심, 요소에 쓰인 모든 노드
+    """
+
+    def __init__(self, mesh: 'MeshData', exterior_faces: Dict[int, 'PartFaces']):
+        self._mesh = mesh
+        self._element_parts = mesh.element_parts()
+        if exterior_faces:
+            self._face_nodes = np.concatenate([f.nodes for f in exterior_faces.values()])
+            self._face_elements = np.concatenate([f.elements for f in exterior_faces.values()]).astype(np.int64)
+        else:
+            self._face_nodes = np.zeros((0, 4), dtype=np.int32)
+            self._face_elements = np.zeros(0, dtype=np.int64)
+        closed = np.where(self._face_nodes < 0, self._face_nodes[:, :1], self._face_nodes)
+        corners = mesh.nodes[closed].astype(np.float64)
+        counts = np.where(self._face_nodes[:, 3] < 0, 3, 4)
+        # 삼각형은 첫 노드가 한 번 더 들어가므로 빼고 평균
+        self._face_centers = (corners.sum(axis=1) - np.where(counts == 3, 1, 0)[:, None] * corners[:, 0]) \
+            / counts[:, None]
+
+        self._beams, beam_nodes = mesh.beam_lines()
+        self._beam_nodes = beam_nodes.astype(np.int64)
+        self._beam_centers = mesh.nodes[beam_nodes].astype(np.float64).mean(axis=1) if len(beam_nodes) \
+            else np.zeros((0, 3))
+        self._element_centers = None
+
+    @property
+    def element_centers(self) -> np.ndarray:
+        """(M, 3) 요소 중심 (노드 평균, 처음 사용할 때 계산)"""
+        if self._element_centers is None:
+            mesh = self._mesh
+            counts = mesh.nodes_per_cell
+            sums = np.add.reduceat(mesh.nodes[mesh.connectivity].astype(np.float64), mesh.offsets[:-1], axis=0) \
+                if len(counts) else np.zeros((0, 3))
+            self._element_centers = sums / np.maximum(counts, 1)[:, None]
+        return self._element_centers
+
+    def depth_buffer(self, view: np.ndarray, proj: np.ndarray, width: int, height: int,
+                     visible_parts: Optional[Set[int]] = None, resolution: int = 256) -> DepthBuffer:
+        """표시 중인 Part의 외곽면 깊이 버퍼"""
+        face_nodes = self._face_nodes
+        if visible_parts is not None:
+            face_nodes = face_nodes[self._visible_mask(self._face_elements, visible_parts)]
+        return DepthBuffer(self._mesh.nodes, face_nodes, view, proj, width, height, resolution)
+
+    def select(self, polygon: np.ndarray, view: np.ndarray, proj: np.ndarray, width: int, height: int,
+               target: str = ELEMENTS, front_only: bool = True,
+               visible_parts: Optional[Set[int]] = None) -> np.ndarray:
+        """영역 안의 요소/노드/Part
+
+        Args:
+            polygon: (K, 2) 윈도우 좌표 다각형 (box는 rectangle_polygon)
+            view, proj: 카메라 행렬
+            width, height: 뷰포트 크기
+            target: ELEMENTS, NODES, PARTS
+            front_only: 가려진 것 제외 (False면 뒤쪽/내부 요소까지 관통 선택)
+            visible_parts: 표시 중인 Part (None이면 전체)
+
+        Returns:
+            정렬된 고유 인덱스 (요소/노드 인덱스 또는 Part ID)
+        """
+        if target not in (ELEMENTS, NODES, PARTS):
+            raise ValueError(f"Unknown selection target: {target}")
+        depth_buffer = self.depth_buffer(view, proj, width, height, visible_parts) if front_only else None
+
+        if target == NODES:
+            if front_only:
+                nodes = np.concatenate([self._face_nodes[self._visible_mask(self._face_elements, visible_parts)]
+                                        .ravel(),
+                                        self._beam_nodes[self._visible_mask(self._beams, visible_parts)].ravel()])
+                nodes = sorted_unique(nodes[nodes >= 0])
+            else:
+                elements = self._visible_elements(visible_parts)
+                nodes = sorted_unique(self._mesh.cell_nodes(elements).astype(np.int64))
+            inside = self._inside(self._mesh.nodes[nodes], polygon, view, proj, width, height, depth_buffer)
+            return nodes[inside]
+
+        if front_only:
+            faces = self._visible_mask(self._face_elements, visible_parts)
+            beams = self._visible_mask(self._beams, visible_parts)
+            elements = np.concatenate([self._face_elements[faces], self._beams[beams]])
+            centers = np.concatenate([self._face_centers[faces], self._beam_centers[beams]])
+        else:
+            elements = self._visible_elements(visible_parts)
+            centers = self.element_centers[elements]
+        inside = self._inside(centers, polygon, view, proj, width, height, depth_buffer)
+        selected = sorted_unique(elements[inside])
+        if target == PARTS:
+            return sorted_unique(self._element_parts[selected])
+        return selected
+
+    @staticmethod
+    def _inside(points, polygon, view, proj, width, height, depth_buffer) -> np.ndarray:
+        xy, depth = project_points(points, view, proj, width, height)
+        inside = (depth > 0) & points_in_polygon(xy, polygon)
+        if depth_buffer is not None and inside.any():
+            candidates = np.flatnonzero(inside)
+            inside[candidates] = depth_buffer.visible(xy[candidates], depth[candidates])
+        return inside
+
+    def _visible_mask(self, elements: np.ndarray, visible_parts: Optional[Set[int]]) -> np.ndarray:
+        if visible_parts is None:
+            return np.ones(len(elements), dtype=bool)
+        return np.isin(self._element_parts[elements], list(visible_parts))
+
+    def _visible_elements(self, visible_parts: Optional[Set[int]]) -> np.ndarray:
+        if visible_parts is None:
+            return np.arange(len(self._mesh.cell_types), dtype=np.int64)
+        return np.sort(self._mesh.get_visible_elements(visible_parts).astype(np.int64))
+
+
+class SelectionManager:
+    """선택 관리 (요소/노드/Part 인덱스를 정렬된 NumPy 배열로 보관)
+
+    - 단일 선택/해제 (클릭, Ctrl+Click 토글)
+    - 영역 선택 결과를 교체/추가/제외로 반영
+    - 대상(요소/노드/Part)을 바꾸면 선택 해제
+    """
+
+    def __init__(self, target: str = ELEMENTS):
+        self.target = target
+        self._selected = np.zeros(0, dtype=np.int64)
+
+    def set_target(self, target: str):
+        """선택 대상 변경 (기존 선택 해제)"""
+        if target not in (ELEMENTS, NODES, PARTS):
+            raise ValueError(f"Unknown selection target: {target}")
+        if target != self.target:
+            self.target = target
+            self.clear()
+
+    def select(self, element_id: int, multi_select: bool = False):
+        """하나 선택
+
+        Args:
+            element_id: 인덱스 (대상에 따라 요소/노드 인덱스 또는 Part ID)
+            multi_select: True이면 기존 선택 유지하고 토글 (Ctrl+Click)
+        """
+        if not multi_select:
+            self._selected = np.array([element_id], dtype=np.int64)
+        elif self.is_selected(element_id):
+            self.apply([element_id], SUBTRACT)
+        else:
+            self.apply([element_id], ADD)
+
+    def apply(self, indices, mode: str = REPLACE):
+        """영역 선택 결과 반영
+
+        Args:
+            indices: 인덱스 배열
+            mode: REPLACE, ADD, SUBTRACT
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if mode == REPLACE:
+            self._selected = sorted_unique(indices)
+        elif mode == ADD:
+            self._selected = sorted_unique(np.concatenate([self._selected, indices]))
+        elif mode == SUBTRACT:
+            self._selected = self._selected[~np.isin(self._selected, indices)]
+        else:
+            raise ValueError(f"Unknown selection mode: {mode}")
+
+    def clear(self):
+        """모든 선택 해제"""
+        self._selected = np.zeros(0, dtype=np.int64)
+
+    def is_selected(self, element_id: int) -> bool:
+        """선택 여부 확인"""
+        i = np.searchsorted(self._selected, element_id)
+        return bool(i < len(self._selected) and self._selected[i] == element_id)
+
+    @property
+    def indices(self) -> np.ndarray:
+        """선택된 인덱스 (정렬된 배열 - 복사하지 않으므로 수정하지 말 것)"""
+        return self._selected
+
+    def get_selected(self) -> set:
+        """선택된 인덱스 집합 반환"""
+        return set(self._selected.tolist())
+
+    def count(self) -> int:
+        """선택 개수"""
+        return len(self._selected)
@@ -91,11 +91,19 @@ class ModelViewerModule(BaseModule):
 
         self._gl_widget = ModelGLWidget()
         self._gl_widget.setMinimumSize(400, 300)
+        # 한 번 연 모델은 외곽면 추출/스킨 생성 없이 디스크 캐시에서 바로 표시
+        self._gl_widget.set_skin_disk_cache(self.ctx.skin_cache)
         self._gl_widget.statusMessage.connect(self._on_gl_status)
         self._gl_widget.fpsUpdate.connect(self._on_fps_update)
         self._gl_widget.elementSelected.connect(self._on_element_selected)
         right_layout.addWidget(self._gl_widget, 1)
 
+        # Part 트리 선택/색상/투명도 → 색상 버퍼만 갱신
+        self._part_tree.highlightChanged.connect(self._gl_widget.set_highlighted_parts)
+        self._part_tree.colorChanged.connect(
+            lambda part_ids, color: self._gl_widget.set_part_colors({pid: color for pid in part_ids}))
+        self._part_tree.opacityChanged.connect(self._gl_widget.set_part_opacity)
+
         # 뷰 옵션
         options_layout = QHBoxLayout()
 
@@ -134,6 +142,27 @@ class ModelViewerModule(BaseModule):
         self._show_nodes_cb.toggled.connect(self._gl_widget.set_show_nodes)
         options_layout.addWidget(self._show_nodes_cb)
 
+        # 영역 선택 (Box/Lasso): 왼쪽 드래그, Shift 추가 / Ctrl 제외
+        options_layout.addSpacing(10)
+        self._selection_tool_combo = QComboBox()
+        self._selection_tool_combo.addItems(["회전", "Box 선택", "Lasso 선택"])
+        self._selection_tool_combo.setToolTip("왼쪽 드래그 동작\n- Box/Lasso: 영역 선택 (Shift 추가, Ctrl 제외)")
+        self._selection_tool_combo.currentIndexChanged.connect(
+            lambda index: self._gl_widget.set_selection_tool((None, 'box', 'lasso')[index]))
+        options_layout.addWidget(self._selection_tool_combo)
+
+        self._selection_target_combo = QComboBox()
+        self._selection_target_combo.addItems(["요소", "노드", "Part"])
+        self._selection_target_combo.currentIndexChanged.connect(
+            lambda index: self._gl_widget.set_selection_target(('elements', 'nodes', 'parts')[index]))
+        options_layout.addWidget(self._selection_target_combo)
+
+        self._front_only_cb = QCheckBox("앞면만")
+        self._front_only_cb.setChecked(True)
+        self._front_only_cb.setToolTip("가려진 요소/노드는 선택하지 않음 (끄면 관통 선택)")
+        self._front_only_cb.toggled.connect(self._gl_widget.set_selection_front_only)
+        options_layout.addWidget(self._front_only_cb)
+
         if qta:
             reset_btn = QPushButton(qta.icon('fa5s.eye'), " 뷰 리셋")
         else:
@@ -164,6 +193,18 @@ class ModelViewerModule(BaseModule):
             btn.clicked.connect(callback)
             options_layout.addWidget(btn)
 
+        # 성능 HUD / 프레임 trace
+        options_layout.addSpacing(10)
+        self._show_hud_cb = QCheckBox("HUD")
+        self._show_hud_cb.setToolTip("성능 HUD (프레임 시간, draw call, culling, VBO 메모리)")
+        self._show_hud_cb.toggled.connect(self._gl_widget.set_show_hud)
+        options_layout.addWidget(self._show_hud_cb)
+
+        trace_btn = QPushButton("Trace")
+        trace_btn.setToolTip("최근 프레임 기록을 Chrome trace (JSON)로 저장 - chrome://tracing, Perfetto")
+        trace_btn.clicked.connect(self._export_trace)
+        options_layout.addWidget(trace_btn)
+
         # FPS 표시
         self._fps_label = QLabel("FPS: --")
         self._fps_label.setStyleSheet("font-weight: bold; color: #4CAF50;")
@@ -245,8 +286,13 @@ class ModelViewerModule(BaseModule):
         self.status("메쉬 데이터 생성 중...")
 
         try:
-            # MeshData 생성
-            self._mesh_data = MeshData.from_parsed_model(self.ctx.model)
+            # 공유 캐시의 MeshData 사용 (다른 모듈/백그라운드 로더와 공유)
+            mesh = self.ctx.geometry.mesh
+            if mesh is self._mesh_data:
+                # 모델이 바뀌지 않았으면 GPU 버퍼 재생성 생략
+                self._update_status()
+                return
+            self._mesh_data = mesh
 
             # GL 위젯에 설정
             self._gl_widget.set_mesh(self._mesh_data)
@@ -281,9 +327,11 @@ class ModelViewerModule(BaseModule):
         elem_count = len(self._mesh_data.elements)
         part_count = len(self._mesh_data.part_elements)
 
+        type_text = ", ".join(f"{name} {count:,}" for name, count in self._mesh_data.type_counts().items())
+
         self._status.setText(
             f"Nodes: {node_count:,} | "
-            f"Elements: {elem_count:,} ({self._mesh_data.element_type}) | "
+            f"Elements: {elem_count:,} ({type_text}) | "
             f"Parts: {part_count}"
         )
 
@@ -313,6 +361,17 @@ class ModelViewerModule(BaseModule):
             self._gl_widget.set_backend(backend)
             self.log(f"Backend changed to: {self._gl_widget.get_backend_name()}", "info")
 
+    def _export_trace(self):
+        """프레임 trace 저장"""
+        path, _ = QFileDialog.getSaveFileName(self, "프레임 Trace 저장", "render_trace.json",
+                                              "Chrome trace (*.json)")
+        if not path:
+            return
+        if self._gl_widget.export_trace(path):
+            self.log(f"프레임 trace 저장: {path}", "info")
+        else:
+            self.log(f"{self._gl_widget.get_backend_name()} 백엔드는 프레임 기록을 지원하지 않습니다", "warning")
+
     def get_actions(self):
         """모듈 액션 버튼"""
         return [
@@ -0,0 +1,106 @@
+"""CPU picking 테스트 (외곽면 BVH 광선 검사, GL 불필요)"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core.bvh import FaceBVH, _ray_triangles
+from gui.modules.model_viewer.core.camera import Camera
+from gui.modules.model_viewer.core.mesh_data import MeshData
+from gui.modules.model_viewer.tests.test_mesh_data import make_mixed_mesh
+
+
+def make_stacked_plates(n: int = 20) -> MeshData:
+    """z=0 (Part 1), z=1 (Part 2) 평판 n x n quad - 위에서 보면 Part 2가 Part 1을 가림"""
+    ij = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij'), axis=-1).reshape(-1, 2)
+    xyz = np.zeros((2 * len(ij), 3))
+    xyz[:len(ij), :2] = ij
+    xyz[len(ij):, :2] = ij
+    xyz[len(ij):, 2] = 1.0
+    i, j = (a.ravel() for a in np.meshgrid(np.arange(n), np.arange(n), indexing='ij'))
+    n1 = i * (n + 1) + j + 1
+    quads = np.stack([n1, n1 + n + 1, n1 + n + 2, n1 + 1], axis=1)
+    connectivity = np.zeros((2 * n * n, 8), dtype=np.int32)
+    connectivity[:, :4] = np.concatenate([quads, quads + len(ij)])
+    pids = np.repeat([1, 2], n * n)
+    return MeshData.from_arrays(np.arange(1, len(xyz) + 1), xyz, connectivity, pids)
+
+
+def brute_force(mesh: MeshData, faces, origin, direction, visible=None):
+    """모든 외곽면 삼각형 검사 → (거리, 요소)"""
+    best = (np.inf, -1)
+    for pid, part in faces.items():
+        if visible is not None and pid not in visible:
+            continue
+        for elem, quad in zip(part.elements, part.nodes):
+            corners = mesh.nodes[np.where(quad < 0, quad[2], quad)].astype(np.float64)
+            for a, b, c in ((0, 1, 2), (0, 2, 3)):
+                t = _ray_triangles(origin, direction, corners[[a]], corners[[b]], corners[[c]])[0]
+                if t < best[0]:
+                    best = (t, int(elem))
+    return best
+
+
+def test_raycast_matches_brute_force():
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    bvh = FaceBVH(mesh.nodes, faces, leaf_size=2)
+    assert len(bvh) == sum(len(f) for f in faces.values())
+
+    rng = np.random.default_rng(1)
+    hits = 0
+    for _ in range(200):
+        origin = rng.random(3) * 4 - 1.5
+        direction = 0.5 + rng.random(3) * 0.5 - origin
+        direction /= np.linalg.norm(direction)
+        t, elem = brute_force(mesh, faces, origin, direction)
+        hit = bvh.raycast(origin, direction)
+        if elem < 0:
+            assert hit is None
+            continue
+        hits += 1
+        assert np.isclose(hit.distance, t)
+        assert np.allclose(hit.point, origin + t * direction)
+    assert hits > 50
+
+
+def test_raycast_face_node_and_visibility():
+    mesh = make_stacked_plates()
+    faces = mesh.extract_exterior_faces()
+    bvh = FaceBVH(mesh.nodes, faces)
+
+    # (3.2, 5.1)에서 아래로 → 위 평판 (Part 2) 요소 (i=3, j=5), 가장 가까운 노드 (3, 5)
+    origin, direction = mesh.to_local([[3.2, 5.1, 10.0]])[0], np.array([0.0, 0.0, -1.0])
+    hit = bvh.raycast(origin, direction)
+    assert hit.part_id == 2
+    assert hit.element == 400 + 3 * 20 + 5
+    assert np.isclose(hit.distance, 9.0)
+    assert np.allclose(mesh.to_world(mesh.nodes[hit.node]), [3.0, 5.0, 1.0])
+    assert np.concatenate([f.elements for f in faces.values()])[hit.face] == hit.element
+
+    # 위 평판을 숨기면 아래 평판
+    hit = bvh.raycast(origin, direction, visible_parts={1})
+    assert hit.part_id == 1 and hit.element == 3 * 20 + 5
+    assert bvh.raycast(origin, direction, visible_parts=set()) is None
+
+    # 평판 밖
+    assert bvh.raycast(mesh.to_local([[30.0, 5.0, 10.0]])[0], direction) is None
+
+
+def test_camera_ray_through_screen_center():
+    camera = Camera()
+    camera.azimuth, camera.elevation = -90.0, 0.0
+    camera.target = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    origin, direction = camera.get_ray(400, 300, 800, 600)
+    assert np.isclose(np.linalg.norm(direction), 1.0)
+    # 화면 중심 광선은 주시점을 지남
+    to_target = camera.target - origin
+    assert np.allclose(np.cross(direction, to_target), 0.0, atol=1e-3)
+    assert np.dot(direction, to_target) > 0
+
+    # 화면 왼쪽 위 → 광선이 주시점 기준 왼쪽(-X)/위(+Z)로
+    _, corner = camera.get_ray(0, 0, 800, 600)
+    assert corner[0] < 0 and corner[2] > 0
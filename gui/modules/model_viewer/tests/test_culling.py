@@ -0,0 +1,107 @@
+"""Part culling 테스트 (GL 없이 합성 카메라/bbox로 검증)"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core.camera import Camera, frustum_planes
+from gui.modules.model_viewer.core.render_cache import VisibilityOptimizer, PerformanceMonitor
+from gui.modules.model_viewer.tests.test_mesh_data import make_mixed_mesh
+
+
+def make_camera() -> Camera:
+    """원점을 -Y 방향에서 바라보는 카메라 (거리 100)"""
+    camera = Camera()
+    camera.azimuth, camera.elevation = -90.0, 0.0
+    return camera
+
+
+def make_optimizer(boxes, min_screen_size=0.0) -> VisibilityOptimizer:
+    """boxes: {part_id: (center, half_size)}"""
+    optimizer = VisibilityOptimizer(min_screen_size=min_screen_size)
+    ids = np.array(list(boxes))
+    centers = np.array([c for c, _ in boxes.values()], dtype=float)
+    half = np.array([h for _, h in boxes.values()], dtype=float)[:, None]
+    optimizer.set_all_part_bounds(ids, centers - half, centers + half)
+    optimizer.set_visible_parts(set(boxes))
+    return optimizer
+
+
+def test_frustum_planes_contain_target():
+    camera = make_camera()
+    planes = camera.get_frustum_planes(aspect=1.0)
+    assert np.allclose(np.linalg.norm(planes[:, :3], axis=1), 1.0)
+    assert (planes @ [0.0, 0.0, 0.0, 1.0] >= 0).all()
+    # 카메라 뒤, near 앞, far 너머는 밖
+    for point in ([0.0, -200.0, 0.0], [0.0, -99.95, 0.0], [0.0, 20000.0, 0.0]):
+        assert (planes @ [*point, 1.0] < 0).any()
+
+
+def test_frustum_cull_boxes():
+    camera = make_camera()
+    optimizer = make_optimizer({
+        1: ((0, 0, 0), 5),          # 화면 중앙
+        2: ((0, -300, 0), 5),       # 카메라 뒤
+        3: ((500, 0, 0), 5),        # 오른쪽 밖 (fov 45°, 거리 100 → 반폭 ~41)
+        4: ((45, 0, 0), 10),        # 가장자리에 걸침 → 표시
+        5: ((0, 0, -400), 5),       # 아래쪽 밖
+    })
+    visible = optimizer.frustum_cull(camera.get_frustum_planes(aspect=1.0))
+    assert visible == {1, 4}
+    assert optimizer.last_stats == {'tested': 5, 'frustum_culled': 3, 'small_culled': 0}
+
+    # 숨긴 Part는 culling 결과에도 없음
+    optimizer.set_visible_parts({2, 4})
+    assert optimizer.frustum_cull(camera.get_frustum_planes(aspect=1.0)) == {4}
+
+
+def test_small_part_cull():
+    camera = make_camera()
+    view, proj = camera.get_view_matrix(), camera.get_projection_matrix(1.0)
+    boxes = {
+        1: ((0, 0, 0), 5.0),        # ~290 px
+        2: ((0, 0, 0), 0.01),       # ~0.6 px
+        3: ((0, 5000, 0), 1.0),     # 멀리 있는 작은 Part (~0.3 px)
+        4: ((0, -99, 0), 0.5),      # 카메라 바로 앞 작은 Part (크게 보임)
+    }
+    optimizer = make_optimizer(boxes, min_screen_size=2.0)
+    assert optimizer.cull(view, proj, viewport_height=800) == {1, 4}
+    assert optimizer.last_stats == {'tested': 4, 'frustum_culled': 0, 'small_culled': 2}
+
+    # 임계값 0 → 작은 Part culling 끔
+    optimizer.min_screen_size = 0.0
+    assert optimizer.cull(view, proj, viewport_height=800) == {1, 2, 3, 4}
+
+    # frustum_planes(proj @ view)와 Camera.get_frustum_planes는 같은 평면
+    assert np.allclose(frustum_planes(proj.astype(float) @ view), camera.get_frustum_planes(1.0))
+
+
+def test_culling_with_mesh_bounds_and_monitor():
+    """MeshData.part_bounds → 전체 보기는 모두 표시, 다른 곳을 보면 모두 제외"""
+    mesh = make_mixed_mesh()
+    optimizer = VisibilityOptimizer(min_screen_size=0.0)
+    optimizer.set_all_part_bounds(*mesh.part_bounds())
+    optimizer.set_visible_parts(set(mesh.part_elements))
+
+    camera = make_camera()
+    camera.fit_to_bounds(mesh.nodes.min(axis=0), mesh.nodes.max(axis=0))
+    view, proj = camera.get_view_matrix(), camera.get_projection_matrix(1.0)
+    assert optimizer.cull(view, proj, 600) == set(mesh.part_elements)
+
+    # 모델에서 벗어난 곳을 보면 전부 제외
+    part_ids = mesh.part_bounds()[0]
+    camera.target = np.array([1000.0, 0.0, 0.0], dtype=np.float32)
+    drawn = optimizer.cull(camera.get_view_matrix(), proj, 600)
+    assert drawn == set()
+
+    monitor = PerformanceMonitor()
+    stats = optimizer.last_stats
+    monitor.record_culling(stats['tested'], stats['frustum_culled'], stats['small_culled'])
+    result = monitor.get_stats()
+    assert result['parts_tested'] == len(part_ids)
+    assert result['frustum_culled'] == len(part_ids) - len(drawn)
+    monitor.reset()
+    assert monitor.get_stats()['frustum_culled'] == 0
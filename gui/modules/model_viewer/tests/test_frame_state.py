@@ -0,0 +1,78 @@
+"""프레임 GL 상태 복원 테스트 (QPainter 오버레이 뒤 depth test 유지)"""
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core.frame_state import apply_frame_state
+
+BACKENDS_DIR = Path(__file__).resolve().parents[1] / "backends"
+
+
+class RecordingGL:
+    """OpenGL.GL 대역 - 상수는 이름 문자열, 함수 호출은 (이름, 인자)로 기록"""
+
+    def __init__(self):
+        self.calls = []
+        self.enabled = {'GL_DEPTH_TEST': False, 'GL_BLEND': True}
+
+    def __getattr__(self, name):
+        if name.startswith('GL_'):
+            return name
+
+        def call(*args):
+            self.calls.append((name, args))
+            if name == 'glEnable':
+                self.enabled[args[0]] = True
+            elif name == 'glDisable':
+                self.enabled[args[0]] = False
+        return call
+
+
+def test_restores_state_left_by_painter():
+    gl = RecordingGL()  # QPainter.end() 직후 상태: depth test 꺼짐, blend 켜짐
+    apply_frame_state(gl)
+
+    assert gl.enabled['GL_DEPTH_TEST'] is True
+    assert gl.enabled['GL_BLEND'] is False
+    assert ('glDepthFunc', ('GL_LESS',)) in gl.calls
+    assert ('glDepthMask', ('GL_TRUE',)) in gl.calls
+    assert ('glShadeModel', ('GL_SMOOTH',)) in gl.calls
+
+
+def test_applied_every_call():
+    gl = RecordingGL()
+    apply_frame_state(gl)
+    first = list(gl.calls)
+    apply_frame_state(gl)
+    assert gl.calls == first * 2
+
+
+def _first_calls(path: Path, method: str):
+    """renderer 클래스 메서드 본문의 최상위 호출 이름을 순서대로 반환"""
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == method:
+            names = []
+            for stmt in node.body:
+                if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Call):
+                    func = stmt.value.func
+                    names.append(getattr(func, 'id', getattr(func, 'attr', None)))
+            return names
+    raise AssertionError(f"{method} not found in {path.name}")
+
+
+@pytest.mark.parametrize("filename, method", [
+    ("vbo_renderer.py", "render"),
+    ("vbo_renderer.py", "_pick_element_gpu"),
+    ("legacy_renderer.py", "render"),
+])
+def test_renderers_apply_state_before_clear(filename, method):
+    """매 프레임(그리고 GPU picking 패스) glClear 전에 상태를 복원해야 함"""
+    names = _first_calls(BACKENDS_DIR / filename, method)
+    assert 'apply_frame_state' in names
+    assert names.index('apply_frame_state') < names.index('glClear')
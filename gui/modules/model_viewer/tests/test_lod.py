@@ -0,0 +1,81 @@
+"""인터랙션 LOD 테스트 (vertex clustering 단순화, 레벨 선택)"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core import vertex_buffers as vb
+from gui.modules.model_viewer.core.lod import LODController, LODSettings, build_lod_levels, decimate_skin
+from gui.modules.model_viewer.core.mesh_data import MeshData
+
+
+def make_plate_skin(n: int = 40) -> vb.IndexedSkin:
+    """z=0 평판 n x n quad, 왼쪽 절반 Part 1 / 오른쪽 절반 Part 2"""
+    ij = np.stack(np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij'), axis=-1).reshape(-1, 2)
+    xyz = np.zeros((len(ij), 3))
+    xyz[:, :2] = ij
+    i, j = (a.ravel() for a in np.meshgrid(np.arange(n), np.arange(n), indexing='ij'))
+    n1 = i * (n + 1) + j + 1
+    connectivity = np.zeros((n * n, 8), dtype=np.int32)
+    connectivity[:, :4] = np.stack([n1, n1 + n + 1, n1 + n + 2, n1 + 1], axis=1)
+    mesh = MeshData.from_arrays(np.arange(1, len(xyz) + 1), xyz, connectivity, np.where(i < n // 2, 1, 2))
+    faces = mesh.extract_exterior_faces()
+    return vb.build_indexed_skin(mesh.nodes, faces, {1: (1.0, 0.0, 0.0), 2: (0.0, 0.0, 1.0)})
+
+
+def test_decimate_skin_keeps_parts():
+    skin = make_plate_skin()
+    lod = decimate_skin(skin, resolution=8)
+
+    assert 0 < len(lod.triangles) < len(skin.triangles) / 10
+    assert lod.part_ids.tolist() == skin.part_ids.tolist()
+    assert lod.triangle_offsets[-1] == len(lod.triangles) and len(lod.edges) == 0
+
+    # Part 범위의 삼각형은 그 Part 색상 정점만 사용 (Part 경계를 넘어 합치지 않음)
+    for rank, color in enumerate(([1.0, 0.0, 0.0], [0.0, 0.0, 1.0])):
+        triangles = lod.triangles[lod.triangle_offsets[rank]:lod.triangle_offsets[rank + 1]]
+        assert len(triangles) and np.allclose(lod.vertices[triangles.ravel(), 6:9], color)
+
+    # 평판 → 위치는 원래 범위 안, 정점 법선은 +z, 퇴화/중복 삼각형 없음
+    assert np.allclose(lod.vertices[:, 2], 0) and lod.vertices[:, :2].max() <= 40
+    assert np.allclose(lod.vertices[:, 3:6], [0.0, 0.0, 1.0])
+    tris = np.sort(lod.triangles, axis=1)
+    assert (tris[:, 0] != tris[:, 1]).all() and (tris[:, 1] != tris[:, 2]).all()
+    assert len(np.unique(tris, axis=0)) == len(tris)
+
+
+def test_build_lod_levels():
+    skin = make_plate_skin()
+    assert build_lod_levels(skin, LODSettings()) == []                  # 작은 모델은 LOD 없음
+
+    settings = LODSettings(min_triangles=0, resolutions=(4, 32, 16, 30))
+    counts = [len(level.triangles) for level in build_lod_levels(skin, settings)]
+    # 세밀한 순, 이전 레벨보다 충분히 줄지 않는 레벨(30)은 건너뜀
+    assert len(counts) == 3 and counts == sorted(counts, reverse=True)
+    assert counts[0] <= len(skin.triangles) * settings.min_reduction
+
+
+def test_lod_controller_adapts_to_frame_time():
+    controller = LODController(LODSettings(target_frame_ms=30.0), smoothing=1.0)
+    controller.set_levels([1_000_000, 100_000, 10_000])
+    assert controller.level == 0 and controller.draw_edges
+
+    controller.begin_interaction()
+    assert controller.level == 1 and not controller.draw_edges
+
+    # LOD 1이 60 ms → 예측: LOD 2 = 6 ms (목표 안 가장 세밀한 레벨)
+    assert controller.record_frame(60.0) == 2
+    assert controller.record_frame(20.0) == 2                           # 목표 범위 안 → 유지
+    # 매우 빠름 → 원래 메쉬가 목표 안이면 복원 (0.01 ms/1만 → 100만 = 1 ms)
+    assert controller.record_frame(0.01) == 0
+
+    controller.end_interaction()
+    assert controller.level == 0 and controller.draw_edges
+    controller.begin_interaction()
+    assert controller.level == 0                                        # 마지막 레벨 재사용
+
+    controller.settings.enabled = False
+    assert controller.level == 0 and controller.draw_edges
@@ -0,0 +1,234 @@
+"""MeshData 벡터화 생성 테스트 (노드 ID 매핑, Part 그룹화, 혼합 요소 토폴로지)"""
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.mesh_cache import MeshDiskCache
+from gui.modules.model_viewer.core import mesh_data
+from gui.modules.model_viewer.core.mesh_data import (
+    CELL_BEAM, CELL_HEX, CELL_PENTA, CELL_QUAD, CELL_TET, CELL_TRI,
+    MeshData, boundary_faces, element_face_loops, group_by_part, map_node_ids,
+)
+
+
+def test_map_node_ids_dense_and_sparse():
+    """밀집 조회 테이블과 searchsorted 결과가 같음 (없는 ID는 -1, 중복은 마지막)"""
+    for node_ids in (np.array([5, 3, 4, 7, 3]), np.array([5, 3, 400000, 7000000, 3])):
+        query = np.array([[3, 5, 0], [node_ids[2], node_ids[3], 99]])
+        result = map_node_ids(node_ids, query)
+        assert result.shape == query.shape
+        assert result.tolist() == [[4, 0, -1], [2, 3, -1]]
+
+
+def test_group_by_part_keeps_element_order():
+    groups = group_by_part(np.array([3, 1, 3, 2, 1]))
+    assert list(groups) == [1, 2, 3]
+    assert groups[1].tolist() == [1, 4]
+    assert groups[3].tolist() == [0, 2]
+
+
+def test_from_parsed_model_objects():
+    """객체 목록 모델 (저장소 없음)"""
+    nodes = [SimpleNamespace(nid=nid, x=float(nid), y=0.0, z=0.0) for nid in (10, 20, 30, 40)]
+    shells = [SimpleNamespace(pid=2, nodes=[10, 20, 30, 40]),
+              SimpleNamespace(pid=1, nodes=[40, 30, 20]),
+              SimpleNamespace(pid=2, nodes=[10, 20, 30, 99])]
+    model = SimpleNamespace(nodes=nodes, elements={'shell': shells, 'solid': []},
+                            parts=[SimpleNamespace(pid=2, name='Panel')])
+    mesh = MeshData.from_parsed_model(model)
+
+    assert mesh.element_type == 'shell'
+    assert mesh.elements.tolist() == [[0, 1, 2, 3], [3, 2, 1], [0, 1, 2, 0]]
+    assert mesh.cell_types.tolist() == [CELL_QUAD, CELL_TRI, CELL_QUAD]
+    assert mesh.part_elements[2].tolist() == [0, 2]
+    assert mesh.part_names == {2: 'Panel', 1: 'Part 1'}
+    assert np.allclose(mesh.world_nodes()[:, 0], [10, 20, 30, 40])
+
+
+def make_mixed_mesh() -> MeshData:
+    """hex 2개 (면 공유) + tet + LS-DYNA penta + pyramid + tri shell + beam"""
+    node_ids = np.arange(1, 25) * 10
+    xyz = np.random.default_rng(0).random((len(node_ids), 3))
+    conn = np.array([
+        [1, 2, 3, 4, 5, 6, 7, 8],
+        [5, 6, 7, 8, 9, 10, 11, 12],
+        [13, 14, 15, 16, 16, 16, 16, 16],       # tet (N4 반복)
+        [17, 18, 19, 20, 21, 21, 22, 22],       # penta (N5 N5 N6 N6)
+        [1, 2, 3, 4, 23, 23, 23, 23],           # pyramid (퇴화 hex)
+        [13, 14, 15, 15, 0, 0, 0, 0],           # tri shell
+        [23, 24, 1, 0, 0, 0, 0, 0],             # beam (N3 = 방향 노드)
+    ]) * 10
+    etype = np.array([1, 1, 1, 1, 1, 0, 2])
+    pids = np.array([1, 1, 2, 3, 4, 5, 6])
+    return MeshData.from_arrays(node_ids, xyz, conn, pids, etype)
+
+
+def test_mixed_topology():
+    mesh = make_mixed_mesh()
+    assert mesh.cell_types.tolist() == [CELL_HEX, CELL_HEX, CELL_TET, CELL_PENTA,
+                                        CELL_HEX, CELL_TRI, CELL_BEAM]
+    assert mesh.nodes_per_cell.tolist() == [8, 8, 4, 6, 8, 3, 2]
+    assert mesh.element_type == 'mixed'
+    # penta: 삼각형 (N1,N2,N5)-(N4,N3,N6)
+    assert mesh.elements[3].tolist() == [16, 17, 20, 19, 18, 21]
+    assert mesh.elements[6].tolist() == [22, 23]
+
+    elem_indices, lines = mesh.beam_lines()
+    assert elem_indices.tolist() == [6] and lines.tolist() == [[22, 23]]
+    assert np.asarray(mesh.elements).shape == (7, 8)
+
+
+def test_exterior_faces_mixed():
+    faces = make_mixed_mesh().extract_exterior_faces()
+    sizes = {pid: sorted(len(f) for _, f in part_faces) for pid, part_faces in faces.items()}
+
+    # hex 2개: 공유면 제외 10개, 단 첫 hex 바닥면은 pyramid 바닥면과 공유
+    assert sizes[1] == [4] * 9
+    assert sizes[2] == [3] * 4
+    assert sizes[3] == [3, 3, 4, 4, 4]
+    # pyramid: 꼭짓점으로 접힌 옆면 4개 (윗면은 버림, 바닥면은 hex와 공유)
+    assert sizes[4] == [3] * 4
+    assert sizes[5] == [3]
+    assert 6 not in faces
+
+
+def test_exterior_faces_keep_winding():
+    """외곽면 노드는 요소 로컬 인덱스 순서 그대로 (법선 방향 유지), 결과는 메쉬에 캐시"""
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    assert mesh.extract_exterior_faces() is faces
+
+    for part_faces in faces.values():
+        for k, (elem_idx, local) in enumerate(part_faces):
+            assert part_faces.nodes[k, :len(local)].tolist() == mesh.elements[elem_idx][local].tolist()
+
+
+def test_element_face_loops():
+    """선택 요소 하이라이트용 외곽면 - 반복(tuple) 결과와 같은 면, 노드 인덱스로"""
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+
+    for elem_idx in range(len(mesh.cell_types)):
+        expected = [mesh.elements[e][local].tolist()
+                    for part_faces in faces.values() for e, local in part_faces if e == elem_idx]
+        assert [loop.tolist() for loop in element_face_loops(faces, elem_idx)] == expected
+
+    assert len(element_face_loops(faces, 0)) == 4   # 윗면(hex)/바닥면(pyramid) 공유 제외
+    assert element_face_loops(faces, 6) == []        # beam은 외곽면 없음
+
+
+def test_boundary_faces_hash_keys(monkeypatch):
+    """대형 모델용 해시 키, 해시 충돌 시 정확한 비교로 대체 - 모두 같은 결과"""
+    _, _, face_nodes = make_mixed_mesh().cell_faces()
+    exact = boundary_faces(face_nodes, 24)
+    assert np.array_equal(boundary_faces(face_nodes, 10 ** 7), exact)
+
+    # 모든 면이 같은 키로 충돌
+    monkeypatch.setattr(mesh_data, 'face_keys',
+                        lambda columns, node_count: (np.zeros(len(columns[0]), dtype=np.uint64), False))
+    assert np.array_equal(boundary_faces(face_nodes, 10 ** 7), exact)
+
+
+def test_mesh_cache_mixed(tmp_path):
+    mesh = make_mixed_mesh()
+    cache = MeshDiskCache(tmp_path)
+    cache.save("mixed", mesh)
+    loaded = cache.load("mixed")
+
+    assert np.array_equal(loaded.offsets, mesh.offsets)
+    assert np.array_equal(loaded.connectivity, mesh.connectivity)
+    assert np.array_equal(loaded.cell_types, mesh.cell_types)
+
+
+def test_mesh_cache_prunes_least_recently_used(tmp_path):
+    """예산을 넘으면 저장 시 가장 오래 쓰지 않은 항목부터 삭제 (로드하면 사용 시각 갱신)"""
+    import os
+
+    mesh = make_mixed_mesh()
+    cache = MeshDiskCache(tmp_path, max_bytes=0)
+    for i, key in enumerate(("a", "b", "c")):
+        path = cache.save(key, mesh)
+        os.utime(path, (1000 + i, 1000 + i))
+    entry_bytes = cache.path_for("a").stat().st_size
+
+    cache.load("a")                               # a가 가장 최근 사용
+    cache.max_bytes = entry_bytes * 3
+    cache.save("d", mesh)
+    assert [cache.contains(k) for k in "abcd"] == [True, False, True, True]
+
+    cache.max_bytes = 1                           # 방금 저장한 항목은 남김
+    cache.save("e", mesh)
+    assert [cache.contains(k) for k in "abcde"] == [False] * 4 + [True]
+
+
+def test_skin_disk_cache(tmp_path):
+    """외곽면 + 스킨 저장/로드 (memory-map), 메쉬가 바뀌면 다른 키"""
+    from gui.mesh_cache import SkinDiskCache
+    from gui.modules.model_viewer.core.lod import decimate_skin
+    from gui.modules.model_viewer.core.render_cache import RenderCache, cached_skin
+
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    skin, signatures, _ = cached_skin(RenderCache(), mesh.nodes, faces, {})
+
+    cache = SkinDiskCache(tmp_path)
+    key = cache.key_for(mesh)
+    assert key == cache.key_for(make_mixed_mesh()) and cache.load(key) is None
+    cache.save(key, faces)
+    assert cache.contains(key) and not cache.contains(key, with_skin=True)
+    assert cache.load(key).skin is None
+    cache.save(key, faces, skin, signatures)
+
+    loaded = cache.load(key)
+    assert isinstance(loaded.skin.vertices, np.memmap) and loaded.signatures == signatures
+    assert list(loaded.exterior_faces) == list(faces)
+    for pid, part in faces.items():
+        for name in ('elements', 'local', 'nodes'):
+            assert np.array_equal(getattr(loaded.exterior_faces[pid], name), getattr(part, name))
+    for name in ('vertices', 'triangles', 'edges', 'part_ids', 'vertex_offsets', 'triangle_offsets',
+                 'edge_offsets', 'pick_elements'):
+        assert np.array_equal(getattr(loaded.skin, name), getattr(skin, name)), name
+    assert loaded.skin.face_edge_count == skin.face_edge_count
+
+    # 읽기 전용 배열로도 LOD 생성 가능, 캐시된 외곽면은 다시 추출하지 않음
+    assert len(decimate_skin(loaded.skin, 4, mesh.bounds).triangles) > 0
+    fresh = make_mixed_mesh()
+    fresh.set_exterior_faces(loaded.exterior_faces)
+    assert fresh.extract_exterior_faces() is loaded.exterior_faces
+
+    # 노드 하나만 움직여도 새 키
+    fresh.nodes = fresh.nodes.copy()
+    fresh.nodes[0, 0] += 1.0
+    assert cache.key_for(fresh) != key
+    cache.remove(key)
+    assert cache.load(key) is None
+
+
+def test_skin_disk_cache_prunes_least_recently_used(tmp_path):
+    """편집마다 새 키가 생겨도 예산 안에서 오래된 스킨부터 삭제"""
+    import os
+    from gui.mesh_cache import SkinDiskCache, prune_cache_dir
+
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    cache = SkinDiskCache(tmp_path, max_bytes=0)
+    for i, key in enumerate(("a", "b", "c")):
+        path = cache.save(key, faces)
+        os.utime(path, (1000 + i, 1000 + i))
+    entry_bytes = sum(f.stat().st_size for f in cache.path_for("a").iterdir())
+
+    assert cache.load("a") is not None           # a가 가장 최근 사용
+    cache.max_bytes = entry_bytes * 3
+    cache.save("d", faces)
+    assert [cache.contains(k) for k in "abcd"] == [True, False, True, True]
+
+    # 작성 중인 임시 항목은 건드리지 않음
+    (tmp_path / "e.tmp").mkdir()
+    assert prune_cache_dir(tmp_path, 1, keep=[cache.path_for("d")]) == entry_bytes * 2
+    assert [cache.contains(k) for k in "acd"] == [False, False, True]
+    assert (tmp_path / "e.tmp").exists()
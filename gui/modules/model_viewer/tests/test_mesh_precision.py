@@ -0,0 +1,109 @@
+"""MeshData 원점 이동(origin + float32 로컬 좌표) 정밀도 테스트"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from core.model_data import ParsedModelData
+from gui.mesh_cache import MeshDiskCache
+from core.model_store import ModelStore
+from gui.modules.model_viewer.core.mesh_data import MeshData
+
+# 차량 모델 수준의 전역 좌표 (mm)
+OFFSET = np.array([5123.25, -4871.5, 1200.125])
+
+
+def make_model(grid: int = 20, spacing: float = 0.01, offset=OFFSET) -> ParsedModelData:
+    """전역 좌표가 큰 쉘 격자 모델 (요소 크기 spacing mm)"""
+    ij = np.stack(np.meshgrid(np.arange(grid + 1), np.arange(grid + 1)), axis=-1).reshape(-1, 2)
+    xyz = np.zeros((len(ij), 3))
+    xyz[:, :2] = ij * spacing
+    xyz += offset
+    # 서브마이크론 요철
+    xyz[:, 2] += np.sin(ij[:, 0]) * 1e-4
+
+    nids = np.arange(1, len(xyz) + 1)
+    n1 = (np.arange(grid)[None, :] + np.arange(grid)[:, None] * (grid + 1)).ravel() + 1
+    conn = np.zeros((len(n1), 8), dtype=np.int32)
+    conn[:, :4] = np.stack([n1, n1 + 1, n1 + grid + 2, n1 + grid + 1], axis=1)
+
+    store = ModelStore()
+    store.nodes.load({'nid': nids, 'xyz': xyz})
+    store.elements.load({
+        'eid': np.arange(1, len(conn) + 1),
+        'pid': np.where(np.arange(len(conn)) < len(conn) // 2, 1, 2),
+        'etype': np.zeros(len(conn)),
+        'node_count': np.full(len(conn), 4),
+        'nodes': conn,
+    })
+    return ParsedModelData(filename="synthetic.k", _store=store)
+
+
+def test_origin_roundtrip():
+    """로컬 float32 + float64 원점으로 전역 좌표 복원"""
+    model = make_model()
+    xyz = model.store.nodes.column('xyz')
+    mesh = MeshData.from_parsed_model(model)
+
+    assert mesh.nodes.dtype == np.float32
+    assert mesh.origin.dtype == np.float64
+
+    error = np.abs(mesh.world_nodes() - xyz).max()
+    naive_error = np.abs(xyz.astype(np.float32).astype(np.float64) - xyz).max()
+    print(f"round-trip error: {error:.2e} mm (float32 전역 좌표: {naive_error:.2e} mm)")
+    assert error < 1e-6
+    assert naive_error > 1e-5
+
+    world_min, world_max = mesh.world_bounds
+    assert np.allclose(world_min, xyz.min(axis=0), atol=1e-6)
+    assert np.allclose(world_max, xyz.max(axis=0), atol=1e-6)
+
+    # 로컬 <-> 전역 변환
+    assert np.allclose(mesh.to_world(mesh.to_local(xyz)), xyz, atol=1e-6)
+
+
+def test_edge_lengths_preserved():
+    """작은 요소의 변 길이가 전역 좌표 크기와 무관하게 유지됨"""
+    model = make_model(spacing=0.001)
+    xyz = model.store.nodes.column('xyz')
+    mesh = MeshData.from_parsed_model(model)
+
+    e = np.asarray(mesh.elements)
+    local = mesh.nodes.astype(np.float64)
+    edges = np.linalg.norm(local[e[:, 1]] - local[e[:, 0]], axis=1)
+    reference = np.linalg.norm(xyz[e[:, 1]] - xyz[e[:, 0]], axis=1)
+    assert np.abs(edges - reference).max() < 1e-7
+
+
+def test_part_grouping():
+    model = make_model(grid=10)
+    mesh = MeshData.from_parsed_model(model)
+    assert sorted(mesh.part_elements) == [1, 2]
+    assert sum(len(v) for v in mesh.part_elements.values()) == len(mesh.elements)
+
+
+def test_mesh_cache_keeps_origin(tmp_path):
+    """디스크 캐시 저장/로드 후에도 원점과 로컬 좌표 유지"""
+    mesh = MeshData.from_parsed_model(make_model())
+    cache = MeshDiskCache(tmp_path)
+    cache.save("synthetic", mesh)
+    loaded = cache.load("synthetic")
+
+    assert loaded is not None
+    assert np.array_equal(loaded.origin, mesh.origin)
+    assert np.array_equal(loaded.nodes, mesh.nodes)
+    assert np.allclose(loaded.world_nodes(), mesh.world_nodes())
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_origin_roundtrip()
+    test_edge_lengths_preserved()
+    test_part_grouping()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_mesh_cache_keeps_origin(Path(tmp))
+    print("OK")
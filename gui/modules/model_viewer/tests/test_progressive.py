@@ -0,0 +1,147 @@
+"""점진적 로드 테스트 (워커 스레드 묶음 생성, 시간 예산 업로드 - GL 불필요)"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core.progressive import (
+    LoadedSkin, ProgressiveSkinLoader, SkinBatch, UploadQueue, batch_parts, upload_order,
+)
+from gui.modules.model_viewer.core.render_cache import RenderCache, cached_skin
+from gui.modules.model_viewer.core.vertex_buffers import split_indices
+from gui.modules.model_viewer.tests.test_mesh_data import make_mixed_mesh
+
+COLORS = {1: (1.0, 0.0, 0.0), 2: (0.0, 1.0, 0.0), 3: (0.0, 0.0, 1.0)}
+
+
+class FakeBuffer:
+    """GLBuffer 대역 (remaining / upload)"""
+
+    def __init__(self, nbytes: int):
+        self.nbytes = nbytes
+        self.uploaded = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.nbytes - self.uploaded
+
+    def upload(self, max_bytes: int) -> int:
+        size = min(max_bytes, self.remaining)
+        self.uploaded += size
+        return size
+
+
+def run_loader(mesh, cache, **kwargs):
+    faces = mesh.extract_exterior_faces()
+    order = upload_order(*mesh.part_bounds())
+    loader = ProgressiveSkinLoader(cache, mesh.nodes, faces, COLORS, order, **kwargs)
+    loader.start()
+    loader.join(timeout=30)
+    return loader, loader.poll()
+
+
+def test_upload_order_and_batches():
+    part_ids = np.array([1, 2, 3, 4])
+    mins = np.zeros((4, 3))
+    maxs = np.array([[1, 1, 1], [5, 5, 5], [3, 3, 3], [9, 9, 9]], dtype=float)
+    assert upload_order(part_ids, mins, maxs) == [4, 2, 3, 1]
+    # 숨긴 Part는 크기와 관계없이 뒤로
+    assert upload_order(part_ids, mins, maxs, visible_parts={1, 3}) == [3, 1, 4, 2]
+
+    counts = {1: 10, 2: 500, 3: 30, 4: 40}
+    assert batch_parts([2, 1, 3, 4], counts, 64) == [[2], [1, 3, 4]]
+    assert batch_parts([1, 3], counts, 64) == [[1, 3]]
+
+
+def test_loader_matches_cached_skin():
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    loader, results = run_loader(mesh, RenderCache(), batch_faces=1,
+                                 finish=lambda skin, signatures: len(skin.triangles))
+    assert loader.error is None and loader.progress == 1.0
+
+    batches = [r for r in results if isinstance(r, SkinBatch)]
+    loaded = results[-1]
+    assert isinstance(loaded, LoadedSkin) and len(batches) == len(faces)
+    # 묶음은 큰 Part 먼저, 묶음마다 독립 스킨
+    assert [b.part_ids for b in batches] == [[pid] for pid in upload_order(*mesh.part_bounds()) if pid in faces]
+    for batch in batches:
+        assert batch.skin.part_ids.tolist() == batch.part_ids
+        assert batch.face_count == len(batch.skin.pick_elements) - 1
+
+    # 최종 스킨은 같은 Part 순서 (묶음 순서)로 한 번에 만든 것과 같음
+    ordered = {pid: faces[pid] for batch in batches for pid in batch.part_ids}
+    expected, signatures, built = cached_skin(RenderCache(), mesh.nodes, ordered, COLORS)
+    assert loaded.signatures == signatures and loaded.built == built
+    assert loaded.extra == len(expected.triangles)
+    for name in ('vertices', 'triangles', 'edges', 'part_ids', 'pick_elements', 'triangle_offsets'):
+        assert np.array_equal(getattr(loaded.skin, name), getattr(expected, name)), name
+
+
+def test_batches_are_segments_of_loaded_skin():
+    """묶음 스킨을 순서대로 이어 붙이면 전체 스킨 (GPU 묶음 버퍼를 다시 올리지 않고 재사용)"""
+    mesh = make_mixed_mesh()
+    _, results = run_loader(mesh, RenderCache(), batch_faces=8)
+    batches, skin = results[:-1], results[-1].skin
+    assert len(batches) > 1
+
+    vertex_bases = [b.vertex_base for b in batches]
+    assert vertex_bases == np.cumsum([0] + [len(b.skin.vertices) for b in batches[:-1]]).tolist()
+    # picking 색상까지 같은 정점
+    assert np.array_equal(np.concatenate([b.skin.vertices for b in batches]), skin.vertices)
+    assert np.array_equal(np.concatenate([b.skin.triangles + b.vertex_base for b in batches]),
+                          skin.triangles)
+    assert np.array_equal(np.concatenate([b.skin.edges + b.vertex_base for b in batches]), skin.edges)
+    assert np.concatenate([b.skin.part_ids for b in batches]).tolist() == skin.part_ids.tolist()
+
+    # 전체 스킨 인덱스 → 묶음 로컬 인덱스 (선택 하이라이트)
+    local = split_indices(skin.triangles[::-1], vertex_bases)
+    for batch, triangles in zip(batches, local):
+        assert sorted(map(tuple, triangles.tolist())) == sorted(map(tuple, batch.skin.triangles.tolist()))
+
+
+def test_loader_reuses_cache_and_cancels():
+    mesh = make_mixed_mesh()
+    cache = RenderCache()
+    run_loader(mesh, cache)
+    _, results = run_loader(mesh, cache)
+    assert results[-1].built == 0
+
+    loader = ProgressiveSkinLoader(cache, mesh.nodes, mesh.extract_exterior_faces(), COLORS, [])
+    loader.cancel()
+    loader.start()
+    loader.join(timeout=30)
+    assert loader.poll() == [] and loader.error is None
+
+
+def test_upload_queue_budget_and_priority():
+    now = [0.0]
+
+    def clock():
+        now[0] += 0.001  # 조회마다 1 ms
+        return now[0]
+
+    uploads = UploadQueue(chunk_bytes=100, clock=clock)
+    big, small = FakeBuffer(1000), FakeBuffer(150)
+    uploads.push('big', [big])
+    uploads.push('small', [small])
+    assert uploads.pending_bytes == 1150
+
+    # 예산 3 ms → 한 프레임에 몇 구간만, 우선순위가 높은 small 먼저 끝남
+    done = uploads.step(3.0, priority=lambda tag: 0 if tag == 'small' else 1)
+    assert done == ['small'] and small.remaining == 0
+    assert 0 < big.uploaded < 1000
+
+    # 예산이 0이어도 프레임마다 최소 한 구간
+    before = big.uploaded
+    assert uploads.step(0.0) == [] and big.uploaded == before + 100
+
+    frames = 0
+    while len(uploads):
+        uploads.step(3.0)
+        frames += 1
+    assert big.remaining == 0 and frames > 1
+    assert uploads.step(3.0) == [] and uploads.last_bytes == 0
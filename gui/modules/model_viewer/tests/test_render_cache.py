@@ -0,0 +1,148 @@
+"""Part 단위 버퍼 캐시 테스트 (LRU, 바뀐 Part만 재생성) + 성능 모니터 (ring buffer, trace)"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core import vertex_buffers as vb
+from gui.modules.model_viewer.core.lod import decimate_skin
+from gui.modules.model_viewer.core.render_cache import (
+    PerformanceMonitor, RenderCache, cached_decimation, cached_skin, format_hud,
+)
+from gui.modules.model_viewer.tests.test_mesh_data import make_mixed_mesh
+
+MB = 1024 * 1024
+
+
+def assert_same_skin(a: vb.IndexedSkin, b: vb.IndexedSkin):
+    for name in ('vertices', 'triangles', 'edges', 'part_ids', 'vertex_offsets', 'face_offsets',
+                 'triangle_offsets', 'edge_offsets', 'pick_elements'):
+        assert np.array_equal(getattr(a, name), getattr(b, name)), name
+    assert a.face_edge_count == b.face_edge_count
+
+
+def test_lru_budget_and_counters():
+    released = []
+    cache = RenderCache(max_memory_mb=3)
+    for pid in (1, 2, 3):
+        cache.put((pid, 'skin', 'v1'), f'part{pid}', MB, release=released.append)
+    assert cache.get((1, 'skin', 'v1')) == 'part1'           # 1을 최근 사용으로
+
+    cache.put((4, 'skin', 'v1'), 'part4', MB, release=released.append)
+    assert released == ['part2'] and (2, 'skin', 'v1') not in cache
+    assert cache.get((2, 'skin', 'v1')) is None
+
+    # 같은 (part, mode)의 새 버전은 이전 버전을 대체 (eviction 아님)
+    cache.put((3, 'skin', 'v2'), 'part3b', MB, release=released.append)
+    assert released == ['part2', 'part3'] and len(cache) == 3
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 1)
+    assert stats['memory_mb'] == 3
+
+    cache.clear()
+    assert len(cache) == 0 and cache.memory_bytes == 0 and len(released) == 5
+
+
+def test_cached_skin_rebuilds_changed_parts_only():
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    colors = {pid: (pid / 10, 0.5, 0.25) for pid in faces}
+    cache = RenderCache()
+
+    skin, signatures, built = cached_skin(cache, mesh.nodes, faces, colors)
+    assert built == len(faces)
+    assert_same_skin(skin, vb.build_indexed_skin(mesh.nodes, faces, colors))
+
+    # 변경 없음 → 전부 캐시
+    _, _, built = cached_skin(cache, mesh.nodes, faces, colors)
+    assert built == 0
+
+    # 한 Part에서만 쓰는 노드 이동 → 그 Part만 재생성, 결과는 전체 빌드와 같음
+    owners = {}
+    for pid, part_faces in faces.items():
+        for node in np.unique(part_faces.nodes[part_faces.nodes >= 0]):
+            owners.setdefault(int(node), set()).add(pid)
+    node, (pid,) = next((n, p) for n, p in owners.items() if len(p) == 1)
+    nodes = mesh.nodes.copy()
+    nodes[node] += 0.5
+    skin, new_signatures, built = cached_skin(cache, nodes, faces, colors)
+    assert built == 1
+    assert [p for p in faces if new_signatures[p] != signatures[p]] == [pid]
+    assert_same_skin(skin, vb.build_indexed_skin(nodes, faces, colors))
+
+    # 색상 변경도 내용 변경
+    colors[pid] = (1.0, 1.0, 1.0)
+    assert cached_skin(cache, nodes, faces, colors)[2] == 1
+    assert cache.get_stats()['hits'] > 0
+
+
+def test_cached_decimation_matches_full():
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    colors = {pid: (pid / 10, 0.5, 0.25) for pid in faces}
+    cache = RenderCache()
+    skin, signatures, _ = cached_skin(cache, mesh.nodes, faces, colors)
+    bounds = (mesh.nodes.min(axis=0).astype(float), mesh.nodes.max(axis=0).astype(float))
+
+    full = decimate_skin(skin, 2, bounds)
+    assert_same_skin(cached_decimation(cache, skin, signatures, 2, bounds), full)
+    misses = cache.get_stats()['misses']
+    assert_same_skin(cached_decimation(cache, skin, signatures, 2, bounds), full)
+    assert cache.get_stats()['misses'] == misses
+
+
+def test_performance_monitor_ring_buffer():
+    monitor = PerformanceMonitor(max_samples=4)
+    for i in range(6):
+        monitor.frame_start()
+        monitor.record_draw_call(triangles=100 * i)
+        monitor.record_draw_call(vertex_count=10)
+        monitor.frame_end()
+        # 프레임 시간을 알려진 값으로 (1..6 ms)
+        monitor._frames['ms'][i % 4] = i + 1
+
+    frames = monitor.frames()
+    assert len(frames) == 4 and frames['ms'].tolist() == [3, 4, 5, 6]
+    assert frames['triangles'].tolist() == [200, 300, 400, 500]
+    assert monitor.get_last_frame_time() == 6
+    assert np.isclose(monitor.get_fps(), 1000 / 4.5)
+
+    stats = monitor.get_stats()
+    assert stats['frames'] == 6 and stats['draw_calls'] == 2 and stats['triangles'] == 500
+    assert np.isclose(stats['p50_ms'], 4.5) and stats['p99_ms'] <= 6
+    monitor.reset()
+    assert monitor.get_stats()['frames'] == 0 and len(monitor.frames()) == 0
+
+
+def test_performance_monitor_chrome_trace(tmp_path):
+    monitor = PerformanceMonitor()
+    with monitor.rebuild('skin'):
+        pass
+    for _ in range(3):
+        monitor.frame_start()
+        with monitor.section('solid'):
+            monitor.record_draw_call(triangles=12)
+        monitor.record_culling(5, 2, 1)
+        monitor.frame_end()
+
+    path = tmp_path / 'trace.json'
+    monitor.export_trace(str(path), {'gpu_bytes': np.int64(1024)})
+    trace = json.loads(path.read_text())
+    events = trace['traceEvents']
+    frames = [e for e in events if e['name'] == 'frame']
+    assert len(frames) == 3 and all(e['ph'] == 'X' and e['dur'] >= 0 for e in frames)
+    assert frames[-1]['args']['frustum_culled'] == 2 and frames[-1]['args']['triangles'] == 12
+    assert sum(e['name'] == 'solid' for e in events) == 3
+    assert any(e['cat'] == 'rebuild' and e['name'] == 'skin' for e in events if 'cat' in e)
+    assert trace['otherData'] == {'gpu_bytes': 1024}
+
+    lines = format_hud(dict(monitor.get_stats(), gpu_bytes=2 * 1024 * 1024, drawn_parts=2))
+    assert lines[0].endswith(tuple('0123456789')) and 'FPS' in lines[0]
+    assert any('culled frustum 2' in line for line in lines)
+    assert any(line.startswith('VBO 2.0 MB') for line in lines)
+    assert lines[-1].startswith('rebuild skin')
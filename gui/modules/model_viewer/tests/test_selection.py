@@ -0,0 +1,114 @@
+"""Box / Lasso 영역 선택 테스트 (GL 없이 합성 카메라로 검증)"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core.camera import Camera
+from gui.modules.model_viewer.core.selection import (
+    ADD, ELEMENTS, NODES, PARTS, SUBTRACT, RegionSelector, SelectionManager,
+    points_in_polygon, project_points, rectangle_polygon,
+)
+from gui.modules.model_viewer.tests.test_bvh import make_stacked_plates
+
+WIDTH, HEIGHT = 800, 600
+
+
+def top_view(mesh):
+    """평판을 위(+Z)에서 내려다보는 카메라 → (view, proj)"""
+    camera = Camera()
+    camera.fit_to_bounds(*mesh.bounds)
+    camera.elevation = 89.0
+    return camera.get_view_matrix(), camera.get_projection_matrix(WIDTH / HEIGHT)
+
+
+def test_points_in_polygon_box_and_lasso():
+    xy = np.array([[5, 5], [15, 5], [5, 15], [-1, 5], [9.9, 0.1]], dtype=float)
+    box = rectangle_polygon(0, 0, 10, 10)
+    assert points_in_polygon(xy, box).tolist() == [True, False, False, False, True]
+
+    # L자 lasso: (15, 5)는 안, (15, 15)는 오목한 부분이라 밖
+    lasso = np.array([[0, 0], [20, 0], [20, 10], [10, 10], [10, 20], [0, 20]], dtype=float)
+    inside = points_in_polygon(np.array([[15, 5], [15, 15], [5, 15], [25, 5]], dtype=float), lasso)
+    assert inside.tolist() == [True, False, True, False]
+
+
+def test_project_points_matches_screen_center():
+    mesh = make_stacked_plates()
+    view, proj = top_view(mesh)
+    center = (mesh.bounds[0] + mesh.bounds[1])[None] / 2
+    xy, depth = project_points(center, view, proj, WIDTH, HEIGHT)
+    assert np.allclose(xy[0], [WIDTH / 2, HEIGHT / 2], atol=1e-3)
+    assert depth[0] > 0
+
+
+def test_box_select_front_only_and_through():
+    mesh = make_stacked_plates()
+    selector = RegionSelector(mesh, mesh.extract_exterior_faces())
+    view, proj = top_view(mesh)
+    everything = rectangle_polygon(0, 0, WIDTH, HEIGHT)
+
+    # 앞면만: 위 평판 (Part 2)만, 관통: 두 평판 모두
+    front = selector.select(everything, view, proj, WIDTH, HEIGHT)
+    assert len(front) == 400 and front.min() == 400
+    through = selector.select(everything, view, proj, WIDTH, HEIGHT, front_only=False)
+    assert np.array_equal(through, np.arange(800))
+
+    # 위 평판을 숨기면 아래 평판이 보임
+    hidden = selector.select(everything, view, proj, WIDTH, HEIGHT, visible_parts={1})
+    assert np.array_equal(hidden, np.arange(400))
+
+    assert selector.select(everything, view, proj, WIDTH, HEIGHT, target=PARTS).tolist() == [2]
+    nodes = selector.select(everything, view, proj, WIDTH, HEIGHT, target=NODES)
+    assert len(nodes) == 21 * 21 and np.allclose(mesh.to_world(mesh.nodes[nodes])[:, 2], 1.0)
+
+    # 왼쪽 절반 box → 요소 중심이 화면 왼쪽인 요소만
+    half = selector.select(rectangle_polygon(0, 0, WIDTH / 2, HEIGHT), view, proj, WIDTH, HEIGHT)
+    xy, _ = project_points(selector._face_centers, view, proj, WIDTH, HEIGHT)
+    expected = np.sort(selector._face_elements[(xy[:, 0] <= WIDTH / 2) & (selector._face_elements >= 400)])
+    assert np.array_equal(half, expected) and 0 < len(half) < 400
+
+
+def test_lasso_and_oblique_view():
+    mesh = make_stacked_plates()
+    selector = RegionSelector(mesh, mesh.extract_exterior_faces())
+    camera = Camera()
+    camera.fit_to_bounds(*mesh.bounds)
+    camera.azimuth, camera.elevation = 30.0, 35.0
+    view, proj = camera.get_view_matrix(), camera.get_projection_matrix(WIDTH / HEIGHT)
+
+    # 비스듬히 봐도 위 평판 전체가 앞면 (깊이 버퍼 여유로 자기 가림 없음)
+    front = selector.select(rectangle_polygon(0, 0, WIDTH, HEIGHT), view, proj, WIDTH, HEIGHT)
+    assert np.isin(np.arange(400, 800), front).all()
+    assert len(front) < 800
+
+    # 삼각형 lasso = 같은 삼각형 안에 투영되는 위 평판 요소
+    lasso = np.array([[100, 500], [700, 500], [400, 100]], dtype=float)
+    picked = selector.select(lasso, view, proj, WIDTH, HEIGHT)
+    xy, _ = project_points(selector._face_centers, view, proj, WIDTH, HEIGHT)
+    top = selector._face_elements >= 400
+    expected = np.sort(selector._face_elements[top & points_in_polygon(xy, lasso)])
+    assert len(expected) and np.isin(expected, picked).all()
+
+
+def test_selection_manager_modes():
+    selection = SelectionManager()
+    selection.apply(np.array([5, 1, 3, 3]))
+    assert selection.indices.tolist() == [1, 3, 5]
+    selection.apply(np.arange(4, 8), ADD)
+    assert selection.indices.tolist() == [1, 3, 4, 5, 6, 7]
+    selection.apply(np.array([3, 6, 100]), SUBTRACT)
+    assert selection.indices.tolist() == [1, 4, 5, 7]
+    assert selection.is_selected(4) and not selection.is_selected(3)
+
+    selection.select(4, multi_select=True)
+    assert selection.get_selected() == {1, 5, 7}
+    selection.select(9)
+    assert selection.count() == 1
+
+    selection.set_target(NODES)
+    assert selection.count() == 0 and selection.target == NODES
+    selection.set_target(ELEMENTS)
@@ -0,0 +1,152 @@
+"""VBO 정점 버퍼 벡터화 테스트 (이전 정점별 루프와 같은 결과)"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[4]))
+
+from gui.modules.model_viewer.core import vertex_buffers as vb
+from gui.modules.model_viewer.tests.test_mesh_data import make_mixed_mesh
+
+
+def reference_vertices(mesh, part_faces, color, mode):
+    """정점별 list.extend 방식 (이전 구현)"""
+    vertices = []
+    for elem_idx, face_indices in part_faces:
+        node_indices = mesh.elements[elem_idx]
+        if mode == 'solid':
+            corners = [i for k in range(1, len(face_indices) - 1)
+                       for i in (face_indices[0], face_indices[k], face_indices[k + 1])]
+        else:
+            n = len(face_indices)
+            corners = [i for k in range(n) for i in (face_indices[k], face_indices[(k + 1) % n])]
+        for i in corners:
+            vertices.extend(mesh.nodes[node_indices[i]])
+            vertices.extend(color)
+    return np.array(vertices, dtype=np.float32).reshape(-1, vb.FLOATS_PER_VERTEX)
+
+
+def test_solid_and_edge_vertices_match_loops():
+    mesh = make_mixed_mesh()
+    color = (0.85, 0.33, 0.10)
+    for part_faces in mesh.extract_exterior_faces().values():
+        assert np.array_equal(vb.solid_vertices(mesh.nodes, part_faces.nodes, color),
+                              reference_vertices(mesh, part_faces, color, 'solid'))
+        assert np.array_equal(vb.edge_vertices(mesh.nodes, part_faces.nodes, color),
+                              reference_vertices(mesh, part_faces, color, 'edges'))
+
+
+def test_picking_ids_per_face():
+    """삼각형 정점 색상 → 면 ID (quad의 두 삼각형은 같은 ID)"""
+    mesh = make_mixed_mesh()
+    part_faces = mesh.extract_exterior_faces()[3]    # penta: tri 2 + quad 3
+    data = vb.picking_vertices(mesh.nodes, part_faces.nodes, first_id=70000)
+
+    rgb = np.rint(data[:, 3:] * 255).astype(np.int64)
+    ids = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    expected = 70000 + np.repeat(np.arange(len(part_faces)), np.where(part_faces.triangles, 3, 6))
+    assert ids.tolist() == expected.tolist()
+
+
+def test_indexed_skin():
+    """공유 정점/엣지 1번씩, provoking 정점이 면의 법선과 picking ID를 가짐"""
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    colors = {pid: (pid / 10, 0.5, 0.25) for pid in faces}
+    skin = vb.build_indexed_skin(mesh.nodes, faces, colors)
+
+    face_nodes = np.concatenate([f.nodes for f in faces.values()])
+    tris_per_face = np.where(face_nodes[:, 3] < 0, 1, 2)
+    face_of = np.repeat(np.arange(len(face_nodes)), tris_per_face)
+    provoking = skin.vertices[skin.triangles[:, 2]]
+    rgb = np.rint(provoking[:, 9:] * 255).astype(np.int64)
+    assert ((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]).tolist() == (face_of + 1).tolist()
+    assert np.allclose(provoking[:, 3:6], vb.face_normals(mesh.nodes, face_nodes)[face_of])
+    assert skin.pick_elements[1:].tolist() == np.concatenate([f.elements for f in faces.values()]).tolist()
+
+    for rank, (pid, part_faces) in enumerate(faces.items()):
+        # 삼각형 정점 = 해당 면의 노드 (Part 색상)
+        triangles = skin.triangles[skin.triangle_offsets[rank]:skin.triangle_offsets[rank + 1]]
+        tri_faces = part_faces.nodes[face_of[skin.triangle_offsets[rank]:skin.triangle_offsets[rank + 1]]
+                                     - face_of[skin.triangle_offsets[rank]]]
+        for tri, face in zip(skin.vertices[triangles, :3].tolist(), tri_faces):
+            assert {tuple(p) for p in tri} <= {tuple(p) for p in mesh.nodes[face[face >= 0]].tolist()}
+        assert np.allclose(skin.vertices[triangles.ravel(), 6:9], colors[pid])
+
+        # 엣지: 면 테두리의 중복 없는 집합
+        edges = skin.edges[skin.edge_offsets[rank]:skin.edge_offsets[rank + 1]]
+        as_points = {frozenset(map(tuple, skin.vertices[e, :3].tolist())) for e in edges}
+        expected = {frozenset(map(tuple, mesh.nodes[e].tolist())) for e in vb.face_edges(part_faces.nodes)}
+        assert len(edges) == len(as_points) and as_points == expected
+
+    assert skin.nbytes < skin.unindexed_nbytes
+
+
+def test_part_runs():
+    """visible Part → 인접 Part를 합친 draw 구간"""
+    runs = vb.PartRuns([5, 3, 9, 1, 7])
+    offsets = np.array([0, 10, 10, 30, 45, 50])    # Part 3은 비어 있음
+
+    runs.set_visible({5, 3, 1, 42})
+    assert runs.runs.tolist() == [[0, 2], [3, 4]]
+    starts, counts = runs.ranges(offsets)
+    assert starts.tolist() == [0, 30] and counts.tolist() == [10, 15]
+
+    runs.set_visible({3})                           # isolate: 빈 Part → 그릴 것 없음
+    assert runs.runs.tolist() == [[1, 2]] and len(runs.ranges(offsets)[0]) == 0
+
+    runs.set_visible({1, 3, 5, 7, 9})
+    assert runs.runs.tolist() == [[0, 5]]
+    runs.set_visible(set())
+    assert runs.runs.shape == (0, 2)
+
+
+def test_part_attributes_recolor_ranges():
+    """색상/하이라이트/투명도 → 바뀐 Part만, 정점 색상은 Part 구간 단위"""
+    mesh = make_mixed_mesh()
+    faces = mesh.extract_exterior_faces()
+    colors = {pid: (pid / 10, 0.5, 0.25) for pid in faces}
+    skin = vb.build_indexed_skin(mesh.nodes, faces, colors)
+    attributes = vb.PartAttributes(list(mesh.part_elements), colors)
+
+    # 초기 정점 색상 = 스킨에 구워진 Part 색상, 불투명
+    rgba = attributes.vertex_colors(skin.part_ids, skin.vertex_offsets)
+    assert rgba.dtype == np.uint8 and rgba.shape == (len(skin.vertices), 4)
+    assert np.array_equal(rgba[:, :3], np.round(skin.vertices[:, 6:9] * 255).astype(np.uint8))
+    assert (rgba[:, 3] == 255).all()
+
+    pids = skin.part_ids.tolist()
+    attributes.set_colors({pids[0]: (1.0, 0.0, 0.0)})
+    attributes.set_alpha([pids[-1]], 0.5)
+    attributes.set_highlighted([])
+    assert attributes.commit() == {pids[0], pids[-1]}
+    assert attributes.commit() == set()
+    assert attributes.translucent == {pids[-1]}
+    assert attributes.opacity(pids[-1]) == 0.5 and attributes.opacity(-1) == 1.0
+    assert attributes.color(pids[0]) == (1.0, 0.0, 0.0)
+
+    # 하이라이트는 하이라이트 색과 반씩, 해제하면 원래 색
+    attributes.set_highlighted([pids[0]])
+    assert attributes.commit() == {pids[0]}
+    assert np.allclose(attributes.color(pids[0]), (1.0, 0.275, 0.0), atol=1 / 255)
+    attributes.set_highlighted([])
+    assert attributes.commit() == {pids[0]}
+
+    # 바뀐 Part의 정점 구간 (인접 Part는 합침, 구간이 많으면 하나로)
+    offsets = skin.vertex_offsets
+    starts, counts = vb.color_update_ranges(skin.part_ids, offsets, {pids[0], pids[-1]})
+    assert starts.tolist() == [0, offsets[-2]]
+    assert counts.tolist() == [offsets[1], offsets[-1] - offsets[-2]]
+    starts, counts = vb.color_update_ranges(skin.part_ids, offsets, {pids[0], pids[-1]}, max_ranges=1)
+    assert starts.tolist() == [0] and counts.tolist() == [offsets[-1]]
+    updated = attributes.vertex_colors(skin.part_ids, skin.vertex_offsets)
+    assert (updated[offsets[-2]:, 3] == 128).all() and np.array_equal(updated[offsets[1]:offsets[-2]],
+                                                                      rgba[offsets[1]:offsets[-2]])
+
+
+def test_sorted_unique_matches_np_unique():
+    values = np.random.default_rng(0).integers(0, 50, 500).astype(np.int64)
+    assert np.array_equal(vb.sorted_unique(values), np.unique(values))
+    assert len(vb.sorted_unique(np.empty(0, dtype=np.int64))) == 0
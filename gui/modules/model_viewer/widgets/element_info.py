@@ -53,7 +53,7 @@ class ElementInfoWidget(QWidget):
 
         # 요소 정보 수집
         node_indices = self._mesh.elements[elem_idx]
-        elem_type = self._mesh.element_type
+        elem_type = self._mesh.cell_name(elem_idx)
 
         # Part 찾기
         part_id = None
@@ -64,10 +64,10 @@ class ElementInfoWidget(QWidget):
 
         part_name = self._mesh.part_names.get(part_id, "Unknown") if part_id else "Unknown"
 
-        # 노드 좌표
+        # 노드 좌표 (전역 좌표로 표시)
         node_coords = []
         for nid in node_indices:
-            coords = self._mesh.nodes[nid]
+            coords = self._mesh.to_world(self._mesh.nodes[nid])
             node_coords.append(f"  Node {nid}: ({coords[0]:.3f}, {coords[1]:.3f}, {coords[2]:.3f})")
 
         # 정보 텍스트 생성
@@ -3,13 +3,17 @@
 여러 렌더링 백엔드를 지원하는 통합 3D 뷰어
 """
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
-from PySide6.QtCore import Qt, Signal, QPoint
+from PySide6.QtCore import Qt, Signal, QPoint, QTimer
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygon, QFont, QFontMetrics
 from OpenGL.GL import *
+import numpy as np
 import time
-from typing import Optional, Set
+from typing import Dict, List, Optional, Set
 
 from ..core.mesh_data import MeshData
 from ..core.camera import Camera
+from ..core.selection import ADD, REPLACE, SUBTRACT, rectangle_polygon
+from ..core.render_cache import format_hud
 from ..backends.legacy_renderer import LegacyRenderer
 from ..backends.vbo_renderer import VBORenderer
 
@@ -25,12 +29,18 @@ class ModelGLWidget(QOpenGLWidget):
     - Part별 색상
     - 와이어프레임/솔리드/노드 렌더링
     - 마우스 인터랙션
+    - Box/Lasso 영역 선택 (선택 도구 활성 시 왼쪽 드래그, Shift 추가 / Ctrl 제외)
+    - 성능 HUD (FPS, 프레임 시간 백분위수, draw call, culling, VBO 메모리) + 프레임 trace 내보내기
+    - Part 색상/투명도/하이라이트 변경 (VBO 백엔드는 색상 버퍼 구간만 갱신)
+    - 큰 모델 점진적 로드 진행 표시 (로드 중에는 계속 다시 그려 업로드 진행)
+    - 외곽면/스킨 디스크 캐시 (한 번 연 모델은 외곽면 추출/스킨 생성 생략)
     """
 
     # 시그널
     statusMessage = Signal(str)
     fpsUpdate = Signal(float)
     elementSelected = Signal(int)  # 요소 선택 시그널 (element_index)
+    regionSelected = Signal(object)  # 영역 선택 후 전체 선택 (정렬된 인덱스 np.ndarray)
 
     def __init__(self, parent=None, backend='legacy'):
         """
@@ -43,6 +53,7 @@ class ModelGLWidget(QOpenGLWidget):
         # 백엔드 선택
         self._backend_name = backend
         self._renderer = None
+        self._skin_disk_cache = None  # 외곽면/스킨 디스크 캐시 (백엔드 교체 시에도 유지)
         self._create_backend(backend)
 
         # 카메라
@@ -56,10 +67,23 @@ class ModelGLWidget(QOpenGLWidget):
         self._is_panning = False
         self._mouse_moved = False  # 드래그 vs 클릭 구분
 
+        # 영역 선택 ('box', 'lasso' 또는 None = 카메라 조작)
+        self._selection_tool: Optional[str] = None
+        self._selection_front_only = True
+        self._selection_path: List[QPoint] = []
+
+        # 카메라 조작 종료 감지 (마지막 움직임 후 일정 시간 → 원래 디테일로 다시 그림)
+        self._interaction_timer = QTimer(self)
+        self._interaction_timer.setSingleShot(True)
+        self._interaction_timer.timeout.connect(self._end_interaction)
+
         # FPS
         self._frame_count = 0
         self._fps_timer = 0.0
 
+        # 성능 HUD
+        self._show_hud = False
+
     def _create_backend(self, backend: str):
         """백엔드 생성"""
         if backend == 'legacy':
@@ -73,6 +97,7 @@ class ModelGLWidget(QOpenGLWidget):
         else:
             self.statusMessage.emit(f"Unknown backend '{backend}', using Legacy")
             self._renderer = LegacyRenderer()
+        self._renderer.set_skin_disk_cache(self._skin_disk_cache)
 
     def set_backend(self, backend: str):
         """렌더링 백엔드 변경"""
@@ -86,6 +111,7 @@ class ModelGLWidget(QOpenGLWidget):
         show_wireframe = self._renderer._show_wireframe if self._renderer else False
         show_edges = self._renderer._show_edges if self._renderer else True
         show_solid = self._renderer._show_solid if self._renderer else True
+        selection_target = self._renderer.selection.target if self._renderer else None
 
         # 새 백엔드 생성
         self._backend_name = backend
@@ -100,6 +126,8 @@ class ModelGLWidget(QOpenGLWidget):
         self._renderer.set_show_wireframe(show_wireframe)
         self._renderer.set_show_edges(show_edges)
         self._renderer.set_show_solid(show_solid)
+        if selection_target:
+            self._renderer.selection.set_target(selection_target)
 
         # OpenGL 재초기화 필요
         self.makeCurrent()
@@ -112,10 +140,18 @@ class ModelGLWidget(QOpenGLWidget):
         """현재 백엔드 이름"""
         return self._renderer.name if self._renderer else "None"
 
+    def set_skin_disk_cache(self, cache):
+        """외곽면/스킨 디스크 캐시 설정 (gui.mesh_cache.SkinDiskCache, 다음 set_mesh부터)"""
+        self._skin_disk_cache = cache
+        if self._renderer:
+            self._renderer.set_skin_disk_cache(cache)
+
     def set_mesh(self, mesh: MeshData):
-        """메쉬 설정"""
+        """메쉬 설정 (이전 모델의 GPU 버퍼 해제와 진행 중인 로드 취소 포함)"""
         if self._renderer:
+            self.makeCurrent()
             self._renderer.set_mesh(mesh)
+            self.doneCurrent()
             if mesh:
                 self._camera.fit_to_bounds(mesh.bounds[0], mesh.bounds[1])
         self.update()
@@ -145,6 +181,22 @@ class ModelGLWidget(QOpenGLWidget):
             self._renderer.set_show_solid(show)
         self.update()
 
+    def set_part_colors(self, colors: Dict[int, tuple]):
+        """Part 색상 변경 {part_id: (r, g, b)}"""
+        if self._renderer:
+            self._renderer.set_part_colors(colors)
+        self.update()
+
+    def set_part_opacity(self, part_ids: Set[int], opacity: float):
+        if self._renderer:
+            self._renderer.set_part_opacity(part_ids, opacity)
+        self.update()
+
+    def set_highlighted_parts(self, part_ids: Set[int]):
+        if self._renderer:
+            self._renderer.set_highlighted_parts(part_ids)
+        self.update()
+
     def reset_view(self):
         mesh = self._renderer._mesh if self._renderer else None
         if mesh:
@@ -188,6 +240,119 @@ class ModelGLWidget(QOpenGLWidget):
         self._camera.view_isometric()
         self.update()
 
+    # ========== 영역 선택 ==========
+
+    def set_selection_tool(self, tool: Optional[str]):
+        """영역 선택 도구 ('box', 'lasso', None이면 왼쪽 드래그는 회전)"""
+        self._selection_tool = tool
+        self._selection_path = []
+        self.update()
+
+    def set_selection_target(self, target: str):
+        """선택 대상 ('elements', 'nodes', 'parts') - 바꾸면 선택 해제"""
+        if self._renderer:
+            self._renderer.selection.set_target(target)
+            self._renderer.clear_selection()
+        self.update()
+
+    def set_selection_front_only(self, front_only: bool):
+        """앞면만 선택 (False면 가려진/내부 요소까지 관통 선택)"""
+        self._selection_front_only = front_only
+
+    def clear_selection(self):
+        if self._renderer:
+            self._renderer.clear_selection()
+        self.update()
+
+    def _finish_region_selection(self, modifiers):
+        """드래그 종료 → 영역 선택 (Shift 추가, Ctrl 제외, 없으면 교체)"""
+        path, self._selection_path = self._selection_path, []
+        if not self._renderer or len(path) < 2:
+            self.update()
+            return
+        if self._selection_tool == 'box':
+            polygon = rectangle_polygon(path[0].x(), path[0].y(), path[-1].x(), path[-1].y())
+        else:
+            polygon = np.array([(p.x(), p.y()) for p in path], dtype=np.float64)
+
+        if modifiers & Qt.ShiftModifier:
+            mode = ADD
+        elif modifiers & Qt.ControlModifier:
+            mode = SUBTRACT
+        else:
+            mode = REPLACE
+        t0 = time.perf_counter()
+        found = self._renderer.select_region(polygon, self.width(), self.height(), mode,
+                                             self._selection_front_only)
+        selection = self._renderer.selection
+        self.update()
+        self.regionSelected.emit(selection.indices)
+        self.statusMessage.emit(f"{len(found):,} {selection.target} in region, {selection.count():,} selected "
+                                f"({(time.perf_counter() - t0) * 1000:.0f} ms)")
+
+    def _draw_selection_path(self):
+        """드래그 중인 선택 영역 (점선)
+
+        painter.end()가 바꾼 GL 상태(depth test 등)는 렌더러가 다음 render()와
+        GPU picking 시작 시 apply_frame_state()로 복원합니다.
+        """
+        painter = QPainter(self)
+        painter.setPen(QPen(QColor(255, 255, 0), 1, Qt.DashLine))
+        path = self._selection_path
+        if self._selection_tool == 'box':
+            x0, y0, x1, y1 = path[0].x(), path[0].y(), path[-1].x(), path[-1].y()
+            painter.drawRect(min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0))
+        else:
+            painter.drawPolygon(QPolygon(path))
+        painter.end()
+
+    # ========== 성능 HUD ==========
+
+    def set_show_hud(self, show: bool):
+        """성능 HUD 표시 ON/OFF"""
+        self._show_hud = show
+        self.update()
+
+    def export_trace(self, path: str) -> bool:
+        """최근 프레임 기록을 Chrome trace JSON으로 저장 (지원하지 않는 백엔드는 False)"""
+        monitor = self._renderer.performance_monitor if self._renderer else None
+        if monitor is None:
+            return False
+        monitor.export_trace(path, dict(self._renderer.get_stats(), backend=self._renderer.name))
+        return True
+
+    def _draw_hud(self):
+        """왼쪽 위 성능 HUD (반투명 배경, 고정폭 글꼴)
+
+        표시하는 프레임 시간은 apply_frame_state()로 상태를 복원한 뒤의 render() 측정값입니다.
+        """
+        lines = format_hud(self._renderer.get_stats()) if self._renderer else []
+        if not lines:
+            lines = [f"{self.get_backend_name()}: no frame statistics"]
+        painter = QPainter(self)
+        font = QFont("Monospace", 9)
+        font.setStyleHint(QFont.TypeWriter)
+        painter.setFont(font)
+        metrics = QFontMetrics(font)
+        line_height = metrics.height()
+        width = max(metrics.horizontalAdvance(line) for line in lines) + 12
+        painter.fillRect(6, 6, width, line_height * len(lines) + 8, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(230, 230, 230))
+        for i, line in enumerate(lines):
+            painter.drawText(12, 10 + metrics.ascent() + i * line_height, line)
+        painter.end()
+
+    def _draw_loading(self, progress: float):
+        """아래쪽 가운데 점진적 로드 진행 막대"""
+        painter = QPainter(self)
+        width = min(240, self.width() - 24)
+        x, y = (self.width() - width) // 2, self.height() - 28
+        painter.fillRect(x, y, width, 12, QColor(0, 0, 0, 160))
+        painter.fillRect(x + 2, y + 2, int((width - 4) * progress), 8, QColor(80, 160, 255))
+        painter.setPen(QColor(230, 230, 230))
+        painter.drawText(x, y - 4, f"Loading model... {progress:.0%}")
+        painter.end()
+
     # ===== OpenGL =====
 
     def initializeGL(self):
@@ -206,6 +371,16 @@ class ModelGLWidget(QOpenGLWidget):
         if self._renderer:
             self._renderer.render()
 
+        if len(self._selection_path) > 1:
+            self._draw_selection_path()
+        if self._show_hud:
+            self._draw_hud()
+
+        progress = self._renderer.loading_progress if self._renderer else None
+        if progress is not None:
+            self._draw_loading(progress)
+            self.update()  # 다음 프레임에 이어서 업로드
+
         # FPS
         self._frame_count += 1
         if time.time() - self._fps_timer > 1.0:
@@ -218,16 +393,21 @@ class ModelGLWidget(QOpenGLWidget):
     def mousePressEvent(self, event):
         self._last_mouse_pos = event.pos()
         self._mouse_moved = False  # 리셋
-        if event.button() == Qt.LeftButton:
+        if event.button() == Qt.LeftButton and self._selection_tool:
+            self._selection_path = [event.pos()]
+        elif event.button() == Qt.LeftButton:
             self._is_panning = bool(event.modifiers() & Qt.ShiftModifier)
             self._is_rotating = not self._is_panning
         elif event.button() == Qt.MiddleButton:
             self._is_panning = True
 
     def mouseReleaseEvent(self, event):
-        # 클릭 (드래그 없음) → 요소 선택
+        # 클릭 (드래그 없음) → 요소 선택, 선택 도구 드래그 → 영역 선택
         if event.button() == Qt.LeftButton and not self._mouse_moved:
+            self._selection_path = []
             self._handle_element_pick(event.x(), event.y())
+        elif event.button() == Qt.LeftButton and self._selection_path:
+            self._finish_region_selection(event.modifiers())
 
         self._is_rotating = False
         self._is_panning = False
@@ -244,10 +424,22 @@ class ModelGLWidget(QOpenGLWidget):
         if abs(dx) > 2 or abs(dy) > 2:
             self._mouse_moved = True
 
-        if self._is_rotating:
+        if self._selection_path:
+            # 시작점에서 조금씩 끌어도 드래그로 처리
+            if (event.pos() - self._selection_path[0]).manhattanLength() > 2:
+                self._mouse_moved = True
+            # lasso는 2픽셀 이상 움직였을 때만 점 추가, box는 반대쪽 모서리만 갱신
+            if self._selection_tool == 'box':
+                self._selection_path[1:] = [event.pos()]
+            elif (event.pos() - self._selection_path[-1]).manhattanLength() > 2:
+                self._selection_path.append(event.pos())
+            self.update()
+        elif self._is_rotating:
+            self._begin_interaction()
             self._camera.rotate(dx * 0.5, dy * 0.5)
             self.update()
         elif self._is_panning:
+            self._begin_interaction()
             scale = self._camera.distance * 0.001
             self._camera.pan(dx * scale, -dy * scale)
             self.update()
@@ -255,24 +447,41 @@ class ModelGLWidget(QOpenGLWidget):
 
     def wheelEvent(self, event):
         delta = event.angleDelta().y()
+        self._begin_interaction()
         self._camera.zoom(1.1 if delta > 0 else 0.9)
         self.update()
 
+    def _begin_interaction(self):
+        """카메라 조작 중 (렌더러 LOD) - 움직일 때마다 종료 타이머 재시작"""
+        if self._renderer:
+            self._renderer.begin_interaction()
+            self._interaction_timer.start(self._renderer.interaction_settle_ms)
+
+    def _end_interaction(self):
+        """움직임이 멈춤 → 원래 디테일로 다시 그리기"""
+        if self._renderer:
+            self._renderer.end_interaction()
+        self.update()
+
     def _handle_element_pick(self, x: int, y: int):
         """요소 선택 처리 (클릭)"""
         if not self._renderer or not hasattr(self._renderer, 'pick_element'):
             return
 
-        # OpenGL 컨텍스트 활성화
+        # OpenGL 컨텍스트 활성화 (Beam은 GPU picking)
         self.makeCurrent()
 
         # 렌더러의 picking 기능 호출
         elem_idx = self._renderer.pick_element(x, y)
 
-        # 화면 다시 그리기 (picking 렌더링 이후)
+        # 화면 다시 그리기 (선택 표시)
         self.update()
 
         # 시그널 발생
         if elem_idx is not None:
             self.elementSelected.emit(elem_idx)
-            self.statusMessage.emit(f"Element {elem_idx} selected")
+            hit = self._renderer.get_last_hit() if hasattr(self._renderer, 'get_last_hit') else None
+            if hit is not None:
+                self.statusMessage.emit(f"Element {elem_idx} selected (part {hit.part_id}, node {hit.node})")
+            else:
+                self.statusMessage.emit(f"Element {elem_idx} selected")
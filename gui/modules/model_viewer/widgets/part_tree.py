@@ -1,8 +1,11 @@
 """Part 목록 트리 위젯
 
-Part별 표시/숨기기 컨트롤
+Part별 표시/숨기기, 하이라이트, 색상/투명도 컨트롤
 """
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QWidget, QVBoxLayout, QPushButton, QHBoxLayout
+from PySide6.QtWidgets import (
+    QTreeWidget, QTreeWidgetItem, QWidget, QVBoxLayout, QPushButton, QHBoxLayout,
+    QAbstractItemView, QMenu, QColorDialog
+)
 from PySide6.QtCore import Signal, Qt
 from typing import Dict, Set
 
@@ -17,6 +20,9 @@ class PartTreeWidget(QWidget):
 
     # 시그널
     visibilityChanged = Signal(set)  # visible_part_ids
+    highlightChanged = Signal(set)  # 트리에서 선택한 part_ids (뷰어에서 하이라이트)
+    colorChanged = Signal(set, tuple)  # (part_ids, (r, g, b))
+    opacityChanged = Signal(set, float)  # (part_ids, 불투명도)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -47,7 +53,12 @@ class PartTreeWidget(QWidget):
         self._tree = QTreeWidget()
         self._tree.setHeaderLabels(["Part", "Elements"])
         self._tree.setColumnWidth(0, 200)
+        self._tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self._tree.setContextMenuPolicy(Qt.CustomContextMenu)
+        self._tree.customContextMenuRequested.connect(self._show_context_menu)
         self._tree.itemChanged.connect(self._on_item_changed)
+        self._tree.itemSelectionChanged.connect(
+            lambda: self.highlightChanged.emit(self._selected_part_ids()))
         layout.addWidget(self._tree)
 
     def set_parts(self, part_names: Dict[int, str], part_element_counts: Dict[int, int]):
@@ -93,21 +104,46 @@ class PartTreeWidget(QWidget):
 
         self.visibilityChanged.emit(visible_parts)
 
-    def _select_all(self):
-        """모두 선택"""
+    def _set_visible(self, part_ids: Set[int]):
+        """체크 상태를 한 번에 바꾸고 시그널 1회 발생"""
         self._tree.blockSignals(True)
-        for item in self._part_items.values():
-            item.setCheckState(0, Qt.Checked)
+        for part_id, item in self._part_items.items():
+            item.setCheckState(0, Qt.Checked if part_id in part_ids else Qt.Unchecked)
         self._tree.blockSignals(False)
         self._emit_visibility_changed()
 
+    def _select_all(self):
+        """모두 선택"""
+        self._set_visible(set(self._part_items))
+
     def _select_none(self):
         """모두 해제"""
-        self._tree.blockSignals(True)
-        for item in self._part_items.values():
-            item.setCheckState(0, Qt.Unchecked)
-        self._tree.blockSignals(False)
-        self._emit_visibility_changed()
+        self._set_visible(set())
+
+    def _selected_part_ids(self) -> Set[int]:
+        return {item.data(0, Qt.UserRole) for item in self._tree.selectedItems()}
+
+    def _show_context_menu(self, pos):
+        """선택한 Part 표시 제어 (Isolate / 숨기기)"""
+        selected = self._selected_part_ids()
+        if not selected:
+            return
+
+        menu = QMenu(self)
+        menu.addAction("선택 Part만 표시 (Isolate)", lambda: self._set_visible(selected))
+        menu.addAction("선택 Part 숨기기", lambda: self._set_visible(self.get_visible_parts() - selected))
+        menu.addAction("전체 표시", self._select_all)
+        menu.addSeparator()
+        menu.addAction("색상 변경...", lambda: self._choose_color(selected))
+        menu.addAction("반투명", lambda: self.opacityChanged.emit(selected, 0.35))
+        menu.addAction("불투명", lambda: self.opacityChanged.emit(selected, 1.0))
+        menu.exec(self._tree.viewport().mapToGlobal(pos))
+
+    def _choose_color(self, part_ids: Set[int]):
+        """색상 선택 대화상자 → colorChanged"""
+        color = QColorDialog.getColor(parent=self)
+        if color.isValid():
+            self.colorChanged.emit(part_ids, (color.redF(), color.greenF(), color.blueF()))
 
     def get_visible_parts(self) -> Set[int]:
         """현재 표시 중인 Part ID 반환"""
@@ -14,6 +14,7 @@ from gui.modules import ModuleRegistry, load_modules
 from gui.modules.base import BaseModule
 from gui.styles import DARK_STYLE
 from gui.dialogs.settings_dialog import SettingsDialog
+from gui.dialogs.memory_dialog import MemoryDialog
 
 
 class AppShell(QMainWindow):
@@ -123,6 +124,10 @@ class AppShell(QMainWindow):
         # 도움말 메뉴
         help_menu = menubar.addMenu("도움말(&H)")
 
+        memory_action = QAction("메모리 사용량(&M)", self)
+        memory_action.triggered.connect(self._show_memory)
+        help_menu.addAction(memory_action)
+
         about_action = QAction("정보(&A)", self)
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
@@ -247,4 +252,9 @@ class AppShell(QMainWindow):
             new_config = dialog.get_config()
             for key, value in new_config.items():
                 self.ctx.config.set(key, value)
+            self.ctx.apply_memory_budget()
             self.log_viewer.append("설정이 저장되었습니다.", "info")
+
+    def _show_memory(self):
+        """메모리 사용량 진단 다이얼로그"""
+        MemoryDialog(self).exec()
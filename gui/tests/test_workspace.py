@@ -0,0 +1,129 @@
+"""ModelWorkspace 테스트 (전환, 강등, 예산 초과 해제, 디스크 캐시 복원)"""
+import shutil
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가 (C++ 파서 빌드 경로는 루트 conftest.py)
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_DIR))
+
+import pytest
+
+from core.geometry_cache import GeometryCache
+from core.model_data import parse_k_file, _KFILE_READER_AVAILABLE
+from gui.mesh_cache import MeshDiskCache
+from gui.workspace import COMPACT, EVICTED, RESIDENT, ModelWorkspace
+
+pytestmark = pytest.mark.skipif(not _KFILE_READER_AVAILABLE, reason="C++ parser not built")
+
+SAMPLE_K = PROJECT_DIR / "core" / "kfile_parser" / "tests" / "sample.k"
+
+
+@pytest.fixture
+def decks(tmp_path):
+    paths = []
+    for name in ("baseline.k", "variant.k", "third.k"):
+        path = tmp_path / name
+        shutil.copy(SAMPLE_K, path)
+        paths.append(path)
+    return paths
+
+
+class CountingLoader:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, path):
+        self.calls.append(Path(path).name)
+        return parse_k_file(path)
+
+
+def make_workspace(tmp_path, budget_bytes=0):
+    loader = CountingLoader()
+    ws = ModelWorkspace(budget_bytes, loader=loader, mesh_cache=MeshDiskCache(tmp_path / "cache"))
+    return ws, loader
+
+
+def open_model(ws, path):
+    model = parse_k_file(str(path))
+    model.geometry.mesh        # 뷰어가 표시한 상태
+    ws.add(model)
+    return model
+
+
+def test_switch_demotes_and_keeps_store(tmp_path, decks):
+    """비활성 모델은 COMPACT - 저장소와 MeshData는 유지, 재파싱 없이 전환"""
+    ws, loader = make_workspace(tmp_path)
+    baseline = open_model(ws, decks[0])
+    store = baseline.store
+    mesh = baseline.geometry.mesh
+    baseline.geometry.part_bboxes
+
+    open_model(ws, decks[1])
+    entry = ws.get_entry(ws.make_id(str(decks[0])))
+    assert entry.state == COMPACT
+    assert baseline._store is store
+    assert baseline.geometry.contains(GeometryCache.MESH)
+    assert not baseline.geometry.contains(GeometryCache.PART_BBOXES)
+
+    assert ws.activate(entry.model_id) is baseline
+    assert entry.state == RESIDENT
+    assert baseline.store is store and baseline.geometry.mesh is mesh
+    assert loader.calls == []
+    assert ws.ids[0] == entry.model_id
+
+
+def test_edited_model_is_not_demoted_or_evicted(tmp_path, decks):
+    ws, _ = make_workspace(tmp_path, budget_bytes=1)
+    edited = open_model(ws, decks[0])
+    edited.nodes[0].x = 42.0
+    edited.mark_modified()
+    edited.geometry.mesh
+    edited.geometry.part_bboxes
+
+    open_model(ws, decks[1])
+    open_model(ws, decks[2])
+    entry = ws.get_entry(ws.make_id(str(decks[0])))
+    assert entry.state == RESIDENT and entry.model is edited
+    assert edited.geometry.contains(GeometryCache.PART_BBOXES)
+    assert edited.nodes[0].x == 42.0
+    assert ws.get_stats()['models'][-1]['modified']
+
+
+def test_budget_evicts_least_recently_used(tmp_path, decks):
+    """예산 초과 시 오래 쓰지 않은 비활성 모델부터 디스크 캐시로 해제"""
+    ws, loader = make_workspace(tmp_path)
+    models = [open_model(ws, path) for path in decks]
+    ids = [ws.make_id(str(path)) for path in decks]
+    ws.budget_bytes = models[1].memory_bytes + 1
+    ws.enforce_budget()
+
+    states = [ws.get_entry(model_id).state for model_id in ids]
+    assert states == [EVICTED, COMPACT, RESIDENT]
+    assert ws.get_entry(ids[0]).model is None
+    cache = ws.mesh_cache
+    key = ws.get_entry(ids[0]).mesh_cache_key
+    assert cache.contains(key) and cache.store_path_for(key).exists()
+
+    # 다시 활성화: 재파싱하지만 저장소 열과 MeshData는 디스크 캐시에서
+    restored = ws.activate(ids[0])
+    assert loader.calls == ["baseline.k"]
+    assert restored._store is not None
+    assert [n.nid for n in restored.nodes] == [n.nid for n in models[2].nodes]
+    assert restored.geometry.contains(GeometryCache.MESH)
+    assert ws.get_entry(ids[0]).state == RESIDENT
+    assert ws.get_entry(ids[2]).state == COMPACT
+
+
+def test_close_removes_disk_cache(tmp_path, decks):
+    ws, _ = make_workspace(tmp_path, budget_bytes=1)
+    open_model(ws, decks[0])
+    open_model(ws, decks[1])
+    model_id = ws.make_id(str(decks[0]))
+    key = ws.get_entry(model_id).mesh_cache_key
+    assert ws.mesh_cache.contains(key)
+
+    ws.close(model_id)
+    assert model_id not in ws
+    assert not ws.mesh_cache.contains(key)
+    assert not ws.mesh_cache.store_path_for(key).exists()
@@ -0,0 +1,281 @@
+"""Model workspace - 여러 모델 동시 유지 (LRU 상주 관리)
+
+기준 모델과 변형 모델을 번갈아 비교할 때 매번 재파싱하지 않도록
+여러 ParsedModelData를 ID(파일 경로)로 보관합니다.
+
+상주 단계:
+    RESIDENT  - 활성 모델. 모든 캐시 유지
+    COMPACT   - 비활성 모델. 소량 키워드 목록과 파생 지오메트리를 버리고
+                C++ 파싱 결과, 열 기반 저장소, MeshData만 유지
+                (전환 시 재파싱/저장소 재생성 없음)
+    EVICTED   - 예산 초과로 해제됨. MeshData와 저장소 열은 디스크 캐시(.npz)에
+                저장, 다시 활성화하면 재파싱 후 캐시된 배열을 바로 사용
+
+편집된 모델(revision > 0)은 저장되지 않은 편집 내용이 있으므로
+강등(demote)하지도, 해제(evict)하지도 않고 RESIDENT로 유지합니다.
+
+UI 스레드에서 사용합니다.
+"""
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any
+
+from core.geometry_cache import GeometryCache
+from gui.mesh_cache import MeshDiskCache
+from core.memory_registry import format_bytes
+
+
+RESIDENT = 'resident'
+COMPACT = 'compact'
+EVICTED = 'evicted'
+
+
+@dataclass
+class WorkspaceEntry:
+    """워크스페이스 항목"""
+    model_id: str
+    filepath: str
+    model: Optional[Any] = None      # ParsedModelData (EVICTED면 None)
+    state: str = RESIDENT
+    last_used: float = 0.0
+    mesh_cache_key: str = ""          # EVICTED 시 MeshData/저장소 캐시 키
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.model.memory_bytes if self.model is not None else 0
+
+
+class ModelWorkspace:
+    """여러 모델을 ID로 관리하는 워크스페이스
+
+    사용 예시:
+        ws = ctx.workspace
+        ctx.load_k_file("baseline.k")
+        ctx.load_k_file("variant.k")       # baseline은 COMPACT로 강등
+        ctx.switch_model("baseline.k")     # 재파싱 없이 전환
+        print(ws.format_report())
+    """
+
+    def __init__(self, budget_bytes: int = 0,
+                 loader: Optional[Callable[[str], Any]] = None,
+                 mesh_cache: Optional[MeshDiskCache] = None):
+        """
+        Args:
+            budget_bytes: 비활성 모델 메모리 예산 (0이면 무제한)
+            loader: EVICTED 모델 재로드 함수 (path -> ParsedModelData)
+            mesh_cache: MeshData 디스크 캐시
+        """
+        self._entries: Dict[str, WorkspaceEntry] = {}
+        self._active_id: Optional[str] = None
+        self.budget_bytes = int(budget_bytes)
+        self._loader = loader
+        self._mesh_cache = mesh_cache or MeshDiskCache()
+
+    # ========== 조회 ==========
+
+    @property
+    def active_id(self) -> Optional[str]:
+        return self._active_id
+
+    @property
+    def mesh_cache(self) -> MeshDiskCache:
+        """해제된 모델의 MeshData/저장소 디스크 캐시"""
+        return self._mesh_cache
+
+    @property
+    def ids(self) -> List[str]:
+        """모델 ID 목록 (최근 사용 순)"""
+        return [e.model_id for e in sorted(self._entries.values(), key=lambda e: -e.last_used)]
+
+    def __contains__(self, model_id: str) -> bool:
+        return model_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_entry(self, model_id: str) -> Optional[WorkspaceEntry]:
+        return self._entries.get(model_id)
+
+    def holds(self, model) -> bool:
+        """워크스페이스가 보관 중인 모델인지"""
+        return any(e.model is model for e in self._entries.values())
+
+    @staticmethod
+    def make_id(filepath: str) -> str:
+        return str(Path(filepath).resolve())
+
+    # ========== 추가/전환/닫기 ==========
+
+    def add(self, model, model_id: Optional[str] = None) -> str:
+        """모델 추가 (같은 ID가 있으면 교체) 후 활성화
+
+        Returns:
+            모델 ID
+        """
+        model_id = model_id or self.make_id(model.filepath)
+        old = self._entries.get(model_id)
+        if old is not None and old.model is not model:
+            self._drop(old)
+
+        self._entries[model_id] = WorkspaceEntry(
+            model_id=model_id,
+            filepath=model.filepath,
+            model=model,
+            last_used=time.monotonic(),
+        )
+        self._set_active(model_id)
+        return model_id
+
+    def activate(self, model_id: str):
+        """모델 활성화 - EVICTED면 재로드
+
+        Returns:
+            ParsedModelData
+
+        Raises:
+            KeyError: 없는 ID
+            RuntimeError: 재로드 실패
+        """
+        entry = self._entries[model_id]
+
+        if entry.state == EVICTED:
+            self._restore(entry)
+
+        entry.state = RESIDENT
+        entry.last_used = time.monotonic()
+        self._set_active(model_id)
+        return entry.model
+
+    def close(self, model_id: str):
+        """모델 닫기 (캐시/메모리 등록 해제)"""
+        entry = self._entries.pop(model_id, None)
+        if entry is None:
+            return
+        self._drop(entry)
+        if self._active_id == model_id:
+            self._active_id = None
+
+    def close_all(self):
+        for model_id in list(self._entries):
+            self.close(model_id)
+
+    # ========== 상주 관리 ==========
+
+    def _set_active(self, model_id: str):
+        previous = self._active_id
+        self._active_id = model_id
+        if previous and previous != model_id and previous in self._entries:
+            self._demote(self._entries[previous])
+        self.enforce_budget()
+
+    def _demote(self, entry: WorkspaceEntry):
+        """비활성 모델을 COMPACT로 강등 (편집된 모델은 그대로 유지)"""
+        if entry.state != RESIDENT or entry.model is None:
+            return
+        model = entry.model
+        if model.revision > 0:
+            return
+        # 저장소는 유지 (다시 만들려면 C++ 결과를 Python으로 순회해야 함)
+        model.clear_cache(keep_store=True)
+        # MeshData만 남기고 파생 지오메트리 해제
+        mesh_cached = model.geometry.contains(GeometryCache.MESH)
+        mesh = model.geometry.mesh if mesh_cached else None
+        model.geometry.invalidate()
+        if mesh is not None:
+            model.geometry.put(GeometryCache.MESH, mesh)
+        entry.state = COMPACT
+
+    def _evict(self, entry: WorkspaceEntry) -> bool:
+        """COMPACT 모델 해제 - MeshData는 디스크 캐시로"""
+        model = entry.model
+        if model is None or model.revision > 0 or self._loader is None:
+            return False
+
+        key = MeshDiskCache.key_for(entry.filepath)
+        try:
+            if model.geometry.contains(GeometryCache.MESH):
+                self._mesh_cache.save(key, model.geometry.mesh)
+                entry.mesh_cache_key = key
+            if model._store is not None:
+                self._mesh_cache.save_store(key, model._store)
+                entry.mesh_cache_key = key
+        except OSError as e:
+            print(f"[Workspace] MeshData 캐시 저장 실패: {e}")
+
+        model.release()
+        entry.model = None
+        entry.state = EVICTED
+        print(f"[Workspace] Evicted {Path(entry.filepath).name}")
+        return True
+
+    def _restore(self, entry: WorkspaceEntry):
+        """EVICTED 모델 재로드"""
+        if self._loader is None:
+            raise RuntimeError("워크스페이스 로더가 설정되지 않았습니다")
+        model = self._loader(entry.filepath)
+        if model is None:
+            raise RuntimeError(f"모델을 다시 로드할 수 없습니다: {entry.filepath}")
+
+        # 파일이 바뀌지 않았으면 캐시된 저장소 열과 MeshData 재사용
+        if entry.mesh_cache_key and entry.mesh_cache_key == MeshDiskCache.key_for(entry.filepath):
+            columns = self._mesh_cache.load_store(entry.mesh_cache_key)
+            if columns is not None:
+                model.restore_store(columns)
+            mesh = self._mesh_cache.load(entry.mesh_cache_key)
+            if mesh is not None:
+                model.geometry.put(GeometryCache.MESH, mesh)
+        entry.model = model
+
+    def enforce_budget(self):
+        """비활성 모델 합계가 예산을 넘으면 LRU 순으로 해제"""
+        if self.budget_bytes <= 0:
+            return
+
+        inactive = [e for e in self._entries.values()
+                    if e.model_id != self._active_id and e.model is not None]
+        total = sum(e.memory_bytes for e in inactive)
+        for entry in sorted(inactive, key=lambda e: e.last_used):
+            if total <= self.budget_bytes:
+                break
+            nbytes = entry.memory_bytes
+            if self._evict(entry):
+                total -= nbytes
+
+    def _drop(self, entry: WorkspaceEntry):
+        if entry.model is not None:
+            entry.model.release()
+            entry.model = None
+        if entry.mesh_cache_key:
+            self._mesh_cache.remove(entry.mesh_cache_key)
+
+    # ========== 진단 ==========
+
+    def get_stats(self) -> Dict[str, Any]:
+        models = []
+        for model_id in self.ids:
+            entry = self._entries[model_id]
+            models.append({
+                'id': model_id,
+                'filename': Path(entry.filepath).name,
+                'state': entry.state,
+                'active': model_id == self._active_id,
+                'bytes': entry.memory_bytes,
+                'modified': entry.model is not None and entry.model.revision > 0,
+            })
+        return {
+            'models': models,
+            'total_bytes': sum(m['bytes'] for m in models),
+            'budget_bytes': self.budget_bytes,
+        }
+
+    def format_report(self) -> str:
+        stats = self.get_stats()
+        budget = format_bytes(stats['budget_bytes']) if stats['budget_bytes'] else "무제한"
+        lines = [f"워크스페이스: {len(stats['models'])}개 모델, "
+                 f"{format_bytes(stats['total_bytes'])} / 예산: {budget}"]
+        for m in stats['models']:
+            mark = "*" if m['active'] else " "
+            edited = " (편집됨)" if m['modified'] else ""
+            lines.append(f"  {mark} {m['state']:<8} {format_bytes(m['bytes']):>10}  {m['filename']}{edited}")
+        return "\n".join(lines)
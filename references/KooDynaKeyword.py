@@ -1,3 +1,4 @@
+import io
 import os
 import numpy as np 
 #from dynareadout import key_file_parse
@@ -11289,6 +11290,278 @@ class DynaKeywordManager():
             self.keywords[key] = dynaManager.keywords[key]
 
 
+# Keyword output order of DynaManager.WriteOutputFile. Each entry is the list of
+# keywords of one group followed by the name of the extra keyword string that is
+# appended after the group (None: nothing appended). KEYWORD_ID is handled
+# separately because "*KEYWORD" is written when it is missing.
+# NOTE: BOUNDARY_SPC_SET_ID appears twice, exactly as in WriteOutputFile.
+DYNA_OUTPUT_SECTIONS = [
+    ([
+        "TITLE", "PARAMETER", "CONTROL_ALE", "CONTROL_ADAPT", "CONTROL_ADAPTIVE",
+        "CONTROL_TERMINATION", "CONTROL_TIMESTEP", "CONTROL_ACCURACY", "CONTROL_SOLUTION",
+        "CONTROL_DYNAMIC_RELAXATION", "CONTROL_CPU", "CONTROL_ENERGY", "CONTROL_HOURGLASS",
+        "CONTROL_IMPLICIT_AUTO", "CONTROL_IMPLICIT_DYNAMICS", "CONTROL_IMPLICIT_EIGENVALUE",
+        "CONTROL_IMPLICIT_GENERAL", "CONTROL_IMPLICIT_SOLUTION", "CONTROL_IMPLICIT_SOLVER",
+        "CONTROL_BULK_VISCOSITY", "CONTROL_CONTACT", "CONTROL_RIGID", "CONTROL_SHELL",
+        "CONTROL_SOLID", "CONTROL_OUTPUT", "CONTROL_MPP_IO_NODUMP"
+    ], "controlKeywords"),
+    ([
+        "CONTACT_ADD_WEAR", "CONTACT_AUTOMATIC_SINGLE_SURFACE",
+        "CONTACT_AUTOMATIC_SINGLE_SURFACE_ID", "CONTACT_AUTOMATIC_SURFACE_TO_SURFACE",
+        "CONTACT_AUTOMATIC_SURFACE_TO_SURFACE_ID",
+        "CONTACT_AUTOMATIC_SURFACE_TO_SURFACE_OFFSET",
+        "CONTACT_AUTOMATIC_SURFACE_TO_SURFACE_OFFSET_ID", "CONTACT_AUTOMATIC_GENERAL",
+        "CONTACT_AUTOMATIC_GENERAL_ID", "CONTACT_AUTOMATIC_NODES_TO_SURFACE",
+        "CONTACT_AUTOMATIC_NODES_TO_SURFACE_ID", "CONTACT_FEM_PERI_TIE_BREAK_ID",
+        "CONTACT_NODES_TO_SURFACE", "CONTACT_NODES_TO_SURFACE_ID",
+        "CONTACT_ONE_WAY_SURFACE_TO_SURFACE", "CONTACT_ONE_WAY_SURFACE_TO_SURFACE_ID",
+        "CONTACT_SINGLE_SURFACE", "CONTACT_SINGLE_SURFACE_ID", "CONTACT_SURFACE_TO_SURFACE",
+        "CONTACT_SURFACE_TO_SURFACE_ID", "CONTACT_SURFACE_TO_SURFACE_INTERFERENCE",
+        "CONTACT_SURFACE_TO_SURFACE_INTERFERENCE_ID", "CONTACT_TIED_NODES_TO_SURFACE",
+        "CONTACT_TIED_NODES_TO_SURFACE_ID", "CONTACT_TIED_SHELL_EDGE_TO_SURFACE",
+        "CONTACT_TIED_SHELL_EDGE_TO_SURFACE_ID",
+        "CONTACT_TIED_SHELL_EDGE_TO_SURFACE_BEAM_OFFSET",
+        "CONTACT_TIED_SHELL_EDGE_TO_SURFACE_BEAM_OFFSET_ID", "CONTACT_TIED_SURFACE_TO_SURFACE",
+        "CONTACT_TIED_SURFACE_TO_SURFACE_ID", "CONTACT_TIED_SURFACE_TO_SURFACE_OFFSET",
+        "CONTACT_TIED_SURFACE_TO_SURFACE_OFFSET_ID",
+        "CONTACT_TIED_SURFACE_TO_SURFACE_CONSTRAINED_OFFSET",
+        "CONTACT_TIED_SURFACE_TO_SURFACE_CONSTRAINED_OFFSET_ID",
+        "CONTACT_ERODING_NODES_TO_SURFACE", "CONTACT_ERODING_NODES_TO_SURFACE_ID",
+        "CONTACT_ERODING_SINGLE_SURFACE", "CONTACT_ERODING_SINGLE_SURFACE_ID",
+        "CONTACT_ERODING_SURFACE_TO_SURFACE", "CONTACT_ERODING_SURFACE_TO_SURFACE_ID",
+        "CONTACT_ERODING_SURFACE_TO_SURFACE_TITLE", "CONTACT_FORCE_TRANSDUCER_PENALTY",
+        "CONTACT_FORCE_TRANSDUCER_PENALTY_ID", "CONTACT_SLIDING_ONLY"
+    ], "contactKeywords"),
+    ([
+        "INITIAL_STRESS_SOLID", "INITIAL_STRESS_SOLID_SET", "INITIAL_VELOCITY",
+        "INITIAL_VELOCITY_NODE", "INITIAL_VELOCITY_GENERATION"
+    ], "initialKeywords"),
+    ([
+        "SET_PART", "SET_PART_LIST", "SET_PART_LIST_TITLE", "SET_PART_LIST_GENERATE",
+        "SET_NODE_ADD", "SET_NODE_LIST", "SET_NODE_LIST_TITLE", "SET_NODE_LIST_GENERATE",
+        "SET_NODE_GENERAL", "SET_SEGMENT", "SET_SEGMENT_TITLE", "SET_SHELL", "SET_SHELL_TITLE",
+        "SET_SHELL_LIST", "SET_SOLID", "SET_SOLID_TITLE"
+    ], "setKeywords"),
+    ([
+        "RIGIDWALL_GEOMETRIC_FLAT_DISPLAY", "RIGIDWALL_GEOMETRIC_FLAT_DISPLAY_ID",
+        "RIGIDWALL_PLANAR", "RIGIDWALL_PLANAR_ID", "RIGIDWALL_PLANAR_MOVING",
+        "RIGIDWALL_PLANAR_MOVING_ID", "RIGIDWALL_PLANAR_MOVING_FORCES",
+        "RIGIDWALL_PLANAR_MOVING_FORCES_ID"
+    ], "rigidKeywords"),
+    ([
+        "BOUNDARY_PRESCRIBED_MOTION_NODE", "BOUNDARY_PRESCRIBED_MOTION_NODE_ID",
+        "BOUNDARY_PRESCRIBED_MOTION_RIGID", "BOUNDARY_PRESCRIBED_MOTION_RIGID_ID",
+        "BOUNDARY_PRESCRIBED_MOTION_SET", "BOUNDARY_PRESCRIBED_MOTION_SET_ID",
+        "BOUNDARY_PZEPOT", "BOUNDARY_SPC_NODE", "BOUNDARY_SPC_SET_ID", "BOUNDARY_SPC_SET",
+        "BOUNDARY_SPC_SET_ID", "CONSTRAINED_JOINT_SPHERICAL", "CONSTRAINED_JOINT_SPHERICAL_ID",
+        "CONSTRAINED_NODAL_RIGID_BODY", "CONSTRAINED_NODAL_RIGID_BODY_TITLE",
+        "CONSTRAINED_EXTRA_NODES_NODE", "CONSTRAINED_EXTRA_NODES_SET", "CONSTRAINED_NODE_SET",
+        "CONSTRAINED_NODE_SET_ID", "CONSTRAINED_INTERPOLATION", "CONSTRAINED_RIGID_BODIES",
+        "CONSTRAINED_RIGID_BODIES_SET"
+    ], "boundaryKeywords"),
+    ([
+        "DATABASE_BNDOUT", "DATABASE_CROSS_SECTION_SET", "DATABASE_CROSS_SECTION_SET_ID",
+        "DATABASE_CROSS_SECTION_PLANE", "DATABASE_CROSS_SECTION_PLANE_ID", "DATABASE_DEFORC",
+        "DATABASE_ELOUT", "DATABASE_FREQUENCY_BINARY_D3SSD", "DATABASE_GLSTAT",
+        "DATABASE_MATSUM", "DATABASE_NCFORC", "DATABASE_NODFOR", "DATABASE_NODOUT",
+        "DATABASE_RBDOUT", "DATABASE_RCFORC", "DATABASE_RWFORC", "DATABASE_SECFORC",
+        "DATABASE_SPCFORC", "DATABASE_SLEOUT", "DATABASE_SWFORC", "DATABASE_BINARY_D3PLOT",
+        "DATABASE_BINARY_D3THDT", "DATABASE_BINARY_D3DUMP", "DATABASE_BINARY_RUNRSF",
+        "DATABASE_BINARY_INTFOR", "DATABASE_BINARY_INTFOR_FILE", "DATABASE_EXTENT_BINARY",
+        "DATABASE_EXTENT_INTFOR", "DATABASE_FORMAT", "DATABASE_HISTORY_NODE",
+        "DATABASE_HISTORY_BEAM", "DATABASE_HISTORY_BEAM_SET", "DATABASE_HISTORY_SHELL",
+        "DATABASE_HISTORY_SHELL_SET", "DATABASE_HISTORY_SOLID", "DATABASE_HISTORY_SOLID_SET",
+        "DATABASE_HISTORY_NODE_SET", "DATABASE_NODAL_FORCE_GROUP"
+    ], "databaseKeywords"),
+    ([
+        "INTERFACE_SPRINGBACK_DYNA3D", "INTERFACE_SPRINGBACK_LSDYNA",
+        "INTERFACE_SPRINGBACK_NASTRAN", "INTERFACE_SPRINGBACK_SEAMLESS"
+    ], "interfaceKeywords"),
+    ([
+        "DEFINE_BOX", "DEFINE_COORDINATE_SYSTEM", "DEFINE_COORDINATE_SYSTEM_TITLE",
+        "DEFINE_CURVE", "DEFINE_CURVE_TITLE"
+    ], "defineKeywords"),
+    ([
+        "SECTION_BEAM", "SECTION_BEAM_TITLE", "SECTION_SHELL", "SECTION_SHELL_TITLE",
+        "SECTION_SOLID", "SECTION_SOLID_TITLE", "SECTION_SOLID_PERI",
+        "SECTION_SOLID_PERI_TITLE", "SECTION_TSHELL", "SECTION_TSHELL_TITLE"
+    ], "sectionKeywords"),
+    ([
+        "HOURGLASS", "EOS_LINEAR_POLYNOMIAL", "EOS_TABULATED", "MAT_ADD_EROSION",
+        "MAT_ADD_PZELECTRIC", "MAT_CSCM_CONCRETE", "MAT_CSCM_CONCRETE_TITLE", "MAT_ELASTIC",
+        "MAT_ELASTIC_TITLE", "MAT_VISCOELASTIC", "MAT_VISCOELASTIC_TITLE", "MAT_SOIL_AND_FOAM",
+        "MAT_SOIL_AND_FOAM_FAILURE", "MAT_RIGID", "MAT_RIGID_TITLE", "MAT_COMPOSITE_DAMAGE",
+        "MAT_COMPOSITE_DAMAGE_TITLE", "MAT_PLASTIC_KINEMATIC", "MAT_PLASTIC_KINEMATIC_TITLE",
+        "MAT_PIECEWISE_LINEAR_PLASTICITY", "MAT_PIECEWISE_LINEAR_PLASTICITY_TITLE",
+        "MAT_ORIENTED_CRACK", "MAT_ENHANCED_COMPOSITE_DAMAGE",
+        "MAT_ENHANCED_COMPOSITE_DAMAGE_TITLE", "MAT_MOONEY-RIVLIN_RUBBER",
+        "MAT_MOONEY-RIVLIN_RUBBER_TITLE", "MAT_LOW_DENSITY_FOAM", "MAT_LOW_DENSITY_FOAM_TITLE",
+        "MAT_SPOTWELD", "MAT_SPOTWELD_TITLE", "MAT_COHESIVE_MIXED_MODE",
+        "MAT_COHESIVE_MIXED_MODE_TITLE", "MAT_ELASTIC_PERI", "MAT_ELASTIC_PERI_TITLE",
+        "MAT_NULL", "DAMPING_GLOBAL", "DAMPING_PART_MASS", "DAMPING_PART_MASS_SET",
+        "DAMPING_PART_STIFFNESS", "DAMPING_PART_STIFFNESS_SET"
+    ], "materialKeywords"),
+    ([
+        "LOAD_BODY_X", "LOAD_BODY_Y", "LOAD_BODY_Z", "LOAD_BODY_RX", "LOAD_BODY_RY",
+        "LOAD_BODY_RZ", "LOAD_BODY_VECTOR", "LOAD_RIGID_BODY", "LOAD_NODE_POINT",
+        "LOAD_NODE_SET", "LOAD_SEGMENT", "LOAD_SEGMENT_ID", "LOAD_SEGMENT_SET",
+        "LOAD_SEGMENT_SET_ID"
+    ], "loadKeywords"),
+    ([
+        "PART", "PART_COMPOSITE", "PART_CONTACT", "ELEMENT_SOLID", "ELEMENT_SHELL",
+        "ELEMENT_SHELL_THICKNESS", "ELEMENT_BEAM", "ELEMENT_MASS", "ELEMENT_MASS_NODE_SET",
+        "NODE"
+    ], "meshKeywords"),
+    ([
+        "FREQUENCY_DOMAIN_SSD"
+    ], None),
+]
+
+class DynaStreamWriter():
+    '''Buffered, chunked writer producing the same bytes as DynaManager.WriteOutputFile.
+
+    Keyword blocks are emitted to a buffered file handle one after another.
+    NODE, ELEMENT_SOLID/SHELL/BEAM and SET_NODE_LIST/SET_PART_LIST/SET_SEGMENT
+    blocks are formatted in bulk: every chunk of rows is rendered with one
+    printf template per row length and handed to the file in a single write,
+    instead of one stream.write() per field.
+
+    With parallel=True each keyword block is rendered to a string on a worker
+    thread and the results are spliced into the file in the original order.
+    At most 2 * maxWorkers rendered blocks are held in memory at a time.
+    '''
+
+    ELEMENT_HEADERS = {
+        "ELEMENT_SOLID": "$$   EID     PID      N1      N2      N3      N4      N5      N6      N7      N8\n",
+        "ELEMENT_SHELL": "$$   EID     PID      N1      N2      N3      N4      N5      N6      N7      N8\n",
+        "ELEMENT_BEAM": "$$   EID     PID      N1      N2      N3     RT1     RR1     RT2     RR2   LOCAL\n",
+    }
+
+    def __init__(self, chunkRows=20000, bufferSize=1 << 20, parallel=False, maxWorkers=None):
+        self.chunkRows = max(1, int(chunkRows))
+        self.bufferSize = bufferSize
+        self.parallel = parallel
+        self.maxWorkers = maxWorkers or min(8, os.cpu_count() or 1)
+        self._rowFormats = {}
+
+    def write(self, outputFileName, dynaKeywords, extraKeywords=None):
+        extraKeywords = extraKeywords or {}
+        with open(outputFileName, 'w', buffering=self.bufferSize) as file:
+            if self.parallel:
+                self._writeParallel(file, self.blocks(dynaKeywords, extraKeywords))
+            else:
+                for block in self.blocks(dynaKeywords, extraKeywords):
+                    for chunk in block():
+                        file.write(chunk)
+
+    def blocks(self, dynaKeywords, extraKeywords):
+        '''Yield one chunk generator factory per output block, in file order.'''
+        if "KEYWORD_ID" in dynaKeywords:
+            yield self._keywordBlock(dynaKeywords["KEYWORD_ID"])
+        else:
+            yield self._textBlock("*KEYWORD\n")
+        for names, extraName in DYNA_OUTPUT_SECTIONS:
+            for name in names:
+                if name in dynaKeywords:
+                    yield self._keywordBlock(dynaKeywords[name])
+            if extraName is not None and len(extraKeywords.get(extraName, "")) > 0:
+                yield self._textBlock(extraKeywords[extraName])
+        yield self._textBlock("*END\n")
+
+    def _writeParallel(self, file, blocks):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        def render(block):
+            return "".join(block())
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.maxWorkers) as executor:
+            for block in blocks:
+                pending.append(executor.submit(render, block))
+                if len(pending) >= 2 * self.maxWorkers:
+                    file.write(pending.popleft().result())
+            while pending:
+                file.write(pending.popleft().result())
+
+    def _textBlock(self, text):
+        return lambda: iter((text,))
+
+    def _keywordBlock(self, keyword):
+        kind = type(keyword)
+        if kind is DynaNode:
+            return lambda: self._nodeChunks(keyword)
+        if kind in (ElementSolid, ElementShell, ElementBeam):
+            return lambda: self._elementChunks(keyword)
+        if kind in (SetNodeList, SetPartList, SetSegment):
+            return lambda: self._setChunks(keyword)
+        return lambda: self._genericChunks(keyword)
+
+    def _genericChunks(self, keyword):
+        stream = io.StringIO()
+        keyword.write(stream)
+        yield stream.getvalue()
+
+    def _rowFormat(self, width, count):
+        key = (width, count)
+        fmt = self._rowFormats.get(key)
+        if fmt is None:
+            fmt = ("%" + str(width) + "s") * count + "\n"
+            self._rowFormats[key] = fmt
+        return fmt
+
+    def _rowChunks(self, rows, width):
+        rowFormat = self._rowFormat
+        for start in range(0, len(rows), self.chunkRows):
+            yield "".join([rowFormat(width, len(row)) % tuple(row)
+                           for row in rows[start:start + self.chunkRows]])
+
+    def _nodeChunks(self, keyword):
+        fmt = "%8s%16s%16s%16s%8s%8s\n"
+        for i in range(len(keyword.parameters)):
+            if i == 0:
+                yield "$$ {i}st Node List\n".format(i=i+1)
+            elif i == 1:
+                yield "$$ {i}nd Node List\n".format(i=i+1)
+            elif i == 2:
+                yield "$$ {i}rd Node List\n".format(i=i+1)
+            else:
+                yield "$$ {i}th Node List\n".format(i=i+1)
+            yield "*NODE\n$$   NID               X               Y               Z      TC      RC\n"
+            rows = keyword.parameters[i]
+            for start in range(0, len(rows), self.chunkRows):
+                yield "".join([fmt % (p[0], p[1], p[2], p[3], p[4], p[5])
+                               for p in rows[start:start + self.chunkRows]])
+
+    def _elementChunks(self, keyword):
+        header = "*" + keyword.name + "\n" + self.ELEMENT_HEADERS[keyword.name]
+        for parameter in keyword.parameters:
+            yield header
+            yield from self._rowChunks(parameter, 8)
+
+    def _setChunks(self, keyword):
+        for parameter in keyword.parameters:
+            yield "*" + keyword.name + "\n"
+            if len(parameter) == 0:
+                continue
+            p = parameter[0]
+            if keyword.name == "SET_NODE_LIST":
+                yield "$#     SID       DA1       DA2       DA3       DA4    SOLVER       ITS\n"
+                yield f"{str(p[0]):>10}{str(p[1]):>10}{str(p[2]):>10}{str(p[3]):>10}{str(p[4]):>10}{str(p[5]):<10}{str(p[6]):<10}\n"
+                columns = "$    NSID1     NSID2     NSID3     NSID4     NSID5     NSID6     NSID7     NSID8\n"
+            elif keyword.name == "SET_PART_LIST":
+                yield "$$     SID       DA1       DA2       DA3       DA4    SOLVER\n"
+                yield f"{str(p[0]):>10}{str(p[1]):>10}{str(p[2]):>10}{str(p[3]):>10}{str(p[4]):>10}{str(p[5]):<10}\n"
+                columns = "$$    PID1      PID2      PID3      PID4      PID5      PID6      PID7      PID8\n"
+            else:
+                yield "$$     SID       DA1       DA2       DA3       DA4    SOLVER       ITS\n"
+                yield f"{str(p[0]):>10}{str(p[1]):>10}{str(p[2]):>10}{str(p[3]):>10}{str(p[4]):>10}{str(p[5]):<10}{str(p[6]):<10}\n"
+                columns = "$$      N1        N2        N3        N4        A1        A2        A3        A4\n"
+            if len(parameter) > 1:
+                yield columns
+                yield from self._rowChunks(parameter[1:], 10)
+
+
 class DynaManager():
     def __init__(self):
         self.currentDirectory = os.getcwd()
@@ -12446,6 +12719,26 @@ class DynaManager():
             file.write("*END\n")
 
 
+    def WriteOutputFileStreaming(self, outputFileName,controlKeywords="", contactKeywords="", initialKeywords="", setKeywords="",rigidKeywords="",boundaryKeywords="",interfaceKeywords="",defineKeywords="",sectionKeywords="",materialKeywords="",loadKeywords="",meshKeywords="",databaseKeywords="", chunkRows=20000, parallel=False, maxWorkers=None):
+        '''Same output as WriteOutputFile, written block by block through DynaStreamWriter.'''
+        extraKeywords = {
+            "controlKeywords": controlKeywords,
+            "contactKeywords": contactKeywords,
+            "initialKeywords": initialKeywords,
+            "setKeywords": setKeywords,
+            "rigidKeywords": rigidKeywords,
+            "boundaryKeywords": boundaryKeywords,
+            "interfaceKeywords": interfaceKeywords,
+            "defineKeywords": defineKeywords,
+            "sectionKeywords": sectionKeywords,
+            "materialKeywords": materialKeywords,
+            "loadKeywords": loadKeywords,
+            "meshKeywords": meshKeywords,
+            "databaseKeywords": databaseKeywords,
+        }
+        writer = DynaStreamWriter(chunkRows=chunkRows, parallel=parallel, maxWorkers=maxWorkers)
+        writer.write(outputFileName, self.dynaKeywordMan.keywords, extraKeywords)
+
     def ReadInputFile(self, outputFileName,writelog = True):
         os.chdir(self.currentDirectory)
         path = os.path.join(self.currentDirectory, self.inputFile)        